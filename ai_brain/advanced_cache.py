@@ -3,31 +3,39 @@ Advanced Caching Strategies
 
 Provides:
 - Multi-level caching (memory + disk)
+- Write-behind disk persistence (coalesced, batched, off the caller's thread)
 - Cache invalidation strategies
 - Cache warming
 - Performance metrics
 """
 
-import json
-import hashlib
-import pickle
-from typing import Dict, Any, Optional, Callable
-from datetime import datetime, timedelta
+import atexit
+import fnmatch
+import os
+import threading
+import weakref
+from typing import Dict, Any, Optional, Callable, Iterable, List
+from datetime import datetime
 from pathlib import Path
 from rich.console import Console
-from ai_brain.shared.cache_manager import CacheManager, CacheEntry
+from ai_brain.shared.cache_manager import CacheManager
+from ai_brain.shared.disk_cache import SQLiteDiskCache, DEFAULT_MAX_BYTES
 
 console = Console()
 
+WRITE_BEHIND_INTERVAL = 0.5  # seconds between background flushes
+WRITE_BEHIND_BATCH = 256  # flush early once this many keys are pending
+
 
 class AdvancedCacheManager(CacheManager):
     """
     Advanced cache manager with multi-level caching and invalidation.
     
     Extends base CacheManager with:
-    - Disk persistence
+    - Disk persistence (single SQLite file, size-bounded, LRU/LFU eviction)
+    - Write-behind queue: set() only touches memory, a writer thread persists
     - Cache warming
-    - Smart invalidation
+    - Smart invalidation (key prefix / glob pattern / tag)
     - Performance metrics
     """
     
@@ -35,7 +43,10 @@ class AdvancedCacheManager(CacheManager):
         self,
         default_ttl: int = 3600,
         disk_cache_dir: Optional[Path] = None,
-        enable_disk_cache: bool = True
+        enable_disk_cache: bool = True,
+        max_disk_bytes: Optional[int] = None,
+        eviction_policy: str = "lru",
+        write_behind: bool = True
     ):
         """
         Initialize advanced cache manager.
@@ -44,6 +55,9 @@ class AdvancedCacheManager(CacheManager):
             default_ttl: Default time-to-live in seconds
             disk_cache_dir: Directory for disk cache
             enable_disk_cache: Enable disk caching
+            max_disk_bytes: Disk budget (default: AUDITMATE_CACHE_MAX_MB or 512 MB)
+            eviction_policy: 'lru' or 'lfu'
+            write_behind: Persist to disk asynchronously (False = write in caller's thread)
         """
         super().__init__(default_ttl)
         self.enable_disk_cache = enable_disk_cache
@@ -54,14 +68,43 @@ class AdvancedCacheManager(CacheManager):
             "memory_hits": 0,
             "disk_hits": 0,
             "misses": 0,
-            "writes": 0
+            "writes": 0,
+            "coalesced": 0,
+            "flushes": 0
         }
+        
+        # Write-behind state: key -> (value, ttl, tags); later writes replace earlier ones
+        self.write_behind = write_behind
+        self._pending: Dict[str, tuple] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # serializes disk writes with invalidation
+        self._flush_requested = threading.Event()
+        self._writer_stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        
+        self.disk: Optional[SQLiteDiskCache] = None
+        if self.enable_disk_cache:
+            if max_disk_bytes is None:
+                env_mb = os.getenv("AUDITMATE_CACHE_MAX_MB")
+                max_disk_bytes = int(env_mb) * 1024 * 1024 if env_mb else DEFAULT_MAX_BYTES
+            self.disk = SQLiteDiskCache(
+                self.disk_cache_dir / "cache.db",
+                max_bytes=max_disk_bytes,
+                eviction_policy=eviction_policy
+            )
+            self._remove_legacy_files()
     
-    def _get_disk_path(self, key: str) -> Path:
-        """Get disk cache file path for key."""
-        # Use hash to avoid filesystem issues with long keys
-        key_hash = hashlib.md5(key.encode()).hexdigest()
-        return self.disk_cache_dir / f"{key_hash}.cache"
+    def _remove_legacy_files(self) -> None:
+        """Drop per-key pickle files left by the old file-per-key disk tier."""
+        removed = 0
+        for cache_file in self.disk_cache_dir.glob("*.cache"):
+            try:
+                cache_file.unlink()
+                removed += 1
+            except OSError:
+                pass
+        if removed:
+            console.print(f"[dim]🧹 Removed {removed} legacy cache files (migrated to cache.db)[/dim]")
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -80,25 +123,28 @@ class AdvancedCacheManager(CacheManager):
             self.access_times[key] = datetime.now()
             return result
         
+        # Pending writes are newer than anything on disk
+        with self._pending_lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            value, ttl, _ = pending
+            self.cache_stats["memory_hits"] += 1
+            super().set(key, value, ttl)
+            return value
+        
         # Check disk cache
-        if self.enable_disk_cache:
-            disk_path = self._get_disk_path(key)
-            if disk_path.exists():
-                try:
-                    with open(disk_path, 'rb') as f:
-                        entry: CacheEntry = pickle.load(f)
-                    
-                    if not entry.is_expired():
-                        self.cache_stats["disk_hits"] += 1
-                        self.access_times[key] = datetime.now()
-                        # Load into memory cache for faster access
-                        self.set(key, entry.value, ttl=None)  # Keep original TTL
-                        return entry.value
-                    else:
-                        # Expired, remove from disk
-                        disk_path.unlink()
-                except Exception as e:
-                    console.print(f"[yellow]⚠️  Disk cache read error: {e}[/yellow]")
+        if self.disk is not None:
+            try:
+                found, value, expires_at = self.disk.get(key)
+                if found:
+                    self.cache_stats["disk_hits"] += 1
+                    self.access_times[key] = datetime.now()
+                    # Promote to memory only, keeping the remaining TTL
+                    remaining = expires_at - datetime.now().timestamp() if expires_at else None
+                    super().set(key, value, ttl=max(1, int(remaining)) if remaining else None)
+                    return value
+            except Exception as e:
+                console.print(f"[yellow]⚠️  Disk cache read error: {e}[/yellow]")
         
         self.cache_stats["misses"] += 1
         return None
@@ -107,61 +153,131 @@ class AdvancedCacheManager(CacheManager):
         self,
         key: str,
         value: Any,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None
     ) -> None:
         """
         Set value in cache (both memory and disk).
         
+        With write-behind enabled the disk write is queued; repeated writes
+        to the same key before the next flush are coalesced into one.
+        
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds
+            tags: Optional tags for group invalidation (invalidate(tag=...))
         """
         # Set in memory cache
         super().set(key, value, ttl)
         
-        # Also write to disk cache
-        if self.enable_disk_cache:
-            disk_path = self._get_disk_path(key)
+        if self.disk is None:
+            return
+        
+        if not self.write_behind:
             try:
-                ttl = ttl or self.default_ttl
-                expires_at = datetime.now() + timedelta(seconds=ttl)
-                
-                entry = CacheEntry(
-                    value=value,
-                    created_at=datetime.now(),
-                    expires_at=expires_at
-                )
-                
-                with open(disk_path, 'wb') as f:
-                    pickle.dump(entry, f)
-                
+                with self._flush_lock:
+                    self.disk.set(key, value, ttl=ttl or self.default_ttl, tags=tags)
                 self.cache_stats["writes"] += 1
             except Exception as e:
                 console.print(f"[yellow]⚠️  Disk cache write error: {e}[/yellow]")
+            return
+        
+        # Queue for the background writer
+        with self._pending_lock:
+            if key in self._pending:
+                self.cache_stats["coalesced"] += 1
+            self._pending[key] = (value, ttl or self.default_ttl, tuple(tags or ()))
+            backlog = len(self._pending)
+        self._ensure_writer()
+        if backlog >= WRITE_BEHIND_BATCH:
+            self._flush_requested.set()
     
-    def invalidate(self, pattern: Optional[str] = None) -> int:
+    # ------------------------------------------------------------------ #
+    # Write-behind
+    # ------------------------------------------------------------------ #
+    
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._pending_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="cache-writer", daemon=True)
+                self._writer.start()
+                # The writer is a daemon, so it dies with the interpreter; flush what it left behind
+                atexit.register(_flush_at_exit, weakref.ref(self))
+    
+    def _writer_loop(self) -> None:
+        while not self._writer_stop.is_set():
+            self._flush_requested.wait(WRITE_BEHIND_INTERVAL)
+            self._flush_requested.clear()
+            self.flush()
+    
+    def flush(self) -> int:
+        """
+        Write all pending entries to disk in one transaction.
+        
+        Returns:
+            Number of entries written
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+            if self.disk is None:
+                return 0
+            try:
+                self.disk.set_many([(k, v, ttl, tags) for k, (v, ttl, tags) in batch.items()])
+            except Exception as e:
+                console.print(f"[yellow]⚠️  Disk cache write error ({len(batch)} entries dropped): {e}[/yellow]")
+                return 0
+            self.cache_stats["writes"] += len(batch)
+            self.cache_stats["flushes"] += 1
+            return len(batch)
+    
+    def _drop_pending(self, pattern: Optional[str] = None, tag: Optional[str] = None) -> List[str]:
+        with self._pending_lock:
+            if pattern is None and tag is None:
+                matched = list(self._pending)
+            elif tag is not None:
+                matched = [k for k, (_, _, tags) in self._pending.items() if tag in tags]
+            else:
+                matched = [k for k in self._pending if fnmatch.fnmatchcase(k, pattern)]
+            for key in matched:
+                del self._pending[key]
+            return matched
+    
+    def invalidate(self, pattern: Optional[str] = None, tag: Optional[str] = None) -> int:
         """
         Invalidate cache entries.
         
         Args:
-            pattern: Optional pattern to match (not implemented yet)
+            pattern: Key pattern ('llm:*' prefix, any glob, exact key); None = everything
+            tag: Invalidate every entry stored with this tag
             
         Returns:
-            Number of entries invalidated
+            Number of distinct keys invalidated across the memory, pending and disk tiers
         """
-        count = super().clear(pattern)
-        
-        # Also clear disk cache
-        if self.enable_disk_cache and pattern is None:
-            for cache_file in self.disk_cache_dir.glob("*.cache"):
-                try:
-                    cache_file.unlink()
-                    count += 1
-                except Exception:
-                    pass
-        
-        return count
+        # Hold the flush lock so an in-flight batch can't resurrect invalidated keys
+        with self._flush_lock:
+            if tag is not None:
+                removed = set(self._drop_pending(tag=tag))
+                if self.disk is not None:
+                    removed.update(self.disk.keys_for_tag(tag))
+                    self.disk.invalidate(tag=tag)
+                for key in removed:
+                    super().clear(key)
+                return len(removed)
+            
+            with self._lock:
+                removed = {k for k in self.cache if pattern is None or fnmatch.fnmatchcase(k, pattern)}
+            super().clear(pattern)
+            removed.update(self._drop_pending(pattern))
+            if self.disk is not None:
+                removed.update(self.disk.keys(pattern))
+                self.disk.invalidate(pattern)
+            return len(removed)
     
     def warm_cache(self, warm_funcs: List[Callable]) -> Dict[str, Any]:
         """
@@ -211,8 +327,7 @@ class AdvancedCacheManager(CacheManager):
             if total_requests > 0 else 0
         )
         
-        # Count disk cache files
-        disk_files = len(list(self.disk_cache_dir.glob("*.cache"))) if self.enable_disk_cache else 0
+        disk_stats = self.disk.get_stats() if self.disk is not None else {}
         
         return {
             **base_stats,
@@ -220,10 +335,14 @@ class AdvancedCacheManager(CacheManager):
             "disk_hits": self.cache_stats["disk_hits"],
             "misses": self.cache_stats["misses"],
             "writes": self.cache_stats["writes"],
+            "coalesced_writes": self.cache_stats["coalesced"],
+            "pending_writes": len(self._pending),
             "memory_hit_rate": f"{memory_hit_rate:.1f}%",
             "disk_hit_rate": f"{disk_hit_rate:.1f}%",
             "overall_hit_rate": f"{overall_hit_rate:.1f}%",
-            "disk_cache_files": disk_files,
+            "disk_entries": disk_stats.get("entries", 0),
+            "disk_size_mb": disk_stats.get("size_mb", 0),
+            "disk_evictions": disk_stats.get("evictions", 0),
             "disk_cache_enabled": self.enable_disk_cache
         }
     
@@ -234,25 +353,49 @@ class AdvancedCacheManager(CacheManager):
         Returns:
             Number of entries cleaned
         """
-        if not self.enable_disk_cache:
+        if self.disk is None:
             return 0
         
-        cleaned = 0
-        for cache_file in self.disk_cache_dir.glob("*.cache"):
-            try:
-                with open(cache_file, 'rb') as f:
-                    entry: CacheEntry = pickle.load(f)
-                
-                if entry.is_expired():
-                    cache_file.unlink()
-                    cleaned += 1
-            except Exception:
-                # Corrupted file, remove it
-                cache_file.unlink()
-                cleaned += 1
+        cleaned = self.disk.sweep_expired()
         
         if cleaned > 0:
             console.print(f"[dim]🧹 Cleaned {cleaned} expired cache entries[/dim]")
         
         return cleaned
+    
+    def close(self) -> None:
+        """Flush pending writes, stop background threads and close the disk tier."""
+        super().close()
+        self._writer_stop.set()
+        self._flush_requested.set()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
+        self.flush()
+        if self.disk is not None:
+            self.disk.close()
+            self.disk = None
+
+
+def _flush_at_exit(ref: "weakref.ReferenceType[AdvancedCacheManager]") -> None:
+    cache = ref()
+    if cache is not None and cache.disk is not None:
+        cache.flush()
+
+
+_advanced_cache: Optional[AdvancedCacheManager] = None
+
+
+def get_advanced_cache() -> AdvancedCacheManager:
+    """Get the shared AdvancedCacheManager instance."""
+    global _advanced_cache
+    if _advanced_cache is None:
+        _advanced_cache = AdvancedCacheManager()
+    return _advanced_cache
+
 
+def close_advanced_cache() -> None:
+    """Flush and close the shared instance, if one was created (cleanup hook)."""
+    global _advanced_cache
+    if _advanced_cache is not None:
+        _advanced_cache.close()
+        _advanced_cache = None
@@ -0,0 +1,355 @@
+"""
+Campaign Runner - Collect evidence for many RFIs in one pass
+
+config/rfi_mapping.yaml lists the collection units every RFI needs
+(rds_snapshots, security_groups, iam_users, ...) and, under
+collection_units, the tool call behind each unit. A campaign expands the
+selected RFIs x accounts x regions into one global task set, in which
+identical calls (same tool, same normalized parameters) appear once even
+when several RFIs or units ask for them. IAM users for "mfa_status" and
+"iam_users" is one export, not two.
+
+Unique tasks run through the PlanScheduler, so API exports run in parallel
+while browser work stays within the per-account browser limit. Each task is
+collected into the folder of the first RFI that needs it; its files are
+then fanned out to every other RFI folder by hardlink (copy when linking
+is not possible, e.g. across filesystems).
+
+    python tools/run_campaign.py --accounts ctr-prod --regions us-east-1,eu-west-1
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+from rich.console import Console
+from rich.table import Table
+
+from ai_brain.plan_journal import extract_artifact_paths
+from ai_brain.plan_models import PlanStep
+from ai_brain.plan_scheduler import PlanScheduler
+
+console = Console()
+
+MAPPING_PATH = Path(__file__).resolve().parent.parent / "config" / "rfi_mapping.yaml"
+
+DEFAULT_LINK_MODE = os.getenv("CAMPAIGN_LINK_MODE", "hardlink")
+
+# Parameters that only say where evidence goes, not what is collected
+DESTINATION_PARAMS = {"rfi_code", "output_dir", "output_path", "destination", "folder"}
+
+# Parameters whose values are case-insensitive
+CASE_INSENSITIVE_PARAMS = {"service", "export_type", "format", "aws_region", "region"}
+
+# Values a tool assumes when the parameter is omitted
+TOOL_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "aws_export_data": {"format": "csv"},
+}
+
+
+def normalize_params(tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Canonical form of a tool call's parameters for deduplication.
+
+    Drops destination-only parameters and empty values, fills tool defaults,
+    collapses whitespace and lower-cases case-insensitive values.
+    """
+    normalized: Dict[str, Any] = {}
+    for key, value in {**TOOL_DEFAULTS.get(tool, {}), **(params or {})}.items():
+        if key in DESTINATION_PARAMS or value is None or value == "":
+            continue
+        if isinstance(value, str):
+            value = re.sub(r"\s+", " ", value.strip())
+            if key in CASE_INSENSITIVE_PARAMS:
+                value = value.lower()
+        normalized[key] = value
+    return normalized
+
+
+def task_key(tool: str, params: Dict[str, Any]) -> str:
+    """Dedup key: tool plus a hash of the normalized parameters."""
+    canonical = json.dumps(normalize_params(tool, params), sort_keys=True, default=str)
+    return f"{tool}:{hashlib.sha256(canonical.encode()).hexdigest()[:12]}"
+
+
+def load_campaign_config(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load rfi_mappings and collection_units (config/rfi_mapping.yaml by default)."""
+    path = Path(path) if path else MAPPING_PATH
+    with open(path) as f:
+        config = yaml.safe_load(f) or {}
+    return {
+        "rfi_mappings": config.get("rfi_mappings") or {},
+        "collection_units": config.get("collection_units") or {},
+    }
+
+
+@dataclass
+class CampaignTask:
+    """One unique tool call and everything that asked for it."""
+    key: str
+    tool: str
+    parameters: Dict[str, Any]
+    rfi_codes: List[str] = field(default_factory=list)
+    units: List[str] = field(default_factory=list)
+    requests: int = 0
+    status: str = "pending"
+    artifacts: List[str] = field(default_factory=list)
+    fanned_out: Dict[str, List[str]] = field(default_factory=dict)
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def primary_rfi(self) -> str:
+        return self.rfi_codes[0] if self.rfi_codes else ""
+
+
+def _fill(value: Any, account: str, region: str) -> Any:
+    if isinstance(value, str):
+        return value.replace("{account}", account).replace("{region}", region)
+    if isinstance(value, dict):
+        return {k: _fill(v, account, region) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, account, region) for v in value]
+    return value
+
+
+def expand_campaign(
+    rfi_codes: List[str],
+    accounts: List[str],
+    regions: List[str],
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[List[CampaignTask], Dict[str, List[str]]]:
+    """
+    Expand RFIs x accounts x regions into unique tasks.
+
+    Returns:
+        (tasks in first-requested order, {rfi_code: units with no collection_units entry})
+    """
+    config = config or load_campaign_config()
+    mappings = config["rfi_mappings"]
+    units = config["collection_units"]
+    tasks: Dict[str, CampaignTask] = {}
+    manual: Dict[str, List[str]] = {}
+
+    for rfi_code in rfi_codes:
+        if rfi_code not in mappings:
+            console.print(f"[yellow]⚠️  {rfi_code} is not in rfi_mapping.yaml - skipped[/yellow]")
+            continue
+        for unit_name in mappings[rfi_code].get("collection") or []:
+            unit = units.get(unit_name)
+            if not unit or not unit.get("tool"):
+                manual.setdefault(rfi_code, []).append(unit_name)
+                continue
+            scope = unit.get("scope", "regional")
+            if scope == "none":
+                targets = [("", "")]
+            elif scope == "account":
+                targets = [(account, "") for account in accounts]
+            else:
+                targets = [(account, region) for account in accounts for region in regions]
+
+            for account, region in targets:
+                params = _fill(unit.get("parameters") or {}, account, region)
+                key = task_key(unit["tool"], params)
+                task = tasks.get(key)
+                if task is None:
+                    task = tasks[key] = CampaignTask(key=key, tool=unit["tool"], parameters=params)
+                task.requests += 1
+                if rfi_code not in task.rfi_codes:
+                    task.rfi_codes.append(rfi_code)
+                if unit_name not in task.units:
+                    task.units.append(unit_name)
+    return list(tasks.values()), manual
+
+
+def fan_out_file(source: str, target_dir: Path, link_mode: str = DEFAULT_LINK_MODE) -> Tuple[str, str]:
+    """
+    Place a file in another RFI folder.
+
+    An existing file with the same name is replaced only if its content is
+    identical; otherwise the file is placed under a numbered name (report_1.csv).
+
+    Returns:
+        (target path, "hardlink" | "copy" | "existing")
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    source_path = Path(source)
+    target = target_dir / source_path.name
+    suffix = 1
+    while target.exists():
+        try:
+            if os.path.samefile(source, target):
+                return str(target), "existing"
+        except OSError:
+            pass
+        if filecmp.cmp(source, target, shallow=False):
+            target.unlink()  # Same content: swap the copy for a link
+            break
+        # A different file already has this name; never overwrite it
+        target = target_dir / f"{source_path.stem}_{suffix}{source_path.suffix}"
+        suffix += 1
+    if link_mode == "hardlink":
+        try:
+            os.link(source, target)
+            return str(target), "hardlink"
+        except OSError:
+            pass  # Cross-device, or the filesystem has no hardlinks
+    shutil.copy2(source, target)
+    return str(target), "copy"
+
+
+class CampaignRunner:
+    """
+    Runs a deduplicated evidence campaign.
+
+    Args:
+        tool_executor: ToolExecutor (or anything with execute_tool(name, params))
+        rfi_directory: rfi_code -> evidence folder (LocalEvidenceManager.get_rfi_directory)
+        max_workers: Concurrent API-bound tasks
+        browser_concurrency: Concurrent browser-bound tasks
+        link_mode: "hardlink" (copy as fallback) or "copy"
+    """
+
+    def __init__(self, tool_executor, rfi_directory: Callable[[str], Path],
+                 max_workers: Optional[int] = None, browser_concurrency: Optional[int] = None,
+                 link_mode: str = DEFAULT_LINK_MODE):
+        self.tool_executor = tool_executor
+        self.rfi_directory = rfi_directory
+        self.max_workers = max_workers
+        self.browser_concurrency = browser_concurrency
+        self.link_mode = link_mode
+        self._lock = threading.Lock()
+
+    def _run_task(self, task: CampaignTask, step: PlanStep) -> Dict[str, Any]:
+        step.mark_in_progress()
+        task.status = "running"
+        started = time.time()
+        try:
+            result = self.tool_executor.execute_tool(task.tool, {**task.parameters, "rfi_code": task.primary_rfi})
+        except Exception as e:
+            result = {"status": "error", "error": str(e)}
+        task.seconds = time.time() - started
+
+        if not isinstance(result, dict) or result.get("status") != "success":
+            task.status = "failed"
+            task.error = str((result or {}).get("error") or (result or {}).get("message") or "unknown error")[:300]
+            step.mark_failed(task.error)
+            console.print(f"[red]❌ {task.tool} {task.units} failed: {task.error}[/red]")
+            return {"step": step.step, "status": "failed", "tool": task.tool, "error": task.error}
+
+        task.artifacts = extract_artifact_paths(result)
+        step.artifacts = list(task.artifacts)
+        for rfi_code in task.rfi_codes[1:]:
+            target_dir = Path(self.rfi_directory(rfi_code))
+            for artifact in task.artifacts:
+                try:
+                    target, _ = fan_out_file(artifact, target_dir, self.link_mode)
+                    task.fanned_out.setdefault(rfi_code, []).append(target)
+                except OSError as e:
+                    console.print(f"[yellow]⚠️  Could not place {Path(artifact).name} in {rfi_code}: {e}[/yellow]")
+
+        task.status = "completed"
+        step.mark_completed(f"{len(task.artifacts)} file(s) for {len(task.rfi_codes)} RFI(s)")
+        if not task.artifacts:
+            console.print(f"[yellow]⚠️  {task.tool} {task.units} succeeded but produced no files[/yellow]")
+        return {"step": step.step, "status": "success", "tool": task.tool}
+
+    def run(self, tasks: List[CampaignTask]) -> Dict[str, Any]:
+        """
+        Execute every task once and fan its files out.
+
+        Returns:
+            Campaign summary (per-task records, per-RFI file counts, scheduler stats)
+        """
+        steps = [
+            PlanStep(step=index, tool=task.tool, description=", ".join(task.units),
+                     parameters={**task.parameters, "rfi_code": task.primary_rfi})
+            for index, task in enumerate(tasks, 1)
+        ]
+        by_step = {step.step: task for step, task in zip(steps, tasks)}
+
+        def skip(step: PlanStep, reason: str) -> Dict[str, Any]:
+            step.status = "skipped"
+            by_step[step.step].status = "skipped"
+            return {"step": step.step, "status": "skipped", "reason": reason}
+
+        scheduler = PlanScheduler(steps, self.max_workers, self.browser_concurrency)
+        console.print(f"[cyan]🚀 Running {len(tasks)} unique collection task(s)...[/cyan]")
+        scheduler.run(lambda step: self._run_task(by_step[step.step], step), skip)
+
+        per_rfi: Dict[str, int] = {}
+        for task in tasks:
+            if task.status != "completed":
+                continue
+            per_rfi[task.primary_rfi] = per_rfi.get(task.primary_rfi, 0) + len(task.artifacts)
+            for rfi_code, files in task.fanned_out.items():
+                per_rfi[rfi_code] = per_rfi.get(rfi_code, 0) + len(files)
+
+        requested = sum(task.requests for task in tasks)
+        return {
+            "status": "success" if all(t.status == "completed" for t in tasks) else "partial",
+            "requested_units": requested,
+            "unique_tasks": len(tasks),
+            "executions_saved": requested - len(tasks),
+            "completed": sum(1 for t in tasks if t.status == "completed"),
+            "failed": sum(1 for t in tasks if t.status == "failed"),
+            "files_per_rfi": per_rfi,
+            "stats": scheduler.stats,
+            "tasks": [asdict(task) for task in tasks],
+        }
+
+
+def write_manifest(summary: Dict[str, Any], directory: Path) -> Path:
+    """Save the campaign summary as JSON (which task produced which RFI's files)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(path, "w") as f:
+        json.dump(summary, f, indent=2, default=str)
+    return path
+
+
+def print_campaign_plan(tasks: List[CampaignTask], manual: Dict[str, List[str]]) -> None:
+    table = Table(show_header=True, title="Campaign Tasks")
+    table.add_column("#", style="dim")
+    table.add_column("Tool", style="cyan")
+    table.add_column("Parameters")
+    table.add_column("Units")
+    table.add_column("RFIs")
+    for index, task in enumerate(tasks, 1):
+        params = ", ".join(f"{k}={v}" for k, v in sorted(normalize_params(task.tool, task.parameters).items()))
+        table.add_row(str(index), task.tool, params, ", ".join(task.units), ", ".join(task.rfi_codes))
+    console.print(table)
+
+    requested = sum(task.requests for task in tasks)
+    console.print(f"\n[bold]{requested} requested unit(s) -> {len(tasks)} unique task(s) "
+                  f"({requested - len(tasks)} duplicate execution(s) avoided)[/bold]")
+    for rfi_code, units in manual.items():
+        console.print(f"[dim]   {rfi_code}: no tool mapping for {', '.join(units)} (collect manually)[/dim]")
+
+
+def print_campaign_summary(summary: Dict[str, Any]) -> None:
+    table = Table(show_header=True, title="Evidence per RFI")
+    table.add_column("RFI", style="cyan")
+    table.add_column("Files", justify="right")
+    for rfi_code, count in sorted(summary["files_per_rfi"].items()):
+        table.add_row(rfi_code, str(count))
+    console.print(table)
+
+    stats = summary.get("stats", {})
+    status = "[green]✅" if summary["failed"] == 0 else "[yellow]⚠️ "
+    console.print(f"\n{status} {summary['completed']}/{summary['unique_tasks']} task(s) completed, "
+                  f"{summary['executions_saved']} duplicate execution(s) avoided[/]")
+    if stats:
+        console.print(f"[dim]   Wall {stats.get('wall_seconds', 0)}s, "
+                      f"task time {stats.get('step_seconds', 0)}s, "
+                      f"peak concurrency {stats.get('max_concurrency', 0)}[/dim]")
@@ -0,0 +1,306 @@
+"""
+Context Budget - Keep the agent's message list bounded
+
+Two problems made long evidence sessions slow down quadratically:
+a single tool result (Jira search, export listing) could be hundreds of KB,
+and every result was resent on every later iteration.
+
+- cap_tool_result(): results over a token budget are stored in a local
+  ToolResultStore and replaced by a structural preview plus a handle the
+  model can page through with the read_tool_result tool
+- compact(): once the context passes a threshold, tool results from older
+  rounds shrink to one-line stubs (their full text stays in the store), and
+  earlier conversation turns are folded into a single summary
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+console = Console()
+
+TOOL_RESULT_TOKENS = int(os.getenv("CONTEXT_TOOL_RESULT_TOKENS", "4000"))
+CONTEXT_MAX_TOKENS = int(os.getenv("CONTEXT_MAX_TOKENS", "60000"))
+KEEP_RECENT_ROUNDS = int(os.getenv("CONTEXT_KEEP_RECENT_ROUNDS", "2"))
+DEFAULT_PAGE_CHARS = 8000
+STORE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+_HANDLE = re.compile(r"^res_[0-9a-f]{16}$")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) - cheap enough to run every iteration."""
+    return len(text) // 4 + 1
+
+
+def estimate_message_tokens(messages: List[Dict[str, Any]]) -> int:
+    total = 0
+    for message in messages:
+        content = message.get("content", "") if isinstance(message, dict) else message
+        if isinstance(content, list):
+            total += sum(estimate_tokens(str(block.get("content", block)) if isinstance(block, dict) else str(block))
+                         for block in content)
+        else:
+            total += estimate_tokens(str(content))
+        if isinstance(message, dict) and message.get("tool_calls"):
+            total += estimate_tokens(json.dumps(message["tool_calls"], default=str))
+    return total
+
+
+class ToolResultStore:
+    """Full tool-result payloads on local disk, addressed by content handle."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or Path.home() / ".auditmate_cache" / "tool_results")
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._pruned = False
+
+    def put(self, text: str, tool_name: str = "") -> str:
+        """Store a payload and return its handle (identical payloads share one)."""
+        handle = "res_" + hashlib.sha256(text.encode()).hexdigest()[:16]
+        path = self.root / f"{handle}.json"
+        if not path.exists():
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"tool": tool_name, "stored_at": time.time(), "text": text}))
+            os.replace(tmp, path)
+        if not self._pruned:
+            self._prune()
+        return handle
+
+    def _load(self, handle: str) -> Optional[Dict[str, Any]]:
+        if not _HANDLE.match(handle or ""):
+            return None
+        path = self.root / f"{handle}.json"
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def read(self, handle: str, offset: int = 0, max_chars: int = DEFAULT_PAGE_CHARS, grep: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Page through a stored payload.
+
+        Args:
+            handle: Handle from a capped tool result
+            offset: Character offset to start from
+            max_chars: Page size
+            grep: If given, return only lines containing this text (case-insensitive)
+        """
+        record = self._load(handle)
+        if record is None:
+            raise KeyError(f"Unknown or expired result handle: {handle}")
+        text = record["text"]
+
+        if grep:
+            # Pretty-print JSON so matches come back as readable lines
+            try:
+                text = json.dumps(json.loads(text), indent=1, default=str)
+            except (json.JSONDecodeError, TypeError):
+                pass
+            needle = grep.lower()
+            lines = [line for line in text.splitlines() if needle in line.lower()]
+            text = "\n".join(lines)
+
+        page = text[offset:offset + max_chars]
+        next_offset = offset + len(page)
+        return {
+            "handle": handle,
+            "tool": record.get("tool"),
+            "total_chars": len(text),
+            "offset": offset,
+            "content": page,
+            "next_offset": next_offset if next_offset < len(text) else None
+        }
+
+    def _prune(self) -> None:
+        """Drop payloads older than a week (once per process)."""
+        self._pruned = True
+        cutoff = time.time() - STORE_MAX_AGE_SECONDS
+        for path in self.root.glob("res_*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+
+def _shrink(value: Any, max_items: int, max_chars: int) -> Any:
+    """Structure-preserving preview: long lists keep their head, long strings are clipped."""
+    if isinstance(value, dict):
+        return {k: _shrink(v, max_items, max_chars) for k, v in value.items()}
+    if isinstance(value, list):
+        head = [_shrink(v, max_items, max_chars) for v in value[:max_items]]
+        if len(value) > max_items:
+            head.append(f"... {len(value) - max_items} more items")
+        return head
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + f"... [{len(value) - max_chars} more chars]"
+    return value
+
+
+def build_preview(payload: Any, budget_tokens: int) -> str:
+    """Largest structural preview of payload that fits the budget."""
+    max_items, max_chars = 50, 2000
+    while True:
+        preview = json.dumps(_shrink(payload, max_items, max_chars), default=str)
+        if estimate_tokens(preview) <= budget_tokens or (max_items <= 1 and max_chars <= 100):
+            return preview[: budget_tokens * 4]
+        max_items = max(1, max_items // 2)
+        max_chars = max(100, max_chars // 2)
+
+
+class ContextBudget:
+    """Caps tool results and compacts the message list between agent iterations."""
+
+    def __init__(
+        self,
+        store: Optional[ToolResultStore] = None,
+        tool_result_tokens: int = TOOL_RESULT_TOKENS,
+        max_context_tokens: int = CONTEXT_MAX_TOKENS,
+        keep_recent_rounds: int = KEEP_RECENT_ROUNDS
+    ):
+        self.store = store or get_tool_result_store()
+        self.tool_result_tokens = tool_result_tokens
+        self.max_context_tokens = max_context_tokens
+        self.keep_recent_rounds = keep_recent_rounds
+        self.stats = {"capped_results": 0, "compactions": 0, "stubbed_results": 0, "summaries": 0}
+
+    def cap_tool_result(self, tool_name: str, content: str) -> str:
+        """Return content unchanged if within budget, else a preview + handle."""
+        if estimate_tokens(content) <= self.tool_result_tokens:
+            return content
+
+        handle = self.store.put(content, tool_name)
+        try:
+            payload = json.loads(content)
+        except (json.JSONDecodeError, TypeError):
+            payload = content
+        preview = build_preview(payload, int(self.tool_result_tokens * 0.8))
+        try:
+            preview = json.loads(preview)  # embed as JSON rather than an escaped string
+        except json.JSONDecodeError:
+            pass
+        self.stats["capped_results"] += 1
+        console.print(f"[dim]✂️  {tool_name}: result {len(content) // 1024} KB → preview (full result: {handle})[/dim]")
+        return json.dumps({
+            "status": payload.get("status", "success") if isinstance(payload, dict) else "success",
+            "truncated": True,
+            "result_handle": handle,
+            "total_chars": len(content),
+            "preview": preview,
+            "note": (
+                "Result was too large for context. The preview keeps the structure with long lists cut. "
+                "Use read_tool_result with this handle (offset / grep) to read the rest - do not re-run the tool."
+            )
+        })
+
+    # ------------------------------------------------------------------ #
+    # Compaction
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _is_tool_result_message(message: Dict[str, Any]) -> bool:
+        content = message.get("content")
+        return (
+            message.get("role") == "user"
+            and isinstance(content, list)
+            and any(isinstance(b, dict) and b.get("type") == "tool_result" for b in content)
+        )
+
+    def _stub_old_results(self, messages: List[Dict[str, Any]]) -> int:
+        """Replace tool results older than the recent rounds with one-line stubs."""
+        result_indexes = [i for i, m in enumerate(messages) if isinstance(m, dict) and self._is_tool_result_message(m)]
+        stubbed = 0
+        for index in result_indexes[:-self.keep_recent_rounds or None]:
+            blocks = []
+            for block in messages[index]["content"]:
+                content = block.get("content") if isinstance(block, dict) else None
+                if isinstance(content, str) and not content.startswith('{"compacted"') and len(content) > 400:
+                    handle = self.store.put(content)
+                    block = {**block, "content": json.dumps({
+                        "compacted": True,
+                        "result_handle": handle,
+                        "gist": content[:200]
+                    })}
+                    stubbed += 1
+                blocks.append(block)
+            messages[index] = {**messages[index], "content": blocks}
+        return stubbed
+
+    @staticmethod
+    def _current_request_index(messages: List[Dict[str, Any]]) -> int:
+        """Index of the latest plain-text user message (start of the current request)."""
+        for index in range(len(messages) - 1, -1, -1):
+            message = messages[index]
+            if isinstance(message, dict) and message.get("role") == "user" and isinstance(message.get("content"), str):
+                return index
+        return 0
+
+    def compact(
+        self,
+        messages: List[Dict[str, Any]],
+        summarize: Optional[Callable[[str], str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Shrink messages in place (and return them) once they pass the context threshold.
+
+        Args:
+            messages: Agent message list (dicts with role/content[/tool_calls])
+            summarize: text -> summary (an LLM call); falls back to clipping
+        """
+        if estimate_message_tokens(messages) <= self.max_context_tokens:
+            return messages
+        self.stats["compactions"] += 1
+        before = estimate_message_tokens(messages)
+
+        self.stats["stubbed_results"] += self._stub_old_results(messages)
+
+        # Still too big: fold earlier conversation turns into one summary exchange
+        current = self._current_request_index(messages)
+        if estimate_message_tokens(messages) > self.max_context_tokens and current >= 2:
+            earlier, rest = messages[:current], messages[current:]
+            transcript = "\n".join(
+                f"{m.get('role', '?')}: {m.get('content') if isinstance(m.get('content'), str) else '[tool data]'}"
+                for m in earlier if isinstance(m, dict)
+            )
+            summary = None
+            if summarize is not None:
+                try:
+                    summary = summarize(transcript)
+                except Exception as e:
+                    console.print(f"[dim]⚠️  Conversation summary failed, clipping instead: {e}[/dim]")
+            if not summary:
+                summary = transcript[-4000:]
+            messages[:] = [
+                {"role": "user", "content": f"[Summary of earlier conversation]\n{summary}"},
+                {"role": "assistant", "content": "Understood - continuing from that context."}
+            ] + rest
+            self.stats["summaries"] += 1
+
+        console.print(
+            f"[dim]🗜️  Context compacted: ~{before // 1000}K → ~{estimate_message_tokens(messages) // 1000}K tokens[/dim]"
+        )
+        return messages
+
+
+SUMMARY_PROMPT = """Summarize this earlier part of an audit-assistant conversation for the assistant's own memory.
+Keep: user goals, accounts/regions/RFI codes, files produced, decisions, open questions, result handles (res_...).
+Drop: pleasantries, raw data dumps. Max 300 words.
+
+{transcript}"""
+
+
+_tool_result_store: Optional[ToolResultStore] = None
+
+
+def get_tool_result_store() -> ToolResultStore:
+    """Get the shared ToolResultStore."""
+    global _tool_result_store
+    if _tool_result_store is None:
+        _tool_result_store = ToolResultStore()
+    return _tool_result_store
@@ -10,24 +10,61 @@ Features:
 6. Distributed locking
 7. Result aggregation
 8. Health monitoring
+9. Optional durable queue (SQLite): queued and running tasks survive restarts
+
+Durable mode (queue_path or DISTRIBUTED_QUEUE_PATH) stores tasks in an
+SQLiteTaskQueue instead of the in-memory PriorityQueue. Workers lease tasks,
+renew the lease while they run and record results in the database, so a
+crash loses nothing: orphaned tasks are claimed again and finished tasks are
+never rerun. Functions must be importable module-level callables or handlers
+registered with register_handler(); args and kwargs must be picklable.
+
+Completion is event-driven: every task has a concurrent.futures.Future that
+is resolved when the task finishes, so get_task_result(wait=True),
+wait_for_tasks() and the asyncio API (wait_for_task_async,
+gather_tasks_async) wake as soon as the result exists. Workers block on the
+queue instead of polling it, and task timeouts, lease renewals and retry
+wake-ups are timers on a TimerWheel rather than a once-a-second scan.
 """
 
+import asyncio
+import importlib
+import itertools
 import json
+import os
 import time
 import uuid
 import threading
 import queue
+from concurrent.futures import Future, wait as wait_futures
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field, asdict
+from pathlib import Path
 from enum import Enum
 from collections import defaultdict
 import pickle
 import hashlib
 from rich.console import Console
 
+from ai_brain.shared.task_queue import SQLiteTaskQueue
+from ai_brain.shared.timer_wheel import TimerWheel
+
 console = Console()
 
+# Durable mode: how often to look for work / results written by other processes
+DURABLE_POLL_SECONDS = float(os.getenv("DISTRIBUTED_QUEUE_POLL_SECONDS", "1"))
+HEALTH_CHECK_SECONDS = 1.0
+
+FINAL_TASK_STATUSES = ("completed", "failed", "cancelled")
+
+_STOP = object()  # Queue sentinel that wakes a blocked worker on stop()
+
+
+class TaskFailedError(Exception):
+    """Raised for a task that failed permanently (or timed out)"""
+
 
 class TaskStatus(Enum):
     """Task execution status"""
@@ -65,6 +102,9 @@ class Task:
     max_retries: int = 3
     worker_id: Optional[str] = None
     metadata: Dict = field(default_factory=dict)
+    idempotency_key: Optional[str] = None
+    lease_token: Optional[str] = None  # Durable mode: current lease
+    future: Future = field(default_factory=Future, repr=False, compare=False)
     
     def __lt__(self, other):
         """For priority queue comparison"""
@@ -102,7 +142,9 @@ class DistributedExecutor:
     def __init__(self, 
                  max_local_workers: int = 3,
                  task_timeout: int = 300,
-                 enable_remote: bool = False):
+                 enable_remote: bool = False,
+                 queue_path: Optional[str] = None,
+                 verbose: Optional[bool] = None):
         """
         Initialize distributed executor
         
@@ -110,16 +152,36 @@ class DistributedExecutor:
             max_local_workers: Maximum local worker threads
             task_timeout: Task execution timeout in seconds
             enable_remote: Enable remote worker support
+            queue_path: SQLite file for the durable queue (default: DISTRIBUTED_QUEUE_PATH,
+                unset = in-memory queue)
+            verbose: Log every task submission/start/completion
+                (default: DISTRIBUTED_EXECUTOR_VERBOSE; failures are always logged)
         """
         self.max_local_workers = max_local_workers
         self.task_timeout = task_timeout
         self.enable_remote = enable_remote
+        if verbose is None:
+            verbose = os.getenv("DISTRIBUTED_EXECUTOR_VERBOSE", "false").lower() == "true"
+        self.verbose = verbose
         
-        # Task management
+        # Task management: (-priority, sequence, task) so higher priority and then FIFO order wins
         self._task_queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
         self._tasks: Dict[str, Task] = {}
         self._task_lock = threading.Lock()
         
+        # Durable queue (optional)
+        self._handlers: Dict[str, Callable] = {}
+        self._work_available = threading.Event()
+        queue_path = queue_path or os.getenv("DISTRIBUTED_QUEUE_PATH")
+        self._durable: Optional[SQLiteTaskQueue] = None
+        if queue_path:
+            self._durable = SQLiteTaskQueue(Path(os.path.expanduser(queue_path)))
+            recovered = self._durable.recover_orphans()
+            counts = self._durable.counts()
+            console.print(f"[green]✅ Durable task queue: {self._durable.db_path} "
+                          f"({counts.get('pending', 0)} pending, {recovered} recovered from a crash)[/green]")
+        
         # Worker management
         self._workers: Dict[str, Worker] = {}
         self._worker_threads: Dict[str, threading.Thread] = {}
@@ -127,7 +189,11 @@ class DistributedExecutor:
         
         # Execution state
         self._running = False
-        self._coordinator_thread = None
+        self._timers = TimerWheel(name="distributed-timers")
+        self._timeout_timers: Dict[str, Any] = {}  # task_id -> timeout timer of a running task
+        self._current = threading.local()  # task running on the calling worker thread
+        self._lease_renewal_armed = False
+        self._health_check_armed = False
         
         # Statistics
         self._stats = {
@@ -190,15 +256,54 @@ class DistributedExecutor:
             self._workers[worker_id] = worker
         
         console.print(f"[green]✅ Added remote worker: {worker_id}[/green]")
+        if self._running:
+            self._arm_health_check()
         return worker_id
     
+    def register_handler(self, name: str, function: Callable):
+        """
+        Register a named task function (durable mode)
+        
+        Tasks submitted with this function are stored as the handler name, so
+        closures and bound methods can be queued durably. Register handlers
+        before start() so tasks recovered from the queue can be run.
+        """
+        self._handlers[name] = function
+    
+    def _function_ref(self, function: Callable) -> str:
+        """Durable reference for a task function: handler name or module:qualname"""
+        for name, handler in self._handlers.items():
+            if handler is function:
+                return name
+        module = getattr(function, "__module__", None)
+        qualname = getattr(function, "__qualname__", "")
+        if not module or not qualname or "<" in qualname:
+            raise ValueError(
+                f"Durable tasks need a module-level function or a registered handler, got {function!r}"
+            )
+        return f"{module}:{qualname}"
+    
+    def _resolve_function(self, ref: str) -> Callable:
+        """Function for a durable reference"""
+        if ref in self._handlers:
+            return self._handlers[ref]
+        module_name, _, qualname = ref.partition(":")
+        if not qualname:
+            raise ValueError(f"Unknown task handler: {ref}")
+        target = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part)
+        return target
+    
     def submit_task(self, 
                    function: Callable,
                    args: Tuple = (),
                    kwargs: Dict = None,
                    priority: TaskPriority = TaskPriority.NORMAL,
                    task_id: Optional[str] = None,
-                   metadata: Dict = None) -> str:
+                   metadata: Dict = None,
+                   idempotency_key: Optional[str] = None,
+                   max_retries: int = 3) -> str:
         """
         Submit a task for distributed execution
         
@@ -209,10 +314,20 @@ class DistributedExecutor:
             priority: Task priority
             task_id: Optional task ID (generated if not provided)
             metadata: Optional task metadata
+            idempotency_key: Durable mode: a task with this key is only ever queued once
+                (the existing task ID is returned)
+            max_retries: Attempts before the task is marked failed
             
         Returns:
             Task ID
         """
+        if self._durable is not None:
+            return self.submit_batch(
+                [(function, args, kwargs)], priority,
+                idempotency_keys=[idempotency_key], max_retries=max_retries,
+                task_ids=[task_id], metadata=metadata
+            )[0]
+        
         if task_id is None:
             task_id = str(uuid.uuid4())
         
@@ -222,16 +337,19 @@ class DistributedExecutor:
             args=args or (),
             kwargs=kwargs or {},
             priority=priority,
-            metadata=metadata or {}
+            max_retries=max_retries,
+            metadata=metadata or {},
+            idempotency_key=idempotency_key
         )
         
         with self._task_lock:
             self._tasks[task_id] = task
             self._stats["total_tasks"] += 1
         
-        self._task_queue.put((priority.value, task))
+        self._task_queue.put((-priority.value, next(self._sequence), task))
         
-        console.print(f"[cyan]📋 Task submitted: {task_id} (priority: {priority.name})[/cyan]")
+        if self.verbose:
+            console.print(f"[cyan]📋 Task submitted: {task_id} (priority: {priority.name})[/cyan]")
         
         # Start coordinator if not running
         if not self._running:
@@ -241,17 +359,28 @@ class DistributedExecutor:
     
     def submit_batch(self, 
                     tasks: List[Tuple[Callable, Tuple, Dict]],
-                    priority: TaskPriority = TaskPriority.NORMAL) -> List[str]:
+                    priority: TaskPriority = TaskPriority.NORMAL,
+                    idempotency_keys: Optional[List[Optional[str]]] = None,
+                    max_retries: int = 3,
+                    task_ids: Optional[List[Optional[str]]] = None,
+                    metadata: Dict = None) -> List[str]:
         """
         Submit multiple tasks as a batch
         
         Args:
             tasks: List of (function, args, kwargs) tuples
             priority: Priority for all tasks
+            idempotency_keys: Durable mode: one key (or None) per task
+            max_retries: Attempts per task before it is marked failed
+            task_ids: Optional task IDs, one per task
+            metadata: Optional metadata for all tasks
             
         Returns:
             List of task IDs
         """
+        if self._durable is not None:
+            return self._submit_durable(tasks, priority, idempotency_keys, max_retries, task_ids, metadata)
+        
         task_ids = []
         
         for func, args, kwargs in tasks:
@@ -261,6 +390,49 @@ class DistributedExecutor:
         console.print(f"[cyan]📋 Submitted batch of {len(task_ids)} tasks[/cyan]")
         return task_ids
     
+    def _submit_durable(self, tasks, priority, idempotency_keys, max_retries, task_ids, metadata) -> List[str]:
+        """Write tasks to the durable queue in one transaction"""
+        specs = []
+        for index, (func, args, kwargs) in enumerate(tasks):
+            try:
+                pickle.dumps((tuple(args or ()), kwargs or {}))
+            except Exception as e:
+                raise ValueError(f"Durable task arguments must be picklable: {e}") from e
+            specs.append({
+                "function": self._function_ref(func),
+                "args": args or (),
+                "kwargs": kwargs or {},
+                "priority": priority.value,
+                "max_retries": max_retries,
+                "task_id": (task_ids or [None] * len(tasks))[index],
+                "idempotency_key": (idempotency_keys or [None] * len(tasks))[index],
+                "metadata": metadata or {}
+            })
+        
+        results = self._durable.enqueue_many(specs)
+        created = 0
+        with self._task_lock:
+            for (task_id, is_new), spec, (func, args, kwargs) in zip(results, specs, tasks):
+                if not is_new:
+                    continue
+                created += 1
+                self._stats["total_tasks"] += 1
+                self._tasks[task_id] = Task(
+                    task_id=task_id, function=func, args=tuple(args or ()), kwargs=kwargs or {},
+                    priority=priority, max_retries=max_retries, metadata=metadata or {},
+                    idempotency_key=spec["idempotency_key"]
+                )
+        
+        skipped = len(results) - created
+        note = f", {skipped} already queued/completed" if skipped else ""
+        console.print(f"[cyan]📋 Queued {created} durable task(s) (priority: {priority.name}{note})[/cyan]")
+        self._work_available.set()
+        
+        if not self._running:
+            self.start()
+        
+        return [task_id for task_id, _ in results]
+    
     def start(self):
         """Start the distributed executor"""
         if self._running:
@@ -268,9 +440,9 @@ class DistributedExecutor:
         
         self._running = True
         
-        # Start coordinator thread
-        self._coordinator_thread = threading.Thread(target=self._coordinate, daemon=True)
-        self._coordinator_thread.start()
+        # Timeouts, lease renewals and health checks run as timers
+        self._timers.start()
+        self._arm_health_check()
         
         # Start local worker threads
         for worker_id, worker in self._workers.items():
@@ -281,22 +453,24 @@ class DistributedExecutor:
         
         console.print("[bold green]🚀 Distributed executor started[/bold green]")
     
-    def _coordinate(self):
-        """Coordinator thread to monitor and manage execution"""
-        while self._running:
-            try:
-                # Monitor worker health
-                self._check_worker_health()
-                
-                # Check for timeout tasks
-                self._check_task_timeouts()
-                
-                # Update statistics
-                self._update_stats()
-                
-                time.sleep(1)
-            except Exception as e:
-                console.print(f"[red]❌ Coordinator error: {e}[/red]")
+    def _arm_health_check(self):
+        """Check remote worker heartbeats every second (only while remote workers exist)"""
+        with self._worker_lock:
+            if self._health_check_armed or not any(w.worker_type != "local" for w in self._workers.values()):
+                return
+            self._health_check_armed = True
+        self._timers.schedule(HEALTH_CHECK_SECONDS, self._health_check_tick)
+    
+    def _health_check_tick(self):
+        with self._worker_lock:
+            self._health_check_armed = False
+        if not self._running:
+            return
+        try:
+            self._check_worker_health()
+        except Exception as e:
+            console.print(f"[red]❌ Coordinator error: {e}[/red]")
+        self._arm_health_check()
     
     def _worker_loop(self, worker_id: str):
         """Worker thread loop"""
@@ -309,19 +483,158 @@ class DistributedExecutor:
         while self._running:
             try:
                 # Get next task from queue
-                try:
-                    priority, task = self._task_queue.get(timeout=1)
-                except queue.Empty:
-                    continue
+                if self._durable is not None:
+                    task = self._claim_durable(worker_id)
+                    if task is None:
+                        # Woken by local submits and retry timers; the timeout only
+                        # covers tasks enqueued by other processes
+                        self._work_available.wait(timeout=DURABLE_POLL_SECONDS)
+                        self._work_available.clear()
+                        continue
+                else:
+                    _, _, task = self._task_queue.get()
+                    if task is _STOP:
+                        continue
                 
                 # Execute task
-                self._execute_task(worker_id, task)
+                try:
+                    self._execute_task(worker_id, task)
+                finally:
+                    self._current.task = None
                 
             except Exception as e:
                 console.print(f"[red]❌ Worker {worker_id} error: {e}[/red]")
         
         console.print(f"[dim]👷 Worker {worker_id} stopped[/dim]")
     
+    def _claim_durable(self, worker_id: str) -> Optional[Task]:
+        """Lease the next task from the durable queue"""
+        row = self._durable.claim(worker_id)
+        if row is None:
+            return None
+        
+        with self._task_lock:
+            task = self._tasks.get(row["task_id"])
+        if task is None:
+            # Submitted by another process or before a restart
+            try:
+                function = self._resolve_function(row["function"])
+            except Exception as e:
+                self._durable.fail(row["task_id"], row["lease_token"], f"Cannot load task function: {e}", retry=False)
+                console.print(f"[red]❌ Task {row['task_id']} has no runnable function ({row['function']}): {e}[/red]")
+                return None
+            task = Task(
+                task_id=row["task_id"],
+                function=function,
+                args=tuple(row["args"]),
+                kwargs=row["kwargs"],
+                priority=TaskPriority(row["priority"]),
+                max_retries=row["max_retries"],
+                metadata=row["metadata"],
+                idempotency_key=row["idempotency_key"]
+            )
+            with self._task_lock:
+                self._tasks[task.task_id] = task
+        
+        with self._task_lock:
+            task.lease_token = row["lease_token"]
+            task.retries = row["attempts"] - 1
+        return task
+    
+    def _arm_lease_renewal(self):
+        """Renew leases a third of the way into the visibility timeout while durable tasks run"""
+        with self._task_lock:
+            if self._lease_renewal_armed:
+                return
+            self._lease_renewal_armed = True
+        self._timers.schedule(self._durable.visibility_timeout / 3, self._renew_leases)
+    
+    def _renew_leases(self):
+        """Extend leases of durable tasks this process is running"""
+        with self._task_lock:
+            self._lease_renewal_armed = False
+            tokens = [
+                task.lease_token for task in self._tasks.values()
+                if task.status == TaskStatus.RUNNING and task.lease_token
+            ]
+        if not tokens:
+            return
+        try:
+            self._durable.extend(tokens)
+        except Exception as e:
+            console.print(f"[red]❌ Lease renewal failed: {e}[/red]")
+        if self._running:
+            self._arm_lease_renewal()
+    
+    def _on_task_timeout(self, task: Task, started_at: datetime):
+        """Timer callback: fail a task that is still running past task_timeout"""
+        with self._task_lock:
+            if task.status != TaskStatus.RUNNING or task.started_at != started_at:
+                return
+            execution_time = (datetime.now() - started_at).total_seconds()
+            console.print(f"[red]⏰ Task {task.task_id} exceeded timeout ({execution_time:.0f}s)[/red]")
+            task.status = TaskStatus.FAILED
+            task.error = f"Task timeout after {execution_time:.0f}s"
+            task.completed_at = datetime.now()
+            self._stats["failed_tasks"] += 1
+            if self._durable is not None and task.lease_token:
+                self._durable.fail(task.task_id, task.lease_token, task.error, retry=False)
+                task.lease_token = None
+        self._resolve_future(task)
+    
+    def _cancel_timeout(self, task: Task):
+        with self._task_lock:
+            timer = self._timeout_timers.pop(task.task_id, None)
+        if timer is not None:
+            timer.cancel()
+    
+    @contextmanager
+    def task_timeout_paused(self):
+        """
+        Stop the calling task's timeout clock while it waits for a shared resource.
+        
+        Task functions that queue for something exclusive (e.g. the single browser
+        session) wait inside this block, so waiting doesn't count toward
+        task_timeout; the full timeout starts again when the block exits.
+        
+        Raises:
+            TaskFailedError: If the task already timed out (nothing should run)
+        """
+        task = getattr(self._current, "task", None)
+        if task is None:
+            yield  # Not called from a worker thread
+            return
+        self._cancel_timeout(task)
+        with self._task_lock:
+            if task.status != TaskStatus.RUNNING:
+                raise TaskFailedError(f"Task {task.task_id} timed out before it got to run")
+        try:
+            yield
+        finally:
+            with self._task_lock:
+                if task.status == TaskStatus.RUNNING:
+                    self._timeout_timers[task.task_id] = self._timers.schedule(
+                        self.task_timeout, self._on_task_timeout, task, task.started_at
+                    )
+    
+    def _resolve_future(self, task: Task):
+        """Wake everyone waiting on a task that reached a final status"""
+        future = task.future
+        if future.done():
+            return
+        if task.status == TaskStatus.COMPLETED:
+            future.set_result(task.result)
+        elif task.status == TaskStatus.FAILED:
+            future.set_exception(TaskFailedError(f"Task failed: {task.error}"))
+        elif task.status == TaskStatus.CANCELLED:
+            future.cancel()
+    
+    def _schedule_retry_wakeup(self, task_id: str):
+        """Wake a worker when a durable retry becomes due (its backoff has passed)"""
+        row = self._durable.get(task_id)
+        if row and row["status"] == TaskStatus.PENDING.value:
+            self._timers.schedule(max(0.0, row["available_at"] - time.time()), self._work_available.set)
+    
     def _execute_task(self, worker_id: str, task: Task):
         """Execute a task on a worker"""
         worker = self._workers.get(worker_id)
@@ -333,30 +646,52 @@ class DistributedExecutor:
             task.status = TaskStatus.RUNNING
             task.started_at = datetime.now()
             task.worker_id = worker_id
+            started_at = task.started_at
         
         worker.current_task = task.task_id
-        worker.last_heartbeat = datetime.now()
+        worker.last_heartbeat = started_at
+        
+        with self._task_lock:
+            self._timeout_timers[task.task_id] = self._timers.schedule(
+                self.task_timeout, self._on_task_timeout, task, started_at
+            )
+        self._current.task = task
+        if self._durable is not None:
+            self._arm_lease_renewal()
         
-        console.print(f"[cyan]⚙️  Worker {worker_id} executing task {task.task_id}[/cyan]")
+        if self.verbose:
+            console.print(f"[cyan]⚙️  Worker {worker_id} executing task {task.task_id}[/cyan]")
         
         try:
             # Execute the function
             start_time = time.time()
             result = task.function(*task.args, **task.kwargs)
             execution_time = time.time() - start_time
+            self._cancel_timeout(task)
+            
+            if task.status != TaskStatus.RUNNING or task.started_at != started_at:
+                # Timed out (already failed and reported) while the function kept running
+                worker.current_task = None
+                return
             
             # Task succeeded
+            if self._durable is not None and task.lease_token:
+                if not self._durable.complete(task.task_id, task.lease_token, result):
+                    console.print(f"[yellow]⚠️  Task {task.task_id} finished after losing its lease; result not recorded[/yellow]")
             with self._task_lock:
                 task.status = TaskStatus.COMPLETED
                 task.completed_at = datetime.now()
                 task.result = result
+                task.lease_token = None
                 self._stats["completed_tasks"] += 1
                 self._stats["total_execution_time"] += execution_time
             
             worker.tasks_completed += 1
             worker.current_task = None
+            self._resolve_future(task)
             
-            console.print(f"[green]✅ Task {task.task_id} completed ({execution_time:.2f}s)[/green]")
+            if self.verbose:
+                console.print(f"[green]✅ Task {task.task_id} completed ({execution_time:.2f}s)[/green]")
             
             # Trigger callbacks
             for callback in self._on_task_complete:
@@ -367,15 +702,30 @@ class DistributedExecutor:
         
         except Exception as e:
             # Task failed
+            self._cancel_timeout(task)
+            if task.status != TaskStatus.RUNNING or task.started_at != started_at:
+                worker.current_task = None
+                return
+            retry_wakeup = False
             with self._task_lock:
                 task.error = str(e)
                 task.retries += 1
                 
-                if task.retries < task.max_retries:
+                if self._durable is not None:
+                    # The queue decides (and schedules the retry with backoff)
+                    outcome = self._durable.fail(task.task_id, task.lease_token, str(e)) if task.lease_token else None
+                    task.lease_token = None
+                    retry = outcome != "failed"
+                    retry_wakeup = outcome == "pending"
+                else:
+                    retry = task.retries < task.max_retries
+                
+                if retry:
                     # Retry task
                     task.status = TaskStatus.RETRYING
                     console.print(f"[yellow]🔄 Task {task.task_id} failed, retrying ({task.retries}/{task.max_retries})[/yellow]")
-                    self._task_queue.put((task.priority.value, task))
+                    if self._durable is None:
+                        self._task_queue.put((-task.priority.value, next(self._sequence), task))
                 else:
                     # Max retries exceeded
                     task.status = TaskStatus.FAILED
@@ -392,6 +742,9 @@ class DistributedExecutor:
             
             worker.tasks_failed += 1
             worker.current_task = None
+            if retry_wakeup:
+                self._schedule_retry_wakeup(task.task_id)
+            self._resolve_future(task)
     
     def _check_worker_health(self):
         """Check health of all workers"""
@@ -410,33 +763,51 @@ class DistributedExecutor:
                         worker.is_active = False
                         console.print(f"[yellow]⚠️  Worker {worker_id} unhealthy (no heartbeat for {heartbeat_age:.0f}s)[/yellow]")
     
-    def _check_task_timeouts(self):
-        """Check for tasks that have exceeded timeout"""
-        current_time = datetime.now()
-        
-        with self._task_lock:
-            for task_id, task in self._tasks.items():
-                if task.status == TaskStatus.RUNNING and task.started_at:
-                    execution_time = (current_time - task.started_at).total_seconds()
-                    
-                    if execution_time > self.task_timeout:
-                        console.print(f"[red]⏰ Task {task_id} exceeded timeout ({execution_time:.0f}s)[/red]")
-                        task.status = TaskStatus.FAILED
-                        task.error = f"Task timeout after {execution_time:.0f}s"
-                        task.completed_at = current_time
-                        self._stats["failed_tasks"] += 1
-    
-    def _update_stats(self):
-        """Update execution statistics"""
-        # Could add more sophisticated metrics here
-        pass
-    
     def get_task_status(self, task_id: str) -> Optional[TaskStatus]:
         """Get status of a specific task"""
+        if self._durable is not None:
+            # The queue is the source of truth (any process may have run the task)
+            row = self._durable.get(task_id)
+            return TaskStatus(row["status"]) if row else None
         with self._task_lock:
             task = self._tasks.get(task_id)
             return task.status if task else None
     
+    def get_task_future(self, task_id: str) -> Optional[Future]:
+        """
+        Future resolved when the task finishes in this process
+        
+        The result is the task's return value; a permanently failed or timed
+        out task raises TaskFailedError. None for unknown task IDs.
+        """
+        with self._task_lock:
+            task = self._tasks.get(task_id)
+        return task.future if task else None
+    
+    def _wait_until_final(self, task_id: str, timeout: Optional[float]) -> bool:
+        """Block until the task reaches a final status. Returns False on timeout."""
+        future = self.get_task_future(task_id)
+        if self._durable is None:
+            if future is None:
+                return True  # Unknown task: nothing to wait for
+            wait_futures([future], timeout=timeout)
+            return future.done()
+        
+        # Durable: local runs resolve the future; runs in other processes are seen in the queue
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.get_task_status(task_id)
+            if status is None or status.value in FINAL_TASK_STATUSES:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            step = DURABLE_POLL_SECONDS if remaining is None else min(DURABLE_POLL_SECONDS, remaining)
+            if future is not None and not future.done():
+                wait_futures([future], timeout=step)
+            else:
+                time.sleep(step)
+    
     def get_task_result(self, task_id: str, wait: bool = False, timeout: float = None) -> Any:
         """
         Get result of a completed task
@@ -449,26 +820,24 @@ class DistributedExecutor:
         Returns:
             Task result or None
         """
-        if wait:
-            start_time = time.time()
-            while True:
-                status = self.get_task_status(task_id)
-                
-                if status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                    break
-                
-                if timeout and (time.time() - start_time) > timeout:
-                    console.print(f"[yellow]⏰ Timeout waiting for task {task_id}[/yellow]")
-                    return None
-                
-                time.sleep(0.1)
+        if wait and not self._wait_until_final(task_id, timeout or None):
+            console.print(f"[yellow]⏰ Timeout waiting for task {task_id}[/yellow]")
+            return None
+        
+        if self._durable is not None:
+            row = self._durable.get(task_id)
+            if row and row["status"] == TaskStatus.COMPLETED.value:
+                return row["result"]
+            elif row and row["status"] == TaskStatus.FAILED.value:
+                raise TaskFailedError(f"Task failed: {row['error']}")
+            return None
         
         with self._task_lock:
             task = self._tasks.get(task_id)
             if task and task.status == TaskStatus.COMPLETED:
                 return task.result
             elif task and task.status == TaskStatus.FAILED:
-                raise Exception(f"Task failed: {task.error}")
+                raise TaskFailedError(f"Task failed: {task.error}")
             return None
     
     def wait_for_tasks(self, task_ids: List[str], timeout: float = None) -> Dict[str, Any]:
@@ -480,11 +849,26 @@ class DistributedExecutor:
             timeout: Maximum wait time
             
         Returns:
-            Dictionary mapping task_id to result
+            Dictionary mapping task_id to result ("Error: ..." for failed tasks;
+            tasks still running at the timeout are left out)
         """
         results = {}
-        start_time = time.time()
         
+        if self._durable is None:
+            futures = {task_id: self.get_task_future(task_id) for task_id in task_ids}
+            wait_futures([f for f in futures.values() if f is not None], timeout=timeout or None)
+            for task_id in task_ids:
+                future = futures[task_id]
+                if future is None:
+                    results[task_id] = None
+                elif future.done():
+                    try:
+                        results[task_id] = future.result()
+                    except Exception as e:
+                        results[task_id] = f"Error: {e}"
+            return results
+        
+        start_time = time.time()
         for task_id in task_ids:
             remaining_timeout = None
             if timeout:
@@ -492,16 +876,53 @@ class DistributedExecutor:
                 if remaining_timeout <= 0:
                     break
             
+            if not self._wait_until_final(task_id, remaining_timeout):
+                break
             try:
-                result = self.get_task_result(task_id, wait=True, timeout=remaining_timeout)
-                results[task_id] = result
+                results[task_id] = self.get_task_result(task_id)
             except Exception as e:
                 results[task_id] = f"Error: {e}"
         
         return results
     
+    async def wait_for_task_async(self, task_id: str, timeout: float = None) -> Any:
+        """
+        Awaitable task result
+        
+        Raises:
+            TaskFailedError: The task failed permanently or timed out
+            asyncio.TimeoutError: Not finished within timeout (the task keeps running)
+        """
+        future = self.get_task_future(task_id)
+        if future is not None and self._durable is None:
+            # shield: giving up on the wait must not cancel the task's future
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(None, self._wait_until_final, task_id, timeout):
+            raise asyncio.TimeoutError(f"Task {task_id} not finished after {timeout}s")
+        return self.get_task_result(task_id)
+    
+    async def gather_tasks_async(self, task_ids: List[str], timeout: float = None) -> Dict[str, Any]:
+        """Awaitable wait_for_tasks (same result shape)"""
+        waiters = {
+            asyncio.ensure_future(self.wait_for_task_async(task_id, timeout)): task_id
+            for task_id in task_ids
+        }
+        if not waiters:
+            return {}
+        done, _ = await asyncio.wait(waiters)
+        results = {}
+        for waiter in done:
+            error = waiter.exception()
+            if isinstance(error, asyncio.TimeoutError):
+                continue
+            results[waiters[waiter]] = f"Error: {error}" if error else waiter.result()
+        return {task_id: results[task_id] for task_id in task_ids if task_id in results}
+    
     def get_stats(self) -> Dict:
         """Get execution statistics"""
+        queue_counts = self._durable.counts() if self._durable is not None else None
         with self._task_lock, self._worker_lock:
             avg_execution_time = (
                 self._stats["total_execution_time"] / max(self._stats["completed_tasks"], 1)
@@ -511,7 +932,8 @@ class DistributedExecutor:
                 "total_tasks": self._stats["total_tasks"],
                 "completed_tasks": self._stats["completed_tasks"],
                 "failed_tasks": self._stats["failed_tasks"],
-                "pending_tasks": self._task_queue.qsize(),
+                "pending_tasks": queue_counts.get("pending", 0) if queue_counts is not None else self._task_queue.qsize(),
+                "durable_queue": queue_counts,
                 "active_workers": sum(1 for w in self._workers.values() if w.is_active),
                 "total_workers": len(self._workers),
                 "avg_execution_time": avg_execution_time,
@@ -540,11 +962,15 @@ class DistributedExecutor:
         console.print("[yellow]🛑 Stopping distributed executor...[/yellow]")
         self._running = False
         
-        if self._coordinator_thread:
-            self._coordinator_thread.join(timeout=2)
+        # Wake blocked workers: sentinels sort ahead of every queued task
+        for _ in self._worker_threads:
+            self._task_queue.put((float("-inf"), next(self._sequence), _STOP))
+        self._work_available.set()
+        self._timers.stop()
         
         for thread in self._worker_threads.values():
             thread.join(timeout=2)
+        self._worker_threads.clear()
         
         console.print("[green]✅ Distributed executor stopped[/green]")
         
@@ -557,14 +983,16 @@ class DistributedExecutor:
 _distributed_executor = None
 
 
-def get_distributed_executor(max_workers: int = 3, enable_remote: bool = False) -> DistributedExecutor:
+def get_distributed_executor(max_workers: int = 3, enable_remote: bool = False,
+                             queue_path: Optional[str] = None) -> DistributedExecutor:
     """Get or create the global distributed executor"""
     global _distributed_executor
     
     if _distributed_executor is None:
         _distributed_executor = DistributedExecutor(
             max_local_workers=max_workers,
-            enable_remote=enable_remote
+            enable_remote=enable_remote,
+            queue_path=queue_path
         )
     
     return _distributed_executor
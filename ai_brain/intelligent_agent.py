@@ -15,12 +15,20 @@ from .tools_definition import get_tool_definitions
 from .tool_executor import ToolExecutor
 from .conversation_history import ConversationHistory
 from .advisor_llm import AdvisorLLM
+from .llm_cache import get_llm_cache
+from .prompt_cache import CompiledPrompt, detect_provider, get_prompt_compiler
+from .tool_selector import ToolSelector, REQUEST_MORE_TOOLS
+from .tool_concurrency import run_tool_calls
+from .context_budget import ContextBudget, SUMMARY_PROMPT
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from evidence_manager.local_evidence_manager import LocalEvidenceManager
 
 console = Console()
 
+# chat() never raises; failures come back as a reply starting with this
+CHAT_ERROR_PREFIX = "I encountered an error: "
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime, date, and Decimal objects"""
@@ -52,6 +60,9 @@ class IntelligentAgent:
         # Pass LLM to ToolExecutor for intelligent evidence analysis
         self.tool_executor = ToolExecutor(self.evidence_manager, llm=self.llm)
         self.tools = get_tool_definitions()
+        self.prompt_compiler = get_prompt_compiler()
+        self.tool_selector = ToolSelector(self.tools)
+        self.context_budget = ContextBudget()
         self.conversation_history = []
         
         # Initialize persistent conversation history
@@ -163,7 +174,7 @@ class IntelligentAgent:
             console.print(f"[red]❌ Error: {e}[/red]")
             import traceback
             traceback.print_exc()
-            return f"I encountered an error: {str(e)}"
+            return f"{CHAT_ERROR_PREFIX}{str(e)}"
     
     def _process_with_tools(self) -> str:
         """
@@ -171,11 +182,20 @@ class IntelligentAgent:
         Claude decides if/which tools to use
         """
         
-        system_prompt = self._get_system_prompt()
+        system_prompt = self._compile_system_prompt()
         
-        # Prepare messages for Claude
+        # Prepare messages for Claude (fold old turns into a summary once history gets long)
+        self.context_budget.compact(self.conversation_history, summarize=self._summarize_for_compaction)
         messages = self.conversation_history.copy()
         
+        # Send only the tool families this request needs (model can ask for more)
+        user_texts = [
+            m.get('content') for m in messages
+            if isinstance(m, dict) and m.get('role') == 'user' and isinstance(m.get('content'), str)
+        ]
+        if user_texts:
+            self.tool_selector.select(user_texts[-1], user_texts[-3:-1])
+        
         # Call Claude with tool use enabled
         # Dynamic iteration logic: increase allowance for evidence collection workflows
         # Default minimal iterations keeps chat snappy; evidence collection often needs more tool cycles
@@ -262,8 +282,9 @@ class IntelligentAgent:
 
         # Incorporate orchestrator execution plan if already present
         try:
-            if hasattr(self.tool_executor, 'orchestrator') and self.tool_executor.orchestrator and self.tool_executor.orchestrator.execution_plan:
-                plan_obj = self.tool_executor.orchestrator.execution_plan
+            orchestrator = self.tool_executor.get_loaded_subsystem('orchestrator')
+            if orchestrator and orchestrator.execution_plan:
+                plan_obj = orchestrator.execution_plan
                 steps = plan_obj.get('execution_plan', [])
                 sc_steps = sum(1 for s in steps if s.get('tool') == 'aws_take_screenshot')
                 total_steps = len(steps)
@@ -289,6 +310,9 @@ class IntelligentAgent:
             
             # For Bedrock/Claude, use invoke with tools
             try:
+                # Keep the resent context bounded: stub old tool results / summarize old turns
+                self.context_budget.compact(messages, summarize=self._summarize_for_compaction)
+                
                 # Unified safe invocation (with automatic credential diagnostics)
                 response = self._safe_llm_invoke(messages, system_prompt, use_tools=True)
                 # If response is an injected error object, short-circuit
@@ -299,23 +323,32 @@ class IntelligentAgent:
                 if hasattr(response, 'tool_calls') and response.tool_calls:
                     console.print(f"[cyan]🔧 Claude is using tools...[/cyan]")
                     
-                    # Execute each tool Claude requested
-                    tool_results = []
+                    # Execute the tools Claude requested (independent API calls run in parallel)
+                    calls = []
                     for tool_call in response.tool_calls:
                         tool_name = tool_call['name']
                         tool_input = tool_call['args']
-                        tool_call_id = tool_call.get('id', f"call_{tool_name}")
+                        calls.append({
+                            "name": tool_name,
+                            "args": tool_input,
+                            "id": tool_call.get('id', f"call_{tool_name}")
+                        })
+                        # Widen the offered tool set if the model used a tool outside it
+                        self.tool_selector.escalate_for(tool_name)
                         
                         console.print(f"[yellow]📌 Calling: {tool_name}[/yellow]")
                         console.print(f"[dim]   Parameters: {json.dumps(tool_input, indent=2, cls=DateTimeEncoder)}[/dim]\n")
-                        
-                        # Execute tool (INSIDE the loop!)
-                        result = self.tool_executor.execute_tool(tool_name, tool_input)
+                    
+                    results = run_tool_calls(calls, self._execute_tool_call)
+                    
+                    tool_results = []
+                    for call, result in zip(calls, results):
+                        tool_call_id = call["id"]
                         
                         # Check if tool returned an error (not implemented)
                         if result.get('status') == 'error':
                             error_msg = result.get('error', 'Tool execution failed')
-                            console.print(f"[red]❌ Tool Error: {error_msg}[/red]\n")
+                            console.print(f"[red]❌ Tool Error ({call['name']}): {error_msg}[/red]\n")
                             
                             # Format tool result for Claude
                             tool_results.append({
@@ -329,11 +362,13 @@ class IntelligentAgent:
                                 }, cls=DateTimeEncoder)
                             })
                         else:
-                            # Successful tool execution
+                            # Successful tool execution (large results become preview + handle)
                             tool_results.append({
                                 "type": "tool_result",
                                 "tool_use_id": tool_call_id,
-                                "content": json.dumps(result, cls=DateTimeEncoder)
+                                "content": self.context_budget.cap_tool_result(
+                                    call["name"], json.dumps(result, cls=DateTimeEncoder)
+                                )
                             })
                     
                     # Add assistant message with tool calls
@@ -368,8 +403,42 @@ class IntelligentAgent:
         
         return "I've completed the maximum number of tool iterations. Let me know if you need anything else!"
     
+    def _execute_tool_call(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one model tool call (handles the request_more_tools meta tool)"""
+        if tool_name == REQUEST_MORE_TOOLS:
+            selection = self.tool_selector.escalate(tool_input.get('families'))
+            return {
+                "status": "success",
+                "result": {
+                    "message": "Additional tools are now available",
+                    "tool_count": len(selection.tools)
+                }
+            }
+        return self.tool_executor.execute_tool(tool_name, tool_input)
+    
+    def _summarize_for_compaction(self, transcript: str) -> str:
+        """LLM summary of earlier conversation turns (used by context compaction)"""
+        prompt = SUMMARY_PROMPT.format(transcript=transcript[-60000:])
+        response = get_llm_cache().invoke(self.llm, prompt, namespace="compaction")
+        return getattr(response, 'content', str(response))
+    
     def _get_system_prompt(self) -> str:
         """System prompt that teaches Claude how to use tools"""
+        return self._compile_system_prompt().text
+    
+    def _compile_system_prompt(self) -> CompiledPrompt:
+        """
+        System prompt split for prompt caching: the static instructions are
+        built once per process, only the date/context suffix changes per turn.
+        """
+        return self.prompt_compiler.compile_system_prompt(
+            "agent_system",
+            self._get_static_system_prompt,
+            self._get_dynamic_system_context()
+        )
+    
+    def _get_dynamic_system_context(self) -> str:
+        """Per-turn part of the system prompt (date and recent conversation)"""
         # Get current date/time for context
         from datetime import datetime
         current_date = datetime.now().strftime("%B %d, %Y")
@@ -382,11 +451,13 @@ class IntelligentAgent:
             if context_snippet:
                 context_snippet = f"\n\n📜 RECENT CONVERSATION CONTEXT:\n{context_snippet}\n\n"
         
-        return f"""You are AuditMate, an intelligent audit evidence collection assistant powered by Claude 3.5 Sonnet.
-{context_snippet}
-
-⏰ CRITICAL: Today's date is {current_date}. The current year is {current_year}.
+        return f"""⏰ CRITICAL: Today's date is {current_date}. The current year is {current_year}.
 When users mention dates like "2025", "today", "this year", or "till now", use {current_year} as the reference year.
+{context_snippet}"""
+    
+    def _get_static_system_prompt(self) -> str:
+        """Static part of the system prompt (identical every turn)"""
+        return f"""You are AuditMate, an intelligent audit evidence collection assistant powered by Claude 3.5 Sonnet.
 
 🚀 **REVOLUTIONARY NEW PARADIGM: YOU ARE NOW A CODING AGENT!**
 
@@ -1389,15 +1460,28 @@ Use your intelligence to decide the best approach for each request!"""
             console.print(f"[red]❌ OpenAI fallback failed: {e}[/red]")
             return None
 
-    def _safe_llm_invoke(self, messages: List[Dict], system_prompt: str, use_tools: bool = True):
+    def _safe_llm_invoke(self, messages: List[Dict], system_prompt, use_tools: bool = True):
         """Invoke LLM with unified error handling & automatic provider fallback.
-        Returns original response object OR a lightweight shim with content + _injected_error flag."""
+        Returns original response object OR a lightweight shim with content + _injected_error flag.
+        
+        system_prompt may be a plain string or a CompiledPrompt (static prefix gets a cache breakpoint)."""
         try:
-            payload = [{"role": "system", "content": system_prompt}] + messages
+            if isinstance(system_prompt, CompiledPrompt):
+                system_content = system_prompt.as_system_content(detect_provider(self.llm))
+            else:
+                system_content = system_prompt
+            payload = [{"role": "system", "content": system_content}] + messages
             if use_tools and hasattr(self.llm, 'bind_tools'):
-                llm_with_tools = self.llm.bind_tools(self.tools)
-                return llm_with_tools.invoke(payload)
-            return self.llm.invoke(payload)
+                # Bound once per (model, tool set) instead of on every iteration
+                active_tools = self.tool_selector.active_tools
+                llm_with_tools = self.prompt_compiler.bind_tools(self.llm, active_tools)
+                response = llm_with_tools.invoke(payload)
+                self.prompt_compiler.record_turn(system_prompt, messages, response, tools=active_tools)
+                return response
+            # Not cached: this is also the error-recovery path, which must see the live conversation
+            response = self.llm.invoke(payload)
+            self.prompt_compiler.record_turn(system_prompt, messages, response)
+            return response
         except Exception as e:
             msg = str(e)
             if 'ResourceNotFoundException' in msg and 'use case' in msg.lower():
@@ -4,12 +4,17 @@ Uses Universal Intelligence to adapt to any file format dynamically
 No more hardcoded CSV/PDF logic - the LLM decides how to parse and extract!
 """
 
+from __future__ import annotations
+
 import os
 import json
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from rich.console import Console
-import pandas as pd
+
+from ai_brain.shared.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")  # Loaded on first export
 
 console = Console()
 
@@ -0,0 +1,316 @@
+"""
+LLM Response Cache - Reuse answers to repeated planning/validation prompts
+
+Orchestration prompts (plans, contracts, complexity analysis, "ask the brain")
+are resent many times with only whitespace, timestamps or request ids
+changing. This layer sits in front of llm.invoke():
+
+- Prompt normalization: values the app injects on every call (the agent's
+  "Today's date is ..." line, labelled fields such as timestamp/generated_at/
+  request_id) are masked and whitespace collapsed before hashing. Dates,
+  times and ids anywhere else are part of the question and are kept
+- Exact hits on sha256(model + namespace + normalized prompt)
+- Optional semantic hits: embedding cosine similarity above a threshold
+  (LLM_CACHE_EMBEDDINGS=bedrock|openai, LLM_CACHE_SIMILARITY)
+- Persistence through the shared AdvancedCacheManager (memory + SQLite disk)
+- Only plain-text answers are cached; tool-calling and image prompts bypass it
+"""
+
+import hashlib
+import math
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from ai_brain.advanced_cache import get_advanced_cache
+
+console = Console()
+
+DEFAULT_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+DEFAULT_SIMILARITY = float(os.getenv("LLM_CACHE_SIMILARITY", "0.97"))
+MAX_SEMANTIC_ENTRIES = 1000
+
+# Only known per-call injections: a timestamp the user asked about (a CloudTrail
+# window, a key id) must still change the key
+_VOLATILE_FIELDS = (
+    r"current[ _]time|current[ _]date|timestamp|generated(?:[ _]at)?|fetched[ _]at|"
+    r"request[ _]id|run[ _]id|task[ _]id|trace[ _]id|session[ _]id"
+)
+_VOLATILE_PATTERNS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"(Today's date is )[^.\n]+\.( The current year is )\d{4}"), r"\1<date>.\2<year>"),
+    (re.compile(rf"""(?i)(\b(?:{_VOLATILE_FIELDS})\b["']?\s*[:=]\s*["']?)[^"',}}\n]+"""), r"\1<volatile>"),
+]
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Mask per-call injected values and collapse whitespace."""
+    for pattern, replacement in _VOLATILE_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def normalize_prompt(prompt: Any) -> Optional[str]:
+    """
+    Canonical text for a prompt (str, message dicts or LangChain messages).
+
+    Returns None when the prompt can't be cached (e.g. it contains images).
+    """
+    if isinstance(prompt, str):
+        return normalize_text(prompt)
+    if not isinstance(prompt, (list, tuple)):
+        return None
+
+    parts = []
+    for message in prompt:
+        if isinstance(message, dict):
+            role, content = message.get("role", ""), message.get("content", "")
+        elif isinstance(message, (list, tuple)) and len(message) == 2:
+            role, content = message
+        else:
+            role, content = getattr(message, "type", ""), getattr(message, "content", "")
+        if isinstance(content, list):
+            texts = []
+            for block in content:
+                if isinstance(block, str):
+                    texts.append(block)
+                elif isinstance(block, dict) and block.get("type") == "text":
+                    texts.append(block.get("text", ""))
+                else:
+                    return None  # images / tool blocks
+            content = " ".join(texts)
+        if not isinstance(content, str):
+            return None
+        parts.append(f"[{role}] {normalize_text(content)}")
+    return "\n".join(parts)
+
+
+def _model_id(llm: Any) -> str:
+    for attr in ("model_id", "model_name", "model", "deployment_name"):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(llm).__name__
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _default_embedder() -> Optional[Callable[[str], List[float]]]:
+    """Embedding function from LLM_CACHE_EMBEDDINGS, or None (exact hits only)."""
+    provider = os.getenv("LLM_CACHE_EMBEDDINGS", "").lower()
+    try:
+        if provider == "bedrock":
+            from langchain_aws import BedrockEmbeddings
+            model = BedrockEmbeddings(
+                model_id=os.getenv("BEDROCK_EMBEDDING_MODEL_ID", "amazon.titan-embed-text-v2:0"),
+                region_name=os.getenv("BEDROCK_REGION", os.getenv("AWS_REGION", "us-east-1"))
+            )
+            return model.embed_query
+        if provider == "openai":
+            from langchain_openai import OpenAIEmbeddings
+            return OpenAIEmbeddings(model=os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")).embed_query
+    except Exception as e:
+        console.print(f"[yellow]⚠️  LLM cache embeddings unavailable ({provider}): {e}[/yellow]")
+    return None
+
+
+class CachedLLMResponse:
+    """Stands in for an AIMessage returned from cache."""
+
+    def __init__(self, content: str, cache_hit: str):
+        self.content = content
+        self.tool_calls: List[Dict[str, Any]] = []
+        self.response_metadata = {"cache": cache_hit}
+
+    def __str__(self) -> str:
+        return self.content
+
+
+class LLMResponseCache:
+    """Exact + optional semantic cache for LLM text responses."""
+
+    def __init__(
+        self,
+        store=None,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Args:
+            store: Backing cache (default: shared AdvancedCacheManager)
+            ttl: Seconds a cached response stays valid
+            embed_fn: text -> vector for semantic hits (default: from LLM_CACHE_EMBEDDINGS)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            enabled: Override LLM_CACHE_ENABLED
+        """
+        if enabled is None:
+            enabled = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        self.enabled = enabled
+        self.store = store
+        self.ttl = ttl
+        self.embed_fn = embed_fn if embed_fn is not None else _default_embedder()
+        self.similarity_threshold = similarity_threshold
+        self._semantic_index: Dict[str, List[Tuple[List[float], str]]] = {}
+        self._index_lock = threading.Lock()
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "stores": 0, "bypassed": 0}
+
+    def _get_store(self):
+        if self.store is None:
+            self.store = get_advanced_cache()
+        return self.store
+
+    # ------------------------------------------------------------------ #
+    # Semantic index (persisted alongside the entries)
+    # ------------------------------------------------------------------ #
+
+    def _index_for(self, scope: str) -> List[Tuple[List[float], str]]:
+        with self._index_lock:
+            if scope not in self._semantic_index:
+                persisted = self._get_store().get(f"llm:semidx:{scope}") or []
+                self._semantic_index[scope] = [(vec, key) for vec, key in persisted]
+            return self._semantic_index[scope]
+
+    def _semantic_lookup(self, scope: str, vector: List[float]) -> Optional[str]:
+        best_key, best_score = None, self.similarity_threshold
+        for candidate, key in self._index_for(scope):
+            score = _cosine(vector, candidate)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _semantic_add(self, scope: str, vector: List[float], key: str) -> None:
+        index = self._index_for(scope)
+        with self._index_lock:
+            index.append((vector, key))
+            del index[:-MAX_SEMANTIC_ENTRIES]
+            snapshot = list(index)
+        self._get_store().set(f"llm:semidx:{scope}", snapshot, ttl=self.ttl, tags=["llm"])
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    def invoke(
+        self,
+        llm: Any,
+        prompt: Any,
+        namespace: str = "default",
+        validate: Optional[Callable[[str], bool]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        llm.invoke(prompt) with caching.
+
+        Args:
+            llm: LangChain chat model (or anything with .invoke)
+            prompt: String or list of messages
+            namespace: Caller group, e.g. 'orchestrator' (also an invalidation tag)
+            validate: Only cache responses whose text passes this check (e.g. parses as JSON)
+        """
+        normalized = normalize_prompt(prompt) if self.enabled else None
+        if normalized is None:
+            self.stats["bypassed"] += 1
+            return llm.invoke(prompt, **kwargs)
+
+        scope = f"{namespace}:{_model_id(llm)}"
+        digest = hashlib.sha256((scope + "\n" + normalized).encode()).hexdigest()
+        key = f"llm:{namespace}:{digest}"
+        store = self._get_store()
+
+        cached = store.get(key)
+        if cached is not None:
+            self.stats["exact_hits"] += 1
+            return CachedLLMResponse(cached["content"], "exact")
+
+        vector = None
+        if self.embed_fn is not None:
+            try:
+                vector = self.embed_fn(normalized)
+                similar_key = self._semantic_lookup(scope, vector)
+                cached = store.get(similar_key) if similar_key else None
+                if cached is not None:
+                    self.stats["semantic_hits"] += 1
+                    console.print(f"[dim]🧠 LLM cache: semantic hit ({namespace})[/dim]")
+                    return CachedLLMResponse(cached["content"], "semantic")
+            except Exception as e:
+                console.print(f"[dim]⚠️  LLM cache embedding failed: {e}[/dim]")
+                vector = None
+
+        self.stats["misses"] += 1
+        response = llm.invoke(prompt, **kwargs)
+
+        content = getattr(response, "content", None)
+        if (
+            isinstance(content, str)
+            and content.strip()
+            and not getattr(response, "tool_calls", None)
+            and not getattr(response, "_injected_error", False)
+            and (validate is None or validate(content))
+        ):
+            store.set(key, {"content": content, "created_at": time.time()}, ttl=self.ttl, tags=["llm", f"llm:{namespace}"])
+            self.stats["stores"] += 1
+            if vector is not None:
+                self._semantic_add(scope, vector, key)
+        return response
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """Drop cached responses for one namespace (or all)."""
+        with self._index_lock:
+            self._semantic_index.clear()
+        store = self._get_store()
+        if namespace:
+            return store.invalidate(tag=f"llm:{namespace}")
+        return store.invalidate(tag="llm")
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["exact_hits"] + self.stats["semantic_hits"] + self.stats["misses"]
+        hits = self.stats["exact_hits"] + self.stats["semantic_hits"]
+        return {
+            **self.stats,
+            "hit_rate": f"{(hits / lookups * 100) if lookups else 0:.1f}%",
+            "semantic_enabled": self.embed_fn is not None
+        }
+
+
+class CachedLLM:
+    """
+    Wraps a chat model so invoke() goes through the response cache.
+
+    bind_tools() returns the underlying model's bound runnable unchanged:
+    tool-calling turns are never cached.
+    """
+
+    def __init__(self, llm: Any, namespace: str = "default", cache: Optional[LLMResponseCache] = None):
+        self.llm = llm
+        self.namespace = namespace
+        self.cache = cache or get_llm_cache()
+
+    def invoke(self, prompt: Any, **kwargs) -> Any:
+        return self.cache.invoke(self.llm, prompt, namespace=self.namespace, **kwargs)
+
+    def bind_tools(self, tools, **kwargs):
+        return self.llm.bind_tools(tools, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm, name)
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the shared LLM response cache."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+    return _llm_cache
@@ -1,14 +1,55 @@
 """
 Flexible LLM Configuration
 Supports: OpenAI GPT-4, Anthropic Claude, AWS Bedrock, Azure OpenAI
+Plus a local 'stub' provider for tests and offline runs, and
+'record' / 'replay' providers for deterministic offline benchmarks
+
+Provider SDKs are imported inside their _create_* factory, so only the
+selected provider's package is loaded.
 """
 
+import json
 import os
-from typing import Optional
-from langchain_openai import ChatOpenAI, AzureChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_aws import ChatBedrock
-import boto3
+from typing import Dict, List, Optional
+
+
+class StubResponse:
+    """Minimal AIMessage look-alike returned by StubLLM"""
+    
+    def __init__(self, content: str):
+        self.content = content
+        self.tool_calls: List[Dict] = []
+    
+    def __str__(self) -> str:
+        return self.content
+
+
+class StubLLM:
+    """
+    Deterministic local LLM for tests and offline runs (LLM_PROVIDER=stub)
+    
+    Replies with the first `responses` entry whose key appears in the prompt,
+    otherwise with `default_response` (LLM_STUB_RESPONSE, default "{}").
+    Every prompt is recorded in `calls`.
+    """
+    
+    model_name = "stub"
+    
+    def __init__(self, responses: Optional[Dict[str, str]] = None, default_response: Optional[str] = None, **kwargs):
+        self.responses = responses or {}
+        self.default_response = default_response if default_response is not None else os.getenv('LLM_STUB_RESPONSE', '{}')
+        self.calls: List[str] = []
+    
+    def invoke(self, prompt, **kwargs) -> StubResponse:
+        text = prompt if isinstance(prompt, str) else json.dumps(prompt, default=str)
+        self.calls.append(text)
+        for needle, reply in self.responses.items():
+            if needle in text:
+                return StubResponse(reply)
+        return StubResponse(self.default_response)
+    
+    def bind_tools(self, tools, **kwargs):
+        return self
 
 
 class LLMFactory:
@@ -23,7 +64,7 @@ class LLMFactory:
         Create LLM instance based on provider
         
         Args:
-            provider: 'openai', 'anthropic', 'bedrock', 'azure', or auto-detect
+            provider: 'openai', 'anthropic', 'bedrock', 'azure', 'stub', 'record', 'replay', or auto-detect
             **kwargs: Provider-specific configuration
         
         Returns:
@@ -41,12 +82,30 @@ class LLMFactory:
             return LLMFactory._create_bedrock(**kwargs)
         elif provider == 'azure':
             return LLMFactory._create_azure(**kwargs)
+        elif provider == 'stub':
+            return StubLLM(**kwargs)
+        elif provider == 'record':
+            return LLMFactory._create_recording(**kwargs)
+        elif provider == 'replay':
+            from ai_brain.llm_replay import ReplayLLM
+            return ReplayLLM(path=kwargs.pop('transcript_path', None), **kwargs)
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
     
+    @staticmethod
+    def _create_recording(**kwargs):
+        """Wrap the real provider (LLM_RECORD_PROVIDER) and record a replay transcript"""
+        from ai_brain.llm_replay import RecordingLLM
+        inner = kwargs.pop('record_provider', None) or os.getenv('LLM_RECORD_PROVIDER', 'bedrock').lower()
+        if inner in ('record', 'replay'):
+            raise ValueError(f"Cannot record provider: {inner}")
+        path = kwargs.pop('transcript_path', None)
+        return RecordingLLM(LLMFactory.create_llm(inner, **kwargs), path)
+    
     @staticmethod
     def _create_openai(**kwargs):
         """Create OpenAI GPT-4 instance"""
+        from langchain_openai import ChatOpenAI
         return ChatOpenAI(
             model=kwargs.get('model', os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview')),
             temperature=kwargs.get('temperature', 0),
@@ -57,6 +116,7 @@ class LLMFactory:
     @staticmethod
     def _create_anthropic(**kwargs):
         """Create Anthropic Claude instance"""
+        from langchain_anthropic import ChatAnthropic
         return ChatAnthropic(
             model=kwargs.get('model', os.getenv('ANTHROPIC_MODEL', 'claude-3-opus-20240229')),
             temperature=kwargs.get('temperature', 0),
@@ -70,6 +130,7 @@ class LLMFactory:
         Create AWS Bedrock instance
         Supports: Claude, Titan, Llama, etc.
         """
+        from langchain_aws import ChatBedrock
         # Default to Claude 3.5 Sonnet on Bedrock
         model_id = kwargs.get('model', os.getenv(
             'BEDROCK_MODEL_ID',
@@ -91,6 +152,7 @@ class LLMFactory:
     @staticmethod
     def _create_azure(**kwargs):
         """Create Azure OpenAI instance"""
+        from langchain_openai import AzureChatOpenAI
         return AzureChatOpenAI(
             azure_deployment=kwargs.get('deployment', os.getenv('AZURE_OPENAI_DEPLOYMENT')),
             azure_endpoint=kwargs.get('endpoint', os.getenv('AZURE_OPENAI_ENDPOINT')),
@@ -160,6 +222,18 @@ class LLMFactory:
             if missing:
                 return False, f"Missing Azure config: {', '.join(missing)}"
         
+        elif provider == 'stub':
+            pass  # Local, no configuration needed
+        
+        elif provider == 'record':
+            inner = os.getenv('LLM_RECORD_PROVIDER', 'bedrock').lower()
+            if inner in ('record', 'replay'):
+                return False, f"LLM_RECORD_PROVIDER cannot be '{inner}'"
+            return LLMFactory.validate_configuration(inner)
+        
+        elif provider == 'replay':
+            pass  # Reads LLM_TRANSCRIPT_PATH; missing transcripts fall back to empty replies
+        
         else:
             return False, f"Unknown provider: {provider}"
         
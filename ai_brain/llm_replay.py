@@ -0,0 +1,265 @@
+"""
+LLM Record / Replay - Run the agent loop offline and deterministically
+
+- RecordingLLM wraps a real chat model and appends every request/response
+  pair (plus measured latency) to a JSONL transcript
+- ReplayLLM serves responses from that transcript with no network access,
+  optionally sleeping for the recorded (or a fixed) latency
+
+Requests are matched by a fingerprint of the normalized prompt and tool set.
+When the prompt differs from the recording (stubbed tool output, new date),
+the next unconsumed response in recorded order is used, so a replay of the
+same scenario always takes the same path.
+
+LLMFactory exposes both as providers: LLM_PROVIDER=record (wrapping
+LLM_RECORD_PROVIDER) and LLM_PROVIDER=replay, with LLM_TRANSCRIPT_PATH.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from ai_brain.llm_cache import normalize_text
+
+console = Console()
+
+DEFAULT_TRANSCRIPT_PATH = os.getenv(
+    "LLM_TRANSCRIPT_PATH",
+    str(Path.home() / ".auditmate_cache" / "llm_transcripts" / "default.jsonl")
+)
+
+
+class ReplayMissError(RuntimeError):
+    """Raised by a strict ReplayLLM when the transcript has no response left."""
+
+
+def _canonical_content(content: Any) -> Any:
+    """Provider-independent form of message content (drops cache_control, joins text blocks)."""
+    if isinstance(content, list):
+        if all(isinstance(b, dict) and b.get("type") == "text" for b in content):
+            return "\n\n".join(b.get("text", "") for b in content)
+        return [
+            {k: v for k, v in b.items() if k != "cache_control"} if isinstance(b, dict) else b
+            for b in content
+        ]
+    return content
+
+
+def _canonical_prompt(prompt: Any) -> Any:
+    if isinstance(prompt, str):
+        return prompt
+    messages = []
+    for message in prompt if isinstance(prompt, (list, tuple)) else [prompt]:
+        if isinstance(message, dict):
+            role, content = message.get("role", ""), message.get("content", "")
+            extra = {"tool_calls": message["tool_calls"]} if message.get("tool_calls") else {}
+        else:
+            role, content = getattr(message, "type", ""), getattr(message, "content", str(message))
+            extra = {}
+        messages.append({"role": role, "content": _canonical_content(content), **extra})
+    return messages
+
+
+def request_fingerprint(prompt: Any, tools: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Hash of the normalized prompt plus the names of the bound tools."""
+    text = normalize_text(json.dumps(_canonical_prompt(prompt), sort_keys=True, default=str))
+    tool_names = sorted(t.get("name", "") for t in tools or [] if isinstance(t, dict))
+    return hashlib.sha256((text + "\n" + ",".join(tool_names)).encode()).hexdigest()[:24]
+
+
+def prompt_size(prompt: Any) -> int:
+    """Serialized prompt size in bytes."""
+    return len(json.dumps(_canonical_prompt(prompt), default=str).encode())
+
+
+class ReplayResponse:
+    """AIMessage look-alike rebuilt from a transcript entry."""
+
+    def __init__(self, content: Any, tool_calls: Optional[List[Dict[str, Any]]] = None, usage: Optional[Dict] = None):
+        self.content = content
+        self.tool_calls = tool_calls or []
+        self.usage_metadata = usage or {}
+        self.response_metadata = {"replayed": True}
+
+    def __str__(self) -> str:
+        return self.content if isinstance(self.content, str) else json.dumps(self.content, default=str)
+
+
+class RecordingLLM:
+    """Pass-through wrapper that appends every invoke() to a transcript."""
+
+    def __init__(self, llm: Any, path: Optional[str] = None, tools: Optional[List[Dict[str, Any]]] = None, _state: Optional[Dict] = None):
+        self.llm = llm
+        self.path = Path(path or DEFAULT_TRANSCRIPT_PATH)
+        self.tools = tools
+        # Bound copies share the sequence counter and file lock with their parent
+        self._state = _state or {"seq": 0, "lock": threading.Lock(), "calls": []}
+        if _state is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists():
+                # Appending to an existing transcript: keep sequence numbers increasing
+                with open(self.path) as f:
+                    self._state["seq"] = sum(1 for line in f if line.strip())
+            console.print(f"[dim]⏺️  Recording LLM transcript to {self.path}[/dim]")
+
+    def invoke(self, prompt: Any, **kwargs) -> Any:
+        started = time.time()
+        response = self.llm.invoke(prompt, **kwargs)
+        latency_ms = int((time.time() - started) * 1000)
+
+        usage = getattr(response, "usage_metadata", None) or {}
+        entry = {
+            "key": request_fingerprint(prompt, self.tools),
+            "model": getattr(self.llm, "model_id", None) or getattr(self.llm, "model_name", None) or type(self.llm).__name__,
+            "prompt_bytes": prompt_size(prompt),
+            "latency_ms": latency_ms,
+            "response": {
+                "content": getattr(response, "content", str(response)),
+                "tool_calls": list(getattr(response, "tool_calls", None) or []),
+                "usage": dict(usage) if isinstance(usage, dict) else {}
+            },
+            "recorded_at": time.time()
+        }
+        with self._state["lock"]:
+            entry["seq"] = self._state["seq"]
+            self._state["seq"] += 1
+            self._state["calls"].append({"prompt_bytes": entry["prompt_bytes"], "latency_ms": latency_ms})
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+        return response
+
+    @property
+    def calls(self) -> List[Dict[str, Any]]:
+        """One record per invoke(): prompt bytes and measured latency."""
+        return self._state["calls"]
+
+    def bind_tools(self, tools, **kwargs):
+        return RecordingLLM(self.llm.bind_tools(tools, **kwargs), self.path, tools, _state=self._state)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm, name)
+
+
+class ReplayLLM:
+    """
+    Serves recorded responses from a transcript - no network, deterministic.
+
+    Args:
+        path: Transcript written by RecordingLLM
+        latency: 'recorded' (sleep for the recorded latency), 'none', or fixed milliseconds
+        latency_scale: Multiplier applied to recorded latency
+        strict: Raise ReplayMissError when the transcript is exhausted (else reply with fallback_response)
+    """
+
+    model_name = "replay"
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        latency: Optional[str] = None,
+        latency_scale: Optional[float] = None,
+        strict: Optional[bool] = None,
+        fallback_response: str = "{}",
+        tools: Optional[List[Dict[str, Any]]] = None,
+        _shared: Optional[Dict] = None,
+        **kwargs
+    ):
+        self.tools = tools
+        if _shared is not None:
+            self._shared = _shared
+            return
+
+        path = Path(path or DEFAULT_TRANSCRIPT_PATH)
+        entries = []
+        if path.exists():
+            with open(path) as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        else:
+            console.print(f"[yellow]⚠️  LLM transcript not found: {path} (replay will use fallback responses)[/yellow]")
+        entries.sort(key=lambda e: e.get("seq", 0))
+
+        if strict is None:
+            strict = os.getenv("LLM_REPLAY_STRICT", "false").lower() == "true"
+        self._shared = {
+            "path": path,
+            "entries": entries,
+            "consumed": [False] * len(entries),
+            "latency": str(latency if latency is not None else os.getenv("LLM_REPLAY_LATENCY", "recorded")).lower(),
+            "scale": float(latency_scale if latency_scale is not None else os.getenv("LLM_REPLAY_LATENCY_SCALE", "1.0")),
+            "strict": strict,
+            "fallback": fallback_response,
+            "lock": threading.Lock(),
+            "calls": [],
+            "stats": {"exact": 0, "in_order": 0, "misses": 0}
+        }
+
+    @property
+    def calls(self) -> List[Dict[str, Any]]:
+        """One record per invoke(): match kind, prompt bytes, simulated latency."""
+        return self._shared["calls"]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return self._shared["stats"]
+
+    def reset(self) -> None:
+        """Rewind the transcript (start a new run)."""
+        with self._shared["lock"]:
+            self._shared["consumed"] = [False] * len(self._shared["entries"])
+            self._shared["calls"].clear()
+            for name in self._shared["stats"]:
+                self._shared["stats"][name] = 0
+
+    def _take(self, key: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        entries, consumed = self._shared["entries"], self._shared["consumed"]
+        with self._shared["lock"]:
+            for index, entry in enumerate(entries):
+                if not consumed[index] and entry.get("key") == key:
+                    consumed[index] = True
+                    return entry, "exact"
+            for index, entry in enumerate(entries):
+                if not consumed[index]:
+                    consumed[index] = True
+                    return entry, "in_order"
+        return None, "miss"
+
+    def _delay_seconds(self, entry: Optional[Dict[str, Any]]) -> float:
+        mode = self._shared["latency"]
+        if mode in ("none", "0", ""):
+            return 0.0
+        if mode == "recorded":
+            return (entry or {}).get("latency_ms", 0) / 1000 * self._shared["scale"]
+        return float(mode) / 1000
+
+    def invoke(self, prompt: Any, **kwargs) -> ReplayResponse:
+        key = request_fingerprint(prompt, self.tools)
+        entry, match = self._take(key)
+        delay = self._delay_seconds(entry)
+        if delay:
+            time.sleep(delay)
+
+        stats_key = "misses" if match == "miss" else match
+        with self._shared["lock"]:
+            self._shared["stats"][stats_key] += 1
+            self._shared["calls"].append({
+                "match": match,
+                "prompt_bytes": prompt_size(prompt),
+                "latency_ms": int(delay * 1000),
+                "tools": len(self.tools or [])
+            })
+
+        if entry is None:
+            if self._shared["strict"]:
+                raise ReplayMissError(f"Transcript {self._shared['path']} has no response left for request {key}")
+            return ReplayResponse(self._shared["fallback"])
+        response = entry.get("response", {})
+        return ReplayResponse(response.get("content", ""), response.get("tool_calls"), response.get("usage"))
+
+    def bind_tools(self, tools, **kwargs):
+        return ReplayLLM(tools=list(tools), _shared=self._shared)
@@ -21,8 +21,11 @@ This creates a truly autonomous, self-improving agent.
 import os
 import json
 import time
+import hashlib
+import inspect
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from rich.console import Console
@@ -30,9 +33,13 @@ from rich.panel import Panel
 import re
 
 from ai_brain.enhancement_manager import EnhancementManager
+from ai_brain.llm_cache import get_llm_cache, normalize_text
+from ai_brain.advanced_cache import get_advanced_cache
 
 console = Console()
 
+CONTRACT_CACHE_TTL_SECONDS = int(os.getenv("META_CONTRACT_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
 
 @dataclass
 class ToolContract:
@@ -104,18 +111,18 @@ class MetaIntelligence:
     6. **Self-Healing**: Fixes broken tools automatically
     """
     
-    def __init__(self, llm, tool_executor, orchestrator):
+    def __init__(self, llm, tool_executor, orchestrator=None):
         """
         Initialize Meta-Intelligence
         
         Args:
             llm: LLM instance (Claude/Bedrock)
             tool_executor: Tool executor with all tools
-            orchestrator: AI Orchestrator for planning
+            orchestrator: AI Orchestrator for planning (default: the executor's, resolved on first use)
         """
         self.llm = llm
         self.tool_executor = tool_executor
-        self.orchestrator = orchestrator
+        self._orchestrator = orchestrator
         self.capability_map = self._build_capability_map()
         self.enhancement_history = []
         self.failure_patterns = []
@@ -131,6 +138,17 @@ class MetaIntelligence:
         self.ground_truth_validators = self._build_ground_truth_validators()
         self.enhancement_manager = EnhancementManager()
         
+        # Parallel tool calls share this instance; see execute_with_meta_intelligence
+        self._state_lock = threading.RLock()
+        
+        # Request-scoped complexity analysis and persisted tool contracts
+        self._analysis_lock = threading.Lock()
+        self._request_analysis: Optional[Tuple[str, Dict[str, Any]]] = None
+        self._tool_schemas: Optional[Dict[str, Dict[str, Any]]] = None
+        self._tool_versions: Dict[str, str] = {}
+        self.contract_fast_path = os.getenv("META_CONTRACT_FAST_PATH", "true").lower() == "true"
+        self.contract_stats = {"analysis_calls": 0, "analysis_reuses": 0, "fast_path": 0, "cache_hits": 0, "llm_contracts": 0}
+        
         # Initialize Auto-Fix Engine
         from ai_brain.knowledge_manager import get_knowledge_manager
         from ai_brain.auto_fix_engine import AutoFixEngine
@@ -140,6 +158,12 @@ class MetaIntelligence:
         console.print("[dim]  Self-evolving multi-dimensional agent ready[/dim]")
         console.print(f"[dim]  Auto-fix: {'ENABLED' if self.auto_fix.enabled else 'DISABLED'}[/dim]\n")
     
+    @property
+    def orchestrator(self):
+        if self._orchestrator is None:
+            self._orchestrator = getattr(self.tool_executor, "orchestrator", None)
+        return self._orchestrator
+    
     def _build_capability_map(self) -> Dict[str, Dict]:
         """
         Build comprehensive capability map of what agent can do
@@ -273,6 +297,11 @@ class MetaIntelligence:
             except json.JSONDecodeError:
                 return None
     
+    @classmethod
+    def _is_json_response(cls, content: str) -> bool:
+        """Only parseable JSON answers are worth caching."""
+        return bool(cls._safe_json_load(cls._extract_json_block(content)))
+    
     def _get_recent_memory_for_prompt(self, limit: int = 3) -> str:
         """Return compact JSON summary of recent executions for prompting."""
         if not self.request_memory:
@@ -398,6 +427,192 @@ class MetaIntelligence:
             raw=contract_dict
         )
     
+    # ------------------------------------------------------------------ #
+    # Contract cache / deterministic fast path
+    # ------------------------------------------------------------------ #
+    
+    def _get_tool_schemas(self) -> Dict[str, Dict[str, Any]]:
+        """input_schema per tool name from the compiled tool catalog."""
+        if self._tool_schemas is None:
+            try:
+                from ai_brain.tools_definition import get_tool_definitions
+                self._tool_schemas = {
+                    tool["name"]: tool.get("input_schema", {}) for tool in get_tool_definitions()
+                }
+            except Exception as e:
+                console.print(f"[dim]⚠️  Tool schemas unavailable for contract fast path: {e}[/dim]")
+                self._tool_schemas = {}
+        return self._tool_schemas
+    
+    def _tool_version(self, tool_name: str) -> str:
+        """Hash of the tool's schema and implementation source (changes invalidate cached contracts)."""
+        if tool_name not in self._tool_versions:
+            schema = self._get_tool_schemas().get(tool_name, {})
+            source = ""
+            executor_cls = type(self.tool_executor)
+            method = getattr(executor_cls, f"_execute_{tool_name}", None)
+            try:
+                if method is None:
+                    # The registry maps the tool to its implementing executor method
+                    from ai_brain.tool_registry import get_tool_registry
+                    tool_info = get_tool_registry().get_tool_info(tool_name) or {}
+                    method = getattr(executor_cls, tool_info.get("method") or "", None)
+                source = inspect.getsource(method if method is not None else executor_cls)
+            except (OSError, TypeError, AttributeError):
+                pass
+            payload = json.dumps(schema, sort_keys=True) + "\n" + source
+            self._tool_versions[tool_name] = hashlib.sha256(payload.encode()).hexdigest()[:12]
+        return self._tool_versions[tool_name]
+    
+    @staticmethod
+    def _param_shape(tool_params: Dict[str, Any]) -> str:
+        """Signature of parameter names and value types (not values)."""
+        shape = {key: type(value).__name__ for key, value in sorted((tool_params or {}).items())}
+        return hashlib.sha256(json.dumps(shape, sort_keys=True).encode()).hexdigest()[:12]
+    
+    def _contract_cache_key(self, tool_name: str, tool_params: Dict[str, Any]) -> str:
+        return f"meta:contract:{tool_name}:{self._param_shape(tool_params)}:{self._tool_version(tool_name)}"
+    
+    @staticmethod
+    def _contract_from_dict(contract_dict: Dict[str, Any]) -> ToolContract:
+        return ToolContract(
+            tool=contract_dict["tool"],
+            intent=contract_dict["intent"],
+            inputs=contract_dict["inputs"],
+            success_criteria=contract_dict["success_criteria"],
+            preconditions=contract_dict.get("preconditions", []),
+            post_validations=contract_dict.get("post_validations", []),
+            fallback_plan=contract_dict.get("fallback_plan", []),
+            execution_constraints=contract_dict.get("execution_constraints", {}),
+            raw=contract_dict
+        )
+    
+    @staticmethod
+    def _matches_schema_type(value: Any, expected: Any) -> bool:
+        checks = {
+            "string": lambda v: isinstance(v, str),
+            "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+            "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+            "boolean": lambda v: isinstance(v, bool),
+            "array": lambda v: isinstance(v, list),
+            "object": lambda v: isinstance(v, dict),
+        }
+        types = expected if isinstance(expected, list) else [expected]
+        return any(checks.get(t, lambda v: True)(value) for t in types if t) or not any(types)
+    
+    def _fast_path_contract(self, tool_name: str, tool_params: Dict[str, Any]) -> Optional[ToolContract]:
+        """
+        Deterministic contract for a well-formed call to a known tool (no LLM).
+        
+        Well-formed: every required parameter present and non-empty, no unknown
+        parameters, and values match the declared type / enum.
+        """
+        schema = self._get_tool_schemas().get(tool_name)
+        if not self.contract_fast_path or not schema:
+            return None
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        params = tool_params or {}
+        
+        if any(ToolContract._is_missing(params.get(name)) for name in required):
+            return None
+        for key, value in params.items():
+            spec = properties.get(key)
+            if spec is None:
+                return None
+            if value is None:
+                continue
+            if "type" in spec and not self._matches_schema_type(value, spec["type"]):
+                return None
+            if "enum" in spec and value not in spec["enum"]:
+                return None
+        
+        contract_dict = {
+            "tool": tool_name,
+            "intent": f"Execute {tool_name} with validated parameters",
+            "inputs": {
+                "required": list(required),
+                "optional": [name for name in properties if name not in required],
+                "final_payload": dict(params)
+            },
+            "success_criteria": [
+                "Tool returns status=success",
+                "Result payload is not empty"
+            ],
+            "preconditions": [],
+            "post_validations": [],
+            "fallback_plan": [],
+            "execution_constraints": {},
+            "source": "fast_path"
+        }
+        return self._contract_from_dict(contract_dict)
+    
+    def _cached_contract(self, tool_name: str, tool_params: Dict[str, Any]) -> Optional[ToolContract]:
+        """Contract previously built for this tool and parameter shape, with this call's values."""
+        cached = get_advanced_cache().get(self._contract_cache_key(tool_name, tool_params))
+        if not cached:
+            return None
+        contract_dict = json.loads(json.dumps(cached))
+        inputs = contract_dict.setdefault("inputs", {})
+        # Defaults the LLM filled in for absent params are kept; supplied params always win
+        template = inputs.get("final_payload") if isinstance(inputs.get("final_payload"), dict) else {}
+        inputs["final_payload"] = {
+            **{k: v for k, v in template.items() if k not in (tool_params or {})},
+            **(tool_params or {})
+        }
+        contract_dict["source"] = "cache"
+        return self._contract_from_dict(contract_dict)
+    
+    def _store_contract(self, tool_name: str, tool_params: Dict[str, Any], contract_dict: Dict[str, Any]) -> None:
+        """Persist an LLM-built contract; values the caller supplied are not stored."""
+        stored = json.loads(json.dumps(contract_dict, default=str))
+        inputs = stored.get("inputs", {})
+        if isinstance(inputs.get("final_payload"), dict):
+            inputs["final_payload"] = {
+                k: v for k, v in inputs["final_payload"].items() if k not in (tool_params or {})
+            }
+        get_advanced_cache().set(
+            self._contract_cache_key(tool_name, tool_params),
+            stored,
+            ttl=CONTRACT_CACHE_TTL_SECONDS,
+            tags=["meta_contract", f"meta_contract:{tool_name}"]
+        )
+    
+    def invalidate_contracts(self, tool_name: Optional[str] = None) -> int:
+        """Drop cached contracts for one tool (or all), e.g. after a self-healing fix."""
+        if tool_name:
+            self._tool_versions.pop(tool_name, None)
+        else:
+            self._tool_versions.clear()
+        tag = f"meta_contract:{tool_name}" if tool_name else "meta_contract"
+        count = get_advanced_cache().invalidate(tag=tag)
+        # _build_tool_contract reads through the LLM cache, which isn't keyed by tool
+        return count + get_llm_cache().invalidate("meta_contract")
+    
+    def get_tool_contract(
+        self,
+        user_request: str,
+        tool_name: str,
+        tool_params: Dict[str, Any],
+        analysis: Dict[str, Any]
+    ) -> ToolContract:
+        """Contract for a tool call: fast path, then persisted cache, then an LLM call."""
+        contract = self._fast_path_contract(tool_name, tool_params)
+        if contract is not None:
+            self.contract_stats["fast_path"] += 1
+            return contract
+        try:
+            contract = self._cached_contract(tool_name, tool_params)
+        except Exception as e:
+            console.print(f"[dim]⚠️  Contract cache read failed: {e}[/dim]")
+            contract = None
+        if contract is not None:
+            self.contract_stats["cache_hits"] += 1
+            console.print(f"[dim]📑 Reusing cached contract for {tool_name}[/dim]")
+            return contract
+        self.contract_stats["llm_contracts"] += 1
+        return self._build_tool_contract(user_request, tool_name, tool_params, analysis)
+    
     def _build_tool_contract(
         self,
         user_request: str,
@@ -436,24 +651,23 @@ Return JSON with the following shape:
 }}
 Only return JSON."""
         try:
-            response = self.llm.invoke(prompt)
+            response = get_llm_cache().invoke(
+                self.llm,
+                prompt,
+                namespace="meta_contract",
+                validate=self._is_json_response
+            )
             content = getattr(response, "content", str(response))
             contract_json = self._extract_json_block(content)
             contract_dict = self._safe_json_load(contract_json)
             if not contract_dict:
                 raise ValueError("LLM did not return valid JSON contract")
             self._validate_contract_schema(contract_dict)
-            contract = ToolContract(
-                tool=contract_dict["tool"],
-                intent=contract_dict["intent"],
-                inputs=contract_dict["inputs"],
-                success_criteria=contract_dict["success_criteria"],
-                preconditions=contract_dict.get("preconditions", []),
-                post_validations=contract_dict.get("post_validations", []),
-                fallback_plan=contract_dict.get("fallback_plan", []),
-                execution_constraints=contract_dict.get("execution_constraints", {}),
-                raw=contract_dict
-            )
+            contract = self._contract_from_dict(contract_dict)
+            try:
+                self._store_contract(tool_name, tool_params, contract_dict)
+            except Exception as e:
+                console.print(f"[dim]⚠️  Contract cache write failed: {e}[/dim]")
             self.contract_history.append({
                 "timestamp": datetime.now().isoformat(),
                 "tool": tool_name,
@@ -775,6 +989,27 @@ Rules:
         )
         return record
     
+    def begin_request(self, user_request: str) -> None:
+        """Start a new user request: the next tool call re-runs the complexity analysis."""
+        with self._analysis_lock:
+            self._request_analysis = None
+    
+    def get_request_analysis(self, user_request: str) -> Dict[str, Any]:
+        """
+        Complexity analysis for the current user request, computed once and
+        shared by every tool call made while serving it.
+        """
+        key = normalize_text(user_request or "")
+        with self._analysis_lock:
+            if self._request_analysis and self._request_analysis[0] == key:
+                self.contract_stats["analysis_reuses"] += 1
+                return self._request_analysis[1]
+            # Held across the LLM call so parallel tool calls wait for one analysis
+            self.contract_stats["analysis_calls"] += 1
+            analysis = self.analyze_request_complexity(user_request)
+            self._request_analysis = (key, analysis)
+            return analysis
+    
     def analyze_request_complexity(self, user_request: str) -> Dict[str, Any]:
         """
         Analyze user request to determine complexity and required capabilities
@@ -793,7 +1028,7 @@ Rules:
 5. What new capabilities might be needed if any
 
 Current agent capabilities:
-{json.dumps(self.capability_map, indent=2)}
+{json.dumps(self.capability_map, separators=(",", ":"))}
 
 User request: "{user_request}"
 
@@ -811,7 +1046,12 @@ Return JSON:
 }}"""
         
         try:
-            response = self.llm.invoke(prompt)
+            response = get_llm_cache().invoke(
+                self.llm,
+                prompt,
+                namespace="meta_complexity",
+                validate=self._is_json_response
+            )
             content = getattr(response, "content", str(response))
             
             json_str = self._extract_json_block(content)
@@ -1101,6 +1341,10 @@ Return as clear, actionable steps."""
         
         Returns:
             Execution result with meta-intelligence enhancements
+        
+        Parallel tool batches call this from several threads. Contracts,
+        telemetry, memory and enhancement state are only touched while holding
+        the state lock; the lock is released while the tool itself runs.
         """
         console.print(f"\n[bold cyan]🧩 Meta-Intelligence Execution: {tool_name}[/bold cyan]")
         
@@ -1111,8 +1355,30 @@ Return as clear, actionable steps."""
             else:
                 execute_callback = self.tool_executor.execute_tool
         
-        # Pre-execution: Analyze complexity
-        analysis = self.analyze_request_complexity(user_request)
+        with self._state_lock:
+            return self._execute_with_meta_intelligence(
+                user_request, tool_name, tool_params, self._without_state_lock(execute_callback)
+            )
+    
+    def _without_state_lock(self, callback: Callable) -> Callable:
+        """Wrap a tool callback so other calls can use the meta state while it runs."""
+        def run(*args, **kwargs):
+            self._state_lock.release()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                self._state_lock.acquire()
+        return run
+    
+    def _execute_with_meta_intelligence(
+        self,
+        user_request: str,
+        tool_name: str,
+        tool_params: Dict,
+        execute_callback: Callable
+    ) -> Dict[str, Any]:
+        # Pre-execution: Analyze complexity (once per user request)
+        analysis = self.get_request_analysis(user_request)
         
         # Check for capability gaps
         gaps = self.detect_capability_gaps(analysis)
@@ -1125,7 +1391,7 @@ Return as clear, actionable steps."""
                 return gap_response
         
         # Build structured contract & guardrails
-        contract = self._build_tool_contract(user_request, tool_name, tool_params, analysis)
+        contract = self.get_tool_contract(user_request, tool_name, tool_params, analysis)
         guardrails = self._derive_guardrails(contract)
         tool_payload = contract.get_final_payload(tool_params)
         payload_valid, payload_errors = self._validate_payload_against_contract(contract, tool_payload)
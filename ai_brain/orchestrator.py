@@ -23,6 +23,11 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ai_brain.plan_models import ExecutionPlan, PlanStep
+from ai_brain.llm_cache import get_llm_cache
+from ai_brain.post_execution import PostExecutionBus, PostExecutionEvent
+from ai_brain.plan_scheduler import PlanScheduler
+from ai_brain.plan_journal import JOURNAL_ENABLED, PlanJournal, extract_artifact_paths
+from ai_brain.plan_cache import PLAN_CACHE_ENABLED, get_plan_cache, plan_fingerprint
 from evidence_manager.document_intelligence import DocumentIntelligence, DocumentInsight
 from tools.universal_output_validator import UniversalOutputValidator  # NEW
 
@@ -52,10 +57,21 @@ class AIOrchestrator:
         self.output_validator = UniversalOutputValidator()  # NEW: Universal validation
         self.execution_plan = None
         self.plan_model: Optional[ExecutionPlan] = None
+        self.journal: Optional[PlanJournal] = None
         self.execution_history = []
         self.current_rfi = None
         self.document_intelligence = document_intelligence or DocumentIntelligence(llm)
         self.latest_evidence_intelligence: List[DocumentInsight] = []
+        # LLM step validation gates dependent steps; ORCHESTRATOR_BLOCKING_VALIDATION=false
+        # moves it to the background (dependents then run before the verdict is in)
+        self.blocking_validation = os.getenv("ORCHESTRATOR_BLOCKING_VALIDATION", "true").lower() != "false"
+        self.step_observers = PostExecutionBus(name="step-observer")
+        self.step_observers.subscribe(
+            "step_validator",
+            self._step_validation_observer,
+            blocking=self.blocking_validation,
+            timeout=float(os.getenv("ORCHESTRATOR_VALIDATION_TIMEOUT_SECONDS", "120"))
+        )
 
         console.print("\n[bold cyan]🧠 AI Orchestrator Initialized[/bold cyan]")
         console.print("[dim]  The Brain will analyze evidence and direct all tools[/dim]\n")
@@ -82,7 +98,12 @@ class AIOrchestrator:
         if not self.llm:
             raise RuntimeError("LLM is not configured for orchestrator operations")
 
-        response = self.llm.invoke(prompt)
+        response = get_llm_cache().invoke(
+            self.llm,
+            prompt,
+            namespace="orchestrator",
+            validate=self._is_json_response
+        )
         content = getattr(response, "content", str(response))
         cleaned = self._strip_json_block(content)
 
@@ -91,19 +112,44 @@ class AIOrchestrator:
         except json.JSONDecodeError as exc:
             raise ValueError(f"Failed to parse {description} JSON: {exc}") from exc
     
-    def analyze_and_plan(self, rfi_code: str, previous_evidence_files: List[Dict]) -> Dict[str, Any]:
+    def _is_json_response(self, content: str) -> bool:
+        """Only parseable JSON answers are worth caching."""
+        try:
+            json.loads(self._strip_json_block(content))
+            return True
+        except (json.JSONDecodeError, TypeError):
+            return False
+    
+    def analyze_and_plan(self, rfi_code: str, previous_evidence_files: List[Dict],
+                         replan: bool = False) -> Dict[str, Any]:
         """
         STEP 1: Brain analyzes previous evidence and creates execution plan
         
         This is the KEY method - the brain decides EVERYTHING before tools execute
         
+        Plans are cached under a fingerprint of the RFI code, the previous
+        evidence files and the tool catalog; an unchanged RFI gets its plan
+        back without summarizing evidence or calling the LLM.
+        
         Args:
             rfi_code: RFI requirement code (e.g., "BCR-06.01")
             previous_evidence_files: List of previous year's evidence files with metadata
+                (falls back to the files recorded in the RFI's evidence playbook)
+            replan: Ignore the plan cache and generate a fresh plan
         
         Returns:
             Execution plan with specific tool actions
         """
+        if not previous_evidence_files:
+            previous_evidence_files = self._playbook_evidence_files(rfi_code)
+
+        fingerprint = None
+        if PLAN_CACHE_ENABLED:
+            fingerprint = plan_fingerprint(rfi_code, previous_evidence_files)
+            cached = None if replan else get_plan_cache().get(fingerprint)
+            if cached:
+                return self._use_cached_plan(rfi_code, fingerprint, cached)
+
         console.print(f"\n[bold cyan]🧠 BRAIN ANALYZING EVIDENCE FOR {rfi_code}[/bold cyan]")
         console.print("[dim]  Studying previous year's evidence to plan collection...[/dim]\n")
         
@@ -238,12 +284,20 @@ Create a comprehensive plan now:"""
                 for insight in insights
             ]
 
+            if fingerprint:
+                try:
+                    get_plan_cache().put(fingerprint, rfi_code, plan_obj.to_dict(), evidence_payload)
+                except OSError as e:
+                    console.print(f"[yellow]⚠️  Could not cache plan: {e}[/yellow]")
+
             return {
                 "status": "success",
                 "plan": plan_obj.to_dict(),
                 "message": f"Brain created {len(plan_obj.steps)} step execution plan",
                 "plan_progress": plan_obj.summarise_progress(),
                 "evidence_intelligence": evidence_payload,
+                "cached": False,
+                "plan_fingerprint": fingerprint,
             }
         
         except Exception as e:
@@ -257,12 +311,61 @@ Create a comprehensive plan now:"""
                 "raw_response": locals().get('raw_plan')
             }
     
-    def execute_plan(self, plan: Optional[Dict] = None) -> Dict[str, Any]:
+    def _use_cached_plan(self, rfi_code: str, fingerprint: str, cached: Dict[str, Any]) -> Dict[str, Any]:
+        """Adopt a plan from the plan cache as the current plan."""
+        plan_obj = ExecutionPlan.from_dict(cached["plan"])
+        self.plan_model = plan_obj
+        self.execution_plan = plan_obj.to_dict()
+        self.current_rfi = rfi_code
+        self.latest_evidence_intelligence = []
+
+        created = datetime.fromtimestamp(cached.get("created_at", 0)).strftime("%Y-%m-%d %H:%M")
+        console.print(f"\n[bold green]♻️  Reusing cached plan for {rfi_code}[/bold green] "
+                      f"[dim](planned {created}; previous evidence and tools unchanged - pass replan=true to re-plan)[/dim]")
+        self._display_execution_plan(plan_obj)
+
+        return {
+            "status": "success",
+            "plan": plan_obj.to_dict(),
+            "message": f"Reused cached {len(plan_obj.steps)} step execution plan (planned {created})",
+            "plan_progress": plan_obj.summarise_progress(),
+            "evidence_intelligence": cached.get("evidence_intelligence", []),
+            "cached": True,
+            "plan_fingerprint": fingerprint,
+        }
+
+    def _playbook_evidence_files(self, rfi_code: str) -> List[Dict[str, Any]]:
+        """Previous-evidence files recorded in the RFI's evidence playbook (if one was built)."""
+        builder = getattr(self.tool_executor, "playbook_builder", None)
+        if builder is None:
+            return []
+        fiscal_year = os.getenv("SHAREPOINT_CURRENT_YEAR", "FY2025")
+        try:
+            playbook = builder.load_playbook(fiscal_year, rfi_code)
+        except (OSError, ValueError, TypeError):
+            return []
+        if not playbook:
+            return []
+        files = []
+        for task in playbook.tasks:
+            local_path = (task.source_reference or {}).get("local_path")
+            name = (task.metadata or {}).get("original_file") or task.title
+            if local_path or name:
+                files.append({"name": name, "local_path": local_path, "type": task.evidence_type})
+        if files:
+            console.print(f"[dim]📚 Using {len(files)} previous evidence file(s) from the {fiscal_year} playbook for {rfi_code}[/dim]")
+        return files
+
+    def execute_plan(self, plan: Optional[Dict] = None, journal: Optional[PlanJournal] = None) -> Dict[str, Any]:
         """
         STEP 2: Execute the brain's plan, with brain monitoring each step
         
+        Every step transition is checkpointed to a PlanJournal so an
+        interrupted run can continue with resume_plan().
+        
         Args:
             plan: Execution plan (uses stored plan if not provided)
+            journal: Journal to continue (resume); a new one is started otherwise
         
         Returns:
             Execution results
@@ -288,139 +391,43 @@ Create a comprehensive plan now:"""
         console.print(f"\n[bold green]🚀 EXECUTING BRAIN'S PLAN FOR {rfi_code}[/bold green]")
         console.print(f"[dim]  {len(steps)} steps to execute[/dim]\n")
         
-        results = []
-        completed_steps = [s.step for s in steps if s.status == 'completed']
-
-        for step_obj in steps:
-            step_num = step_obj.step
-            tool_name = step_obj.tool
-            description = step_obj.description
-            parameters = step_obj.parameters or {}
-            validation = step_obj.validation
-            depends_on = step_obj.depends_on or []
-            if_fails = step_obj.if_fails
-
-            step_obj.mark_in_progress()
-
-            console.print(f"[cyan]━━━ Step {step_num}: {description} ━━━[/cyan]")
-            console.print(f"[dim]  Tool: {tool_name}[/dim]")
-            console.print(f"[dim]  Validation: {validation}[/dim]")
-
-            if depends_on:
-                missing_deps = [d for d in depends_on if d not in completed_steps]
-                if missing_deps:
-                    console.print(f"[yellow]⚠️  Skipping - depends on steps {missing_deps}[/yellow]\n")
-                    results.append({
-                        "step": step_num,
-                        "status": "skipped",
-                        "reason": f"Dependencies not met: {missing_deps}"
-                    })
-                    step_obj.status = "skipped"
-                    continue
-
+        self.journal = journal
+        if self.journal is None and JOURNAL_ENABLED:
             try:
-                console.print(f"[yellow]🔧 Executing {tool_name}...[/yellow]")
-
-                result = self.tool_executor.execute_tool(tool_name, parameters)
-                
-                # 🔍 NEW: Validate tool output
-                console.print(f"\n[bold yellow]🔍 Validating tool output...[/bold yellow]")
-                validation_result = self.output_validator.validate_tool_output(
-                    tool_name=tool_name,
-                    tool_parameters=parameters,
-                    tool_output=result
-                )
-                
-                # Add validation to result
-                if isinstance(result, dict):
-                    result["validation"] = validation_result
-                
-                # Check validation
-                if not validation_result.get("valid"):
-                    console.print(f"\n[bold red]⚠️  OUTPUT VALIDATION FAILED![/bold red]")
-                    console.print(f"[red]   Confidence: {validation_result.get('confidence', 0)*100:.0f}%[/red]")
-                    console.print(f"[red]   Issues: {validation_result.get('issues', [])}[/red]")
-                    
-                    if validation_result.get("diagnosis"):
-                        console.print(f"\n[yellow]🔍 Diagnosis:[/yellow]")
-                        console.print(f"[yellow]   {validation_result['diagnosis']}[/yellow]")
-                    
-                    if validation_result.get("suggested_fix"):
-                        console.print(f"\n[cyan]💡 Suggested Fix:[/cyan]")
-                        console.print(f"[cyan]   {validation_result['suggested_fix']}[/cyan]\n")
-                    
-                    # Mark step as needing attention
-                    step.status = 'needs_attention'
-                    console.print(f"[yellow]⚠️  Step marked as 'needs_attention'[/yellow]")
-                else:
-                    console.print(f"\n[green]✅ Output validated (Confidence: {validation_result.get('confidence', 0)*100:.0f}%)[/green]\n")
-
-                if result.get('status') == 'success':
-                    console.print(f"[green]✅ Step {step_num} completed[/green]")
-
-                    is_valid = self._validate_step_output(
-                        step_num=step_num,
-                        tool_name=tool_name,
-                        result=result,
-                        validation_criteria=validation
-                    )
+                self.journal = PlanJournal.start(plan_obj)
+            except OSError as e:
+                console.print(f"[yellow]⚠️  Plan checkpointing disabled: {e}[/yellow]")
+        
+        completed_steps = [s.step for s in steps if s.status == 'completed']
 
-                    if is_valid:
-                        completed_steps.append(step_num)
-                        step_obj.mark_completed(
-                            output_summary=self._summarize_tool_output(result),
-                            validation_notes="Validated successfully"
-                        )
-                        results.append({
-                            "step": step_num,
-                            "status": "success",
-                            "tool": tool_name,
-                            "result": result,
-                            "validated": True
-                        })
-                    else:
-                        console.print(f"[yellow]⚠️  Output validation failed[/yellow]")
-                        step_obj.mark_invalid("Failed validation criteria")
-                        results.append({
-                            "step": step_num,
-                            "status": "invalid_output",
-                            "tool": tool_name,
-                            "result": result,
-                            "validated": False
-                        })
-                else:
-                    console.print(f"[red]❌ Step {step_num} failed: {result.get('error')}[/red]")
-
-                    recovery_action = self._handle_step_failure(
-                        step_num=step_num,
-                        tool_name=tool_name,
-                        error=result.get('error'),
-                        if_fails_guidance=if_fails
-                    )
-
-                    step_obj.mark_failed(result.get('error', 'Unknown error'))
-                    results.append({
-                        "step": step_num,
-                        "status": "failed",
-                        "tool": tool_name,
-                        "error": result.get('error'),
-                        "recovery_action": recovery_action
-                    })
+        # Independent steps run concurrently; see ai_brain/plan_scheduler.py
+        scheduler = PlanScheduler(steps)
+        try:
+            results = scheduler.run(
+                execute_step=lambda step_obj: self._execute_plan_step(step_obj, rfi_code, completed_steps),
+                skip_step=self._skip_plan_step,
+                on_update=lambda: self._publish_plan_progress(plan_obj)
+            )
+        finally:
+            # Interrupted (Ctrl-C) or not, the journal gets the last known state
+            self._publish_plan_progress(plan_obj)
+        plan_obj.metadata["execution_stats"] = scheduler.stats
+        console.print(
+            f"[dim]⚡ Plan ran in {scheduler.stats['wall_seconds']:.1f}s "
+            f"(steps {scheduler.stats['step_seconds']:.1f}s total, critical path {scheduler.stats['critical_path_seconds']:.1f}s, "
+            f"up to {scheduler.stats['max_concurrency']} at once)[/dim]\n"
+        )
+        
+        # Background validations must land before the final assessment
+        if not self.step_observers.flush(timeout=float(os.getenv("ORCHESTRATOR_VALIDATION_TIMEOUT_SECONDS", "120"))):
+            console.print("[yellow]⚠️  Some step validations are still running; assessing without them[/yellow]")
 
-                console.print()
+        self._publish_plan_progress(plan_obj)  # Validation may have downgraded steps
 
-            except Exception as e:
-                console.print(f"[red]❌ Step {step_num} exception: {e}[/red]\n")
-                step_obj.mark_failed(str(e))
-                results.append({
-                    "step": step_num,
-                    "status": "exception",
-                    "tool": tool_name,
-                    "error": str(e)
-                })
-        
         # Brain final assessment
         final_assessment = self._assess_execution_results(plan, results)
+        if self.journal:
+            self.journal.record_event("finished", progress=plan_obj.summarise_progress())
         
         # Store execution history
         self.execution_history.append({
@@ -437,6 +444,7 @@ Create a comprehensive plan now:"""
         return {
             "status": "completed",
             "rfi_code": rfi_code,
+            "plan_id": self.journal.plan_id if self.journal else None,
             "steps_completed": len([s for s in plan_obj.steps if s.status == 'completed']),
             "steps_total": len(plan_obj.steps),
             "results": results,
@@ -444,6 +452,183 @@ Create a comprehensive plan now:"""
             "plan": plan_obj.to_dict()
         }
     
+    def _execute_plan_step(self, step_obj: PlanStep, rfi_code: str, completed_steps: List[int]) -> Dict[str, Any]:
+        """Run one plan step: execute the tool, validate its output, update the step. Returns the result record."""
+        step_num = step_obj.step
+        tool_name = step_obj.tool
+        description = step_obj.description
+        parameters = step_obj.parameters or {}
+        validation = step_obj.validation
+        if_fails = step_obj.if_fails
+
+        step_obj.mark_in_progress()
+
+        console.print(f"[cyan]━━━ Step {step_num}: {description} ━━━[/cyan]")
+        console.print(f"[dim]  Tool: {tool_name}[/dim]")
+        console.print(f"[dim]  Validation: {validation}[/dim]")
+
+        try:
+            console.print(f"[yellow]🔧 Executing {tool_name}...[/yellow]")
+
+            result = self.tool_executor.execute_tool(tool_name, parameters)
+            
+            # 🔍 NEW: Validate tool output
+            console.print(f"\n[bold yellow]🔍 Validating tool output...[/bold yellow]")
+            validation_result = self.output_validator.validate_tool_output(
+                tool_name=tool_name,
+                tool_parameters=parameters,
+                tool_output=result
+            )
+            
+            # Add validation to result
+            if isinstance(result, dict):
+                result["validation"] = validation_result
+            
+            # Check validation
+            needs_attention = not validation_result.get("valid")
+            if needs_attention:
+                console.print(f"\n[bold red]⚠️  OUTPUT VALIDATION FAILED![/bold red]")
+                console.print(f"[red]   Confidence: {validation_result.get('confidence', 0)*100:.0f}%[/red]")
+                console.print(f"[red]   Issues: {validation_result.get('issues', [])}[/red]")
+                
+                if validation_result.get("diagnosis"):
+                    console.print(f"\n[yellow]🔍 Diagnosis:[/yellow]")
+                    console.print(f"[yellow]   {validation_result['diagnosis']}[/yellow]")
+                
+                if validation_result.get("suggested_fix"):
+                    console.print(f"\n[cyan]💡 Suggested Fix:[/cyan]")
+                    console.print(f"[cyan]   {validation_result['suggested_fix']}[/cyan]\n")
+            else:
+                console.print(f"\n[green]✅ Output validated (Confidence: {validation_result.get('confidence', 0)*100:.0f}%)[/green]\n")
+
+            if result.get('status') == 'success':
+                console.print(f"[green]✅ Step {step_num} completed[/green]")
+
+                # The brain's validation below may downgrade this to invalid_output
+                record = {
+                    "step": step_num,
+                    "status": "success",
+                    "tool": tool_name,
+                    "result": result,
+                    "validated": None
+                }
+                if not self.blocking_validation:
+                    completed_steps.append(step_num)  # Background validation may remove it again
+                step_obj.artifacts = extract_artifact_paths(result)
+                step_obj.mark_completed(
+                    output_summary=self._summarize_tool_output(result),
+                    validation_notes="Validation pending"
+                )
+                if needs_attention:
+                    # Mark step as needing attention (dependents may still run)
+                    step_obj.status = 'needs_attention'
+                    step_obj.validation_notes = f"Output validation issues: {validation_result.get('issues', [])}"
+                    console.print(f"[yellow]⚠️  Step marked as 'needs_attention'[/yellow]")
+                outcomes = self.step_observers.publish(PostExecutionEvent(
+                    tool_name=tool_name,
+                    tool_input=parameters,
+                    result=result,
+                    request=rfi_code or "",
+                    context={
+                        "step": step_obj,
+                        "record": record,
+                        "criteria": validation,
+                        "completed_steps": completed_steps
+                    }
+                ))
+                if self.blocking_validation:
+                    # The scheduler reads the step status once we return, so an
+                    # invalid_output verdict already holds back dependent steps
+                    if outcomes.get("step_validator") is None and record["validated"] is None:
+                        step_obj.validation_notes = "Validation did not finish in time"
+                    if record["status"] == "success":
+                        completed_steps.append(step_num)
+                console.print()
+                return record
+
+            console.print(f"[red]❌ Step {step_num} failed: {result.get('error')}[/red]")
+
+            recovery_action = self._handle_step_failure(
+                step_num=step_num,
+                tool_name=tool_name,
+                error=result.get('error'),
+                if_fails_guidance=if_fails
+            )
+
+            step_obj.mark_failed(result.get('error', 'Unknown error'))
+            console.print()
+            return {
+                "step": step_num,
+                "status": "failed",
+                "tool": tool_name,
+                "error": result.get('error'),
+                "recovery_action": recovery_action
+            }
+
+        except Exception as e:
+            console.print(f"[red]❌ Step {step_num} exception: {e}[/red]\n")
+            step_obj.mark_failed(str(e))
+            return {
+                "step": step_num,
+                "status": "exception",
+                "tool": tool_name,
+                "error": str(e)
+            }
+    
+    def _skip_plan_step(self, step_obj: PlanStep, reason: str) -> Dict[str, Any]:
+        """Mark a step skipped (its dependencies cannot be met). Returns the result record."""
+        console.print(f"[yellow]⚠️  Skipping step {step_obj.step} ({step_obj.tool}) - {reason}[/yellow]\n")
+        step_obj.status = "skipped"
+        step_obj.validation_notes = reason
+        return {
+            "step": step_obj.step,
+            "status": "skipped",
+            "reason": reason
+        }
+    
+    def _publish_plan_progress(self, plan_obj: ExecutionPlan) -> None:
+        """Refresh the plan snapshot that monitoring hooks read and checkpoint step transitions."""
+        self.execution_plan = plan_obj.to_dict()
+        if self.journal:
+            try:
+                self.journal.record_steps(plan_obj.steps)
+            except OSError as e:
+                console.print(f"[yellow]⚠️  Plan checkpoint failed ({e}) - continuing without it[/yellow]")
+                self.journal = None
+    
+    def resume_plan(self, plan_id: Optional[str] = None, rfi_code: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Continue an interrupted plan from its journal.
+        
+        Completed steps whose evidence files are still present and unchanged
+        are skipped; failed, skipped, interrupted or tampered steps run again.
+        
+        Args:
+            plan_id: Journal to resume (default: most recent unfinished plan)
+            rfi_code: Restrict the default to this RFI
+        """
+        journal = PlanJournal.find(plan_id=plan_id, rfi_code=rfi_code)
+        if journal is None:
+            target = plan_id or (f"RFI {rfi_code}" if rfi_code else "any unfinished plan")
+            return {
+                "status": "error",
+                "error": f"No plan journal found for {target}",
+                "available": PlanJournal.list_journals()[:10]
+            }
+        
+        plan_obj, decision = journal.prepare_resume()
+        console.print(
+            f"\n[bold cyan]⏯️  Resuming {journal.plan_id}: keeping {len(decision['kept'])} completed steps, "
+            f"running {len(decision['rerun'])}[/bold cyan]"
+        )
+        journal.record_event("resumed", **decision)
+        self.current_rfi = plan_obj.rfi_code
+        self.plan_model = plan_obj
+        self.execution_plan = plan_obj.to_dict()
+        result = self.execute_plan(journal=journal)
+        result["resumed"] = decision
+        return result
+    
     def monitor_tool_action(self, tool_name: str, action: str, parameters: Dict) -> Dict[str, Any]:
         """
         REAL-TIME MONITORING: Brain watches tool actions and corrects if wrong
@@ -579,6 +764,28 @@ Create a comprehensive plan now:"""
             return payload[:400]
         return str(payload)[:400]
 
+    def _step_validation_observer(self, event: PostExecutionEvent) -> bool:
+        """Validate a completed step and record the outcome on its step and result entry."""
+        step_obj = event.context["step"]
+        record = event.context["record"]
+        is_valid = self._validate_step_output(
+            step_num=step_obj.step,
+            tool_name=event.tool_name,
+            result=event.result,
+            validation_criteria=event.context.get("criteria", "")
+        )
+        record["validated"] = is_valid
+        if is_valid:
+            step_obj.validation_notes = "Validated successfully"
+        else:
+            console.print(f"[yellow]⚠️  Step {step_obj.step} output validation failed[/yellow]")
+            step_obj.mark_invalid("Failed validation criteria")
+            record["status"] = "invalid_output"
+            completed = event.context.get("completed_steps")
+            if completed is not None and step_obj.step in completed:
+                completed.remove(step_obj.step)
+        return is_valid
+
     def _validate_step_output(self, step_num: int, tool_name: str, 
                               result: Dict, validation_criteria: str) -> bool:
         """
@@ -36,7 +36,13 @@ WHEN TO USE:
 - Starting evidence collection for any RFI
 - Previous year's evidence is available
 - Need brain to decide what evidence is needed
-- Want automated, intelligent collection plan""",
+- Want automated, intelligent collection plan
+
+REPEAT SESSIONS:
+Plans are cached per RFI. If the previous evidence and tools haven't changed,
+the stored plan comes back instantly (cached: true) - go straight to
+orchestrator_execute_plan. Passing an empty previous_evidence_files list uses
+the files recorded in the RFI's evidence playbook.""",
     "input_schema": {
         "type": "object",
         "properties": {
@@ -56,6 +62,11 @@ WHEN TO USE:
                     }
                 },
                 "description": "List of previous year's evidence files with metadata. Get this from sharepoint_review_evidence tool."
+            },
+            "replan": {
+                "type": "boolean",
+                "description": "Generate a fresh plan even if a cached plan exists for this RFI (default: false). Plans are reused automatically while the previous evidence and tool catalog are unchanged; set this only when the user asks to re-plan.",
+                "default": False
             }
         },
         "required": ["rfi_code", "previous_evidence_files"]
@@ -102,10 +113,44 @@ WHEN TO USE:
     }
 }
 
+# Tool definition for resume_plan
+ORCHESTRATOR_RESUME_TOOL = {
+    "name": "orchestrator_resume_plan",
+    "description": """⏯️ RESUME AN INTERRUPTED EVIDENCE COLLECTION PLAN
+
+Plan execution is checkpointed after every step. If a run stopped part way
+(browser crash, Duo timeout, Ctrl-C, failed steps), use this instead of
+re-running the whole plan:
+- Completed steps whose evidence files are still present and unchanged are kept
+- Failed, skipped, interrupted steps (or steps whose files changed) run again
+
+WHEN TO USE:
+- User says "continue", "resume", "pick up where we left off"
+- orchestrator_execute_plan stopped before finishing
+- Re-running only the failed steps of a plan
+
+Without parameters, resumes the most recent unfinished plan.""",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "plan_id": {
+                "type": "string",
+                "description": "Plan id from a previous orchestrator_execute_plan result (optional)"
+            },
+            "rfi_code": {
+                "type": "string",
+                "description": "Resume the latest unfinished plan for this RFI (optional)"
+            }
+        },
+        "required": []
+    }
+}
+
 # Combined tools list
 ORCHESTRATOR_TOOLS = [
     ORCHESTRATOR_ANALYZE_TOOL,
-    ORCHESTRATOR_EXECUTE_TOOL
+    ORCHESTRATOR_EXECUTE_TOOL,
+    ORCHESTRATOR_RESUME_TOOL
 ]
 
 
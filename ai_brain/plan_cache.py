@@ -0,0 +1,192 @@
+"""
+Plan Cache - Reuse RFI execution plans while their inputs are unchanged
+
+AIOrchestrator.analyze_and_plan() summarizes last year's evidence (one
+document-intelligence pass per file) and asks the LLM for a plan. Both are
+skipped when the same plan inputs were planned before. Plans are stored
+under a fingerprint of:
+
+- the RFI code
+- the previous-evidence files (sha256 of each local file; name/size/modified
+  metadata for files that are not downloaded)
+- the tool catalog version (tool names and input schemas, plus
+  PLANNER_VERSION, which is bumped when the planning prompt changes)
+
+A changed evidence file or tool catalog gives a new fingerprint, so stale
+plans are never served. replan=True skips the lookup and overwrites the entry.
+
+Plans: ~/.auditmate_cache/plan_cache/<fingerprint>.json (PLAN_CACHE_DIR)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from ai_brain.plan_journal import fingerprint_artifact
+
+console = Console()
+
+PLAN_CACHE_ENABLED = os.getenv("PLAN_CACHE_ENABLED", "true").lower() == "true"
+DEFAULT_PLAN_CACHE_DIR = Path(os.getenv(
+    "PLAN_CACHE_DIR",
+    str(Path.home() / ".auditmate_cache" / "plan_cache")
+))
+DEFAULT_TTL_DAYS = float(os.getenv("PLAN_CACHE_TTL_DAYS", "30"))
+
+# Bump when the planning prompt in AIOrchestrator.analyze_and_plan changes
+PLANNER_VERSION = 1
+
+_catalog_version: Optional[str] = None
+_file_hashes: Dict[Tuple[str, int, float], str] = {}
+_hash_lock = threading.Lock()
+
+
+def tool_catalog_version() -> str:
+    """Hash of the tool catalog the planner can choose from."""
+    global _catalog_version
+    if _catalog_version is None:
+        from ai_brain.tools_definition import get_tool_definitions
+        catalog = sorted(
+            (tool.get("name", ""), json.dumps(tool.get("input_schema", {}), sort_keys=True))
+            for tool in get_tool_definitions()
+        )
+        payload = json.dumps([PLANNER_VERSION, catalog])
+        _catalog_version = hashlib.sha256(payload.encode()).hexdigest()[:12]
+    return _catalog_version
+
+
+def _file_hash(path: str) -> Optional[str]:
+    """sha256 of a local file, memoized on (path, size, mtime)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    memo_key = (path, stat.st_size, stat.st_mtime)
+    with _hash_lock:
+        if memo_key in _file_hashes:
+            return _file_hashes[memo_key]
+    fingerprint = fingerprint_artifact(path)
+    if not fingerprint:
+        return None
+    with _hash_lock:
+        _file_hashes[memo_key] = fingerprint["sha256"]
+    return fingerprint["sha256"]
+
+
+def evidence_fingerprints(files: List[Dict[str, Any]]) -> List[str]:
+    """One sorted entry per previous-evidence file (content hash when available locally)."""
+    entries = []
+    for file_info in files or []:
+        if not isinstance(file_info, dict):
+            entries.append(f"raw:{file_info}")
+            continue
+        path = file_info.get("local_path") or file_info.get("path")
+        digest = _file_hash(os.path.expanduser(path)) if path else None
+        if digest:
+            entries.append(f"sha256:{digest}")
+        else:
+            name = file_info.get("name") or file_info.get("file_name") or path or "unknown"
+            modified = file_info.get("modified") or file_info.get("last_modified") or ""
+            entries.append(f"meta:{name}|{file_info.get('size', '')}|{modified}")
+    return sorted(entries)
+
+
+def plan_fingerprint(rfi_code: str, files: List[Dict[str, Any]],
+                     catalog_version: Optional[str] = None) -> str:
+    """Cache key for a planning call."""
+    payload = json.dumps({
+        "rfi_code": rfi_code,
+        "evidence": evidence_fingerprints(files),
+        "catalog": catalog_version or tool_catalog_version(),
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+class PlanCache:
+    """Execution plans on disk, one JSON file per fingerprint."""
+
+    def __init__(self, directory: Optional[Path] = None, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.directory = Path(directory or DEFAULT_PLAN_CACHE_DIR)
+        self.ttl_seconds = ttl_days * 86400
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.directory / f"{fingerprint}.json"
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached entry for a fingerprint.
+
+        Returns:
+            {"rfi_code", "plan", "evidence_intelligence", "created_at", ...} or None
+        """
+        path = self._path(fingerprint)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+        if self.ttl_seconds and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+        with self._lock:
+            self.stats["hits"] += 1
+        return entry
+
+    def put(self, fingerprint: str, rfi_code: str, plan: Dict[str, Any],
+            evidence_intelligence: Optional[List[Dict[str, Any]]] = None) -> Path:
+        """Store a freshly generated plan (atomically replaces an older entry)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(fingerprint)
+        entry = {
+            "fingerprint": fingerprint,
+            "rfi_code": rfi_code,
+            "catalog_version": tool_catalog_version(),
+            "created_at": time.time(),
+            "plan": plan,
+            "evidence_intelligence": evidence_intelligence or [],
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.stats["stores"] += 1
+        return path
+
+    def invalidate(self, rfi_code: Optional[str] = None) -> int:
+        """Drop cached plans (for one RFI, or all). Returns the number removed."""
+        removed = 0
+        for path in self.directory.glob("*.json") if self.directory.exists() else []:
+            if rfi_code:
+                try:
+                    with open(path) as f:
+                        if json.load(f).get("rfi_code") != rfi_code:
+                            continue
+                except (OSError, json.JSONDecodeError):
+                    pass
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+_plan_cache: Optional[PlanCache] = None
+
+
+def get_plan_cache() -> PlanCache:
+    """Get the shared plan cache."""
+    global _plan_cache
+    if _plan_cache is None:
+        _plan_cache = PlanCache()
+    return _plan_cache
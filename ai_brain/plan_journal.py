@@ -0,0 +1,312 @@
+"""
+Plan Journal - Durable checkpoints for orchestrator plan execution
+
+Every step transition is appended (and fsync'd) to a JSONL journal. Each
+entry records the step's status, its parameters and the evidence files it
+produced (path, size, sha256). A browser crash, Duo timeout or Ctrl-C at
+step 22 of 30 no longer throws away steps 1-21: AIOrchestrator.resume_plan()
+rebuilds the plan from the journal. Completed steps whose artifacts are still
+on disk and unchanged are kept; everything else runs again.
+
+Journals: ~/.auditmate_cache/plan_journal/<plan_id>.jsonl (PLAN_JOURNAL_DIR)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+from ai_brain.plan_models import ExecutionPlan, PlanStep
+
+console = Console()
+
+JOURNAL_ENABLED = os.getenv("PLAN_JOURNAL_ENABLED", "true").lower() == "true"
+DEFAULT_JOURNAL_DIR = Path(os.getenv(
+    "PLAN_JOURNAL_DIR",
+    str(Path.home() / ".auditmate_cache" / "plan_journal")
+))
+
+# Statuses whose artifacts are fingerprinted and reused on resume
+KEEPABLE_STATUSES = {"completed", "needs_attention"}
+
+MAX_ARTIFACTS_PER_STEP = 200
+
+
+def plan_id_for(plan: ExecutionPlan) -> str:
+    """Stable id: RFI code plus a hash of the steps' tools and parameters."""
+    shape = [(step.step, step.tool, step.parameters) for step in plan.steps]
+    digest = hashlib.sha256(json.dumps(shape, sort_keys=True, default=str).encode()).hexdigest()[:10]
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", plan.rfi_code or "plan").strip("_") or "plan"
+    return f"{slug}-{digest}"
+
+
+def extract_artifact_paths(result: Any, limit: int = MAX_ARTIFACTS_PER_STEP) -> List[str]:
+    """Existing files referenced anywhere in a tool result (screenshots, exports, ...)."""
+    found: List[str] = []
+    seen = set()
+
+    def walk(value: Any, depth: int) -> None:
+        if len(found) >= limit or depth > 6:
+            return
+        if isinstance(value, dict):
+            for item in value.values():
+                walk(item, depth + 1)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                walk(item, depth + 1)
+        elif isinstance(value, str) and os.sep in value and len(value) < 1024 and "\n" not in value:
+            path = os.path.abspath(os.path.expanduser(value))
+            if path not in seen and os.path.isfile(path):
+                seen.add(path)
+                found.append(path)
+
+    walk(result, 0)
+    return found
+
+
+def fingerprint_artifact(path: str) -> Optional[Dict[str, Any]]:
+    """{path, size, sha256} for an existing file, else None."""
+    try:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return {"path": path, "size": os.path.getsize(path), "sha256": digest.hexdigest()}
+    except OSError:
+        return None
+
+
+def artifact_is_valid(fingerprint: Dict[str, Any]) -> Tuple[bool, str]:
+    """Check a recorded artifact is still present and unchanged."""
+    path = fingerprint.get("path", "")
+    if not os.path.isfile(path):
+        return False, f"missing: {path}"
+    if os.path.getsize(path) != fingerprint.get("size") or os.path.getsize(path) == 0:
+        return False, f"size changed: {path}"
+    current = fingerprint_artifact(path)
+    if not current or current["sha256"] != fingerprint.get("sha256"):
+        return False, f"content changed: {path}"
+    return True, ""
+
+
+class PlanJournal:
+    """Append-only step journal for one plan execution."""
+
+    def __init__(self, plan_id: str, directory: Optional[Path] = None):
+        self.plan_id = plan_id
+        self.directory = Path(directory or DEFAULT_JOURNAL_DIR)
+        self.path = self.directory / f"{plan_id}.jsonl"
+        self._lock = threading.Lock()
+        self._last: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        entry["ts"] = time.time()
+        line = (json.dumps(entry, default=str) + "\n").encode()
+        with open(self.path, "ab+") as f:
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line  # Previous run died mid-write
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def is_unfinished(self) -> bool:
+        """True if this journal holds a run that can still be resumed."""
+        if not self.path.exists():
+            return False
+        try:
+            return not self.load()[2]
+        except (ValueError, OSError, KeyError):
+            return False
+
+    @classmethod
+    def start(cls, plan: ExecutionPlan, directory: Optional[Path] = None) -> "PlanJournal":
+        """
+        Begin a new journal for a plan.
+
+        A finished journal of the same plan is replaced. An unfinished one is
+        an interrupted run's checkpoint, so the new run gets a suffixed id
+        (<plan_id>-2, -3, ...) and the old run stays resumable.
+        """
+        base_id = plan_id_for(plan)
+        journal = cls(base_id, directory)
+        suffix = 2
+        while journal.is_unfinished():
+            journal = cls(f"{base_id}-{suffix}", directory)
+            suffix += 1
+        if journal.plan_id != base_id:
+            console.print(
+                f"[yellow]⚠️  Plan {base_id} has an unfinished checkpoint; this run is journaled as "
+                f"{journal.plan_id} (resume the earlier run with orchestrator_resume_plan)[/yellow]"
+            )
+        journal.directory.mkdir(parents=True, exist_ok=True)
+        with journal._lock:
+            journal.path.unlink(missing_ok=True)
+            journal._append({"event": "plan", "plan_id": journal.plan_id, "plan": plan.to_dict()})
+            journal._remember([step for step in plan.steps if step.status not in KEEPABLE_STATUSES])
+        journal.record_steps(plan.steps)  # Fingerprint steps that were already complete
+        console.print(f"[dim]📒 Checkpointing plan to {journal.path}[/dim]")
+        return journal
+
+    def _remember(self, steps: List[PlanStep]) -> None:
+        for step in steps:
+            self._last[step.step] = (step.status, tuple(step.artifacts))
+
+    def record_steps(self, steps: List[PlanStep]) -> int:
+        """
+        Append an entry for every step whose status or artifacts changed since the last call.
+
+        Returns:
+            Number of entries written
+        """
+        written = 0
+        with self._lock:
+            for step in steps:
+                state = (step.status, tuple(step.artifacts))
+                if self._last.get(step.step) == state:
+                    continue
+                self._last[step.step] = state
+                entry = {
+                    "event": "step",
+                    "step": step.step,
+                    "tool": step.tool,
+                    "status": step.status,
+                    "parameters": step.parameters,
+                    "started_at": step.started_at,
+                    "completed_at": step.completed_at,
+                    "output_summary": step.output_summary,
+                    "validation_notes": step.validation_notes,
+                }
+                if step.status in KEEPABLE_STATUSES:
+                    entry["artifacts"] = [fp for fp in (fingerprint_artifact(p) for p in step.artifacts) if fp]
+                else:
+                    entry["artifacts"] = []
+                self._append(entry)
+                written += 1
+        return written
+
+    def record_event(self, event: str, **details: Any) -> None:
+        """Append a plan-level event (resumed, finished)."""
+        with self._lock:
+            self._append({"event": event, **details})
+
+    # ------------------------------------------------------------------
+    # Reading / resuming
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> List[Dict[str, Any]]:
+        entries = []
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Torn write from a crash mid-append
+        return entries
+
+    def load(self) -> Tuple[ExecutionPlan, Dict[int, List[Dict[str, Any]]], bool]:
+        """
+        Rebuild the plan as of the last checkpoint.
+
+        Returns:
+            (plan, {step number: artifact fingerprints}, finished)
+        """
+        entries = self._entries()
+        if not entries or entries[0].get("event") != "plan":
+            raise ValueError(f"Not a plan journal: {self.path}")
+        plan = ExecutionPlan.from_dict(entries[0]["plan"])
+        fingerprints: Dict[int, List[Dict[str, Any]]] = {}
+        finished = False
+        for entry in entries[1:]:
+            if entry.get("event") == "finished":
+                finished = True
+            elif entry.get("event") == "resumed":
+                finished = False
+            if entry.get("event") != "step":
+                continue
+            step = plan.get_step(entry.get("step"))
+            if step is None:
+                continue
+            step.status = entry.get("status", step.status)
+            step.started_at = entry.get("started_at")
+            step.completed_at = entry.get("completed_at")
+            step.output_summary = entry.get("output_summary")
+            step.validation_notes = entry.get("validation_notes")
+            fingerprints[step.step] = entry.get("artifacts") or []
+            step.artifacts = [fp["path"] for fp in fingerprints[step.step]]
+        return plan, fingerprints, finished
+
+    def prepare_resume(self) -> Tuple[ExecutionPlan, Dict[str, List[int]]]:
+        """
+        Load the plan and decide which steps to keep.
+
+        Completed steps are kept when every recorded artifact still validates.
+        All other steps (failed, skipped, interrupted, changed artifacts) are
+        reset to pending.
+
+        Returns:
+            (plan ready for execute_plan, {"kept": [...], "rerun": [...]})
+        """
+        plan, fingerprints, _ = self.load()
+        kept, rerun = [], []
+        for step in plan.steps:
+            if step.status in KEEPABLE_STATUSES:
+                problems = [reason for ok, reason in (artifact_is_valid(fp) for fp in fingerprints.get(step.step, [])) if not ok]
+                if not problems:
+                    kept.append(step.step)
+                    continue
+                console.print(f"[yellow]⚠️  Step {step.step} artifacts no longer valid ({problems[0]}) - re-running[/yellow]")
+                step.reset(f"Re-run on resume: {problems[0]}")
+            elif step.status != "pending":
+                step.reset(f"Re-run on resume (was {step.status})")
+            rerun.append(step.step)
+
+        with self._lock:
+            self._remember(plan.steps)
+        return plan, {"kept": kept, "rerun": rerun}
+
+    @classmethod
+    def list_journals(cls, directory: Optional[Path] = None) -> List[Dict[str, Any]]:
+        """Summaries of stored journals, most recently updated first."""
+        directory = Path(directory or DEFAULT_JOURNAL_DIR)
+        summaries = []
+        for path in directory.glob("*.jsonl") if directory.exists() else []:
+            journal = cls(path.stem, directory)
+            try:
+                plan, _, finished = journal.load()
+            except (ValueError, OSError, KeyError):
+                continue
+            summaries.append({
+                "plan_id": journal.plan_id,
+                "rfi_code": plan.rfi_code,
+                "finished": finished,
+                "updated": path.stat().st_mtime,
+                "status_breakdown": plan.summarise_progress()["status_breakdown"],
+            })
+        return sorted(summaries, key=lambda s: s["updated"], reverse=True)
+
+    @classmethod
+    def find(cls, plan_id: Optional[str] = None, rfi_code: Optional[str] = None,
+             directory: Optional[Path] = None) -> Optional["PlanJournal"]:
+        """Journal by id, else the most recent unfinished one (optionally for an RFI code)."""
+        if plan_id:
+            journal = cls(plan_id, directory)
+            return journal if journal.path.exists() else None
+        for summary in cls.list_journals(directory):
+            if summary["finished"]:
+                continue
+            if rfi_code and summary["rfi_code"] != rfi_code:
+                continue
+            return cls(summary["plan_id"], directory)
+        return None
@@ -45,6 +45,7 @@ class PlanStep:
     completed_at: Optional[str] = None
     output_summary: Optional[str] = None
     validation_notes: Optional[str] = None
+    artifacts: List[str] = field(default_factory=list)
 
     def mark_in_progress(self) -> None:
         """Mark the step as running."""
@@ -79,6 +80,16 @@ class PlanStep:
         self.completed_at = _utc_iso()
         self.validation_notes = reason
 
+    def reset(self, reason: Optional[str] = None) -> None:
+        """Return the step to pending so it runs again (e.g. on resume)."""
+
+        self.status = "pending"
+        self.started_at = None
+        self.completed_at = None
+        self.output_summary = None
+        self.artifacts = []
+        self.validation_notes = reason
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the step for JSON responses."""
 
@@ -95,6 +106,7 @@ class PlanStep:
             "completed_at": self.completed_at,
             "output_summary": self.output_summary,
             "validation_notes": self.validation_notes,
+            "artifacts": self.artifacts,
         }
 
     @classmethod
@@ -114,6 +126,7 @@ class PlanStep:
             completed_at=payload.get("completed_at"),
             output_summary=payload.get("output_summary"),
             validation_notes=payload.get("validation_notes"),
+            artifacts=list(payload.get("artifacts", []) or []),
         )
 
 
@@ -161,6 +174,8 @@ class ExecutionPlan:
             "completed": 0,
             "failed": 0,
             "invalid_output": 0,
+            "needs_attention": 0,
+            "skipped": 0,
         }
         for step in self.steps:
             totals[step.status] = totals.get(step.status, 0) + 1
@@ -169,6 +184,7 @@ class ExecutionPlan:
             "rfi_code": self.rfi_code,
             "steps_total": len(self.steps),
             "status_breakdown": totals,
+            "running": [step.step for step in self.steps if step.status == "in_progress"],
         }
 
     @classmethod
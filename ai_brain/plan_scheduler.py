@@ -0,0 +1,261 @@
+"""
+Plan Scheduler - Run ExecutionPlan steps as a dependency graph
+
+Steps start as soon as what they wait on has finished, instead of strictly
+in plan order:
+
+- depends_on (explicit): the dependency must complete, otherwise the step is
+  skipped
+- Inferred ordering (finish-before, success not required):
+  * browser steps for the same account run in plan order, since they share
+    page state
+  * steps with unknown side effects ('serial' tools) and SharePoint uploads
+    are barriers: they wait for every earlier step, and every later step
+    waits for them
+
+API-backed ('parallel') steps are otherwise free. Ready steps run
+concurrently under per-class limits: PLAN_PARALLELISM for API steps and
+PLAN_BROWSER_CONCURRENCY for browser steps. The browser limit defaults to 1
+because every account shares one browser session. A plan that mixes
+exports, Jira queries and screenshots finishes in about the time of its
+critical path.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from rich.console import Console
+
+from ai_brain.plan_models import PlanStep
+from ai_brain.tool_concurrency import classify_tool, DEFAULT_MAX_WORKERS
+
+console = Console()
+
+DEFAULT_PLAN_PARALLELISM = int(os.getenv("PLAN_PARALLELISM", str(DEFAULT_MAX_WORKERS)))
+DEFAULT_BROWSER_CONCURRENCY = int(os.getenv("PLAN_BROWSER_CONCURRENCY", "1"))
+
+# Statuses that let dependent steps run
+SATISFIED_STATUSES = {"completed", "needs_attention"}
+
+# Steps that consume everything collected before them
+BARRIER_TOOLS = {"upload_to_sharepoint"}
+
+SHAREPOINT_TOOLS = {"sharepoint_review_evidence", "upload_to_sharepoint", "learn_from_sharepoint_url"}
+
+
+def browser_resource(step: PlanStep) -> str:
+    """Browser session a step drives: the AWS account, or 'sharepoint'."""
+    if step.tool in SHAREPOINT_TOOLS:
+        return "sharepoint"
+    params = step.parameters or {}
+    return str(params.get("account") or params.get("profile") or "default")
+
+
+@dataclass
+class StepNode:
+    """A plan step in the graph (keyed by position in the plan)."""
+    index: int
+    step: PlanStep
+    resource_class: str
+    requires: Set[int] = field(default_factory=set)
+    after: Set[int] = field(default_factory=set)
+    missing: List[int] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def build_step_graph(steps: List[PlanStep]) -> Dict[int, StepNode]:
+    """
+    Build the dependency graph for a plan.
+
+    Returns:
+        Dict of plan position -> StepNode. requires holds explicit depends_on
+        edges, after holds inferred ordering edges. missing lists depends_on
+        step numbers that are not in the plan.
+    """
+    index_of: Dict[int, int] = {}
+    for index, step in enumerate(steps):
+        index_of.setdefault(step.step, index)
+
+    nodes: Dict[int, StepNode] = {}
+    last_browser: Dict[str, int] = {}
+    last_barrier: Optional[int] = None
+    for index, step in enumerate(steps):
+        node = StepNode(index=index, step=step, resource_class=classify_tool(step.tool))
+        for dependency in step.depends_on or []:
+            if dependency in index_of and index_of[dependency] != index:
+                node.requires.add(index_of[dependency])
+            else:
+                node.missing.append(dependency)
+
+        barrier = node.resource_class == "serial" or step.tool in BARRIER_TOOLS
+        if barrier:
+            node.after.update(range(index))
+            last_barrier = index
+        elif last_barrier is not None:
+            node.after.add(last_barrier)
+
+        if node.resource_class == "browser":
+            resource = browser_resource(step)
+            if resource in last_browser:
+                node.after.add(last_browser[resource])
+            last_browser[resource] = index
+        nodes[index] = node
+    return nodes
+
+
+def critical_path_seconds(nodes: Dict[int, StepNode]) -> float:
+    """Longest chain of step durations through the graph."""
+    finish: Dict[int, float] = {}
+
+    def finish_time(index: int, visiting: Set[int]) -> float:
+        if index in finish:
+            return finish[index]
+        if index in visiting:
+            return 0.0  # Cycle: those steps never ran
+        visiting.add(index)
+        node = nodes[index]
+        start = max((finish_time(d, visiting) for d in node.requires | node.after if d in nodes), default=0.0)
+        visiting.discard(index)
+        finish[index] = start + node.seconds
+        return finish[index]
+
+    return max((finish_time(index, set()) for index in nodes), default=0.0)
+
+
+class PlanScheduler:
+    """
+    Executes plan steps concurrently in dependency order.
+
+    Args:
+        steps: Plan steps (PlanStep objects are updated in place, so the
+            ExecutionPlan shows live status)
+        max_workers: Concurrent API-bound steps
+        browser_concurrency: Concurrent browser-bound steps
+    """
+
+    def __init__(self, steps: List[PlanStep], max_workers: Optional[int] = None,
+                 browser_concurrency: Optional[int] = None):
+        self.nodes = build_step_graph(steps)
+        self.limits = {
+            "parallel": max(1, max_workers or DEFAULT_PLAN_PARALLELISM),
+            "browser": max(1, browser_concurrency or DEFAULT_BROWSER_CONCURRENCY),
+            "serial": 1,
+        }
+        self.stats: Dict[str, Any] = {}
+
+    def run(
+        self,
+        execute_step: Callable[[PlanStep], Dict[str, Any]],
+        skip_step: Callable[[PlanStep, str], Dict[str, Any]],
+        on_update: Optional[Callable[[], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run every step that can run.
+
+        Args:
+            execute_step: Runs one step, updates its status, returns its result record
+            skip_step: Marks a step skipped (dependency failed/missing/cycle), returns its record
+            on_update: Called after every status change
+
+        Returns:
+            Result records in plan order (steps completed before this run get a 'reused' record)
+        """
+        nodes = self.nodes
+        records: Dict[int, Dict[str, Any]] = {}
+        finished: Set[int] = set()
+        satisfied: Set[int] = set()
+        waiting: List[int] = []
+        for index, node in nodes.items():
+            if node.step.status in SATISFIED_STATUSES:
+                finished.add(index)
+                satisfied.add(index)
+                records[index] = {
+                    "step": node.step.step,
+                    "status": "success",
+                    "tool": node.step.tool,
+                    "reused": True,
+                    "output_summary": node.step.output_summary
+                }
+            else:
+                waiting.append(index)
+
+        in_use = {name: 0 for name in self.limits}
+        running: Dict[Any, int] = {}
+        peak = 0
+        started = time.time()
+
+        def timed(node: StepNode) -> Dict[str, Any]:
+            step_started = time.time()
+            try:
+                return execute_step(node.step)
+            finally:
+                node.seconds = time.time() - step_started
+
+        def notify() -> None:
+            if on_update:
+                try:
+                    on_update()
+                except Exception:
+                    pass
+
+        total_workers = sum(self.limits.values())
+        with ThreadPoolExecutor(max_workers=total_workers, thread_name_prefix="plan-step") as pool:
+            while waiting or running:
+                # Skip steps whose explicit dependencies can no longer succeed
+                for index in list(waiting):
+                    node = nodes[index]
+                    unmet = [nodes[d].step.step for d in node.requires if d in finished and d not in satisfied]
+                    if node.missing or unmet:
+                        waiting.remove(index)
+                        records[index] = skip_step(node.step, f"Dependencies not met: {node.missing + unmet}")
+                        finished.add(index)
+                        notify()
+
+                # Start whatever is ready and has capacity, in plan order
+                for index in list(waiting):
+                    node = nodes[index]
+                    if not (node.requires <= satisfied and node.after <= finished):
+                        continue
+                    if in_use[node.resource_class] >= self.limits[node.resource_class]:
+                        continue
+                    waiting.remove(index)
+                    in_use[node.resource_class] += 1
+                    running[pool.submit(timed, node)] = index
+                peak = max(peak, len(running))
+                notify()
+
+                if not running:
+                    # Nothing runnable and nothing in flight: the rest is a depends_on cycle
+                    for index in waiting:
+                        records[index] = skip_step(nodes[index].step, "Dependency cycle in plan")
+                        finished.add(index)
+                    waiting.clear()
+                    notify()
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    node = nodes[index]
+                    in_use[node.resource_class] -= 1
+                    try:
+                        records[index] = future.result()
+                    except Exception as e:
+                        node.step.mark_failed(str(e))
+                        records[index] = {"step": node.step.step, "status": "exception", "tool": node.step.tool, "error": str(e)}
+                    finished.add(index)
+                    if node.step.status in SATISFIED_STATUSES:
+                        satisfied.add(index)
+                notify()
+
+        wall = time.time() - started
+        self.stats = {
+            "wall_seconds": round(wall, 2),
+            "step_seconds": round(sum(n.seconds for n in nodes.values()), 2),
+            "critical_path_seconds": round(critical_path_seconds(nodes), 2),
+            "max_concurrency": peak,
+        }
+        return [records[index] for index in sorted(records)]
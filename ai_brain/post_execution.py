@@ -0,0 +1,203 @@
+"""
+Post-Execution Bus - Run tool observers off the critical path
+
+After each tool call the advisor LLM, the error debugger and step validators
+used to run inline, so the user waited on every one of them before the next
+step could start. Observers now subscribe to a bus:
+
+- Non-blocking observers (default) run on a small worker pool. Each has a
+  bounded backlog; when it is full, new events for that observer are dropped
+  rather than slowing the caller. Events that waited past the observer's
+  timeout are skipped as stale.
+- Blocking observers run before publish() returns, up to their timeout, and
+  their return values are handed back to the caller. Only these gate the
+  next step.
+
+flush() waits for queued work (e.g. before a plan's final assessment).
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_WORKERS = int(os.getenv("POST_EXECUTION_WORKERS", "2"))
+DEFAULT_BACKLOG = int(os.getenv("POST_EXECUTION_BACKLOG", "50"))
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("POST_EXECUTION_TIMEOUT_SECONDS", "60"))
+
+
+@dataclass
+class PostExecutionEvent:
+    """One finished tool call."""
+    tool_name: str
+    tool_input: Dict[str, Any]
+    result: Dict[str, Any]
+    request: str = ""
+    context: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def succeeded(self) -> bool:
+        return isinstance(self.result, dict) and self.result.get("status") == "success"
+
+
+@dataclass
+class Observer:
+    """A subscriber to post-execution events."""
+    name: str
+    callback: Callable[[PostExecutionEvent], Any]
+    blocking: bool = False
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+    when: Optional[Callable[[PostExecutionEvent], bool]] = None
+    backlog: int = DEFAULT_BACKLOG
+    pending: int = 0
+    stats: Dict[str, int] = field(default_factory=lambda: {
+        "delivered": 0, "failed": 0, "dropped": 0, "stale": 0, "timed_out": 0
+    })
+
+
+class PostExecutionBus:
+    """Dispatches PostExecutionEvents to blocking and background observers."""
+
+    def __init__(self, name: str = "post-exec", max_workers: int = DEFAULT_WORKERS):
+        self.name = name
+        self._observers: Dict[str, Observer] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=name)
+        # Separate pool so blocking observers never queue behind background work
+        self._blocking_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix=f"{name}-blocking")
+        self._closed = False
+
+    def subscribe(
+        self,
+        name: str,
+        callback: Callable[[PostExecutionEvent], Any],
+        blocking: bool = False,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        when: Optional[Callable[[PostExecutionEvent], bool]] = None,
+        backlog: int = DEFAULT_BACKLOG
+    ) -> Observer:
+        """
+        Register an observer (replaces one with the same name).
+
+        Args:
+            name: Observer name (used in stats and returned results)
+            callback: event -> value
+            blocking: If True, publish() waits for it and returns its value
+            timeout: Blocking: max wait. Background: max time an event may wait in the backlog
+            when: Optional filter; the observer only sees events it returns True for
+            backlog: Max queued + running background events before new ones are dropped
+        """
+        observer = Observer(name, callback, blocking, timeout, when, backlog)
+        with self._lock:
+            self._observers[name] = observer
+        return observer
+
+    def unsubscribe(self, name: str) -> None:
+        with self._lock:
+            self._observers.pop(name, None)
+
+    def _run(self, observer: Observer, event: PostExecutionEvent, queued_at: Optional[float] = None) -> Any:
+        try:
+            if queued_at is not None and time.time() - queued_at > observer.timeout:
+                observer.stats["stale"] += 1
+                return None
+            value = observer.callback(event)
+            observer.stats["delivered"] += 1
+            return value
+        except Exception as e:
+            observer.stats["failed"] += 1
+            console.print(f"[yellow]⚠️  {observer.name} observer failed: {e}[/yellow]")
+            return None
+        finally:
+            if queued_at is not None:
+                with self._lock:
+                    observer.pending -= 1
+                    self._in_flight -= 1
+                    if self._in_flight == 0:
+                        self._idle.notify_all()
+
+    def publish(self, event: PostExecutionEvent) -> Dict[str, Any]:
+        """
+        Deliver an event.
+
+        Returns:
+            {observer_name: value} for blocking observers (None on timeout/failure)
+        """
+        with self._lock:
+            observers = [o for o in self._observers.values()]
+        matching = []
+        for observer in observers:
+            try:
+                if observer.when is None or observer.when(event):
+                    matching.append(observer)
+            except Exception:
+                continue
+
+        # Background observers: enqueue and return immediately
+        for observer in (o for o in matching if not o.blocking):
+            with self._lock:
+                if self._closed or observer.pending >= observer.backlog:
+                    observer.stats["dropped"] += 1
+                    continue
+                observer.pending += 1
+                self._in_flight += 1
+            self._pool.submit(self._run, observer, event, time.time())
+
+        # Blocking observers: run together, wait up to each one's timeout
+        blocking = [o for o in matching if o.blocking]
+        if not blocking:
+            return {}
+        if self._closed:
+            return {o.name: self._run(o, event) for o in blocking}
+
+        started = time.time()
+        futures = {o.name: self._blocking_pool.submit(self._run, o, event) for o in blocking}
+        values = {}
+        for observer in blocking:
+            try:
+                values[observer.name] = futures[observer.name].result(
+                    timeout=max(0.0, started + observer.timeout - time.time())
+                )
+            except FutureTimeout:
+                observer.stats["timed_out"] += 1
+                console.print(f"[yellow]⚠️  {observer.name} observer timed out after {observer.timeout:.0f}s[/yellow]")
+                values[observer.name] = None
+        return values
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued background events are processed. Returns False on timeout."""
+        deadline = None if timeout is None else time.time() + timeout
+        with self._idle:
+            while self._in_flight:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "observers": {
+                    name: {**o.stats, "blocking": o.blocking, "pending": o.pending}
+                    for name, o in self._observers.items()
+                }
+            }
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Give queued events a moment to finish, then stop accepting new ones."""
+        self.flush(timeout)
+        with self._lock:
+            self._closed = True
+        self._pool.shutdown(wait=False)
+        self._blocking_pool.shutdown(wait=False)
@@ -0,0 +1,259 @@
+"""
+Prompt Cache - Compile the tool schema and system prompt once per process
+
+Every iteration of IntelligentAgent._process_with_tools used to rebuild the
+~1,000-line system prompt, re-run bind_tools() over the full tool catalog
+and resend both. This module:
+
+- Compiles static prompt text once and keys it by content hash
+- Caches bound LLMs by (model, tool-set hash) so bind_tools runs once
+- Splits the system prompt into a static prefix and a small dynamic suffix
+  (date, recent context) so provider prompt caching can reuse the prefix
+- Adds cache_control breakpoints (Anthropic / Bedrock-Anthropic) after the
+  tool schema and after the static system prefix
+- Records prompt bytes and provider cache read/write tokens per turn
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rich.console import Console
+
+console = Console()
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def content_hash(obj: Any) -> str:
+    """Stable short hash of a string or JSON-serializable object."""
+    payload = obj if isinstance(obj, str) else json.dumps(obj, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def detect_provider(llm: Any) -> str:
+    """'anthropic', 'bedrock', 'openai' or 'other' from the LangChain class name."""
+    inner = getattr(llm, "__dict__", {}).get("llm")
+    if inner is not None:
+        return detect_provider(inner)  # Wrappers (CachedLLM, RecordingLLM)
+    name = type(llm).__name__.lower()
+    if "anthropic" in name:
+        return "anthropic"
+    if "bedrock" in name:
+        model_id = str(getattr(llm, "model_id", "") or "")
+        return "bedrock" if "anthropic" in model_id or not model_id else "other"
+    if "openai" in name:
+        return "openai"
+    return "other"
+
+
+def supports_breakpoints(provider: str) -> bool:
+    if os.getenv("PROMPT_CACHE_BREAKPOINTS", "true").lower() != "true":
+        return False
+    return provider in ("anthropic", "bedrock")
+
+
+@dataclass
+class CompiledPrompt:
+    """System prompt split into a cacheable static prefix and a per-turn suffix."""
+    static_text: str
+    static_hash: str
+    dynamic_text: str = ""
+
+    @property
+    def text(self) -> str:
+        return f"{self.static_text}\n\n{self.dynamic_text}" if self.dynamic_text else self.static_text
+
+    def as_system_content(self, provider: str) -> Any:
+        """Content for the system message: blocks with a breakpoint, or a plain string."""
+        if not supports_breakpoints(provider):
+            return self.text  # OpenAI caches identical prefixes automatically
+        blocks = [{"type": "text", "text": self.static_text, "cache_control": CACHE_CONTROL}]
+        if self.dynamic_text:
+            blocks.append({"type": "text", "text": self.dynamic_text})
+        return blocks
+
+
+@dataclass
+class TurnMetrics:
+    """Prompt size and provider cache usage for one LLM call."""
+    system_bytes: int
+    tools_bytes: int
+    messages_bytes: int
+    input_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    static_hash: str = ""
+    tools_hash: str = ""
+
+    @property
+    def total_bytes(self) -> int:
+        return self.system_bytes + self.tools_bytes + self.messages_bytes
+
+
+@dataclass
+class _CompiledTools:
+    tools: List[Dict[str, Any]]
+    tools_hash: str
+    size_bytes: int
+    bound: Dict[Tuple[int, str], Any] = field(default_factory=dict)
+
+
+class PromptCompiler:
+    """Process-wide cache of compiled prompts, tool schemas and bound LLMs."""
+
+    def __init__(self):
+        self._static: Dict[str, Tuple[str, str]] = {}
+        self._tools: Dict[str, _CompiledTools] = {}
+        self._tools_by_id: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.turns: List[TurnMetrics] = []
+        self._hooks: List[Callable[[TurnMetrics], None]] = []
+        self.stats = {"static_compiles": 0, "static_reuses": 0, "binds": 0, "bind_reuses": 0}
+
+    # ------------------------------------------------------------------ #
+    # System prompt
+    # ------------------------------------------------------------------ #
+
+    def compile_system_prompt(self, name: str, build_static: Callable[[], str], dynamic_text: str = "") -> CompiledPrompt:
+        """
+        Build the static part once per process (per name) and attach this turn's dynamic text.
+
+        Args:
+            name: Identifier of the static prompt (e.g. 'agent_system')
+            build_static: Returns the static text; only called on first use
+            dynamic_text: Per-turn suffix (date, recent conversation context)
+        """
+        with self._lock:
+            compiled = self._static.get(name)
+            if compiled is None:
+                text = build_static()
+                compiled = self._static[name] = (text, content_hash(text))
+                self.stats["static_compiles"] += 1
+            else:
+                self.stats["static_reuses"] += 1
+        return CompiledPrompt(static_text=compiled[0], static_hash=compiled[1], dynamic_text=dynamic_text)
+
+    # ------------------------------------------------------------------ #
+    # Tool schema
+    # ------------------------------------------------------------------ #
+
+    def compile_tools(self, tools: List[Dict[str, Any]]) -> _CompiledTools:
+        """Hash and size a tool list once; identical lists share one entry."""
+        with self._lock:
+            known_hash = self._tools_by_id.get(id(tools))
+            if known_hash and self._tools[known_hash].tools is tools:
+                return self._tools[known_hash]
+            serialized = json.dumps(tools, sort_keys=True, default=str)
+            tools_hash = content_hash(serialized)
+            compiled = self._tools.get(tools_hash)
+            if compiled is None:
+                compiled = self._tools[tools_hash] = _CompiledTools(tools, tools_hash, len(serialized.encode()))
+            self._tools_by_id[id(tools)] = tools_hash
+            return compiled
+
+    def bind_tools(self, llm: Any, tools: List[Dict[str, Any]]) -> Any:
+        """llm.bind_tools(tools), cached by (llm, tool-set hash)."""
+        compiled = self.compile_tools(tools)
+        key = (id(llm), compiled.tools_hash)
+        bound = compiled.bound.get(key)
+        if bound is not None:
+            self.stats["bind_reuses"] += 1
+            return bound
+
+        schema = compiled.tools
+        if schema and supports_breakpoints(detect_provider(llm)):
+            # Breakpoint after the last tool caches the whole tool block
+            schema = list(schema)
+            schema[-1] = {**schema[-1], "cache_control": CACHE_CONTROL}
+        bound = llm.bind_tools(schema)
+        compiled.bound[key] = bound
+        self.stats["binds"] += 1
+        return bound
+
+    # ------------------------------------------------------------------ #
+    # Metrics
+    # ------------------------------------------------------------------ #
+
+    def add_metrics_hook(self, hook: Callable[[TurnMetrics], None]) -> None:
+        """Register a callback that receives TurnMetrics after every LLM call."""
+        self._hooks.append(hook)
+
+    def record_turn(
+        self,
+        system_prompt: Any,
+        messages: List[Any],
+        response: Any = None,
+        tools: Optional[List[Dict[str, Any]]] = None
+    ) -> TurnMetrics:
+        """Measure one LLM call and pass it to the metrics hooks."""
+        if isinstance(system_prompt, CompiledPrompt):
+            system_bytes = len(system_prompt.text.encode())
+            static_hash = system_prompt.static_hash
+        else:
+            system_bytes = len(str(system_prompt).encode())
+            static_hash = ""
+        compiled_tools = self.compile_tools(tools) if tools else None
+        metrics = TurnMetrics(
+            system_bytes=system_bytes,
+            tools_bytes=compiled_tools.size_bytes if compiled_tools else 0,
+            messages_bytes=len(json.dumps(messages, default=str).encode()),
+            static_hash=static_hash,
+            tools_hash=compiled_tools.tools_hash if compiled_tools else ""
+        )
+        self._read_usage(response, metrics)
+
+        self.turns.append(metrics)
+        del self.turns[:-200]
+        for hook in self._hooks:
+            try:
+                hook(metrics)
+            except Exception as e:
+                console.print(f"[dim]⚠️  Prompt metrics hook failed: {e}[/dim]")
+        if os.getenv("PROMPT_METRICS_VERBOSE", "false").lower() == "true":
+            hit_rate = (metrics.cache_read_tokens / metrics.input_tokens * 100) if metrics.input_tokens else 0
+            console.print(
+                f"[dim]📏 Prompt: {metrics.total_bytes / 1024:.0f} KB "
+                f"(system {metrics.system_bytes / 1024:.0f} KB, tools {metrics.tools_bytes / 1024:.0f} KB) | "
+                f"cache read {metrics.cache_read_tokens}/{metrics.input_tokens} tokens ({hit_rate:.0f}%)[/dim]"
+            )
+        return metrics
+
+    @staticmethod
+    def _read_usage(response: Any, metrics: TurnMetrics) -> None:
+        """Pull input / cache token counts from LangChain usage metadata (any provider)."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        if usage:
+            details = usage.get("input_token_details") or {}
+            metrics.input_tokens = int(usage.get("input_tokens") or 0)
+            metrics.cache_read_tokens = int(details.get("cache_read") or 0)
+            metrics.cache_write_tokens = int(details.get("cache_creation") or 0)
+            return
+        raw = (getattr(response, "response_metadata", None) or {}).get("usage") or {}
+        metrics.cache_read_tokens = int(raw.get("cache_read_input_tokens") or 0)
+        metrics.cache_write_tokens = int(raw.get("cache_creation_input_tokens") or 0)
+        metrics.input_tokens = int(raw.get("input_tokens") or 0) + metrics.cache_read_tokens + metrics.cache_write_tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        input_tokens = sum(t.input_tokens for t in self.turns)
+        cache_read = sum(t.cache_read_tokens for t in self.turns)
+        return {
+            **self.stats,
+            "turns": len(self.turns),
+            "avg_prompt_kb": round(sum(t.total_bytes for t in self.turns) / len(self.turns) / 1024, 1) if self.turns else 0,
+            "cache_hit_rate": f"{(cache_read / input_tokens * 100) if input_tokens else 0:.1f}%"
+        }
+
+
+_prompt_compiler: Optional[PromptCompiler] = None
+
+
+def get_prompt_compiler() -> PromptCompiler:
+    """Get the process-wide PromptCompiler."""
+    global _prompt_compiler
+    if _prompt_compiler is None:
+        _prompt_compiler = PromptCompiler()
+    return _prompt_compiler
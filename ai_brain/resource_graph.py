@@ -0,0 +1,550 @@
+"""
+Resource Graph - In-memory cross-service relationship graph for AWS evidence
+
+Nodes are AWS resources keyed by ARN; edges are typed relationships extracted
+from well-known fields in collector output (KmsKeyId, VpcSecurityGroups,
+SubnetId, VpcId, IAM roles, cluster members ...).
+
+Provides:
+- Interned integer node ids with ARN / short-id / name indexes
+- Compact CSR adjacency (array-backed offsets/targets/edge types) in both directions
+- Multi-hop traversal, typed neighbour lookups and "X related to Y" joins
+- Public exposure query (0.0.0.0/0 or ::/0 security groups -> resources behind them)
+- Build from collector output or from the columnar evidence store
+"""
+
+import json
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from rich.console import Console
+
+console = Console()
+
+
+EDGE_TYPES = (
+    "encrypted_by",
+    "protected_by",
+    "in_subnet",
+    "in_vpc",
+    "assumes_role",
+    "uses_instance_profile",
+    "has_member",
+)
+_EDGE_TYPE_IDS = {name: idx for idx, name in enumerate(EDGE_TYPES)}
+
+# field -> (edge type, target kind). Target kind is used to synthesise a
+# placeholder node when the referenced resource was not collected.
+EDGE_RULES: List[Tuple[str, str, str]] = [
+    ("KmsKeyId", "encrypted_by", "kms:keys"),
+    ("KMSKeyArn", "encrypted_by", "kms:keys"),
+    ("KmsKeyArn", "encrypted_by", "kms:keys"),
+    ("VpcSecurityGroups[].VpcSecurityGroupId", "protected_by", "ec2:security_groups"),
+    ("SecurityGroups[].GroupId", "protected_by", "ec2:security_groups"),
+    ("VpcConfig.SecurityGroupIds[]", "protected_by", "ec2:security_groups"),
+    ("SubnetId", "in_subnet", "ec2:subnets"),
+    ("DBSubnetGroup.Subnets[].SubnetIdentifier", "in_subnet", "ec2:subnets"),
+    ("VpcConfig.SubnetIds[]", "in_subnet", "ec2:subnets"),
+    ("VpcId", "in_vpc", "ec2:vpcs"),
+    ("DBSubnetGroup.VpcId", "in_vpc", "ec2:vpcs"),
+    ("Role", "assumes_role", "iam:roles"),
+    ("IamInstanceProfile.Arn", "uses_instance_profile", "iam:instance_profiles"),
+    ("DBClusterMembers[].DBInstanceIdentifier", "has_member", "rds:instances"),
+]
+
+_REFERENCE_FIELDS = {path.split(".")[0].rstrip("[]") for path, _, _ in EDGE_RULES}
+
+# Fields tried (in order) to find a resource's own identifier. Network ids come
+# late because instances/clusters also carry SubnetId/VpcId as references.
+ID_FIELDS = (
+    "InstanceId", "DBClusterIdentifier", "DBInstanceIdentifier", "FunctionName",
+    "RoleName", "UserName", "TableName", "KeyId", "GroupId", "SubnetId", "VpcId",
+    "BucketName", "AliasName", "Name", "Id",
+)
+
+_NULL_VALUES = {"", "n/a", "none", "null", "nan", "not set"}
+
+# kind -> resource part prefix of the real ARN, so placeholder nodes for
+# uncollected resources get the same ARN AWS reports (security-group/sg-1, db:name)
+ARN_RESOURCE_PREFIXES = {
+    "ec2:instances": "instance/",
+    "ec2:security_groups": "security-group/",
+    "ec2:subnets": "subnet/",
+    "ec2:vpcs": "vpc/",
+    "ec2:volumes": "volume/",
+    "ec2:snapshots": "snapshot/",
+    "ec2:network_interfaces": "network-interface/",
+    "kms:keys": "key/",
+    "kms:aliases": "",  # AliasName already starts with alias/
+    "rds:instances": "db:",
+    "rds:clusters": "cluster:",
+    "rds:snapshots": "snapshot:",
+    "rds:cluster_snapshots": "cluster-snapshot:",
+    "lambda:functions": "function:",
+    "dynamodb:tables": "table/",
+    "iam:roles": "role/",
+    "iam:users": "user/",
+    "iam:groups": "group/",
+    "iam:policies": "policy/",
+    "iam:instance_profiles": "instance-profile/",
+    "ecs:clusters": "cluster/",
+    "eks:clusters": "cluster/",
+    "secretsmanager:secrets": "secret:",
+    "sns:topics": "",
+}
+_GLOBAL_ARN_SERVICES = {"iam"}  # ARNs without a region
+
+_PUBLIC_CIDRS = {"0.0.0.0/0", "::/0"}
+
+
+def _maybe_json(value: Any) -> Any:
+    """Evidence-store and CSV rows carry nested structures as JSON strings."""
+    if isinstance(value, str) and value[:1] in ("[", "{"):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _allows_public_ingress(permissions: Any) -> bool:
+    """True if any security group ingress rule is open to 0.0.0.0/0 or ::/0."""
+    permissions = _maybe_json(permissions)
+    if not isinstance(permissions, list):
+        return False
+    for permission in permissions:
+        if not isinstance(permission, dict):
+            continue
+        ranges = _maybe_json(permission.get("IpRanges")) or []
+        ranges_v6 = _maybe_json(permission.get("Ipv6Ranges")) or []
+        cidrs = [r.get("CidrIp") for r in ranges if isinstance(r, dict)]
+        cidrs += [r.get("CidrIpv6") for r in ranges_v6 if isinstance(r, dict)]
+        if _PUBLIC_CIDRS.intersection(cidrs):
+            return True
+    return False
+
+
+def _arn_resource_prefix(kind: str) -> str:
+    if kind in ARN_RESOURCE_PREFIXES:
+        return ARN_RESOURCE_PREFIXES[kind]
+    resource_type = kind.partition(":")[2]
+    if resource_type.endswith("ies"):
+        resource_type = resource_type[:-3] + "y"
+    elif resource_type.endswith("s"):
+        resource_type = resource_type[:-1]
+    return resource_type.replace("_", "-") + "/"
+
+
+def _extract_path(record: Dict[str, Any], path: str) -> List[str]:
+    """Resolve a dotted path with [] list markers into a flat list of strings."""
+    values: List[Any] = [record]
+    for part in path.split("."):
+        is_list = part.endswith("[]")
+        key = part[:-2] if is_list else part
+        next_values: List[Any] = []
+        for value in values:
+            value = _maybe_json(value)
+            if not isinstance(value, dict):
+                continue
+            child = _maybe_json(value.get(key))
+            if child is None:
+                continue
+            if is_list and isinstance(child, list):
+                next_values.extend(child)
+            else:
+                next_values.append(child)
+        values = next_values
+    return [
+        str(v) for v in values
+        if v is not None and not isinstance(v, (dict, list)) and str(v).strip().lower() not in _NULL_VALUES
+        and not str(v).startswith("N/A")
+    ]
+
+
+@dataclass
+class ResourceNode:
+    """A resource (or placeholder for a referenced-but-uncollected resource)"""
+    arn: str
+    kind: str  # "<service>:<resource_type>"
+    name: str
+    account: str = ""
+    region: str = ""
+    placeholder: bool = False
+    flags: Set[str] = field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "arn": self.arn,
+            "kind": self.kind,
+            "name": self.name,
+            "account": self.account,
+            "region": self.region,
+        }
+        if self.placeholder:
+            data["placeholder"] = True
+        if self.flags:
+            data["flags"] = sorted(self.flags)
+        return data
+
+
+class ResourceGraph:
+    """
+    Typed, directed resource graph with CSR adjacency.
+
+    Edges are buffered while loading and frozen into array-backed CSR
+    structures on the first query, so lookups are O(degree) with no
+    per-edge Python objects.
+    """
+
+    def __init__(self):
+        self.nodes: List[ResourceNode] = []
+        self._arn_index: Dict[str, int] = {}
+        self._alias_index: Dict[str, List[int]] = {}
+        self._kind_index: Dict[str, List[int]] = {}
+        self._pending_edges: List[Tuple[int, int, int]] = []
+        self._edge_set: Set[Tuple[int, int, int]] = set()
+        self._frozen = False
+        self._lock = threading.RLock()
+        # CSR: out_offsets[n]..out_offsets[n+1] index into out_targets/out_types
+        self._out_offsets = array("I")
+        self._out_targets = array("I")
+        self._out_types = array("B")
+        self._in_offsets = array("I")
+        self._in_targets = array("I")
+        self._in_types = array("B")
+
+    # ------------------------------------------------------------------ #
+    # Loading
+    # ------------------------------------------------------------------ #
+
+    def _intern(self, node: ResourceNode, aliases: Iterable[str]) -> int:
+        idx = self._arn_index.get(node.arn)
+        if idx is not None:
+            existing = self.nodes[idx]
+            if existing.placeholder and not node.placeholder:
+                node.flags |= existing.flags
+                self.nodes[idx] = node
+                if node.kind != existing.kind:
+                    self._kind_index[existing.kind].remove(idx)
+                    self._kind_index.setdefault(node.kind, []).append(idx)
+                self._add_aliases(idx, aliases)
+            return idx
+        idx = len(self.nodes)
+        self.nodes.append(node)
+        self._arn_index[node.arn] = idx
+        self._kind_index.setdefault(node.kind, []).append(idx)
+        self._add_aliases(idx, aliases)
+        return idx
+
+    def _add_aliases(self, idx: int, aliases: Iterable[str]) -> None:
+        for alias in aliases:
+            if not alias:
+                continue
+            bucket = self._alias_index.setdefault(alias.lower(), [])
+            if idx not in bucket:
+                bucket.append(idx)
+
+    @staticmethod
+    def _own_arn(record: Dict[str, Any]) -> Optional[str]:
+        for key in ("Arn", "ARN"):
+            value = record.get(key)
+            if isinstance(value, str) and value.startswith("arn:"):
+                return value
+        for key, value in record.items():
+            if key in _REFERENCE_FIELDS:
+                continue
+            if key.endswith("Arn") and isinstance(value, str) and value.startswith("arn:"):
+                return value
+        return None
+
+    @staticmethod
+    def _synthetic_arn(kind: str, identifier: str, account: str, region: str) -> str:
+        service = kind.partition(":")[0]
+        if service == "s3":
+            return f"arn:aws:s3:::{identifier}"
+        if service in _GLOBAL_ARN_SERVICES:
+            region = ""
+        return f"arn:aws:{service}:{region}:{account}:{_arn_resource_prefix(kind)}{identifier}"
+
+    def _resolve_reference(self, value: str, target_kind: str, account: str, region: str) -> int:
+        """Find (or create a placeholder for) the node a field value refers to."""
+        if value.startswith("arn:"):
+            idx = self._arn_index.get(value)
+            if idx is not None:
+                return idx
+            short = value.rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+        else:
+            short = value
+        for idx in self._alias_index.get(short.lower(), []):
+            node = self.nodes[idx]
+            if node.kind == target_kind and (not account or node.account in ("", account)):
+                return idx
+        arn = value if value.startswith("arn:") else self._synthetic_arn(target_kind, short, account, region)
+        placeholder = ResourceNode(arn=arn, kind=target_kind, name=short, account=account, region=region, placeholder=True)
+        return self._intern(placeholder, [short, value])
+
+    def add_records(
+        self,
+        records: Iterable[Dict[str, Any]],
+        service: str,
+        resource_type: str,
+        account: str = "",
+        region: str = "",
+    ) -> int:
+        """Add one resource table. Returns number of resources added."""
+        kind = f"{service}:{resource_type}"
+        added: List[Tuple[int, Dict[str, Any]]] = []
+        with self._lock:
+            for record in records:
+                identifier = next((str(record[f]) for f in ID_FIELDS if record.get(f)), None)
+                arn = self._own_arn(record)
+                if not arn and not identifier:
+                    continue
+                identifier = identifier or arn.rsplit("/", 1)[-1]
+                arn = arn or self._synthetic_arn(kind, identifier, account, region)
+                node = ResourceNode(arn=arn, kind=kind, name=identifier, account=account, region=region)
+                if kind == "ec2:security_groups" and _allows_public_ingress(record.get("IpPermissions")):
+                    node.flags.add("public_ingress")
+                if str(record.get("PubliclyAccessible", "")).lower() == "true":
+                    node.flags.add("publicly_accessible")
+                aliases = [identifier, str(record.get("KeyId", "")), str(record.get("AliasName", ""))]
+                added.append((self._intern(node, aliases), record))
+
+            # Edges after all nodes of this table are interned, so intra-table refs resolve
+            for idx, record in added:
+                for path, edge_type, target_kind in EDGE_RULES:
+                    for value in _extract_path(record, path):
+                        target = self._resolve_reference(value, target_kind, account, region)
+                        if target != idx:
+                            self.add_edge(idx, target, edge_type)
+            self._frozen = False
+        return len(added)
+
+    def add_collection(
+        self,
+        data: Dict[str, Dict[str, List[Dict[str, Any]]]],
+        account: str = "",
+        region: str = "",
+    ) -> int:
+        """Add collector output (service -> resource_type -> records)."""
+        total = 0
+        # Load network/KMS tables first so references resolve to real nodes
+        ordered = sorted(
+            ((s, t, r) for s, types in data.items() for t, r in types.items()),
+            key=lambda item: 0 if item[0] in ("ec2", "kms", "iam") else 1,
+        )
+        for service, resource_type, records in ordered:
+            total += self.add_records(records or [], service, resource_type, account, region)
+        return total
+
+    def add_edge(self, source: int, target: int, edge_type: str) -> None:
+        key = (source, target, _EDGE_TYPE_IDS[edge_type])
+        if key not in self._edge_set:
+            self._edge_set.add(key)
+            self._pending_edges.append(key)
+            self._frozen = False
+
+    def _freeze(self) -> None:
+        """Rebuild CSR arrays from the edge list."""
+        with self._lock:
+            if self._frozen:
+                return
+            n = len(self.nodes)
+            for direction in ("out", "in"):
+                counts = [0] * (n + 1)
+                for src, dst, _ in self._pending_edges:
+                    counts[(src if direction == "out" else dst) + 1] += 1
+                for i in range(n):
+                    counts[i + 1] += counts[i]
+                offsets = array("I", counts)
+                cursor = list(counts[:-1])
+                targets = array("I", bytes(4 * len(self._pending_edges)))
+                types = array("B", bytes(len(self._pending_edges)))
+                for src, dst, etype in self._pending_edges:
+                    owner, other = (src, dst) if direction == "out" else (dst, src)
+                    pos = cursor[owner]
+                    targets[pos] = other
+                    types[pos] = etype
+                    cursor[owner] += 1
+                if direction == "out":
+                    self._out_offsets, self._out_targets, self._out_types = offsets, targets, types
+                else:
+                    self._in_offsets, self._in_targets, self._in_types = offsets, targets, types
+            self._frozen = True
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def find(self, ref: str) -> List[int]:
+        """Resolve an ARN, short id (sg-..., key id) or resource name to node ids."""
+        if ref in self._arn_index:
+            return [self._arn_index[ref]]
+        return list(self._alias_index.get(ref.lower(), []))
+
+    def _edges(self, idx: int, direction: str) -> Iterable[Tuple[int, str, str]]:
+        self._freeze()
+        if direction in ("out", "both"):
+            for pos in range(self._out_offsets[idx], self._out_offsets[idx + 1]):
+                yield self._out_targets[pos], EDGE_TYPES[self._out_types[pos]], "out"
+        if direction in ("in", "both"):
+            for pos in range(self._in_offsets[idx], self._in_offsets[idx + 1]):
+                yield self._in_targets[pos], EDGE_TYPES[self._in_types[pos]], "in"
+
+    def neighbors(
+        self,
+        ref: str,
+        edge_types: Optional[List[str]] = None,
+        direction: str = "both",
+    ) -> List[Dict[str, Any]]:
+        results = []
+        for idx in self.find(ref):
+            for other, edge_type, edge_dir in self._edges(idx, direction):
+                if edge_types and edge_type not in edge_types:
+                    continue
+                entry = self.nodes[other].to_dict()
+                entry.update({"edge": edge_type, "direction": edge_dir, "from": self.nodes[idx].arn})
+                results.append(entry)
+        return results
+
+    def traverse(
+        self,
+        ref: str,
+        edge_types: Optional[List[str]] = None,
+        direction: str = "both",
+        max_hops: int = 3,
+        target_kind: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Breadth-first multi-hop traversal; returns reached nodes with their path."""
+        results = []
+        for start in self.find(ref):
+            seen = {start}
+            queue = deque([(start, 0, [])])
+            while queue:
+                idx, hops, path = queue.popleft()
+                if hops >= max_hops:
+                    continue
+                for other, edge_type, edge_dir in self._edges(idx, direction):
+                    if other in seen or (edge_types and edge_type not in edge_types):
+                        continue
+                    seen.add(other)
+                    step_path = path + [f"{'-' if edge_dir == 'out' else '<-'}{edge_type}{'->' if edge_dir == 'out' else '-'}"
+                                        f" {self.nodes[other].name}"]
+                    if not target_kind or self.nodes[other].kind == target_kind:
+                        entry = self.nodes[other].to_dict()
+                        entry.update({"hops": hops + 1, "path": " ".join(step_path)})
+                        results.append(entry)
+                    queue.append((other, hops + 1, step_path))
+        return results
+
+    def related(self, source_kind: str, edge_type: str, direction: str = "out") -> List[Dict[str, str]]:
+        """All (source, target) pairs for one edge type, e.g. rds:clusters encrypted_by."""
+        pairs = []
+        for idx in self._kind_index.get(source_kind, []):
+            for other, etype, _ in self._edges(idx, direction):
+                if etype == edge_type:
+                    pairs.append({
+                        "source": self.nodes[idx].name,
+                        "source_arn": self.nodes[idx].arn,
+                        "target": self.nodes[other].name,
+                        "target_arn": self.nodes[other].arn,
+                        "target_kind": self.nodes[other].kind,
+                        "account": self.nodes[idx].account,
+                        "region": self.nodes[idx].region,
+                    })
+        return pairs
+
+    def exposure(self) -> List[Dict[str, Any]]:
+        """Resources protected by a security group that allows 0.0.0.0/0 or ::/0 ingress."""
+        exposed = []
+        for idx in self._kind_index.get("ec2:security_groups", []):
+            if "public_ingress" not in self.nodes[idx].flags:
+                continue
+            for other, edge_type, _ in self._edges(idx, "in"):
+                if edge_type == "protected_by":
+                    entry = self.nodes[other].to_dict()
+                    entry["security_group"] = self.nodes[idx].name
+                    exposed.append(entry)
+        return exposed
+
+    def get_stats(self) -> Dict[str, Any]:
+        self._freeze()
+        edge_counts: Dict[str, int] = {}
+        for etype in self._out_types:
+            edge_counts[EDGE_TYPES[etype]] = edge_counts.get(EDGE_TYPES[etype], 0) + 1
+        return {
+            "nodes": len(self.nodes),
+            "placeholders": sum(1 for n in self.nodes if n.placeholder),
+            "edges": len(self._pending_edges),
+            "edges_by_type": edge_counts,
+            "kinds": {kind: len(ids) for kind, ids in sorted(self._kind_index.items())},
+        }
+
+
+def build_graph_from_evidence_store(
+    fiscal_year: Optional[str] = None,
+    account: Optional[str] = None,
+    region: Optional[str] = None,
+) -> ResourceGraph:
+    """Build a graph from the latest snapshots in the columnar evidence store."""
+    from evidence_manager.evidence_store import get_evidence_store, PARTITION_KEYS, PYARROW_AVAILABLE
+
+    graph = ResourceGraph()
+    if not PYARROW_AVAILABLE:
+        console.print("[yellow]⚠️  pyarrow not installed - resource graph is empty[/yellow]")
+        return graph
+
+    store = get_evidence_store()
+    filters = {
+        "fiscal_year": fiscal_year or store.current_fiscal_year(),
+        "account": account,
+        "region": region,
+    }
+    partitions = store.list_partitions(**filters)
+    # Same ordering as add_collection: referenced tables first
+    partitions.sort(key=lambda p: 0 if p.get("service") in ("ec2", "kms", "iam") else 1)
+    for partition in partitions:
+        df = store.scan(filters={k: partition[k] for k in PARTITION_KEYS})
+        if df.empty:
+            continue
+        graph.add_records(
+            df.to_dict("records"),
+            service=partition["service"],
+            resource_type=partition["resource_type"],
+            account=partition["account"],
+            region=partition["region"],
+        )
+
+    stats = graph.get_stats()
+    console.print(f"[green]✅ Resource graph: {stats['nodes']} nodes, {stats['edges']} edges[/green]")
+    return graph
+
+
+_resource_graphs: Dict[Tuple[str, Optional[str], Optional[str]], ResourceGraph] = {}
+_resource_graphs_lock = threading.Lock()
+
+
+def get_resource_graph(
+    rebuild: bool = False,
+    fiscal_year: Optional[str] = None,
+    account: Optional[str] = None,
+    region: Optional[str] = None,
+) -> ResourceGraph:
+    """
+    Get the resource graph for a (fiscal_year, account, region) scope.
+
+    Each scope is built lazily from the evidence store and cached on its own,
+    so a filtered query neither rebuilds nor replaces the unfiltered graph.
+    """
+    from evidence_manager.evidence_store import ColumnarEvidenceStore
+
+    key = (fiscal_year or ColumnarEvidenceStore.current_fiscal_year(), account or None, region or None)
+    with _resource_graphs_lock:
+        graph = _resource_graphs.get(key)
+        if graph is None or rebuild:
+            graph = build_graph_from_evidence_store(fiscal_year=key[0], account=key[1], region=key[2])
+            _resource_graphs[key] = graph
+    return graph
@@ -6,14 +6,22 @@ This module provides:
 - BaseNavigator: Common navigation patterns
 - ErrorHandler: Standardized error handling
 - CacheManager: LLM response caching
+- SQLiteDiskCache: Size-bounded persistent cache backend
+- SQLiteTaskQueue: Durable task queue with leases and retries
+- TimerWheel: O(1) cancellable timeouts on one thread
 - ConnectionPool: AWS client pooling
+- lazy_import: Defer heavy modules until first use
 """
 
 from .base_tool import BaseTool
 from .base_navigator import BaseNavigator
 from .error_handler import ErrorHandler, RetryConfig
 from .cache_manager import CacheManager
+from .disk_cache import SQLiteDiskCache
+from .task_queue import SQLiteTaskQueue
+from .timer_wheel import TimerWheel
 from .connection_pool import ConnectionPool
+from .lazy_imports import lazy_import, optional_lazy_import, module_available
 
 __all__ = [
     'BaseTool',
@@ -21,6 +29,12 @@ __all__ = [
     'ErrorHandler',
     'RetryConfig',
     'CacheManager',
+    'SQLiteDiskCache',
+    'SQLiteTaskQueue',
+    'TimerWheel',
     'ConnectionPool',
+    'lazy_import',
+    'optional_lazy_import',
+    'module_available',
 ]
 
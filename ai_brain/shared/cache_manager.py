@@ -5,10 +5,20 @@ Reduces redundant LLM calls by caching responses based on:
 - Input prompt hash
 - Tool parameters
 - Context fingerprint
+
+The in-process tier is safe to share between threads:
+- LRU ordering with capacity limits (entries and approximate bytes)
+- Background sweeper thread that drops expired entries
+- Single-flight population: concurrent misses on one key compute once
 """
 
+import fnmatch
 import hashlib
 import json
+import sys
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
@@ -16,6 +26,26 @@ from rich.console import Console
 
 console = Console()
 
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB (approximate)
+DEFAULT_SWEEP_INTERVAL = 60  # seconds
+
+_MISSING = object()
+
+
+def _approx_size(value: Any, depth: int = 0) -> int:
+    """Cheap recursive size estimate; containers are walked a few levels deep."""
+    size = sys.getsizeof(value, 64)
+    if depth >= 3:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _approx_size(k, depth + 1) + _approx_size(v, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _approx_size(item, depth + 1)
+    return size
+
 
 @dataclass
 class CacheEntry:
@@ -23,6 +53,7 @@ class CacheEntry:
     value: Any
     created_at: datetime
     expires_at: Optional[datetime] = None
+    size: int = 0
     
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
@@ -31,20 +62,48 @@ class CacheEntry:
         return datetime.now() > self.expires_at
 
 
+class _Flight:
+    """One in-progress computation that concurrent callers wait on."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
 class CacheManager:
     """Manages caching of LLM responses and tool results."""
     
-    def __init__(self, default_ttl: int = 3600):
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        sweep_interval: Optional[float] = DEFAULT_SWEEP_INTERVAL
+    ):
         """
         Initialize cache manager.
         
         Args:
             default_ttl: Default time-to-live in seconds (1 hour)
+            max_entries: Maximum number of entries before LRU eviction
+            max_bytes: Approximate memory budget before LRU eviction
+            sweep_interval: Seconds between background expiry sweeps (None disables)
         """
-        self.cache: Dict[str, CacheEntry] = {}
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        
+        self._lock = threading.RLock()
+        self._inflight: Dict[str, _Flight] = {}
+        self._stop_event = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
     
     def _generate_key(self, *args, **kwargs) -> str:
         """
@@ -53,7 +112,7 @@ class CacheManager:
         Args:
             *args: Positional arguments
             **kwargs: Keyword arguments
-            
+        
         Returns:
             Cache key (SHA256 hash)
         """
@@ -65,29 +124,78 @@ class CacheManager:
         key_str = json.dumps(key_data, sort_keys=True, default=str)
         return hashlib.sha256(key_str.encode()).hexdigest()
     
+    # ------------------------------------------------------------------ #
+    # Internal helpers (caller holds self._lock)
+    # ------------------------------------------------------------------ #
+    
+    def _lookup(self, key: str) -> Any:
+        """Return the live value for key or _MISSING; refreshes LRU position."""
+        entry = self.cache.get(key)
+        if entry is None:
+            return _MISSING
+        if entry.is_expired():
+            self._remove(key)
+            return _MISSING
+        self.cache.move_to_end(key)
+        return entry.value
+    
+    def _remove(self, key: str) -> None:
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+    
+    def _evict_if_needed(self) -> None:
+        while self.cache and (len(self.cache) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, entry = self.cache.popitem(last=False)
+            self.total_bytes -= entry.size
+            self.evictions += 1
+    
+    def _ensure_sweeper(self) -> None:
+        """Start the background expiry sweeper on first write."""
+        if self._sweeper is not None or not self.sweep_interval:
+            return
+        # The thread holds only a weak reference so an unused manager can still be collected
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop,
+            args=(weakref.ref(self), self._stop_event, self.sweep_interval),
+            name="cache-sweeper",
+            daemon=True
+        )
+        self._sweeper.start()
+    
+    @staticmethod
+    def _sweep_loop(ref: "weakref.ref", stop_event: threading.Event, interval: float) -> None:
+        while not stop_event.wait(interval):
+            manager = ref()
+            if manager is None:
+                return
+            try:
+                manager.sweep_expired()
+            except Exception:
+                pass
+            del manager
+    
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
         
         Args:
             key: Cache key
-            
+        
         Returns:
             Cached value or None if not found/expired
         """
-        entry = self.cache.get(key)
-        
-        if entry is None:
-            self.misses += 1
-            return None
-        
-        if entry.is_expired():
-            del self.cache[key]
-            self.misses += 1
-            return None
-        
-        self.hits += 1
-        return entry.value
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return value
     
     def set(
         self,
@@ -104,13 +212,81 @@ class CacheManager:
             ttl: Time-to-live in seconds (uses default if None)
         """
         ttl = ttl or self.default_ttl
-        expires_at = datetime.now() + timedelta(seconds=ttl)
-        
-        self.cache[key] = CacheEntry(
+        now = datetime.now()
+        entry = CacheEntry(
             value=value,
-            created_at=datetime.now(),
-            expires_at=expires_at
+            created_at=now,
+            expires_at=now + timedelta(seconds=ttl),
+            size=_approx_size(value)
         )
+        
+        with self._lock:
+            self._remove(key)
+            self.cache[key] = entry
+            self.total_bytes += entry.size
+            self._evict_if_needed()
+            self._ensure_sweeper()
+    
+    def delete(self, key: str) -> bool:
+        """Remove one entry. Returns True if it existed."""
+        with self._lock:
+            existed = key in self.cache
+            self._remove(key)
+            return existed
+    
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing it at most once.
+        
+        Concurrent callers that miss on the same key wait for the first
+        caller's computation instead of running their own. None results
+        are returned but not cached.
+        
+        The fast path goes through get(), so subclasses with extra tiers
+        (disk, pending writes) are consulted before computing.
+        
+        Args:
+            key: Cache key
+            compute: Zero-argument function producing the value
+            ttl: Time-to-live in seconds
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        with self._lock:
+            # A leader may have stored the value since the get() above
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        
+        try:
+            flight.value = compute()
+            if flight.value is not None:
+                self.set(key, flight.value, ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
     
     def cached(
         self,
@@ -123,7 +299,7 @@ class CacheManager:
         Args:
             ttl: Time-to-live in seconds
             key_func: Custom key generation function
-            
+        
         Example:
             @cache_manager.cached(ttl=3600)
             def expensive_llm_call(prompt: str) -> str:
@@ -137,39 +313,49 @@ class CacheManager:
                 else:
                     cache_key = self._generate_key(*args, **kwargs)
                 
-                # Check cache
-                cached_value = self.get(cache_key)
-                if cached_value is not None:
-                    return cached_value
-                
-                # Execute function
-                result = func(*args, **kwargs)
-                
-                # Cache result
-                self.set(cache_key, result, ttl)
-                
-                return result
+                return self.get_or_compute(cache_key, lambda: func(*args, **kwargs), ttl)
             
             return wrapper
         return decorator
     
+    def sweep_expired(self) -> int:
+        """
+        Drop expired entries (run periodically by the background sweeper).
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            expired = [key for key, entry in self.cache.items() if entry.is_expired()]
+            for key in expired:
+                self._remove(key)
+            return len(expired)
+    
     def clear(self, pattern: Optional[str] = None) -> int:
         """
         Clear cache entries.
         
         Args:
-            pattern: Optional pattern to match keys (not implemented yet)
-            
+            pattern: Optional glob pattern to match keys (e.g. 'llm:*')
+        
         Returns:
             Number of entries cleared
         """
-        if pattern is None:
-            count = len(self.cache)
-            self.cache.clear()
-            return count
-        
-        # TODO: Implement pattern matching
-        return 0
+        with self._lock:
+            if pattern is None:
+                count = len(self.cache)
+                self.cache.clear()
+                self.total_bytes = 0
+                return count
+            
+            matched = [key for key in self.cache if fnmatch.fnmatchcase(key, pattern)]
+            for key in matched:
+                self._remove(key)
+            return len(matched)
+    
+    def close(self) -> None:
+        """Stop the background sweeper."""
+        self._stop_event.set()
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -178,14 +364,17 @@ class CacheManager:
         Returns:
             Dict with cache stats
         """
-        total_requests = self.hits + self.misses
-        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
-        
-        return {
-            "hits": self.hits,
-            "misses": self.misses,
-            "hit_rate": f"{hit_rate:.1f}%",
-            "entries": len(self.cache),
-            "total_requests": total_requests
-        }
-
+        with self._lock:
+            total_requests = self.hits + self.misses
+            hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+            
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": f"{hit_rate:.1f}%",
+                "entries": len(self.cache),
+                "total_requests": total_requests,
+                "approx_mb": round(self.total_bytes / (1024 * 1024), 2),
+                "evictions": self.evictions,
+                "inflight": len(self._inflight)
+            }
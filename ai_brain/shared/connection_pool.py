@@ -6,7 +6,9 @@ Reuses AWS clients to reduce overhead and improve performance.
 
 from typing import Dict, Optional, Any
 from threading import Lock
-import boto3
+from .lazy_imports import lazy_import
+
+boto3 = lazy_import("boto3")  # Loaded on the first client/session request
 from rich.console import Console
 
 console = Console()
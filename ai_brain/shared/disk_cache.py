@@ -0,0 +1,274 @@
+"""
+Disk Cache - Single-file, size-bounded SQLite backend for the cache hierarchy.
+
+Replaces one-pickle-file-per-key storage with one WAL-mode SQLite database:
+- Byte and entry accounting kept in a meta table by triggers (O(1) stats)
+- LRU or LFU eviction down to a low watermark when the byte budget is exceeded
+- Indexed expiry sweeps (no directory globbing, no unpickling to check TTLs)
+- Invalidation by key prefix (index range scan), glob pattern, or tag
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+LOW_WATERMARK = 0.9  # evict down to 90% of the budget
+EVICTION_BATCH = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires_at);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS idx_entries_hits ON entries(hits, last_access);
+
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+);
+CREATE INDEX IF NOT EXISTS idx_entry_tags_key ON entry_tags(key);
+
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('total_bytes', 0);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('entry_count', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE meta SET value = value + NEW.size WHERE name = 'total_bytes';
+    UPDATE meta SET value = value + 1 WHERE name = 'entry_count';
+END;
+CREATE TRIGGER IF NOT EXISTS trg_entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE meta SET value = value - OLD.size WHERE name = 'total_bytes';
+    UPDATE meta SET value = value - 1 WHERE name = 'entry_count';
+    DELETE FROM entry_tags WHERE key = OLD.key;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE meta SET value = value - OLD.size + NEW.size WHERE name = 'total_bytes';
+END;
+"""
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _pattern_clause(pattern: Optional[str]) -> Tuple[str, tuple]:
+    """WHERE clause for a key pattern: None = everything, 'prefix*' = index range scan, other globs use GLOB."""
+    if pattern is None:
+        return "", ()
+    prefix = pattern[:-1]
+    if pattern.endswith("*") and prefix and not any(c in prefix for c in "*?["):
+        return " WHERE key >= ? AND key < ?", (prefix, _prefix_upper_bound(prefix))
+    if not any(c in pattern for c in "*?["):
+        return " WHERE key = ?", (pattern,)
+    return " WHERE key GLOB ?", (pattern,)
+
+
+class SQLiteDiskCache:
+    """
+    Persistent key/value cache in a single SQLite file.
+
+    Values are pickled. All operations touch a bounded number of rows through
+    indexes, so cost does not grow with the number of cached entries.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        eviction_policy: str = "lru",
+    ):
+        """
+        Initialize disk cache.
+
+        Args:
+            db_path: SQLite database file
+            max_bytes: Byte budget for stored values
+            eviction_policy: 'lru' (least recently used) or 'lfu' (least frequently used)
+        """
+        if eviction_policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------ #
+    # Core operations
+    # ------------------------------------------------------------------ #
+
+    def get(self, key: str, touch: bool = True) -> Tuple[bool, Any, Optional[float]]:
+        """
+        Read an entry.
+
+        Returns:
+            (found, value, expires_at) - expired entries are deleted and reported as not found
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None, None
+            blob, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return False, None, None
+            if touch:
+                self.conn.execute(
+                    "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+                )
+        return True, pickle.loads(blob), expires_at
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Optional[Iterable[str]] = None) -> None:
+        self.set_many([(key, value, ttl, tags)])
+
+    def set_many(self, items: List[Tuple[str, Any, Optional[float], Optional[Iterable[str]]]]) -> None:
+        """Write several entries in one transaction, then enforce the byte budget."""
+        if not items:
+            return
+        now = time.time()
+        rows = []
+        tag_rows = []
+        for key, value, ttl, tags in items:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            expires_at = now + ttl if ttl else None
+            rows.append((key, sqlite3.Binary(blob), len(blob), now, expires_at, now))
+            tag_rows.extend((tag, key) for tag in (tags or []))
+
+        with self._lock:
+            self.conn.execute("BEGIN")
+            try:
+                # DELETE first so the delete trigger clears old tags and byte accounting
+                self.conn.executemany("DELETE FROM entries WHERE key = ?", [(r[0],) for r in rows])
+                self.conn.executemany(
+                    "INSERT INTO entries (key, value, size, created_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                if tag_rows:
+                    self.conn.executemany("INSERT OR IGNORE INTO entry_tags (tag, key) VALUES (?, ?)", tag_rows)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self._evict_if_needed()
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self.conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    # ------------------------------------------------------------------ #
+    # Eviction / expiry
+    # ------------------------------------------------------------------ #
+
+    def _meta(self, name: str) -> int:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return int(row[0]) if row else 0
+
+    def _evict_if_needed(self) -> None:
+        """Evict in batches until under the low watermark. Caller holds the lock."""
+        if self._meta("total_bytes") <= self.max_bytes:
+            return
+        order = "last_access" if self.eviction_policy == "lru" else "hits, last_access"
+        target = int(self.max_bytes * LOW_WATERMARK)
+        # Expired entries go first - they are free to drop
+        self.evictions += self.conn.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+        ).rowcount
+        while self._meta("total_bytes") > target:
+            deleted = self.conn.execute(
+                f"DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY {order} LIMIT ?)",
+                (EVICTION_BATCH,),
+            ).rowcount
+            if not deleted:
+                break
+            self.evictions += deleted
+
+    def sweep_expired(self) -> int:
+        """Delete expired entries via the expires_at index."""
+        with self._lock:
+            return self.conn.execute(
+                "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+            ).rowcount
+
+    # ------------------------------------------------------------------ #
+    # Invalidation
+    # ------------------------------------------------------------------ #
+
+    def invalidate(self, pattern: Optional[str] = None, tag: Optional[str] = None) -> int:
+        """
+        Delete entries.
+
+        Args:
+            pattern: None = everything; 'prefix*' = index range scan; other globs use SQLite GLOB
+            tag: delete every entry stored with this tag
+        """
+        with self._lock:
+            if tag is not None:
+                return self.conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entry_tags WHERE tag = ?)", (tag,)
+                ).rowcount
+            where, params = _pattern_clause(pattern)
+            return self.conn.execute(f"DELETE FROM entries{where}", params).rowcount
+
+    def keys(self, pattern: Optional[str] = None) -> List[str]:
+        """List stored keys matching a pattern (same syntax as invalidate)."""
+        where, params = _pattern_clause(pattern)
+        with self._lock:
+            return [row[0] for row in self.conn.execute(f"SELECT key FROM entries{where}", params)]
+
+    def keys_for_tag(self, tag: str) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self.conn.execute("SELECT key FROM entry_tags WHERE tag = ?", (tag,))]
+
+    # ------------------------------------------------------------------ #
+    # Stats / lifecycle
+    # ------------------------------------------------------------------ #
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total_bytes = self._meta("total_bytes")
+            return {
+                "entries": self._meta("entry_count"),
+                "bytes": total_bytes,
+                "size_mb": round(total_bytes / (1024 * 1024), 2),
+                "max_mb": round(self.max_bytes / (1024 * 1024), 2),
+                "evictions": self.evictions,
+                "eviction_policy": self.eviction_policy,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                self.conn.close()
+            except sqlite3.Error:
+                pass
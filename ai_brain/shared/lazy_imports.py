@@ -0,0 +1,87 @@
+"""
+Lazy imports - defer heavy modules until first attribute access
+
+Startup used to import Selenium, Playwright, pandas, PIL, boto3 and the
+integration SDKs before the first prompt, although most sessions touch only
+a few of them. lazy_import() returns a stand-in module that imports the real
+one the first time an attribute is read, so
+
+    pd = lazy_import("pandas")
+
+costs a spec lookup at import time and the real import on the first pd.read_csv().
+
+Use the module-qualified form (pd.DataFrame, browser.SharePointBrowserAccess)
+at call sites; `from x import Name` would force the import immediately.
+
+The first load happens under a per-module lock, so parallel tool batches can
+touch the same lazy module from several threads (importlib.util.LazyLoader is
+not thread-safe on first access before Python 3.12).
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Dict, Optional
+
+_AVAILABLE: Dict[str, bool] = {}
+
+
+def module_available(name: str) -> bool:
+    """True if the module can be imported (without importing it)."""
+    if name not in _AVAILABLE:
+        if name in sys.modules:
+            _AVAILABLE[name] = True
+        else:
+            try:
+                _AVAILABLE[name] = importlib.util.find_spec(name) is not None
+            except (ImportError, ValueError):
+                _AVAILABLE[name] = False
+    return _AVAILABLE[name]
+
+
+class _LazyModule(ModuleType):
+    """Stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+        object.__setattr__(self, "_lazy_module", None)
+
+    def _load(self) -> ModuleType:
+        module = self._lazy_module
+        if module is None:
+            with self._lazy_lock:
+                module = self._lazy_module
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    object.__setattr__(self, "_lazy_module", module)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Module that is loaded on first attribute access.
+
+    Raises:
+        ModuleNotFoundError: If the module doesn't exist (checked up front)
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    return _LazyModule(name)
+
+
+def optional_lazy_import(name: str) -> Optional[ModuleType]:
+    """lazy_import() for optional dependencies: None when not installed."""
+    return lazy_import(name) if module_available(name) else None
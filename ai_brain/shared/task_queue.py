@@ -0,0 +1,373 @@
+"""
+Task Queue - Durable SQLite backend for DistributedExecutor
+
+Queued and running tasks live in one WAL-mode SQLite file, so they survive
+process restarts:
+- Leases: a worker claims a task for a visibility timeout and renews the
+  lease while it runs. A task whose lease expires (worker crashed, process
+  killed) becomes claimable again. Leases held by dead processes on this
+  host are recovered immediately on start.
+- Retries: attempts are counted per claim; failures are retried with
+  exponential backoff until max_retries, then marked failed
+- Idempotency keys: enqueueing a key that already exists returns the
+  existing task, so resubmitting a bulk job never redoes completed work;
+  failed or cancelled tasks are reset to pending and run again
+- Lease tokens: a worker that lost its lease cannot overwrite the result of
+  the worker that took over
+
+Functions are stored by reference ("module:qualname" or a handler name
+registered with the executor); args, kwargs and results are pickled.
+"""
+
+import json
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_VISIBILITY_TIMEOUT = float(os.getenv("DISTRIBUTED_QUEUE_VISIBILITY_SECONDS", "60"))
+DEFAULT_RETRY_BACKOFF = float(os.getenv("DISTRIBUTED_QUEUE_RETRY_BACKOFF_SECONDS", "2"))
+MAX_RETRY_BACKOFF = 300.0
+
+FINAL_STATUSES = ("completed", "failed", "cancelled")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    function TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_retries INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_token TEXT,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    completed_at REAL,
+    result BLOB,
+    error TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks(status, priority DESC, available_at, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_lease ON tasks(status, lease_expires_at);
+"""
+
+
+def lease_owner(worker_id: str) -> str:
+    """Lease owner id: host, process and worker."""
+    return f"{socket.gethostname()}:{os.getpid()}:{worker_id}"
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class SQLiteTaskQueue:
+    """
+    Persistent priority queue with leases, retries and idempotency keys.
+
+    Safe to share between threads and between processes using the same file.
+    """
+
+    def __init__(self, db_path: Path, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+                 retry_backoff: float = DEFAULT_RETRY_BACKOFF):
+        """
+        Initialize task queue.
+
+        Args:
+            db_path: SQLite database file
+            visibility_timeout: Seconds a claimed task stays invisible without a lease renewal
+            retry_backoff: Base delay before a failed task is retried (doubles per attempt)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.visibility_timeout = visibility_timeout
+        self.retry_backoff = retry_backoff
+        self._lock = threading.Lock()
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------ #
+    # Producers
+    # ------------------------------------------------------------------ #
+
+    def enqueue(self, function: str, args: Tuple = (), kwargs: Optional[Dict] = None,
+                priority: int = 2, max_retries: int = 3, task_id: Optional[str] = None,
+                idempotency_key: Optional[str] = None, metadata: Optional[Dict] = None) -> Tuple[str, bool]:
+        """
+        Add a task.
+
+        Returns:
+            (task_id, created) - created is False when the idempotency key or
+            task id already exists and is pending, running or completed (the
+            existing task id is returned). A failed or cancelled task is
+            requeued with the new arguments and reported as created.
+        """
+        return self.enqueue_many([{
+            "function": function, "args": args, "kwargs": kwargs, "priority": priority,
+            "max_retries": max_retries, "task_id": task_id,
+            "idempotency_key": idempotency_key, "metadata": metadata
+        }])[0]
+
+    def enqueue_many(self, tasks: Iterable[Dict[str, Any]]) -> List[Tuple[str, bool]]:
+        """Add many tasks in one transaction (bulk jobs). Same return shape as enqueue, per task."""
+        now = time.time()
+        results: List[Tuple[str, bool]] = []
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for spec in tasks:
+                    task_id = spec.get("task_id") or str(uuid.uuid4())
+                    key = spec.get("idempotency_key")
+                    payload = pickle.dumps((tuple(spec.get("args") or ()), spec.get("kwargs") or {}))
+                    cursor = self.conn.execute(
+                        "INSERT OR IGNORE INTO tasks (task_id, idempotency_key, function, payload, priority, "
+                        "status, max_retries, available_at, created_at, metadata) "
+                        "VALUES (?, ?, ?, ?, ?, 'pending', ?, ?, ?, ?)",
+                        (task_id, key, spec["function"], payload, int(spec.get("priority", 2)),
+                         int(spec.get("max_retries", 3)), now, now, json.dumps(spec.get("metadata") or {}, default=str))
+                    )
+                    if cursor.rowcount:
+                        results.append((task_id, True))
+                        continue
+                    row = self.conn.execute(
+                        "SELECT task_id, status FROM tasks WHERE idempotency_key = ? OR task_id = ?", (key, task_id)
+                    ).fetchone()
+                    if row and row[1] in ("failed", "cancelled"):
+                        # Resubmitting is the retry path once the cause (e.g. credentials) is fixed
+                        self.conn.execute(
+                            "UPDATE tasks SET function = ?, payload = ?, priority = ?, status = 'pending', "
+                            "attempts = 0, max_retries = ?, available_at = ?, lease_owner = NULL, "
+                            "lease_token = NULL, lease_expires_at = NULL, started_at = NULL, "
+                            "completed_at = NULL, result = NULL, error = NULL WHERE task_id = ?",
+                            (spec["function"], payload, int(spec.get("priority", 2)),
+                             int(spec.get("max_retries", 3)), now, row[0])
+                        )
+                        results.append((row[0], True))
+                        continue
+                    results.append((row[0] if row else task_id, False))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return results
+
+    # ------------------------------------------------------------------ #
+    # Workers
+    # ------------------------------------------------------------------ #
+
+    def claim(self, worker_id: str, lease_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Lease the highest-priority available task (pending, or running with an expired lease).
+
+        Returns:
+            Task dict (args/kwargs unpickled, lease_token set) or None
+        """
+        now = time.time()
+        lease = lease_seconds or self.visibility_timeout
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire_leases(now)
+                row = self.conn.execute(
+                    "SELECT task_id FROM tasks WHERE status = 'pending' AND available_at <= ? "
+                    "ORDER BY priority DESC, available_at, created_at LIMIT 1", (now,)
+                ).fetchone()
+                if row is None:
+                    self.conn.execute("COMMIT")
+                    return None
+                token = uuid.uuid4().hex
+                self.conn.execute(
+                    "UPDATE tasks SET status = 'running', attempts = attempts + 1, lease_owner = ?, "
+                    "lease_token = ?, lease_expires_at = ?, started_at = ? WHERE task_id = ?",
+                    (lease_owner(worker_id), token, now + lease, now, row[0])
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return self.get(row[0])
+
+    def _expire_leases(self, now: float) -> int:
+        """Return running tasks with expired leases to pending (or failed when out of retries)."""
+        failed = self.conn.execute(
+            "UPDATE tasks SET status = 'failed', completed_at = ?, lease_token = NULL, "
+            "error = 'Lease expired (worker lost) on final attempt' "
+            "WHERE status = 'running' AND lease_expires_at < ? AND attempts >= max_retries",
+            (now, now)
+        ).rowcount
+        requeued = self.conn.execute(
+            "UPDATE tasks SET status = 'pending', available_at = ?, lease_token = NULL "
+            "WHERE status = 'running' AND lease_expires_at < ?",
+            (now, now)
+        ).rowcount
+        if failed or requeued:
+            console.print(f"[yellow]🔁 Task queue: {requeued} orphaned task(s) requeued, {failed} failed[/yellow]")
+        return failed + requeued
+
+    def recover_orphans(self) -> int:
+        """
+        Expire leases held by processes on this host that are no longer running.
+
+        Called on start-up so tasks interrupted by a crash are picked up right
+        away instead of after the visibility timeout. Returns tasks released.
+        """
+        host = socket.gethostname()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT task_id, lease_owner FROM tasks WHERE status = 'running' AND lease_owner LIKE ?",
+                (f"{host}:%",)
+            ).fetchall()
+            dead = []
+            for task_id, owner in rows:
+                try:
+                    pid = int(owner.split(":")[1])
+                except (IndexError, ValueError):
+                    continue
+                if pid != os.getpid() and not _process_alive(pid):
+                    dead.append(task_id)
+            if not dead:
+                return 0
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    "UPDATE tasks SET lease_expires_at = 0 WHERE task_id = ? AND status = 'running'",
+                    [(task_id,) for task_id in dead]
+                )
+                released = self._expire_leases(time.time())
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return released
+
+    def extend(self, tokens: Iterable[str], lease_seconds: Optional[float] = None) -> int:
+        """Renew leases (heartbeat for running tasks). Returns leases still held."""
+        tokens = list(tokens)
+        if not tokens:
+            return 0
+        expires = time.time() + (lease_seconds or self.visibility_timeout)
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                renewed = sum(
+                    self.conn.execute(
+                        "UPDATE tasks SET lease_expires_at = ? WHERE lease_token = ? AND status = 'running'",
+                        (expires, token)
+                    ).rowcount
+                    for token in tokens
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return renewed
+
+    def complete(self, task_id: str, token: str, result: Any = None) -> bool:
+        """Record success. Returns False if the lease was lost (another worker owns the task)."""
+        try:
+            blob = pickle.dumps(result)
+        except Exception:
+            blob = pickle.dumps(repr(result))
+        with self._lock:
+            return self.conn.execute(
+                "UPDATE tasks SET status = 'completed', result = ?, error = NULL, completed_at = ?, "
+                "lease_token = NULL WHERE task_id = ? AND lease_token = ? AND status = 'running'",
+                (blob, time.time(), task_id, token)
+            ).rowcount == 1
+
+    def fail(self, task_id: str, token: str, error: str, retry: bool = True) -> Optional[str]:
+        """
+        Record a failed attempt.
+
+        Returns:
+            New status ('pending' when it will be retried, 'failed'), or None if the lease was lost
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT attempts, max_retries FROM tasks WHERE task_id = ? AND lease_token = ? AND status = 'running'",
+                (task_id, token)
+            ).fetchone()
+            if row is None:
+                return None
+            attempts, max_retries = row
+            if retry and attempts < max_retries:
+                delay = min(MAX_RETRY_BACKOFF, self.retry_backoff * (2 ** (attempts - 1)))
+                self.conn.execute(
+                    "UPDATE tasks SET status = 'pending', error = ?, available_at = ?, lease_token = NULL "
+                    "WHERE task_id = ?", (error, now + delay, task_id)
+                )
+                return "pending"
+            self.conn.execute(
+                "UPDATE tasks SET status = 'failed', error = ?, completed_at = ?, lease_token = NULL "
+                "WHERE task_id = ?", (error, now, task_id)
+            )
+            return "failed"
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a task that has not finished."""
+        with self._lock:
+            return self.conn.execute(
+                "UPDATE tasks SET status = 'cancelled', completed_at = ?, lease_token = NULL "
+                "WHERE task_id = ? AND status IN ('pending', 'running')",
+                (time.time(), task_id)
+            ).rowcount == 1
+
+    # ------------------------------------------------------------------ #
+    # Inspection
+    # ------------------------------------------------------------------ #
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Task dict with args, kwargs and result unpickled."""
+        with self._lock:
+            cursor = self.conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,))
+            row = cursor.fetchone()
+            columns = [column[0] for column in cursor.description]
+        if row is None:
+            return None
+        task = dict(zip(columns, row))
+        task["args"], task["kwargs"] = pickle.loads(task.pop("payload"))
+        task["result"] = pickle.loads(task["result"]) if task["result"] is not None else None
+        task["metadata"] = json.loads(task["metadata"] or "{}")
+        return task
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per status."""
+        with self._lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def purge(self, older_than_seconds: float = 7 * 86400) -> int:
+        """Delete finished tasks older than the cutoff. Returns rows deleted."""
+        cutoff = time.time() - older_than_seconds
+        with self._lock:
+            return self.conn.execute(
+                f"DELETE FROM tasks WHERE status IN {FINAL_STATUSES} AND completed_at < ?", (cutoff,)
+            ).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,137 @@
+"""
+Timer Wheel - Cheap, cancellable timeouts on one thread
+
+A hashed timing wheel: timers are dropped into the slot of their deadline
+tick, so schedule() and cancel() are O(1) and expiry never scans every
+pending timer. The wheel thread sleeps until the next occupied slot; with
+no timers it blocks without waking at all. Timers further out than one
+rotation stay in their slot and are skipped until their tick comes round.
+
+Callbacks run on the wheel thread and must be short (set an event, resolve
+a future, hand work to a pool).
+"""
+
+import itertools
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_TICK_SECONDS = 0.05
+DEFAULT_SLOTS = 1024  # ~51 s per rotation at 50 ms ticks
+
+
+class Timer:
+    """Handle for a scheduled callback."""
+
+    __slots__ = ("timer_id", "deadline_tick", "callback", "args", "_wheel")
+
+    def __init__(self, timer_id: int, deadline_tick: int, callback: Callable, args: tuple, wheel: "TimerWheel"):
+        self.timer_id = timer_id
+        self.deadline_tick = deadline_tick
+        self.callback = callback
+        self.args = args
+        self._wheel = wheel
+
+    def cancel(self) -> bool:
+        """Remove the timer. Returns False if it already fired or was cancelled."""
+        return self._wheel._cancel(self)
+
+
+class TimerWheel:
+    """Hashed timing wheel driven by a single daemon thread."""
+
+    def __init__(self, tick: float = DEFAULT_TICK_SECONDS, slots: int = DEFAULT_SLOTS,
+                 name: str = "timer-wheel"):
+        self.tick = tick
+        self.name = name
+        self._slots: List[Dict[int, Timer]] = [{} for _ in range(slots)]
+        self._count = 0
+        self._cursor = 0  # Next tick to process
+        self._origin = time.monotonic()
+        self._ids = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._origin) / self.tick)
+
+    def schedule(self, delay: float, callback: Callable, *args: Any) -> Timer:
+        """Run callback(*args) after `delay` seconds (rounded up to the next tick)."""
+        deadline = math.ceil((time.monotonic() - self._origin + max(0.0, delay)) / self.tick)
+        with self._cond:
+            timer = Timer(next(self._ids), max(deadline, self._cursor), callback, args, self)
+            self._slots[timer.deadline_tick % len(self._slots)][timer.timer_id] = timer
+            self._count += 1
+            self._cond.notify()
+        return timer
+
+    def _cancel(self, timer: Timer) -> bool:
+        with self._cond:
+            if self._slots[timer.deadline_tick % len(self._slots)].pop(timer.timer_id, None) is None:
+                return False
+            self._count -= 1
+            return True
+
+    def __len__(self) -> int:
+        return self._count
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def _collect_due(self) -> List[Timer]:
+        """Pop timers whose deadline has passed (call with the lock held)."""
+        now_tick = self._now_tick()
+        due: List[Timer] = []
+        if self._count:
+            size = len(self._slots)
+            for offset in range(min(now_tick - self._cursor + 1, size)):
+                slot = self._slots[(self._cursor + offset) % size]
+                for timer_id in [t for t, timer in slot.items() if timer.deadline_tick <= now_tick]:
+                    due.append(slot.pop(timer_id))
+            self._count -= len(due)
+        self._cursor = max(self._cursor, now_tick + 1)
+        return due
+
+    def _seconds_to_next_slot(self) -> Optional[float]:
+        """Time until the next occupied slot's tick (call with the lock held); None when empty."""
+        if not self._count:
+            return None
+        size = len(self._slots)
+        for offset in range(size):
+            if self._slots[(self._cursor + offset) % size]:
+                target = self._origin + (self._cursor + offset) * self.tick
+                return max(0.0, target - time.monotonic())
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                due = self._collect_due()
+                if not due:
+                    self._cond.wait(self._seconds_to_next_slot())
+                    continue
+            for timer in sorted(due, key=lambda t: t.deadline_tick):
+                try:
+                    timer.callback(*timer.args)
+                except Exception as e:
+                    console.print(f"[yellow]⚠️  {self.name} timer callback failed: {e}[/yellow]")
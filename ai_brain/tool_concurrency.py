@@ -0,0 +1,134 @@
+"""
+Tool Concurrency - Run independent tool calls from one LLM turn in parallel
+
+When the model asks for several tools at once (three Jira searches, exports
+for two accounts), API-backed read tools can run concurrently. Tools that
+drive the shared browser session, or whose side effects we can't reason
+about, keep running one at a time in their original order.
+
+Results are always returned in the order the model issued the calls.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Sequence
+
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_MAX_WORKERS = int(os.getenv("TOOL_PARALLELISM", "4"))
+
+# API-backed tools whose handlers keep no per-call state on the executor (boto3 / REST /
+# local reads). The shared ToolExecutor reads the request once per call, and Meta-Intelligence
+# holds its contract/telemetry state under a lock, so only the tool bodies overlap.
+PARALLEL_SAFE_TOOLS = {
+    "list_aws_resources",
+    "aws_export_data",
+    "query_evidence_store",
+    "query_resource_graph",
+    "iam_access_query",
+    "run_compliance_checks",
+    "show_local_evidence",
+    "web_search",
+    "jira_list_tickets",
+    "jira_search_jql",
+    "jira_search_intent",
+    "jira_dashboard_summary",
+    "jira_get_ticket",
+    "confluence_search",
+    "confluence_get_page",
+    "confluence_list_space",
+    "github_list_prs",
+    "github_list_discussions",
+    "github_get_pr",
+    "github_search_code",
+    "github_list_issues",
+    "read_tool_source",
+    "search_implementation_examples",
+}
+
+# Tools that drive the single shared browser session - never concurrent
+BROWSER_TOOLS = {
+    "aws_console_action",
+    "aws_navigate",
+    "aws_take_screenshot",
+    "sharepoint_review_evidence",
+    "upload_to_sharepoint",
+    "learn_from_sharepoint_url",
+    "get_browser_screenshot",
+    "replay_evidence_playbook",
+    "myid_export_access",
+}
+
+
+def classify_tool(tool_name: str) -> str:
+    """'parallel' (API-backed, independent), 'browser' (shared browser) or 'serial' (unknown side effects)."""
+    if tool_name in BROWSER_TOOLS:
+        return "browser"
+    if tool_name in PARALLEL_SAFE_TOOLS:
+        return "parallel"
+    return "serial"
+
+
+def is_parallel_safe(tool_name: str) -> bool:
+    return classify_tool(tool_name) == "parallel"
+
+
+def plan_batches(tool_names: Sequence[str]) -> List[List[int]]:
+    """
+    Group call indexes into batches that run one after another.
+
+    Consecutive parallel-safe calls share a batch; every other call (browser
+    or unknown side effects) is a batch of its own, so relative order with
+    respect to serialized calls is preserved.
+    """
+    batches: List[List[int]] = []
+    for index, name in enumerate(tool_names):
+        if is_parallel_safe(name) and batches and is_parallel_safe(tool_names[batches[-1][0]]):
+            batches[-1].append(index)
+        else:
+            batches.append([index])
+    return batches
+
+
+def run_tool_calls(
+    calls: Sequence[Dict[str, Any]],
+    execute: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Execute tool calls, parallelizing where safe.
+
+    Args:
+        calls: [{"name": ..., "args": {...}}, ...] in model order
+        execute: (tool_name, tool_input) -> result dict
+        max_workers: Concurrency cap for a parallel batch (1 = fully sequential)
+
+    Returns:
+        Results in the same order as calls
+    """
+    results: List[Dict[str, Any]] = [None] * len(calls)
+
+    def run(index: int) -> None:
+        call = calls[index]
+        try:
+            results[index] = execute(call["name"], call["args"])
+        except Exception as e:
+            results[index] = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+
+    for batch in plan_batches([call["name"] for call in calls]):
+        if len(batch) == 1 or max_workers <= 1:
+            for index in batch:
+                run(index)
+            continue
+
+        started = time.time()
+        console.print(f"[cyan]⚡ Running {len(batch)} tool calls in parallel: "
+                      f"{', '.join(calls[i]['name'] for i in batch)}[/cyan]")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batch)), thread_name_prefix="tool-call") as pool:
+            list(pool.map(run, batch))
+        console.print(f"[dim]   Parallel batch finished in {time.time() - started:.1f}s[/dim]")
+
+    return results
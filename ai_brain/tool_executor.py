@@ -5,8 +5,9 @@ Tool Executor - Executes tools that Claude decides to call
 import os
 import time  # ← SELF-HEAL FIX: Added for time.sleep() calls
 import json
+import threading
 from dataclasses import asdict
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 import datetime as dt
 from collections import Counter
 from pathlib import Path
@@ -14,7 +15,7 @@ from rich.console import Console
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from integrations.sharepoint_browser import SharePointBrowserAccess
+from ai_brain.shared.lazy_imports import lazy_import
 from evidence_manager.local_evidence_manager import LocalEvidenceManager
 from evidence_manager.evidence_analyzer_v2 import EvidenceAnalyzerV2
 from evidence_manager.llm_evidence_analyzer import LLMEvidenceAnalyzer
@@ -22,20 +23,15 @@ from evidence_manager.sharepoint_evidence_learner import SharePointEvidenceLearn
 from evidence_manager.document_intelligence import DocumentIntelligence
 from evidence_manager.playbook_builder import EvidencePlaybookBuilder
 from evidence_manager.playbook_replayer import EvidencePlaybookReplayer
-from tools.universal_screenshot_enhanced import UniversalScreenshotEnhanced, ClickStrategy
-from tools.rds_navigator_enhanced import RDSNavigatorEnhanced
 from ai_brain.browser_session_manager import BrowserSessionManager  # ← ADDED FOR aws_console_action
 from ai_brain.parallel_executor import ParallelExecutor  # ← ADDED FOR PARALLEL EXECUTION
-from tools.aws_universal_export import (
-    export_aws_data,  # Universal export (auto-detects best tool)
-    export_all_aws_services  # Export ALL 100+ services
-)
-from tools.aws_list_tool import (
-    list_s3_buckets, list_rds_instances, list_rds_clusters,
-    list_iam_users, list_ec2_instances, list_lambda_functions,
-    list_vpc_resources
-)
-from tools.sharepoint_upload_tool import upload_to_sharepoint, batch_upload_from_rfi_folder
+
+# Browser/export tool modules load on first use (Playwright, Selenium, PIL, boto3)
+sharepoint_browser = lazy_import("integrations.sharepoint_browser")
+rds_navigator_enhanced = lazy_import("tools.rds_navigator_enhanced")
+aws_universal_export = lazy_import("tools.aws_universal_export")  # export_aws_data, export_all_aws_services
+aws_list_tool = lazy_import("tools.aws_list_tool")  # list_s3_buckets, list_rds_*, list_iam_users, ...
+sharepoint_upload_tool = lazy_import("tools.sharepoint_upload_tool")  # upload_to_sharepoint, batch_upload_from_rfi_folder
 from ai_brain.universal_intelligence import UniversalIntelligence
 from ai_brain.intelligent_tools import IntelligentFileExporter, IntelligentAWSCLI, IntelligentEvidenceCollector
 from ai_brain.orchestrator import AIOrchestrator
@@ -45,6 +41,9 @@ from ai_brain.error_debugger import ErrorDebugger
 from ai_brain.enhancement_reviewer import EnhancementReviewer
 from ai_brain.navigation_intelligence import get_navigation_intelligence
 from ai_brain.execution_intelligence import get_execution_intelligence
+from ai_brain.post_execution import PostExecutionBus, PostExecutionEvent
+from ai_brain.tool_result_cache import ToolResultCache
+from ai_brain.tool_registry import get_tool_registry, lazy_subsystem
 
 console = Console()
 
@@ -71,12 +70,9 @@ class ToolExecutor:
         self.evidence_manager = evidence_manager
         self.sharepoint = None
         self.llm = llm
-        self.document_intelligence = DocumentIntelligence(llm)
-        self.meta_intelligence = None
-        self.multi_dim_coordinator = None
         self.current_request: Optional[str] = None
         self.advisor = None
-        self.enhancement_manager = None
+        self._advisor_lock = threading.Lock()
         # Reusable AWS browser session (UniversalScreenshotEnhanced) for non-RDS services
         self._aws_universal_session = None
         self._aws_session_account = None
@@ -85,77 +81,138 @@ class ToolExecutor:
         catalog_regions = self.service_catalog.get_domain_default_regions("aws")
         if catalog_regions:
             ToolExecutor.DEFAULT_REGIONS = catalog_regions
-        self.error_debugger = ErrorDebugger(llm)
-        self.enhancement_reviewer = None
-        self.parallel_executor = ParallelExecutor(max_workers=3)  # Max 3 parallel browser sessions
-        self.navigation_intelligence = get_navigation_intelligence(llm)  # Fixed: was initialized twice
-        self.execution_intelligence = get_execution_intelligence(llm)
+        # Advisor / debugger run after each tool call without holding up the next one
+        self.post_execution = PostExecutionBus(name="tool-observer")
+        self.post_execution.subscribe("advisor", self._advisor_observer, when=lambda e: self.advisor is not None)
+        self.post_execution.subscribe(
+            "error_debugger",
+            self._debugger_observer,
+            when=lambda e: self.error_debugger is not None and not e.succeeded
+        )
         
         # Initialize shared utilities
         from ai_brain.shared import ErrorHandler, CacheManager, ConnectionPool
         self.error_handler = ErrorHandler()
         self.cache_manager = CacheManager(default_ttl=3600)  # 1 hour default TTL
+        self.result_cache = ToolResultCache()  # Read-only tool results (stale-while-revalidate)
         self.connection_pool = ConnectionPool()
         
         self.repo_root = Path(__file__).resolve().parents[1]
-        playbook_dir = self.repo_root / "evidence_playbooks"
-        report_dir = self.repo_root / "playbook_reports"
-        self.playbook_builder = EvidencePlaybookBuilder(playbook_dir)
-        self.playbook_replayer = EvidencePlaybookReplayer(self, self.playbook_builder, report_dir)
-
-        # Initialize Universal Intelligence Hub
+        
+        # Tool name -> handler; filled from the registry on first call of each tool
+        self.tool_registry = get_tool_registry()
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        
+        # Orchestrator, Meta-Intelligence, analyzers etc. are lazy_subsystems (built on first use)
         if llm:
-            console.print("[cyan]🧠 Initializing AI Brain Orchestrator...[/cyan]")
-            self.intelligence = UniversalIntelligence(llm)
-            console.print("[green]✅ Universal Intelligence active - ALL tools can query the brain![/green]")
-            
-            # Initialize AI Orchestrator - the brain that directs everything
-            self.orchestrator = AIOrchestrator(
-                llm,
-                evidence_manager,
-                self,
-                document_intelligence=self.document_intelligence,
-            )
-            console.print("[green]✅ AI Orchestrator active - brain will analyze evidence and direct tools![/green]")
-            
-            # Initialize intelligent tool wrappers
-            self.file_exporter = IntelligentFileExporter(self.intelligence)
-            self.aws_cli = IntelligentAWSCLI(self.intelligence)
-            self.evidence_collector = IntelligentEvidenceCollector(self.intelligence)
-            
-            # Activate Meta-Intelligence layer (self-evolving brain)
-            self.meta_intelligence = MetaIntelligence(
-                llm=llm,
-                tool_executor=self,
-                orchestrator=self.orchestrator
-            )
-            self.multi_dim_coordinator = MultiDimensionalCoordinator(self.meta_intelligence)
-            self.enhancement_manager = self.meta_intelligence.enhancement_manager
-            
-            # Use LLM-powered analyzer
-            console.print("[cyan]✅ Using LLM-powered evidence analyzer (Claude)[/cyan]")
-            self.analyzer = LLMEvidenceAnalyzer(llm)
-            self.learner = SharePointEvidenceLearner(llm)
+            console.print("[green]✅ AI Brain ready - orchestrator and Meta-Intelligence load on first use[/green]")
         else:
             console.print("[yellow]⚠️  No LLM configured - tools will use fallback logic[/yellow]")
-            self.intelligence = None
-            self.orchestrator = None
-            self.file_exporter = None
-            self.aws_cli = None
-            self.evidence_collector = None
-            self.analyzer = EvidenceAnalyzerV2()
-            self.learner = None
-            self.meta_intelligence = None
-            self.multi_dim_coordinator = None
-            self.playbook_builder = EvidencePlaybookBuilder(playbook_dir)
-            self.playbook_replayer = EvidencePlaybookReplayer(self, self.playbook_builder, report_dir)
-
-        if llm and self.enhancement_manager:
-            self.enhancement_reviewer = EnhancementReviewer(self.enhancement_manager, llm)
+    
+    # ------------------------------------------------------------------
+    # Subsystems (built on first access; see tool_registry.lazy_subsystem)
+    # ------------------------------------------------------------------
+    
+    @lazy_subsystem
+    def document_intelligence(self):
+        return DocumentIntelligence(self.llm)
+    
+    @lazy_subsystem
+    def error_debugger(self):
+        return ErrorDebugger(self.llm)
+    
+    @lazy_subsystem
+    def parallel_executor(self):
+        return ParallelExecutor(max_workers=3)  # Max 3 parallel browser sessions
+    
+    @lazy_subsystem
+    def navigation_intelligence(self):
+        return get_navigation_intelligence(self.llm)
+    
+    @lazy_subsystem
+    def execution_intelligence(self):
+        return get_execution_intelligence(self.llm)
+    
+    @lazy_subsystem
+    def playbook_builder(self):
+        return EvidencePlaybookBuilder(self.repo_root / "evidence_playbooks")
+    
+    @lazy_subsystem
+    def playbook_replayer(self):
+        return EvidencePlaybookReplayer(self, self.playbook_builder, self.repo_root / "playbook_reports")
+    
+    @lazy_subsystem
+    def intelligence(self):
+        """Universal Intelligence Hub - ALL tools can query the brain"""
+        return UniversalIntelligence(self.llm) if self.llm else None
+    
+    @lazy_subsystem
+    def orchestrator(self):
+        """AI Orchestrator - the brain that analyzes evidence and directs tools"""
+        if not self.llm:
+            return None
+        console.print("[cyan]🧠 Initializing AI Brain Orchestrator...[/cyan]")
+        return AIOrchestrator(
+            self.llm,
+            self.evidence_manager,
+            self,
+            document_intelligence=self.document_intelligence,
+        )
+    
+    @lazy_subsystem
+    def file_exporter(self):
+        return IntelligentFileExporter(self.intelligence) if self.intelligence else None
+    
+    @lazy_subsystem
+    def aws_cli(self):
+        return IntelligentAWSCLI(self.intelligence) if self.intelligence else None
+    
+    @lazy_subsystem
+    def evidence_collector(self):
+        return IntelligentEvidenceCollector(self.intelligence) if self.intelligence else None
+    
+    @lazy_subsystem
+    def meta_intelligence(self):
+        """Meta-Intelligence layer (self-evolving brain); resolves the orchestrator lazily"""
+        if not self.llm:
+            return None
+        return MetaIntelligence(llm=self.llm, tool_executor=self)
+    
+    @lazy_subsystem
+    def multi_dim_coordinator(self):
+        return MultiDimensionalCoordinator(self.meta_intelligence) if self.meta_intelligence else None
+    
+    @lazy_subsystem
+    def enhancement_manager(self):
+        return self.meta_intelligence.enhancement_manager if self.meta_intelligence else None
+    
+    @lazy_subsystem
+    def enhancement_reviewer(self):
+        if not (self.llm and self.enhancement_manager):
+            return None
+        return EnhancementReviewer(self.enhancement_manager, self.llm)
+    
+    @lazy_subsystem
+    def analyzer(self):
+        if not self.llm:
+            return EvidenceAnalyzerV2()
+        console.print("[cyan]✅ Using LLM-powered evidence analyzer (Claude)[/cyan]")
+        return LLMEvidenceAnalyzer(self.llm)
+    
+    @lazy_subsystem
+    def learner(self):
+        return SharePointEvidenceLearner(self.llm) if self.llm else None
+    
+    def get_loaded_subsystem(self, name: str) -> Any:
+        """A subsystem if it has already been built, else None (never triggers construction)."""
+        return self.__dict__.get(name)
     
     def set_current_request(self, request: str):
         """Track the latest user request for meta-intelligence context."""
         self.current_request = request
+        meta = self.get_loaded_subsystem("meta_intelligence")
+        if meta:
+            meta.begin_request(request)
     
     def set_advisor(self, advisor) -> None:
         """Attach advisor LLM for failure analysis."""
@@ -166,10 +223,29 @@ class ToolExecutor:
         Public entry point for tool execution. When Meta-Intelligence is active,
         all tool calls are routed through the self-evolving layer for analysis,
         gap detection, retries, and self-healing orchestration.
+        
+        Read-only tools with a cache policy are served from the session
+        result cache; mutating tools invalidate the entries they affect.
         """
-        if self.meta_intelligence and self.current_request:
+        if self.result_cache.is_cacheable(tool_name):
+            return self.result_cache.get_or_execute(
+                tool_name,
+                tool_input,
+                execute=lambda: self._execute_tool_uncached(tool_name, tool_input),
+                refresh=lambda: self._execute_tool_direct(tool_name, dict(tool_input))
+            )
+        
+        result = self._execute_tool_uncached(tool_name, tool_input)
+        self.result_cache.invalidate_after(tool_name)
+        return result
+    
+    def _execute_tool_uncached(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool through Meta-Intelligence (if active) and post-execution observers."""
+        # Read once: parallel calls must see the request they were issued for
+        request = self.current_request
+        if self.meta_intelligence and request:
             result = self.meta_intelligence.execute_with_meta_intelligence(
-                user_request=self.current_request,
+                user_request=request,
                 tool_name=tool_name,
                 tool_params=tool_input,
                 execute_callback=self._execute_tool_direct
@@ -178,15 +254,29 @@ class ToolExecutor:
             result = self._execute_tool_direct(tool_name, tool_input)
 
         if isinstance(result, dict):
-            self._notify_advisor_of_step(tool_name, tool_input, result)
-            if self.error_debugger:
-                self.error_debugger.analyze(tool_name=tool_name, tool_input=tool_input, result=result)
+            self.post_execution.publish(PostExecutionEvent(
+                tool_name=tool_name,
+                tool_input=dict(tool_input),
+                result=result,
+                request=request or ""
+            ))
         return result
     
+    def _advisor_observer(self, event: PostExecutionEvent) -> None:
+        # The bus may deliver events from parallel tool calls at the same time
+        with self._advisor_lock:
+            self._notify_advisor_of_step(event.tool_name, event.tool_input, event.result, event.request)
+    
+    def _debugger_observer(self, event: PostExecutionEvent) -> Dict[str, Any]:
+        return self.error_debugger.analyze(tool_name=event.tool_name, tool_input=event.tool_input, result=event.result)
+    
     def _execute_tool_direct(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a tool and return results
         
+        Tools are looked up in the ToolRegistry (EXECUTOR_TOOLS) once per
+        executor and cached; per-tool latency/errors go to registry metrics.
+        
         Args:
             tool_name: Name of tool to execute
             tool_input: Parameters for the tool
@@ -197,177 +287,29 @@ class ToolExecutor:
         
         console.print(f"\n[cyan]🔧 Executing: {tool_name}[/cyan]")
         
-        try:
-            if tool_name == "sharepoint_review_evidence":
-                return self._execute_sharepoint_review(tool_input)
-            
-            elif tool_name == "aws_console_action":
-                return self._execute_aws_console_action(tool_input)
-            
-            elif tool_name == "aws_navigate":
-                # Legacy support - redirect to aws_console_action with capture_screenshot=false
-                tool_input["capture_screenshot"] = False
-                return self._execute_aws_console_action(tool_input)
-            
-            elif tool_name == "aws_take_screenshot":
-                # Legacy support - redirect to aws_console_action with capture_screenshot=true
-                tool_input["capture_screenshot"] = True
-                return self._execute_aws_console_action(tool_input)
-            
-            elif tool_name == "aws_export_data":
-                return self._execute_aws_export(tool_input)
-            
-            elif tool_name == "list_aws_resources":
-                return self._execute_list_aws(tool_input)
-            
-            elif tool_name == "show_local_evidence":
-                return self._execute_show_evidence(tool_input)
-            
-            elif tool_name == "upload_to_sharepoint":
-                return self._execute_upload(tool_input)
-
-            elif tool_name == "learn_from_sharepoint_url":
-                return self._execute_learn_from_sharepoint(tool_input)
-
-            elif tool_name == "analyze_document_evidence":
-                return self._execute_analyze_document_evidence(tool_input)
-
-            # Self-healing/debugging tools
-            elif tool_name == "read_tool_source":
-                return self._execute_read_tool_source(tool_input)
-            
-            elif tool_name == "diagnose_error":
-                return self._execute_diagnose_error(tool_input)
-            
-            elif tool_name == "fix_tool_code":
-                return self._execute_fix_tool_code(tool_input)
-            
-            elif tool_name == "test_tool":
-                return self._execute_test_tool(tool_input)
-
-            elif tool_name == "list_pending_enhancements":
-                return self._execute_list_pending_enhancements(tool_input)
-
-            elif tool_name == "apply_pending_enhancement":
-                return self._execute_apply_pending_enhancement(tool_input)
-
-            elif tool_name == "review_pending_enhancement":
-                return self._execute_review_pending_enhancement(tool_input)
-
-            elif tool_name == "replay_evidence_playbook":
-                return self._execute_replay_evidence_playbook(tool_input)
-
-            elif tool_name == "bulk_aws_export":
-                return self._execute_bulk_aws_export(tool_input)
-            
-            elif tool_name == "myid_export_access":
-                return self._execute_myid_export_access(tool_input)
-            
-            elif tool_name == "web_search":
-                return self._execute_web_search(tool_input)
-            
-            elif tool_name == "get_browser_screenshot":
-                return self._execute_browser_screenshot(tool_input)
-            
-            # Code generation tools
-            elif tool_name == "generate_new_tool":
-                return self._execute_generate_tool(tool_input)
-            
-            elif tool_name == "add_functionality_to_tool":
-                return self._execute_add_functionality(tool_input)
-            
-            elif tool_name == "implement_missing_function":
-                return self._execute_implement_function(tool_input)
-            
-            elif tool_name == "search_implementation_examples":
-                return self._execute_search_examples(tool_input)
-            
-            # NEW: Intelligent tool methods
-            elif tool_name == "intelligent_file_export":
-                return self._execute_intelligent_export(tool_input)
-            
-            elif tool_name == "intelligent_aws_cli":
-                return self._execute_intelligent_aws_cli(tool_input)
-            
-            elif tool_name == "intelligent_evidence_collection":
-                return self._execute_intelligent_evidence_collection(tool_input)
-            
-            # NEW: Orchestrator methods - brain directs from the start
-            elif tool_name == "orchestrator_analyze_and_plan":
-                return self._execute_orchestrator_analyze(tool_input)
-            
-            elif tool_name == "orchestrator_execute_plan":
-                return self._execute_orchestrator_execute(tool_input)
-            
-            # REVOLUTIONARY: Dynamic code execution - Claude writes code on the fly!
-            elif tool_name == "execute_python_code":
-                return self._execute_python_code(tool_input)
-            
-            elif tool_name == "query_agent_database":
-                return self._execute_query_agent_database(tool_input)
-            
-            elif tool_name == "store_in_database":
-                return self._execute_store_in_database(tool_input)
-            
-            elif tool_name == "analyze_past_evidence":
-                return self._execute_analyze_past_evidence(tool_input)
-            
-            # === JIRA INTEGRATION TOOLS ===
-            elif tool_name == "jira_list_tickets":
-                return self._execute_jira_list_tickets(tool_input)
-            
-            elif tool_name == "jira_search_jql":
-                return self._execute_jira_search_jql(tool_input)
-            
-            elif tool_name == "jira_search_intent":
-                return self._execute_jira_search_intent(tool_input)
-            
-            elif tool_name == "jira_dashboard_summary":
-                return self._execute_jira_dashboard_summary(tool_input)
-            
-            elif tool_name == "jira_get_ticket":
-                return self._execute_jira_get_ticket(tool_input)
-            
-            # === CONFLUENCE INTEGRATION TOOLS ===
-            elif tool_name == "confluence_search":
-                return self._execute_confluence_search(tool_input)
-            
-            elif tool_name == "confluence_get_page":
-                return self._execute_confluence_get_page(tool_input)
-            
-            elif tool_name == "confluence_list_space":
-                return self._execute_confluence_list_space(tool_input)
-            
-            # === GITHUB INTEGRATION TOOLS ===
-            elif tool_name == "github_list_prs":
-                return self._execute_github_list_prs(tool_input)
-            
-            elif tool_name == "github_get_pr":
-                return self._execute_github_get_pr(tool_input)
-            
-            elif tool_name == "github_search_code":
-                return self._execute_github_search_code(tool_input)
-            
-            elif tool_name == "github_list_issues":
-                return self._execute_github_list_issues(tool_input)
-            
-            elif tool_name == "github_list_discussions":
-                return self._execute_github_list_discussions(tool_input)
-            
-            else:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
+            handler = self.tool_registry.resolve_handler(tool_name, self)
+            if handler is None:
                 return {
                     "status": "error",
                     "error": f"Unknown tool: {tool_name}"
                 }
+            self._handlers[tool_name] = handler
         
+        started = time.time()
+        try:
+            result = handler(tool_input)
         except Exception as e:
             console.print(f"[red]❌ Tool execution failed: {e}[/red]")
             import traceback
             traceback.print_exc()
-            return {
+            result = {
                 "status": "error",
                 "error": str(e)
             }
+        self.tool_registry.record_call(tool_name, time.time() - started, result)
+        return result
 
     def _execute_review_pending_enhancement(self, params: Dict) -> Dict:
         """Run LLM review on a pending enhancement."""
@@ -404,7 +346,7 @@ class ToolExecutor:
             # Initialize SharePoint if needed
             if not self.sharepoint:
                 console.print("[yellow]💡 Opening SharePoint with Playwright...[/yellow]")
-                self.sharepoint = SharePointBrowserAccess(headless=False)
+                self.sharepoint = sharepoint_browser.SharePointBrowserAccess(headless=False)
                 if not self.sharepoint.connect():
                     return {"status": "error", "error": "Failed to connect to SharePoint"}
             
@@ -950,7 +892,7 @@ class ToolExecutor:
                     console.print(f"[yellow]🚀 Using RDS Navigator Enhanced[/yellow]")
                     
                     # Pass the persistent browser to RDS navigator
-                    navigator = RDSNavigatorEnhanced(browser)
+                    navigator = rds_navigator_enhanced.RDSNavigatorEnhanced(browser)
                     
                     # Ensure correct region
                     try:
@@ -1486,7 +1428,7 @@ class ToolExecutor:
                         console.print(f"[cyan]   Date Filter: {audit_period or f'{start_date} to {end_date}'}[/cyan]")
                     
                     try:
-                        export_result = export_aws_data(
+                        export_result = aws_universal_export.export_aws_data(
                             service=current_service,
                             export_type=effective_export_type,
                             format=format_type,
@@ -1650,26 +1592,26 @@ class ToolExecutor:
             result = None
             
             if service == 's3':
-                result = list_s3_buckets(account, region)
+                result = aws_list_tool.list_s3_buckets(account, region)
             elif service == 'rds':
                 # List both instances and clusters
-                instances = list_rds_instances(account, region)
-                clusters = list_rds_clusters(account, region)
+                instances = aws_list_tool.list_rds_instances(account, region)
+                clusters = aws_list_tool.list_rds_clusters(account, region)
                 result = {
                     'instances': instances,
                     'clusters': clusters,
                     'total': len(instances) + len(clusters)
                 }
             elif service == 'iam':
-                result = list_iam_users(account)
+                result = aws_list_tool.list_iam_users(account)
             elif service == 'ec2':
-                result = list_ec2_instances(account, region)
+                result = aws_list_tool.list_ec2_instances(account, region)
             elif service == 'lambda':
-                result = list_lambda_functions(account, region)
+                result = aws_list_tool.list_lambda_functions(account, region)
             elif service == 'kms':
                 result = list_kms_keys(account, region)
             elif service == 'vpc':
-                result = list_vpc_resources(account, region)
+                result = aws_list_tool.list_vpc_resources(account, region)
             else:
                 return {
                     "status": "error",
@@ -1917,7 +1859,7 @@ Only return JSON, no prose.
                 product = params.get('product', '')
                 year = os.getenv('SHAREPOINT_CURRENT_YEAR', 'FY2025')
                 
-                success, message = upload_to_sharepoint(
+                success, message = sharepoint_upload_tool.upload_to_sharepoint(
                     local_files=file_paths,
                     rfi_code=rfi_code,
                     product=product,
@@ -2149,6 +2091,11 @@ Only return JSON, no prose.
         
         result = fix_tool_code_with_validation(tool_name, issue, old_code, new_code)
         
+        # Tool code changed: cached meta-intelligence contracts may no longer apply
+        meta = self.get_loaded_subsystem("meta_intelligence")
+        if meta and result.get("status") == "success":
+            meta.invalidate_contracts()
+        
         return result
     
     def _execute_test_tool(self, params: Dict) -> Dict:
@@ -2203,6 +2150,9 @@ Only return JSON, no prose.
             return {"status": "error", "error": "Missing proposal_id"}
         try:
             record = self.enhancement_manager.apply_proposal(proposal_id)
+            meta = self.get_loaded_subsystem("meta_intelligence")
+            if meta:
+                meta.invalidate_contracts()
             return {
                 "status": "success",
                 "result": {
@@ -2611,7 +2561,8 @@ Only return JSON, no prose.
             
             result = self.orchestrator.analyze_and_plan(
                 rfi_code=rfi_code,
-                previous_evidence_files=previous_evidence
+                previous_evidence_files=previous_evidence,
+                replan=bool(params.get('replan', False))
             )
             
             return result
@@ -2651,6 +2602,27 @@ Only return JSON, no prose.
                 "error": f"Execution failed: {str(e)}"
             }
     
+    def _execute_orchestrator_resume(self, params: Dict) -> Dict:
+        """Resume an interrupted orchestrator plan from its checkpoint journal"""
+        if not self.orchestrator:
+            return {
+                "status": "error",
+                "error": "AI Orchestrator requires LLM. Please configure LLM_PROVIDER."
+            }
+        
+        try:
+            return self.orchestrator.resume_plan(
+                plan_id=params.get('plan_id'),
+                rfi_code=params.get('rfi_code')
+            )
+        
+        except Exception as e:
+            console.print(f"[red]❌ Orchestrator resume failed: {e}[/red]")
+            return {
+                "status": "error",
+                "error": f"Resume failed: {str(e)}"
+            }
+    
     def _execute_python_code(self, params: dict) -> dict:
         """Execute Python code written by Claude dynamically"""
         from ai_brain.dynamic_code_executor import execute_python_code
@@ -2733,6 +2705,230 @@ Only return JSON, no prose.
                 "error": f"Evidence analysis failed: {str(e)}"
             }
     
+    def _execute_query_evidence_store(self, params: Dict) -> Dict:
+        """Query the columnar (Parquet) evidence store"""
+        from evidence_manager.evidence_store import get_evidence_store, DEFAULT_MAX_ROWS
+        
+        try:
+            store = get_evidence_store()
+            mode = (params.get('mode') or 'sql').lower()
+            
+            if mode == 'stats':
+                return {"status": "success", "result": store.get_stats()}
+            
+            if mode == 'partitions':
+                filters = params.get('filters') or {}
+                partitions = store.list_partitions(**filters)
+                for partition in partitions:
+                    partition.pop('path', None)
+                return {
+                    "status": "success",
+                    "result": {"partitions": partitions, "count": len(partitions)}
+                }
+            
+            sql = (params.get('sql') or '').strip()
+            if not sql:
+                return {"status": "error", "error": "Missing 'sql' for mode='sql'"}
+            
+            max_rows = int(params.get('max_rows') or DEFAULT_MAX_ROWS)
+            console.print(f"[cyan]📊 Evidence store query:[/cyan] [dim]{sql[:200]}[/dim]")
+            started = time.time()
+            columns, rows = store.query(sql, max_rows=max_rows)
+            elapsed_ms = round((time.time() - started) * 1000, 1)
+            console.print(f"[green]✅ {len(rows)} row(s) in {elapsed_ms} ms[/green]")
+            
+            return {
+                "status": "success",
+                "result": {
+                    "columns": columns,
+                    "rows": json.loads(json.dumps(rows, default=str)),
+                    "row_count": len(rows),
+                    "truncated": len(rows) >= max_rows,
+                    "elapsed_ms": elapsed_ms
+                }
+            }
+        
+        except Exception as e:
+            console.print(f"[red]❌ Evidence store query failed: {e}[/red]")
+            return {
+                "status": "error",
+                "error": f"Evidence store query failed: {str(e)}"
+            }
+    
+    def _execute_query_resource_graph(self, params: Dict) -> Dict:
+        """Query the in-memory AWS resource relationship graph"""
+        from ai_brain.resource_graph import get_resource_graph
+        
+        try:
+            operation = (params.get('operation') or 'stats').lower()
+            graph = get_resource_graph(
+                rebuild=bool(params.get('rebuild')),
+                fiscal_year=params.get('fiscal_year'),
+                account=params.get('aws_account')
+            )
+            
+            started = time.time()
+            resource = params.get('resource')
+            edge_types = params.get('edge_types') or None
+            
+            if operation == 'stats':
+                results = graph.get_stats()
+            elif operation == 'exposure':
+                results = graph.exposure()
+            elif operation == 'related':
+                if not params.get('resource_kind') or not edge_types:
+                    return {"status": "error", "error": "operation='related' needs resource_kind and edge_types"}
+                results = []
+                for edge_type in edge_types:
+                    results.extend(graph.related(
+                        params['resource_kind'], edge_type, params.get('direction') or 'out'
+                    ))
+            elif operation in ('neighbors', 'traverse'):
+                if not resource:
+                    return {"status": "error", "error": f"operation='{operation}' needs a resource"}
+                if not graph.find(resource):
+                    return {"status": "error", "error": f"Resource '{resource}' not found in graph (try rebuild=true after exporting)"}
+                if operation == 'neighbors':
+                    results = graph.neighbors(resource, edge_types, params.get('direction') or 'both')
+                else:
+                    results = graph.traverse(
+                        resource,
+                        edge_types,
+                        params.get('direction') or 'both',
+                        int(params.get('max_hops') or 3),
+                        params.get('resource_kind')
+                    )
+            else:
+                return {"status": "error", "error": f"Unknown graph operation: {operation}"}
+            
+            elapsed_ms = round((time.time() - started) * 1000, 2)
+            console.print(f"[green]✅ Resource graph {operation} answered in {elapsed_ms} ms[/green]")
+            return {
+                "status": "success",
+                "result": {
+                    "operation": operation,
+                    "results": results,
+                    "count": len(results) if isinstance(results, list) else None,
+                    "elapsed_ms": elapsed_ms
+                }
+            }
+        
+        except Exception as e:
+            console.print(f"[red]❌ Resource graph query failed: {e}[/red]")
+            return {
+                "status": "error",
+                "error": f"Resource graph query failed: {str(e)}"
+            }
+    
+    def _execute_iam_access_query(self, params: Dict) -> Dict:
+        """Query the IAM effective-permission index"""
+        from tools.iam_policy_index import get_iam_policy_index
+        
+        try:
+            operation = (params.get('operation') or '').lower()
+            if operation not in ('refresh', 'who_can', 'what_can', 'who_can_assume'):
+                return {"status": "error", "error": f"Unknown IAM query operation: {operation}"}
+            aws_account = params.get('aws_account')
+            index = get_iam_policy_index(aws_account, refresh=(operation == 'refresh'))
+            
+            started = time.time()
+            if operation == 'refresh':
+                result = {
+                    "principals": len(index.principals),
+                    "statements": len(index.statements)
+                }
+            elif operation == 'who_can':
+                if not params.get('action'):
+                    return {"status": "error", "error": "operation='who_can' needs an action"}
+                principals = index.who_can(params['action'], params.get('resource'))
+                result = {
+                    "action": params['action'],
+                    "resource": index.normalize_resource(params['action'], params.get('resource')),
+                    "principals": principals,
+                    "count": len(principals)
+                }
+            elif operation == 'what_can':
+                if not params.get('principal'):
+                    return {"status": "error", "error": "operation='what_can' needs a principal"}
+                result = index.what_can(params['principal'], params.get('service'))
+            elif operation == 'who_can_assume':
+                if not params.get('principal'):
+                    return {"status": "error", "error": "operation='who_can_assume' needs a role name or ARN"}
+                result = {
+                    "role": params['principal'],
+                    "trust_statements": index.who_can_assume(params['principal'])
+                }
+            
+            elapsed_ms = round((time.time() - started) * 1000, 2)
+            console.print(f"[green]✅ IAM {operation} answered in {elapsed_ms} ms[/green]")
+            result["index_age_hours"] = round(index.age_hours(), 1)
+            result["elapsed_ms"] = elapsed_ms
+            return {"status": "success", "result": result}
+        
+        except KeyError as e:
+            return {"status": "error", "error": str(e).strip("'")}
+        except Exception as e:
+            console.print(f"[red]❌ IAM access query failed: {e}[/red]")
+            return {
+                "status": "error",
+                "error": f"IAM access query failed: {str(e)}"
+            }
+    
+    def _execute_run_compliance_checks(self, params: Dict) -> Dict:
+        """Evaluate declarative compliance rules over exported AWS tables"""
+        from evidence_manager.compliance_engine import run_compliance_checks, DEFAULT_MAX_FINDINGS
+        
+        try:
+            console.print(f"[bold cyan]✅ Running compliance checks[/bold cyan]")
+            report = run_compliance_checks(
+                rule_ids=params.get('rule_ids'),
+                files=params.get('files'),
+                fiscal_year=params.get('fiscal_year'),
+                account=params.get('aws_account'),
+                region=params.get('aws_region'),
+                max_findings=int(params.get('max_findings') or DEFAULT_MAX_FINDINGS)
+            )
+            return {
+                "status": "success",
+                "result": json.loads(json.dumps(report, default=str))
+            }
+        
+        except Exception as e:
+            console.print(f"[red]❌ Compliance checks failed: {e}[/red]")
+            return {
+                "status": "error",
+                "error": f"Compliance checks failed: {str(e)}"
+            }
+    
+    def _execute_read_tool_result(self, params: Dict) -> Dict:
+        """Page through a large tool result stored behind a handle"""
+        from ai_brain.context_budget import get_tool_result_store, DEFAULT_PAGE_CHARS
+        
+        try:
+            handle = params.get('handle')
+            if not handle:
+                return {
+                    "status": "error",
+                    "error": "Missing required parameter: handle"
+                }
+            
+            page = get_tool_result_store().read(
+                handle,
+                offset=int(params.get('offset') or 0),
+                max_chars=min(int(params.get('max_chars') or DEFAULT_PAGE_CHARS), 4 * DEFAULT_PAGE_CHARS),
+                grep=params.get('grep')
+            )
+            return {
+                "status": "success",
+                "result": page
+            }
+        
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Could not read tool result: {str(e)}"
+            }
+    
     # === JIRA INTEGRATION IMPLEMENTATIONS ===
     def _execute_jira_list_tickets(self, params: Dict) -> Dict:
         """Execute Jira list tickets"""
@@ -3355,6 +3551,13 @@ Only return JSON, no prose.
         
         # Close persistent browser session
         BrowserSessionManager.close_browser()
+        
+        # Stop the cache sweeper thread and flush write-behind disk writes
+        from ai_brain.advanced_cache import close_advanced_cache
+        self.post_execution.close()
+        self.cache_manager.close()
+        self.result_cache.close()
+        close_advanced_cache()
 
     @staticmethod
     def _determine_effective_max_results(raw_max: Optional[int], user_request: Optional[str]) -> int:
@@ -3380,10 +3583,13 @@ Only return JSON, no prose.
         tool_name: str,
         tool_params: Dict[str, Any],
         result_payload: Dict[str, Any],
+        current_request: Optional[str] = None,
     ) -> None:
         """Forward failure context to advisor LLM for diagnosis."""
         if not self.advisor:
             return
+        if current_request is None:
+            current_request = self.current_request or ""
         try:
             log_excerpt = (
                 result_payload.get("error")
@@ -3392,7 +3598,7 @@ Only return JSON, no prose.
             )
             if result_payload.get("status") == "success":
                 advice = self.advisor.review_step(
-                    current_request=self.current_request or "",
+                    current_request=current_request,
                     tool_name=tool_name,
                     tool_params=tool_params,
                     result_payload=result_payload,
@@ -3400,7 +3606,7 @@ Only return JSON, no prose.
                 )
             else:
                 advice = self.advisor.analyze_failure(
-                    current_request=self.current_request or "",
+                    current_request=current_request,
                     tool_name=tool_name,
                     tool_params=tool_params,
                     result_payload=result_payload,
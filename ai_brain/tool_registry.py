@@ -6,8 +6,12 @@ Provides:
 - Tool registration and discovery
 - Tool metadata and documentation
 - Performance optimization through deferred imports
+- O(1) dispatch for ToolExecutor (resolve_handler) and per-tool call metrics
+- lazy_subsystem: executor subsystems built on first use
 """
 
+import threading
+import time
 from typing import Dict, Any, Optional, Callable, Type
 from functools import lru_cache
 from rich.console import Console
@@ -15,6 +19,42 @@ from rich.console import Console
 console = Console()
 
 
+class lazy_subsystem:
+    """
+    Decorator for executor subsystems that are expensive to build.
+    
+    The method runs once, on first attribute access, and its value is stored
+    on the instance (so later reads are plain attribute lookups and tests can
+    still assign the attribute). Construction is serialized per instance;
+    subsystems may depend on each other. Build times are kept in
+    instance.subsystem_load_seconds.
+    """
+    
+    def __init__(self, factory: Callable[[Any], Any]):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        state = instance.__dict__
+        if self.name in state:
+            return state[self.name]
+        with state.setdefault("_subsystem_lock", threading.RLock()):
+            if self.name not in state:
+                started = time.time()
+                state[self.name] = self.factory(instance)
+                elapsed = time.time() - started
+                state.setdefault("subsystem_load_seconds", {})[self.name] = round(elapsed, 3)
+                if elapsed >= 0.1:
+                    console.print(f"[dim]🧩 Loaded {self.name} ({elapsed:.1f}s)[/dim]")
+        return state[self.name]
+
+
 class ToolRegistry:
     """
     Central registry for all tools with lazy loading support.
@@ -26,6 +66,8 @@ class ToolRegistry:
     _instance = None
     _tools: Dict[str, Dict[str, Any]] = {}
     _loaded_tools: Dict[str, Any] = {}
+    _metrics: Dict[str, Dict[str, Any]] = {}
+    _metrics_lock = threading.Lock()
     
     def __new__(cls):
         """Singleton pattern."""
@@ -42,83 +84,95 @@ class ToolRegistry:
         self._register_all_tools()
         self._initialized = True
     
+    # name -> (ToolExecutor method, category, description[, fixed params])
+    EXECUTOR_TOOLS = {
+        # AWS
+        "aws_console_action": ("_execute_aws_console_action", "aws", "Universal AWS console actions"),
+        "aws_navigate": ("_execute_aws_console_action", "aws", "Navigate the AWS console (legacy alias)",
+                         {"capture_screenshot": False}),
+        "aws_take_screenshot": ("_execute_aws_console_action", "aws", "Capture AWS console screenshots (legacy alias)",
+                                {"capture_screenshot": True}),
+        "aws_export_data": ("_execute_aws_export", "aws", "Export AWS resources to CSV/JSON"),
+        "bulk_aws_export": ("_execute_bulk_aws_export", "aws", "Export several services/regions in one call"),
+        "list_aws_resources": ("_execute_list_aws", "aws", "List AWS resources"),
+        "intelligent_aws_cli": ("_execute_intelligent_aws_cli", "aws", "AWS CLI with LLM-generated commands"),
+        "query_resource_graph": ("_execute_query_resource_graph", "aws", "Query the AWS resource relationship graph"),
+        "iam_access_query": ("_execute_iam_access_query", "aws", "Who can access what (IAM policy index)"),
+        "run_compliance_checks": ("_execute_run_compliance_checks", "aws", "Run compliance rules against AWS resources"),
+
+        # SharePoint / evidence
+        "sharepoint_review_evidence": ("_execute_sharepoint_review", "sharepoint", "Review previous-year evidence"),
+        "upload_to_sharepoint": ("_execute_upload", "sharepoint", "Upload files to SharePoint"),
+        "learn_from_sharepoint_url": ("_execute_learn_from_sharepoint", "sharepoint", "Learn evidence patterns from a SharePoint URL"),
+        "show_local_evidence": ("_execute_show_evidence", "evidence", "Show local evidence files"),
+        "analyze_document_evidence": ("_execute_analyze_document_evidence", "evidence", "Analyze evidence documents"),
+        "replay_evidence_playbook": ("_execute_replay_evidence_playbook", "evidence", "Replay a stored evidence playbook"),
+        "intelligent_file_export": ("_execute_intelligent_export", "evidence", "Export data in an LLM-chosen format"),
+        "intelligent_evidence_collection": ("_execute_intelligent_evidence_collection", "evidence", "LLM-directed evidence collection"),
+        "analyze_past_evidence": ("_execute_analyze_past_evidence", "evidence", "Learn patterns from past evidence"),
+        "query_evidence_store": ("_execute_query_evidence_store", "evidence", "Query the columnar evidence store"),
+        "myid_export_access": ("_execute_myid_export_access", "evidence", "Export MyID access listings"),
+
+        # Orchestrator
+        "orchestrator_analyze_and_plan": ("_execute_orchestrator_analyze", "orchestrator", "Analyze evidence and build a plan"),
+        "orchestrator_execute_plan": ("_execute_orchestrator_execute", "orchestrator", "Execute the current plan"),
+        "orchestrator_resume_plan": ("_execute_orchestrator_resume", "orchestrator", "Resume an interrupted plan from its journal"),
+
+        # Self-healing / enhancements
+        "read_tool_source": ("_execute_read_tool_source", "self_healing", "Read tool source code"),
+        "diagnose_error": ("_execute_diagnose_error", "self_healing", "Diagnose a tool error"),
+        "fix_tool_code": ("_execute_fix_tool_code", "self_healing", "Fix tool code automatically"),
+        "test_tool": ("_execute_test_tool", "self_healing", "Test a tool after a fix"),
+        "list_pending_enhancements": ("_execute_list_pending_enhancements", "self_healing", "List pending enhancement proposals"),
+        "apply_pending_enhancement": ("_execute_apply_pending_enhancement", "self_healing", "Apply an approved enhancement"),
+        "review_pending_enhancement": ("_execute_review_pending_enhancement", "self_healing", "LLM review of an enhancement"),
+
+        # Code generation / execution
+        "generate_new_tool": ("_execute_generate_tool", "code_generation", "Generate a new tool"),
+        "add_functionality_to_tool": ("_execute_add_functionality", "code_generation", "Add functionality to a tool"),
+        "implement_missing_function": ("_execute_implement_function", "code_generation", "Implement a missing function"),
+        "search_implementation_examples": ("_execute_search_examples", "code_generation", "Search the codebase for examples"),
+        "execute_python_code": ("_execute_python_code", "code_generation", "Run LLM-written Python code"),
+        "query_agent_database": ("_execute_query_agent_database", "database", "Query the agent database"),
+        "store_in_database": ("_execute_store_in_database", "database", "Store data in the agent database"),
+
+        # Knowledge / browser / context
+        "web_search": ("_execute_web_search", "knowledge", "Search the web for real-time information"),
+        "get_browser_screenshot": ("_execute_browser_screenshot", "browser", "Screenshot the current browser page"),
+        "read_tool_result": ("_execute_read_tool_result", "context", "Read a stored large tool result"),
+
+        # Jira
+        "jira_list_tickets": ("_execute_jira_list_tickets", "jira", "List Jira tickets"),
+        "jira_search_jql": ("_execute_jira_search_jql", "jira", "Search Jira with JQL"),
+        "jira_search_intent": ("_execute_jira_search_intent", "jira", "Search Jira from a natural-language intent"),
+        "jira_dashboard_summary": ("_execute_jira_dashboard_summary", "jira", "Summarize a Jira dashboard"),
+        "jira_get_ticket": ("_execute_jira_get_ticket", "jira", "Get one Jira ticket"),
+
+        # Confluence
+        "confluence_search": ("_execute_confluence_search", "confluence", "Search Confluence"),
+        "confluence_get_page": ("_execute_confluence_get_page", "confluence", "Get a Confluence page"),
+        "confluence_list_space": ("_execute_confluence_list_space", "confluence", "List pages in a Confluence space"),
+
+        # GitHub
+        "github_list_prs": ("_execute_github_list_prs", "github", "List pull requests"),
+        "github_get_pr": ("_execute_github_get_pr", "github", "Get one pull request"),
+        "github_search_code": ("_execute_github_search_code", "github", "Search code"),
+        "github_list_issues": ("_execute_github_list_issues", "github", "List issues"),
+        "github_list_discussions": ("_execute_github_list_discussions", "github", "List discussions"),
+    }
+    
     def _register_all_tools(self):
         """Register all available tools (without importing them)."""
-        # AWS Tools
-        self.register(
-            name="aws_export_data",
-            module="tools.aws_universal_export",
-            function="export_aws_data",
-            description="Export AWS resources to CSV/JSON",
-            category="aws"
-        )
-        
-        self.register(
-            name="aws_take_screenshot",
-            module="ai_brain.tool_executor",
-            method="_execute_aws_screenshot",
-            description="Capture AWS console screenshots",
-            category="aws"
-        )
-        
-        self.register(
-            name="aws_console_action",
-            module="ai_brain.tool_executor",
-            method="_execute_aws_console_action",
-            description="Universal AWS console actions",
-            category="aws"
-        )
-        
-        self.register(
-            name="list_aws_resources",
-            module="ai_brain.tool_executor",
-            method="_execute_list_aws",
-            description="List AWS resources",
-            category="aws"
-        )
-        
-        # SharePoint Tools
-        self.register(
-            name="upload_to_sharepoint",
-            module="ai_brain.tool_executor",
-            method="_execute_upload",
-            description="Upload files to SharePoint",
-            category="sharepoint"
-        )
-        
-        self.register(
-            name="show_local_evidence",
-            module="ai_brain.tool_executor",
-            method="_execute_show_evidence",
-            description="Show local evidence files",
-            category="evidence"
-        )
-        
-        # Self-healing Tools
-        self.register(
-            name="read_tool_source",
-            module="ai_brain.tool_executor",
-            method="_execute_read_tool_source",
-            description="Read tool source code",
-            category="self_healing"
-        )
-        
-        self.register(
-            name="fix_tool_code",
-            module="ai_brain.tool_executor",
-            method="_execute_fix_tool_code",
-            description="Fix tool code automatically",
-            category="self_healing"
-        )
-        
-        # Web Search
-        self.register(
-            name="web_search",
-            module="ai_brain.tool_executor",
-            method="_execute_web_search",
-            description="Search the web for real-time information",
-            category="knowledge"
-        )
+        for name, entry in self.EXECUTOR_TOOLS.items():
+            method, category, description = entry[:3]
+            self.register(
+                name=name,
+                module="ai_brain.tool_executor",
+                method=method,
+                description=description,
+                category=category,
+                fixed_params=entry[3] if len(entry) > 3 else None
+            )
         
         console.print(f"[dim]📦 Registered {len(self._tools)} tools (lazy loading enabled)[/dim]")
     
@@ -130,7 +184,8 @@ class ToolRegistry:
         method: Optional[str] = None,
         class_name: Optional[str] = None,
         description: str = "",
-        category: str = "general"
+        category: str = "general",
+        fixed_params: Optional[Dict[str, Any]] = None
     ):
         """
         Register a tool without importing it.
@@ -143,6 +198,7 @@ class ToolRegistry:
             class_name: Class name (if method)
             description: Tool description
             category: Tool category
+            fixed_params: Parameters forced on every call (aliases such as aws_navigate)
         """
         self._tools[name] = {
             "module": module,
@@ -151,6 +207,7 @@ class ToolRegistry:
             "class_name": class_name,
             "description": description,
             "category": category,
+            "fixed_params": fixed_params or {},
             "loaded": False
         }
     
@@ -214,6 +271,78 @@ class ToolRegistry:
         
         return None
     
+    def resolve_handler(self, name: str, executor_instance: Any) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        """
+        Callable that runs a registered tool on an executor (params -> result dict).
+        
+        Applies the tool's fixed params. Callers cache the handler per executor,
+        so dispatch after the first call is a dict lookup.
+        
+        Returns:
+            Handler, or None if the tool is not registered
+        """
+        tool_info = self._tools.get(name)
+        if tool_info is None:
+            return None
+        
+        if tool_info.get("method"):
+            # Executor methods are already loaded with the executor; no import needed
+            tool = getattr(executor_instance, tool_info["method"], None)
+        else:
+            tool = self.get_tool(name, executor_instance)
+        if tool is None:
+            target = tool_info.get("method") or tool_info.get("function") or tool_info.get("class_name")
+            
+            def not_implemented(params: Dict[str, Any]) -> Dict[str, Any]:
+                return {"status": "error", "error": f"Tool '{name}' is registered but {target} is not implemented"}
+            return not_implemented
+        
+        fixed_params = tool_info.get("fixed_params")
+        if not fixed_params:
+            return tool
+        
+        def with_fixed_params(params: Dict[str, Any]) -> Dict[str, Any]:
+            params.update(fixed_params)
+            return tool(params)
+        return with_fixed_params
+    
+    def record_call(self, name: str, seconds: float, result: Any) -> None:
+        """Record one tool call (latency, error) in the per-tool metrics."""
+        failed = not isinstance(result, dict) or result.get("status") == "error"
+        with self._metrics_lock:
+            metrics = self._metrics.setdefault(name, {
+                "calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0, "last_error": None
+            })
+            metrics["calls"] += 1
+            metrics["total_seconds"] += seconds
+            metrics["max_seconds"] = max(metrics["max_seconds"], seconds)
+            if failed:
+                metrics["errors"] += 1
+                error = result.get("error") if isinstance(result, dict) else result
+                metrics["last_error"] = str(error)[:200]
+    
+    def get_metrics(self, name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-tool call metrics.
+        
+        Args:
+            name: Optional tool name filter
+            
+        Returns:
+            Dict of tool names to {calls, errors, total_seconds, avg_seconds, max_seconds, last_error}
+        """
+        with self._metrics_lock:
+            selected = {name: self._metrics[name]} if name in self._metrics else ({} if name else self._metrics)
+            return {
+                tool: {
+                    **metrics,
+                    "total_seconds": round(metrics["total_seconds"], 3),
+                    "avg_seconds": round(metrics["total_seconds"] / metrics["calls"], 3),
+                    "max_seconds": round(metrics["max_seconds"], 3)
+                }
+                for tool, metrics in selected.items()
+            }
+    
     def list_tools(self, category: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
         List all registered tools.
@@ -237,8 +366,10 @@ class ToolRegistry:
         return self._tools.get(name)
     
     def clear_cache(self):
-        """Clear loaded tools cache (for testing/reloading)."""
+        """Clear loaded tools cache and call metrics (for testing/reloading)."""
         self._loaded_tools.clear()
+        with self._metrics_lock:
+            self._metrics.clear()
         console.print("[dim]🧹 Cleared tool cache[/dim]")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -246,7 +377,9 @@ class ToolRegistry:
         return {
             "total_tools": len(self._tools),
             "loaded_tools": len(self._loaded_tools),
-            "load_percentage": f"{(len(self._loaded_tools) / len(self._tools) * 100):.1f}%" if self._tools else "0%"
+            "load_percentage": f"{(len(self._loaded_tools) / len(self._tools) * 100):.1f}%" if self._tools else "0%",
+            "tools_called": len(self._metrics),
+            "total_calls": sum(m["calls"] for m in self._metrics.values())
         }
 
 
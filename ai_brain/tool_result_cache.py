@@ -0,0 +1,217 @@
+"""
+Tool Result Cache - Session-level cache for read-only tool results
+
+The LLM often repeats the same read-only call seconds apart ("list the RDS
+clusters" ... "which of those clusters ..."). Results are cached per tool
+name + normalized parameters with per-tool TTL policies:
+
+- Fresh entries are returned immediately
+- Stale entries (past TTL, within the stale window) are returned immediately
+  while a background refresh replaces them (stale-while-revalidate)
+- Concurrent misses on the same call execute once (CacheManager single-flight)
+- Mutating tools invalidate the cached tools they affect
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+from ai_brain.shared.cache_manager import CacheManager
+
+console = Console()
+
+
+@dataclass
+class CachePolicy:
+    """How long a tool's results stay fresh, and how long stale results may be served."""
+    ttl: int
+    stale_ttl: int = 0
+
+
+# Read-only tools whose results are safe to reuse within a session
+CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "list_aws_resources": CachePolicy(ttl=300, stale_ttl=1800),
+    "jira_search_jql": CachePolicy(ttl=120, stale_ttl=600),
+    "confluence_search": CachePolicy(ttl=300, stale_ttl=1800),
+    "github_list_prs": CachePolicy(ttl=120, stale_ttl=600),
+    "show_local_evidence": CachePolicy(ttl=30, stale_ttl=120),
+}
+
+# Tools with side effects -> cached tools whose results they make outdated ("*" = all)
+INVALIDATED_BY: Dict[str, List[str]] = {
+    "aws_export_data": ["show_local_evidence"],
+    "bulk_aws_export": ["show_local_evidence"],
+    "aws_console_action": ["show_local_evidence", "list_aws_resources"],
+    "aws_take_screenshot": ["show_local_evidence"],
+    "myid_export_access": ["show_local_evidence"],
+    "replay_evidence_playbook": ["show_local_evidence"],
+    "upload_to_sharepoint": ["show_local_evidence"],
+    "sharepoint_review_evidence": ["show_local_evidence"],
+    "execute_python_code": ["*"],
+    "fix_tool_code": ["*"],
+    "apply_pending_enhancement": ["*"],
+}
+
+
+def _normalize(value: Any) -> Any:
+    """Canonical form of tool params: sorted keys, trimmed strings, no empty values."""
+    if isinstance(value, dict):
+        return {
+            str(k): _normalize(v)
+            for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))
+            if v is not None and v != "" and v != [] and v != {}
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, set):
+        return sorted(_normalize(v) for v in value)
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def make_cache_key(tool_name: str, params: Dict[str, Any]) -> str:
+    """Cache key for a tool call: tool name + hash of normalized params."""
+    payload = json.dumps(_normalize(params or {}), sort_keys=True, default=str)
+    return f"tool:{tool_name}:{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+
+class _Uncacheable(Exception):
+    """Carries a result that must be returned but not cached (e.g. an error)."""
+
+    def __init__(self, result: Any):
+        super().__init__("uncacheable tool result")
+        self.result = result
+
+
+class ToolResultCache:
+    """Per-session cache of read-only tool results with stale-while-revalidate."""
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+        enabled: Optional[bool] = None,
+        max_entries: int = 2000
+    ):
+        if enabled is None:
+            enabled = os.getenv("TOOL_RESULT_CACHE_ENABLED", "true").lower() == "true"
+        self.enabled = enabled
+        self.policies = policies if policies is not None else dict(CACHE_POLICIES)
+        self.cache = CacheManager(max_entries=max_entries)
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self.stats = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "invalidations": 0}
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        return self.enabled and tool_name in self.policies
+
+    def get_or_execute(
+        self,
+        tool_name: str,
+        params: Dict[str, Any],
+        execute: Callable[[], Dict[str, Any]],
+        refresh: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return a cached result for the call or execute it.
+
+        Args:
+            tool_name: Tool being called
+            params: Tool parameters (normalized for the key)
+            execute: Runs the tool in the foreground on a miss
+            refresh: Runs the tool for a background refresh (defaults to execute)
+        """
+        policy = self.policies[tool_name]
+        key = make_cache_key(tool_name, params)
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            age = time.time() - entry["fetched_at"]
+            if age <= policy.ttl:
+                self.stats["fresh_hits"] += 1
+                return self._annotate(entry["result"], age, refreshing=False)
+            self.stats["stale_hits"] += 1
+            self._schedule_refresh(key, tool_name, policy, refresh or execute)
+            console.print(f"[dim]♻️  {tool_name}: serving {age:.0f}s-old result, refreshing in background[/dim]")
+            return self._annotate(entry["result"], age, refreshing=True)
+
+        self.stats["misses"] += 1
+
+        def compute():
+            result = execute()
+            if not self._should_store(result):
+                raise _Uncacheable(result)
+            return {"result": result, "fetched_at": time.time()}
+
+        try:
+            entry = self.cache.get_or_compute(key, compute, ttl=policy.ttl + policy.stale_ttl)
+        except _Uncacheable as e:
+            return e.result
+        # Callers get their own copy; the entry stays shared by later hits
+        return copy.deepcopy(entry["result"])
+
+    @staticmethod
+    def _should_store(result: Any) -> bool:
+        return isinstance(result, dict) and result.get("status") == "success"
+
+    @staticmethod
+    def _annotate(result: Dict[str, Any], age: float, refreshing: bool) -> Dict[str, Any]:
+        annotated = copy.deepcopy(result)
+        annotated["cache"] = {"age_seconds": round(age, 1), "refreshing": refreshing}
+        return annotated
+
+    def _schedule_refresh(self, key: str, tool_name: str, policy: CachePolicy, refresh: Callable) -> None:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tool-cache-refresh")
+        self._refresh_pool.submit(self._refresh, key, tool_name, policy, refresh)
+
+    def _refresh(self, key: str, tool_name: str, policy: CachePolicy, refresh: Callable) -> None:
+        try:
+            result = refresh()
+            if self._should_store(result):
+                self.cache.set(key, {"result": result, "fetched_at": time.time()}, ttl=policy.ttl + policy.stale_ttl)
+                self.stats["refreshes"] += 1
+        except Exception as e:
+            console.print(f"[dim]⚠️  Background refresh of {tool_name} failed: {e}[/dim]")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def invalidate_after(self, tool_name: str) -> int:
+        """Drop cached results made outdated by running a mutating tool."""
+        targets = INVALIDATED_BY.get(tool_name)
+        if not targets:
+            return 0
+        if "*" in targets:
+            count = self.cache.clear("tool:*")
+        else:
+            count = sum(self.cache.clear(f"tool:{target}:*") for target in targets)
+        if count:
+            self.stats["invalidations"] += count
+            console.print(f"[dim]🧹 {tool_name}: invalidated {count} cached tool result(s)[/dim]")
+        return count
+
+    def clear(self) -> int:
+        return self.cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self.cache.cache), "refreshing": len(self._refreshing)}
+
+    def close(self) -> None:
+        self.cache.close()
+        if self._refresh_pool is not None:
+            self._refresh_pool.shutdown(wait=False)
+            self._refresh_pool = None
@@ -0,0 +1,280 @@
+"""
+Tool Selector - Send only the tool families a request needs
+
+A one-line Jira question doesn't need the AWS, SharePoint, self-healing and
+code-generation schemas. A local classifier (keyword + vocabulary overlap,
+no LLM call) scores each tool family against the request and recent user
+turns; only the matching families are sent to the model.
+
+Escalation: every subset carries a `request_more_tools` meta tool. When the
+model calls it, or calls a catalog tool that wasn't offered, the full
+catalog (or the requested families) is sent from the next iteration on.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from rich.console import Console
+
+console = Console()
+
+REQUEST_MORE_TOOLS = "request_more_tools"
+MIN_FAMILY_SCORE = 1.0
+FULL_CATALOG_RATIO = 0.8  # subsets this large are not worth the risk of a missing tool
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9_\-]+")
+
+_STOPWORDS = {
+    "the", "and", "for", "with", "this", "that", "from", "into", "use", "tool", "tools", "when", "what",
+    "you", "your", "are", "can", "all", "any", "get", "list", "show", "data", "not", "only", "will",
+    "must", "should", "e.g", "etc", "via", "using", "each", "one", "more", "also", "then", "like",
+}
+
+
+@dataclass
+class ToolFamily:
+    """
+    A group of related tools plus the phrases that signal them.
+
+    Keywords match whole words (plural -s/-es included); a trailing '*' marks
+    a stem that matches any word starting with it ("orchestrat*").
+    """
+    name: str
+    tools: List[str]
+    keywords: List[str]
+    description: str = ""
+
+
+TOOL_FAMILIES: List[ToolFamily] = [
+    ToolFamily(
+        name="aws",
+        description="AWS console screenshots, exports, listings and offline analysis",
+        tools=[
+            "aws_console_action", "aws_export_data", "list_aws_resources", "bulk_aws_export",
+            "query_evidence_store", "query_resource_graph", "iam_access_query", "run_compliance_checks",
+        ],
+        keywords=[
+            "aws", "ec2", "s3", "rds", "iam", "kms", "lambda", "vpc", "subnet", "security group", "bucket",
+            "cluster", "instance", "screenshot", "console", "export", "region", "account", "ctr-prod",
+            "ctr-int", "ctr-test", "sxo", "cloudtrail", "cloudwatch", "encryption", "encrypted", "rotation",
+            "compliance", "policy", "policies", "role", "dynamodb", "ecs", "eks", "api gateway", "secrets manager",
+            "backup", "snapshot", "waf", "guardduty", "config rule", "mfa", "access key",
+        ],
+    ),
+    ToolFamily(
+        name="evidence",
+        description="Local and SharePoint audit evidence, RFIs, playbooks and documents",
+        tools=[
+            "sharepoint_review_evidence", "replay_evidence_playbook", "analyze_document_evidence",
+            "upload_to_sharepoint", "learn_from_sharepoint_url", "analyze_past_evidence",
+            "myid_export_access", "query_agent_database", "store_in_database",
+        ],
+        keywords=[
+            "evidence", "rfi", "sharepoint", "upload", "previous year", "last year", "playbook", "document",
+            "pdf", "docx", "myid", "audit", "fy2*", "ismap", "soc", "collect", "folder", "replay",
+        ],
+    ),
+    ToolFamily(
+        name="orchestrator",
+        description="Brain-directed evidence collection plans for RFIs",
+        tools=["orchestrator_analyze_and_plan", "orchestrator_execute_plan", "orchestrator_resume_plan"],
+        keywords=["rfi", "plan", "collect evidence", "evidence collection", "orchestrat*", "previous year", "resume", "continue"],
+    ),
+    ToolFamily(
+        name="jira",
+        description="Jira tickets, JQL searches and dashboards",
+        tools=["jira_list_tickets", "jira_search_jql", "jira_search_intent", "jira_dashboard_summary", "jira_get_ticket"],
+        keywords=["jira", "ticket", "jql", "sprint", "epic", "backlog", "assignee", "story", "bug", "dashboard"],
+    ),
+    ToolFamily(
+        name="confluence",
+        description="Confluence pages and spaces",
+        tools=["confluence_search", "confluence_get_page", "confluence_list_space"],
+        keywords=["confluence", "wiki", "page", "space", "runbook", "documentation", "docs"],
+    ),
+    ToolFamily(
+        name="github",
+        description="GitHub pull requests, issues, discussions and code search",
+        tools=["github_list_prs", "github_list_discussions", "github_get_pr", "github_search_code", "github_list_issues"],
+        keywords=["github", "pull request", "pr", "repo", "repository", "commit", "merge", "discussion", "code search"],
+    ),
+    ToolFamily(
+        name="self_healing",
+        description="Read tool source, diagnose errors, fix and test tools, pending enhancements",
+        tools=[
+            "read_tool_source", "diagnose_error", "fix_tool_code", "test_tool", "get_browser_screenshot",
+            "list_pending_enhancements", "apply_pending_enhancement",
+        ],
+        keywords=[
+            "error", "fix", "broken", "fail", "failed", "failing", "debug", "traceback", "exception",
+            "source code", "enhancement", "not working", "crash", "bug in",
+        ],
+    ),
+    ToolFamily(
+        name="code_generation",
+        description="Generate new tools or add functionality to existing ones",
+        tools=["generate_new_tool", "add_functionality_to_tool", "implement_missing_function", "search_implementation_examples"],
+        keywords=["new tool", "generate", "implement", "add functionality", "add support", "capability", "create a tool"],
+    ),
+]
+
+REQUEST_MORE_TOOLS_DEFINITION = {
+    "name": REQUEST_MORE_TOOLS,
+    "description": (
+        "Only a subset of tools is loaded for this request. Call this if you need a tool that isn't listed. "
+        "Families: " + ", ".join(f"{f.name} ({f.description})" for f in TOOL_FAMILIES) +
+        ". Omit families to load the full catalog."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "families": {
+                "type": "array",
+                "items": {"type": "string", "enum": [f.name for f in TOOL_FAMILIES]},
+                "description": "Tool families to add (empty = all tools)"
+            },
+            "reason": {
+                "type": "string",
+                "description": "What you need the extra tools for"
+            }
+        },
+        "required": []
+    }
+}
+
+
+def _keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """Word-boundary regex for a family keyword, so 'rds' doesn't match 'records'."""
+    if keyword.endswith("*"):
+        return re.compile(rf"\b{re.escape(keyword[:-1])}")
+    return re.compile(rf"\b{re.escape(keyword)}(?:e?s)?\b")
+
+
+def _tokens(text: str) -> Set[str]:
+    return {t for t in _WORD.findall(text.lower()) if t not in _STOPWORDS and len(t) > 2}
+
+
+@dataclass
+class ToolSelection:
+    """Tools to send for one request."""
+    families: FrozenSet[str]
+    tools: List[Dict]
+    full_catalog: bool
+    scores: Dict[str, float] = field(default_factory=dict)
+
+
+class ToolSelector:
+    """Keyword/vocabulary classifier that maps a request to tool families."""
+
+    def __init__(self, catalog: List[Dict], families: Optional[List[ToolFamily]] = None, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.getenv("TOOL_SELECTION_ENABLED", "true").lower() == "true"
+        self.enabled = enabled
+        self.catalog = catalog
+        self.families = {f.name: f for f in (families or TOOL_FAMILIES)}
+        self._by_name = {tool["name"]: tool for tool in catalog}
+        self._keyword_patterns = {
+            f.name: [_keyword_pattern(kw) for kw in f.keywords] for f in self.families.values()
+        }
+
+        # Catalog tools that belong to no family are always sent, so new tools never go missing
+        assigned = {name for f in self.families.values() for name in f.tools}
+        self.base_tools = [tool for tool in catalog if tool["name"] not in assigned]
+
+        # Vocabulary per family from its tool names and descriptions (secondary signal)
+        self._vocab: Dict[str, Set[str]] = {}
+        for family in self.families.values():
+            words = _tokens(family.description)
+            for name in family.tools:
+                tool = self._by_name.get(name)
+                if tool:
+                    words |= _tokens(name.replace("_", " ")) | _tokens(str(tool.get("description", ""))[:400])
+            self._vocab[family.name] = words
+
+        self._subsets: Dict[FrozenSet[str], List[Dict]] = {}
+        self.current: Optional[ToolSelection] = None
+
+    def score(self, text: str) -> Dict[str, float]:
+        """Relevance score per family: keyword hits dominate, vocabulary overlap breaks ties."""
+        lowered = text.lower()
+        words = _tokens(text)
+        scores = {}
+        for name, family in self.families.items():
+            keyword_hits = sum(1 for pattern in self._keyword_patterns[name] if pattern.search(lowered))
+            overlap = len(words & self._vocab[name])
+            scores[name] = keyword_hits * 1.0 + min(overlap, 10) * 0.2
+        return scores
+
+    def _subset(self, families: FrozenSet[str]) -> List[Dict]:
+        """Tool list for a family set; cached so the same set keeps one identity (and one bound LLM)."""
+        if families not in self._subsets:
+            wanted = {name for f in families for name in self.families[f].tools}
+            tools = self.base_tools + [tool for tool in self.catalog if tool["name"] in wanted]
+            self._subsets[families] = tools + [REQUEST_MORE_TOOLS_DEFINITION]
+        return self._subsets[families]
+
+    def _full(self, scores: Optional[Dict[str, float]] = None) -> ToolSelection:
+        return ToolSelection(frozenset(self.families), self.catalog, True, scores or {})
+
+    def select(self, request_text: str, context_texts: Iterable[str] = ()) -> ToolSelection:
+        """
+        Pick tool families for a request.
+
+        Args:
+            request_text: Latest user message
+            context_texts: Previous user messages (weighted at half)
+        """
+        if not self.enabled or not request_text:
+            self.current = self._full()
+            return self.current
+
+        scores = self.score(request_text)
+        for text in context_texts:
+            for name, value in self.score(text).items():
+                scores[name] += value * 0.5
+
+        chosen = frozenset(name for name, value in scores.items() if value >= MIN_FAMILY_SCORE)
+        if not chosen:
+            self.current = self._full(scores)  # No confident signal: don't guess
+        else:
+            tools = self._subset(chosen)
+            if len(tools) >= len(self.catalog) * FULL_CATALOG_RATIO:
+                self.current = self._full(scores)
+            else:
+                self.current = ToolSelection(chosen, tools, False, scores)
+
+        if self.current.full_catalog:
+            console.print(f"[dim]🧰 Tools: full catalog ({len(self.catalog)})[/dim]")
+        else:
+            console.print(
+                f"[dim]🧰 Tools: {', '.join(sorted(self.current.families))} "
+                f"({len(self.current.tools)}/{len(self.catalog)})[/dim]"
+            )
+        return self.current
+
+    def escalate(self, families: Optional[Iterable[str]] = None) -> ToolSelection:
+        """Add families (or everything) to the current selection."""
+        requested = frozenset(f for f in (families or []) if f in self.families)
+        if not requested or self.current is None:
+            self.current = self._full(self.current.scores if self.current else None)
+        else:
+            merged = self.current.families | requested
+            self.current = ToolSelection(merged, self._subset(merged), False, self.current.scores)
+        console.print(f"[cyan]🧰 Tool catalog expanded: {len(self.current.tools)} tools available[/cyan]")
+        return self.current
+
+    def escalate_for(self, tool_name: str) -> bool:
+        """Called when the model uses a tool; expands the selection if it wasn't offered."""
+        if self.current is None or self.current.full_catalog or tool_name not in self._by_name:
+            return False
+        if any(tool["name"] == tool_name for tool in self.current.tools):
+            return False
+        family = next((f.name for f in self.families.values() if tool_name in f.tools), None)
+        self.escalate([family] if family else None)
+        return True
+
+    @property
+    def active_tools(self) -> List[Dict]:
+        return self.current.tools if self.current else self.catalog
@@ -9,7 +9,7 @@ from ai_brain.code_generation_tools import get_code_generation_tools
 from ai_brain.orchestrator_tools import get_orchestrator_tools
 
 
-def get_tool_definitions(read_only_mode: bool = False) -> List[Dict]:
+def _build_tool_definitions(read_only_mode: bool = False) -> List[Dict]:
     """
     Define all tools available to the agent
     Claude will read these and decide when to use them
@@ -1116,6 +1116,241 @@ CRITICAL: Always use this BEFORE collecting new evidence so you match the expect
                 "required": ["evidence_path"]
             }
         },
+        {
+            "name": "query_evidence_store",
+            "description": """📊 Query historical AWS evidence with SQL (columnar store, all accounts / regions / fiscal years).
+
+Every AWS export is also stored as Parquet, partitioned by
+fiscal_year / account / region / service / resource_type / source, and exposed as ONE SQL view named `evidence`.
+source is 'collector' (comprehensive collector, raw AWS fields) or 'exporter' (detailed exporter, derived
+fields such as MFAEnabled, EncryptionStatus); the same resource can appear once per source.
+
+Use this INSTEAD of re-reading CSV/JSON exports or re-calling AWS APIs for questions like:
+- "Which RDS clusters were unencrypted in FY2024 but encrypted in FY2025?"
+- "Count S3 buckets per account across all regions"
+- "Which IAM users in ctr-prod have MFAEnabled = false?"
+
+Rules:
+- ALWAYS filter on partition columns (fiscal_year, account, region, service, resource_type) - they prune whole directories
+- Filter on source too when counting resources, otherwise a resource exported by both writers is counted twice
+- SELECT only the columns you need (column pruning) - avoid SELECT *
+- Resource attribute columns are the AWS field names from the export (e.g. StorageEncrypted, KmsKeyId, MFAEnabled); values keep their collected types (StorageEncrypted = false, Port = 5432), nested structures are JSON strings, and a column whose type differs between snapshots is a string
+- Use mode='partitions' first if you don't know what has been collected
+
+Example:
+SELECT account, region, DBClusterIdentifier, StorageEncrypted
+FROM evidence
+WHERE service = 'rds' AND resource_type = 'clusters' AND source = 'collector'
+  AND fiscal_year IN ('FY2024', 'FY2025')""",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "mode": {
+                        "type": "string",
+                        "enum": ["sql", "partitions", "stats"],
+                        "description": "sql = run a query, partitions = list what is stored, stats = store summary (default: sql)"
+                    },
+                    "sql": {
+                        "type": "string",
+                        "description": "SQL over the `evidence` view (DuckDB dialect). Required when mode='sql'."
+                    },
+                    "filters": {
+                        "type": "object",
+                        "description": "Partition filters for mode='partitions', e.g. {\"account\": \"ctr-prod\", \"service\": \"rds\"}"
+                    },
+                    "max_rows": {
+                        "type": "integer",
+                        "description": "Maximum rows to return (default: 200)"
+                    }
+                },
+                "required": []
+            }
+        },
+        {
+            "name": "query_resource_graph",
+            "description": """🕸️ Answer cross-service relationship questions from an in-memory AWS resource graph.
+
+The graph is built from the evidence store (collected exports). Nodes are resources keyed by ARN,
+edges are typed: encrypted_by, protected_by, in_subnet, in_vpc, assumes_role, uses_instance_profile, has_member.
+
+Use this INSTEAD of exporting several services and cross-referencing CSVs:
+- "Which KMS keys protect which RDS clusters?" → operation='related', resource_kind='rds:clusters', edge_types=['encrypted_by']
+- "Which instances sit behind security groups open to 0.0.0.0/0 or ::/0?" → operation='exposure'
+- "What is connected to cluster prod-db?" → operation='traverse', resource='prod-db'
+- "What is encrypted with key 1234abcd-...?" → operation='neighbors', resource='<key id>', direction='in'
+
+Resource kinds are '<service>:<resource_type>' as collected, e.g. 'rds:clusters', 'ec2:instances', 'kms:keys'.""",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "enum": ["neighbors", "traverse", "related", "exposure", "stats"],
+                        "description": "Query type"
+                    },
+                    "resource": {
+                        "type": "string",
+                        "description": "ARN, short id (sg-..., subnet-..., KMS key id) or resource name (for neighbors/traverse)"
+                    },
+                    "resource_kind": {
+                        "type": "string",
+                        "description": "Source kind for operation='related' (e.g. 'rds:clusters'); target kind filter for 'traverse'"
+                    },
+                    "edge_types": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Restrict to these edge types"
+                    },
+                    "direction": {
+                        "type": "string",
+                        "enum": ["out", "in", "both"],
+                        "description": "Edge direction (default: both; 'related' defaults to out)"
+                    },
+                    "max_hops": {
+                        "type": "integer",
+                        "description": "Traversal depth (default: 3)"
+                    },
+                    "aws_account": {
+                        "type": "string",
+                        "description": "Limit the graph to one account (cached per account)"
+                    },
+                    "fiscal_year": {
+                        "type": "string",
+                        "description": "Fiscal year snapshot to load (default: current year; cached per year)"
+                    },
+                    "rebuild": {
+                        "type": "boolean",
+                        "description": "Reload the graph from the evidence store (after new exports)"
+                    }
+                },
+                "required": ["operation"]
+            }
+        },
+        {
+            "name": "iam_access_query",
+            "description": """🔐 Answer IAM access questions in milliseconds from a cached effective-permission index.
+
+The index is built from ONE get_account_authorization_details snapshot per account (cached on disk
+for 24h), with wildcard actions/resources expanded, group policies folded into users, explicit
+Deny applied and Condition blocks flagged.
+
+Use this INSTEAD of exporting IAM users/roles and reading policies:
+- "Which principals can s3:GetObject on bucket audit-logs?" → operation='who_can', action='s3:GetObject', resource='audit-logs'
+- "What can role app-deployer do?" → operation='what_can', principal='app-deployer'
+- "Who can assume role break-glass?" → operation='who_can_assume', principal='break-glass'
+
+Identity-based policies only: SCPs, resource policies and permission boundaries are NOT evaluated
+(principals with a boundary are flagged). Conditional grants are marked conditional=true.""",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "enum": ["who_can", "what_can", "who_can_assume", "refresh"],
+                        "description": "Query type (refresh = rebuild the index from AWS)"
+                    },
+                    "aws_account": {
+                        "type": "string",
+                        "description": "AWS profile/account (e.g., 'ctr-prod')"
+                    },
+                    "action": {
+                        "type": "string",
+                        "description": "IAM action for who_can (e.g., 's3:GetObject', 'kms:Decrypt')"
+                    },
+                    "resource": {
+                        "type": "string",
+                        "description": "Resource ARN for who_can (bare S3 bucket names are accepted). Default: any resource"
+                    },
+                    "principal": {
+                        "type": "string",
+                        "description": "User/role name or ARN for what_can / who_can_assume"
+                    },
+                    "service": {
+                        "type": "string",
+                        "description": "Limit what_can output to one service prefix (e.g., 's3')"
+                    }
+                },
+                "required": ["operation", "aws_account"]
+            }
+        },
+        {
+            "name": "run_compliance_checks",
+            "description": """✅ Run deterministic compliance checks over collected AWS data (no LLM reading of CSVs).
+
+Rules (config/compliance_rules.yaml) are evaluated as vectorized predicates over whole tables:
+- IAM-001 users without MFA, IAM-002 access keys older than 90 days
+- S3-001 buckets without default encryption
+- KMS-001 customer-managed keys without rotation
+- EC2-001 security groups open to 0.0.0.0/0 or ::/0
+- RDS-001 / RDS-002 unencrypted clusters / instances
+
+Reads the evidence store by default (export the relevant services first), or specific export files.
+Returns per-rule pass/fail counts plus per-resource findings with evidence pointers (file + row).
+Use the findings directly in your answer - do NOT re-open the export files to verify them.""",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "rule_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Rules to run (default: all), e.g. ['IAM-001', 'KMS-001']"
+                    },
+                    "aws_account": {
+                        "type": "string",
+                        "description": "Limit to one account (evidence store source)"
+                    },
+                    "aws_region": {
+                        "type": "string",
+                        "description": "Limit to one region (evidence store source)"
+                    },
+                    "fiscal_year": {
+                        "type": "string",
+                        "description": "Fiscal year snapshot (default: current year)"
+                    },
+                    "files": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Optional export files instead of the evidence store (collector naming, e.g. .../iam_users.csv)"
+                    },
+                    "max_findings": {
+                        "type": "integer",
+                        "description": "Maximum findings to return (default: 50); counts always cover everything"
+                    }
+                },
+                "required": []
+            }
+        },
+        {
+            "name": "read_tool_result",
+            "description": """📄 Read the full content of a large tool result that was truncated to a preview.
+
+When a tool result comes back with "truncated": true (or "compacted": true) it includes a result_handle (res_...).
+Use this tool to page through the full payload instead of re-running the original tool:
+- offset/max_chars to page sequentially (follow next_offset)
+- grep to pull only the lines mentioning a name, ID or value""",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "handle": {
+                        "type": "string",
+                        "description": "result_handle from the truncated result (e.g. 'res_3f2a9c...')"
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Character offset to start reading from (default: 0)"
+                    },
+                    "max_chars": {
+                        "type": "integer",
+                        "description": "Characters to return (default: 8000)"
+                    },
+                    "grep": {
+                        "type": "string",
+                        "description": "Only return lines containing this text (case-insensitive)"
+                    }
+                },
+                "required": ["handle"]
+            }
+        },
         
         # === JIRA INTEGRATION TOOLS ===
         {
@@ -1772,6 +2007,22 @@ Useful for general collaboration/audit reviews. Results can be exported to CSV/J
     return all_tools
 
 
+_COMPILED_TOOL_DEFINITIONS: Dict[bool, List[Dict]] = {}
+
+
+def get_tool_definitions(read_only_mode: bool = False) -> List[Dict]:
+    """
+    Tool definitions, built once per process per mode.
+    
+    The catalog is static, so rebuilding ~80 KB of dicts per request is
+    wasted work. Returns a fresh list; the tool dicts themselves are shared
+    and must not be mutated.
+    """
+    if read_only_mode not in _COMPILED_TOOL_DEFINITIONS:
+        _COMPILED_TOOL_DEFINITIONS[read_only_mode] = _build_tool_definitions(read_only_mode)
+    return list(_COMPILED_TOOL_DEFINITIONS[read_only_mode])
+
+
 # Export TOOLS constant for convenience
 # 🔓 SELF-HEALING ENABLED: Agent can now fix code autonomously!
 TOOLS = get_tool_definitions(read_only_mode=False)
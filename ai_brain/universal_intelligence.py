@@ -12,6 +12,8 @@ from pathlib import Path
 from rich.console import Console
 import traceback
 
+from ai_brain.llm_cache import get_llm_cache
+
 console = Console()
 
 
@@ -104,7 +106,7 @@ Respond in JSON:
                 )
                 response = self.llm.invoke([message])
             else:
-                response = self.llm.invoke(prompt)
+                response = get_llm_cache().invoke(self.llm, prompt, namespace="universal_intelligence")
             
             # Parse response
             response_text = response.content if hasattr(response, 'content') else str(response)
@@ -0,0 +1,353 @@
+"""
+Compliance Engine - Vectorized rule evaluation over exported AWS tables
+
+Rules are declared in config/compliance_rules.yaml and evaluated as pandas /
+NumPy boolean masks over whole tables, so checks like "users without MFA" or
+"KMS keys without rotation" cost one vectorized pass instead of an LLM read.
+
+Provides:
+- Declarative rule loading (ComplianceRule / RuleCondition)
+- Table sources: columnar evidence store (column-pruned scans) or CSV/JSON export files
+- Per-resource findings with evidence pointers (source file, row, partition)
+- Compact report (counts per rule + capped findings) for the LLM
+"""
+
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import yaml
+from rich.console import Console
+
+console = Console()
+
+RULES_PATH = Path(__file__).resolve().parent.parent / "config" / "compliance_rules.yaml"
+DEFAULT_MAX_FINDINGS = 50
+
+_TRUE_VALUES = ["true", "1", "yes", "enabled", "y"]
+_FALSE_VALUES = ["false", "0", "no", "disabled", "n", "none", "nan", ""]
+_NULL_VALUES = ["", "n/a", "none", "null", "nan", "never", "not set"]
+_FILE_KIND_PATTERN = re.compile(r"^(?P<service>[a-z0-9]+)_(?P<resource_type>[a-z0-9_]+?)(?:_\d{8}.*)?$")
+
+
+@dataclass
+class RuleCondition:
+    """Single column predicate"""
+    column: str
+    op: str
+    value: Any = None
+
+
+@dataclass
+class ComplianceRule:
+    """Declarative compliance check over one resource table"""
+    rule_id: str
+    title: str
+    service: str
+    resource_type: str
+    severity: str = "medium"
+    conditions: List[RuleCondition] = field(default_factory=list)
+    match: str = "all"
+    id_columns: List[str] = field(default_factory=list)
+    evidence_columns: List[str] = field(default_factory=list)
+    remediation: str = ""
+    source: Optional[str] = None  # evidence store writer to read (collector / exporter)
+
+    @property
+    def table(self) -> str:
+        return f"{self.service}:{self.resource_type}"
+
+    @property
+    def store_table(self) -> str:
+        """Key of the store-loaded table: one per (table, source)."""
+        return f"{self.table}@{self.source}" if self.source else self.table
+
+    @property
+    def required_columns(self) -> List[str]:
+        return [c.column for c in self.conditions]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ComplianceRule":
+        data = dict(data)
+        data["conditions"] = [RuleCondition(**c) for c in data.get("conditions", [])]
+        return cls(**data)
+
+
+def load_rules(path: Optional[Path] = None) -> List[ComplianceRule]:
+    """Load rules from YAML (config/compliance_rules.yaml by default)."""
+    path = Path(path) if path else RULES_PATH
+    if not path.exists():
+        console.print(f"[yellow]⚠️  Compliance rules file not found: {path}[/yellow]")
+        return []
+    with open(path, "r") as f:
+        config = yaml.safe_load(f) or {}
+    return [ComplianceRule.from_dict(rule) for rule in config.get("rules", [])]
+
+
+# ---------------------------------------------------------------------- #
+# Vectorized predicates
+# ---------------------------------------------------------------------- #
+
+def _normalized(series: pd.Series) -> pd.Series:
+    return series.astype(str).str.strip().str.lower()
+
+
+def _evaluate_condition(df: pd.DataFrame, condition: RuleCondition, now: pd.Timestamp) -> np.ndarray:
+    series = df[condition.column]
+    op = condition.op
+    value = condition.value
+
+    if op == "is_true":
+        return _normalized(series).isin(_TRUE_VALUES).to_numpy()
+    if op == "is_false":
+        return _normalized(series).isin(_FALSE_VALUES).to_numpy()
+    if op == "is_null":
+        return (series.isna() | _normalized(series).isin(_NULL_VALUES)).to_numpy()
+    if op == "not_null":
+        return ~(series.isna() | _normalized(series).isin(_NULL_VALUES)).to_numpy()
+    if op == "eq":
+        return (_normalized(series) == str(value).lower()).to_numpy()
+    if op == "ne":
+        return (_normalized(series) != str(value).lower()).to_numpy()
+    if op == "in":
+        return _normalized(series).isin([str(v).lower() for v in value]).to_numpy()
+    if op in ("gt", "gte", "lt", "lte"):
+        numbers = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+        compare = {"gt": np.greater, "gte": np.greater_equal, "lt": np.less, "lte": np.less_equal}[op]
+        with np.errstate(invalid="ignore"):
+            # NaN (non-numeric cells) compares False
+            return compare(numbers, float(value))
+    if op == "older_than_days":
+        timestamps = pd.to_datetime(series, errors="coerce", utc=True)
+        return ((now - timestamps).dt.days > float(value)).fillna(False).to_numpy(dtype=bool)
+    if op in ("contains", "not_contains"):
+        hits = series.astype(str).str.contains(str(value), regex=False, na=False).to_numpy()
+        return hits if op == "contains" else ~hits
+    if op == "contains_any":
+        pattern = "|".join(re.escape(str(v)) for v in value)
+        return series.astype(str).str.contains(pattern, regex=True, na=False).to_numpy()
+    raise ValueError(f"Unknown condition op: {op}")
+
+
+class ComplianceEngine:
+    """Evaluate ComplianceRules over resource tables (one DataFrame per service:resource_type)."""
+
+    def __init__(self, rules: Optional[List[ComplianceRule]] = None):
+        self.rules = rules if rules is not None else load_rules()
+
+    def select_rules(self, rule_ids: Optional[List[str]] = None) -> List[ComplianceRule]:
+        if not rule_ids:
+            return list(self.rules)
+        wanted = {r.upper() for r in rule_ids}
+        return [r for r in self.rules if r.rule_id.upper() in wanted]
+
+    # ------------------------------------------------------------------ #
+    # Table loading
+    # ------------------------------------------------------------------ #
+
+    def load_tables_from_store(
+        self,
+        rules: List[ComplianceRule],
+        fiscal_year: Optional[str] = None,
+        account: Optional[str] = None,
+        region: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """One column-pruned scan per table, shared by every rule on that table."""
+        from evidence_manager.evidence_store import get_evidence_store
+
+        store = get_evidence_store()
+        columns_by_table: Dict[str, set] = {}
+        for rule in rules:
+            columns_by_table.setdefault(rule.store_table, set()).update(
+                rule.required_columns + rule.id_columns + rule.evidence_columns + ["_source_file"]
+            )
+
+        tables = {}
+        for table, columns in columns_by_table.items():
+            table_kind, _, source = table.partition("@")
+            service, resource_type = table_kind.split(":", 1)
+            filters = {
+                "fiscal_year": fiscal_year or store.current_fiscal_year(),
+                "service": service,
+                "resource_type": resource_type,
+            }
+            if source:
+                filters["source"] = source
+            if account:
+                filters["account"] = account
+            if region:
+                filters["region"] = region
+            tables[table] = store.scan(columns=sorted(columns), filters=filters)
+        return tables
+
+    @staticmethod
+    def load_tables_from_files(files: Union[Dict[str, str], List[str]]) -> Dict[str, pd.DataFrame]:
+        """
+        Load export files.
+
+        Args:
+            files: {'service:resource_type': path} or a list of paths named the
+                   way the collector names them (e.g. 'iam_users.csv')
+        """
+        items = files.items() if isinstance(files, dict) else [("", f) for f in files]
+        tables: Dict[str, pd.DataFrame] = {}
+        for table, file_path in items:
+            path = Path(file_path).expanduser()
+            table = table or ComplianceEngine.infer_table_kind(path)
+            if not table:
+                console.print(f"[yellow]⚠️  Cannot infer table for {path.name} - pass it as 'service:resource_type'[/yellow]")
+                continue
+            if path.suffix.lower() == ".csv":
+                df = pd.read_csv(path, dtype=str, keep_default_na=False)
+            elif path.suffix.lower() == ".json":
+                with open(path, "r") as f:
+                    payload = json.load(f)
+                if isinstance(payload, dict):
+                    service, resource_type = table.split(":", 1)
+                    payload = payload.get(service, {}).get(resource_type, [])
+                df = pd.DataFrame(payload)
+            else:
+                console.print(f"[yellow]⚠️  Unsupported export format: {path.name}[/yellow]")
+                continue
+            df["_source_file"] = str(path)
+            tables[table] = pd.concat([tables[table], df], ignore_index=True) if table in tables else df
+        return tables
+
+    @staticmethod
+    def infer_table_kind(path: Path) -> Optional[str]:
+        match = _FILE_KIND_PATTERN.match(Path(path).stem.lower())
+        if not match:
+            return None
+        return f"{match.group('service')}:{match.group('resource_type')}"
+
+    # ------------------------------------------------------------------ #
+    # Evaluation
+    # ------------------------------------------------------------------ #
+
+    def evaluate(
+        self,
+        tables: Dict[str, pd.DataFrame],
+        rules: Optional[List[ComplianceRule]] = None,
+        max_findings: int = DEFAULT_MAX_FINDINGS,
+    ) -> Dict[str, Any]:
+        """
+        Run rules over tables.
+
+        Returns:
+            {"summary": [...per rule...], "findings": [...capped...],
+             "total_findings": int, "resources_evaluated": int, "elapsed_ms": float}
+        """
+        started = time.perf_counter()
+        rules = rules if rules is not None else self.rules
+        now = pd.Timestamp(datetime.now(timezone.utc))
+
+        summary = []
+        findings: List[Dict[str, Any]] = []
+        total_findings = 0
+        resources_evaluated = 0
+
+        for rule in rules:
+            df = tables.get(rule.store_table)
+            if df is None:
+                df = tables.get(rule.table)
+            entry = {
+                "rule_id": rule.rule_id,
+                "title": rule.title,
+                "severity": rule.severity,
+                "table": rule.table,
+            }
+            if df is None or df.empty:
+                entry.update({"status": "skipped", "reason": "no data collected for table"})
+                summary.append(entry)
+                continue
+            missing = [c for c in rule.required_columns if c not in df.columns]
+            if missing:
+                entry.update({"status": "skipped", "reason": f"missing columns: {', '.join(missing)}"})
+                summary.append(entry)
+                continue
+
+            masks = [_evaluate_condition(df, condition, now) for condition in rule.conditions]
+            if not masks:
+                entry.update({"status": "skipped", "reason": "rule has no conditions"})
+                summary.append(entry)
+                continue
+            mask = np.logical_and.reduce(masks) if rule.match == "all" else np.logical_or.reduce(masks)
+
+            failed = int(mask.sum())
+            resources_evaluated += len(df)
+            total_findings += failed
+            entry.update({
+                "status": "fail" if failed else "pass",
+                "evaluated": len(df),
+                "failed": failed,
+            })
+            summary.append(entry)
+
+            remaining = max_findings - len(findings)
+            if failed and remaining > 0:
+                findings.extend(self._build_findings(df, mask, rule, remaining))
+
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        console.print(
+            f"[green]✅ Compliance: {len(rules)} rule(s), {resources_evaluated} resource rows, "
+            f"{total_findings} finding(s) in {elapsed_ms} ms[/green]"
+        )
+        return {
+            "summary": summary,
+            "findings": findings,
+            "total_findings": total_findings,
+            "findings_truncated": total_findings > len(findings),
+            "resources_evaluated": resources_evaluated,
+            "elapsed_ms": elapsed_ms,
+        }
+
+    @staticmethod
+    def _build_findings(df: pd.DataFrame, mask: np.ndarray, rule: ComplianceRule, limit: int) -> List[Dict[str, Any]]:
+        pointer_columns = [c for c in ("_source_file", "fiscal_year", "account", "region") if c in df.columns]
+        id_columns = [c for c in rule.id_columns if c in df.columns]
+        evidence_columns = [c for c in rule.evidence_columns if c in df.columns]
+        rows = np.flatnonzero(mask)[:limit]
+        subset = df.iloc[rows][list(dict.fromkeys(id_columns + evidence_columns + pointer_columns))]
+
+        findings = []
+        for row_number, record in zip(rows.tolist(), subset.to_dict("records")):
+            resource_id = next((str(record[c]) for c in id_columns if record.get(c) not in (None, "")), f"row {row_number}")
+            findings.append({
+                "rule_id": rule.rule_id,
+                "severity": rule.severity,
+                "resource": resource_id,
+                "evidence": {c: record.get(c) for c in evidence_columns},
+                "pointer": {
+                    "file": record.get("_source_file") or None,
+                    "row": row_number,
+                    **{c: record.get(c) for c in pointer_columns if c != "_source_file"},
+                },
+                "remediation": rule.remediation,
+            })
+        return findings
+
+
+def run_compliance_checks(
+    rule_ids: Optional[List[str]] = None,
+    files: Optional[Union[Dict[str, str], List[str]]] = None,
+    fiscal_year: Optional[str] = None,
+    account: Optional[str] = None,
+    region: Optional[str] = None,
+    max_findings: int = DEFAULT_MAX_FINDINGS,
+) -> Dict[str, Any]:
+    """High-level entry point: export files if given, otherwise the evidence store."""
+    engine = ComplianceEngine()
+    rules = engine.select_rules(rule_ids)
+    if not rules:
+        return {"summary": [], "findings": [], "total_findings": 0, "resources_evaluated": 0, "elapsed_ms": 0.0}
+    if files:
+        tables = engine.load_tables_from_files(files)
+    else:
+        tables = engine.load_tables_from_store(rules, fiscal_year=fiscal_year, account=account, region=region)
+    return engine.evaluate(tables, rules, max_findings=max_findings)
@@ -20,36 +20,20 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-try:  # Optional dependency; handled gracefully if unavailable.
-    import pandas as pd  # type: ignore
-except Exception:  # pragma: no cover - optional dependency guard
-    pd = None
+from ai_brain.shared.lazy_imports import optional_lazy_import
 
-try:  # Optional dependency; handled gracefully if unavailable.
-    import PyPDF2  # type: ignore
-except Exception:  # pragma: no cover - optional dependency guard
-    PyPDF2 = None
-
-try:  # Optional dependency; handled gracefully if unavailable.
-    import pytesseract  # type: ignore
-except Exception:  # pragma: no cover - optional dependency guard
-    pytesseract = None
+# Optional parsers: None when not installed, otherwise loaded on first use
+pd = optional_lazy_import("pandas")
+PyPDF2 = optional_lazy_import("PyPDF2")
+pytesseract = optional_lazy_import("pytesseract")
+Image = optional_lazy_import("PIL.Image")
+docx = optional_lazy_import("docx")
 
 try:  # Optional dependency; handled gracefully if unavailable.
     import yaml  # type: ignore
 except Exception:  # pragma: no cover - optional dependency guard
     yaml = None
 
-try:  # Optional dependency; handled gracefully if unavailable.
-    from PIL import Image  # type: ignore
-except Exception:  # pragma: no cover - optional dependency guard
-    Image = None
-
-try:  # Optional dependency; handled gracefully if unavailable.
-    from docx import Document as DocxDocument  # type: ignore
-except Exception:  # pragma: no cover - optional dependency guard
-    DocxDocument = None
-
 
 @dataclass
 class DocumentInsight:
@@ -197,10 +181,10 @@ class DocumentIntelligence:
     def _extract_docx_text(self, path: Path) -> Tuple[str, Dict[str, Any]]:
         if path.suffix.lower() == ".doc":
             return "", {"extraction_warning": "Legacy .doc format not supported"}
-        if not DocxDocument:
+        if not docx:
             return "", {"extraction_warning": "python-docx not installed", "extraction_strategy": "unavailable"}
 
-        document = DocxDocument(str(path))
+        document = docx.Document(str(path))
         paragraphs = [para.text for para in document.paragraphs if para.text.strip()]
         return "\n".join(paragraphs), {
             "extraction_strategy": "docx_text",
@@ -7,8 +7,10 @@ import re
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from rich.console import Console
-from PIL import Image
-import pytesseract
+from ai_brain.shared.lazy_imports import lazy_import
+
+Image = lazy_import("PIL.Image")  # OCR stack loads on first screenshot
+pytesseract = lazy_import("pytesseract")
 
 console = Console()
 
@@ -0,0 +1,438 @@
+"""
+Columnar Evidence Store - Historical AWS evidence in partitioned Parquet
+
+Every collection run (comprehensive collector or detailed exporter) is also
+written here as a Parquet snapshot, laid out Hive-style:
+
+    <store>/fiscal_year=FY2025/account=ctr-prod/region=us-east-1/
+            service=rds/resource_type=clusters/source=collector/snapshot.parquet
+
+`source` names the writer (collector, exporter, import). The comprehensive
+collector and the detailed exporter emit different columns for the same
+resource type, so each keeps its own snapshot instead of overwriting the other.
+
+Provides:
+- Cheap appends: one snapshot file per partition, replaced atomically on re-collection
+- Cross-audit queries: FY2024 vs FY2025 live side by side under the same root
+- Embedded read-only SQL (DuckDB) over a single `evidence` view with partition and column pruning
+- PyArrow dataset scans (filters + column projection) when DuckDB is not installed
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rich.console import Console
+
+from evidence_manager.evidence_path_utils import (
+    DEFAULT_YEAR,
+    DEFAULT_YEAR_ENV,
+    _get_base_dir,
+)
+
+console = Console()
+
+try:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.dataset as pa_dataset
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+
+STORE_PATH_ENV = "EVIDENCE_STORE_PATH"
+STORE_ENABLED_ENV = "EVIDENCE_STORE_ENABLED"
+
+PARTITION_KEYS = ("fiscal_year", "account", "region", "service", "resource_type", "source")
+SOURCE_COLLECTOR = "collector"
+SOURCE_EXPORTER = "exporter"
+SOURCE_IMPORT = "import"
+SNAPSHOT_FILENAME = "snapshot.parquet"
+DEFAULT_MAX_ROWS = 200
+
+_UNSAFE_PARTITION_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _partition_value(value: Optional[str]) -> str:
+    """Normalise a partition value so it is safe as a directory name."""
+    text = str(value or "unknown").strip()
+    text = _UNSAFE_PARTITION_CHARS.sub("_", text)
+    return text or "unknown"
+
+
+def _flatten_value(value: Any) -> Any:
+    """Nested AWS structures are stored as JSON strings (same as the CSV exports)."""
+    if isinstance(value, (dict, list, tuple, set)):
+        return json.dumps(list(value) if isinstance(value, set) else value, default=str)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _union_schema(schemas: Iterable["pa.Schema"]) -> "pa.Schema":
+    """Union of snapshot schemas by column name; columns whose types disagree become strings."""
+    fields: Dict[str, "pa.DataType"] = {}
+    for schema in schemas:
+        for field in schema:
+            current = fields.get(field.name)
+            if current is None or pa.types.is_null(current):
+                fields[field.name] = field.type
+            elif not pa.types.is_null(field.type) and current != field.type:
+                fields[field.name] = pa.string()
+    return pa.schema(list(fields.items()))
+
+
+def _typed_value(value: Any, arrow_type: "pa.DataType") -> "pa.Scalar":
+    """Filter value as a scalar of the column's type (False for bool columns, "5432" for int columns)."""
+    try:
+        return pa.scalar(value, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+        text = str(value)
+        if pa.types.is_boolean(arrow_type):
+            text = text.lower()
+        return pa.scalar(text).cast(arrow_type)
+
+
+class ColumnarEvidenceStore:
+    """
+    Partitioned Parquet store for collected AWS evidence.
+
+    Writes are snapshot-per-partition: re-collecting the same
+    (fiscal_year, account, region, service, resource_type, source) replaces
+    the previous snapshot, while other fiscal years are kept for history.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        if root:
+            self.root = Path(root).expanduser()
+        elif os.getenv(STORE_PATH_ENV):
+            self.root = Path(os.getenv(STORE_PATH_ENV)).expanduser()
+        else:
+            self.root = _get_base_dir() / "_evidence_store"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # Writes
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Store writes can be disabled with EVIDENCE_STORE_ENABLED=false."""
+        return os.getenv(STORE_ENABLED_ENV, "true").lower() not in ("false", "0", "no")
+
+    @staticmethod
+    def current_fiscal_year() -> str:
+        return os.getenv(DEFAULT_YEAR_ENV, DEFAULT_YEAR)
+
+    def partition_dir(
+        self,
+        fiscal_year: str,
+        account: str,
+        region: str,
+        service: str,
+        resource_type: str,
+        source: str = SOURCE_COLLECTOR,
+    ) -> Path:
+        values = (fiscal_year, account, region, service, resource_type, source)
+        path = self.root
+        for key, value in zip(PARTITION_KEYS, values):
+            path = path / f"{key}={_partition_value(value)}"
+        return path
+
+    def write_records(
+        self,
+        records: List[Dict[str, Any]],
+        account: str,
+        region: str,
+        service: str,
+        resource_type: str,
+        fiscal_year: Optional[str] = None,
+        source_file: Optional[str] = None,
+        source: str = SOURCE_COLLECTOR,
+    ) -> Optional[str]:
+        """
+        Write one resource snapshot into its partition.
+
+        Pass the complete resource list: the snapshot replaces the whole
+        partition, so a filtered subset would hide the rest.
+
+        Returns:
+            Path of the written Parquet file, or None if nothing was written
+        """
+        if not records or not self.is_enabled():
+            return None
+        if not PYARROW_AVAILABLE:
+            console.print("[dim]ℹ️  pyarrow not installed - skipping columnar evidence store write[/dim]")
+            return None
+
+        fiscal_year = fiscal_year or self.current_fiscal_year()
+        collected_at = datetime.now().isoformat()
+
+        rows = []
+        for record in records:
+            row = {str(k): _flatten_value(v) for k, v in record.items()}
+            row["_collected_at"] = collected_at
+            row["_source_file"] = source_file or ""
+            rows.append(row)
+
+        df = pd.DataFrame(rows)
+        # Mixed-type object columns (e.g. 'N/A' next to ints) cannot be typed by Arrow
+        for col in df.columns:
+            if df[col].dtype == "object":
+                df[col] = df[col].map(lambda x: None if x is None else str(x))
+
+        target_dir = self.partition_dir(fiscal_year, account, region, service, resource_type, source)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / SNAPSHOT_FILENAME
+        tmp_target = target_dir / f".{SNAPSHOT_FILENAME}.tmp"
+
+        with self._write_lock:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, tmp_target, compression="zstd")
+            os.replace(tmp_target, target)
+
+        console.print(
+            f"[dim]🗄️  Evidence store: {len(rows)} {service}/{resource_type} rows ({source}) → "
+            f"{fiscal_year}/{account}/{region}[/dim]"
+        )
+        return str(target)
+
+    def write_collection(
+        self,
+        data: Dict[str, Dict[str, List[Dict[str, Any]]]],
+        account: str,
+        region: str,
+        fiscal_year: Optional[str] = None,
+        source_file: Optional[str] = None,
+        source: str = SOURCE_COLLECTOR,
+    ) -> List[str]:
+        """Write collector output (service -> resource_type -> records)."""
+        written = []
+        for service, resources_dict in (data or {}).items():
+            for resource_type, records in (resources_dict or {}).items():
+                path = self.write_records(
+                    records,
+                    account=account,
+                    region=region,
+                    service=service,
+                    resource_type=resource_type,
+                    fiscal_year=fiscal_year,
+                    source_file=source_file,
+                    source=source,
+                )
+                if path:
+                    written.append(path)
+        return written
+
+    def ingest_file(
+        self,
+        file_path: str,
+        account: str,
+        region: str,
+        service: str,
+        resource_type: str,
+        fiscal_year: Optional[str] = None,
+    ) -> Optional[str]:
+        """Backfill a previously exported CSV/JSON file into the store."""
+        if not PYARROW_AVAILABLE:
+            return None
+        path = Path(file_path).expanduser()
+        if path.suffix.lower() == ".csv":
+            records = pd.read_csv(path, dtype=str).to_dict("records")
+        elif path.suffix.lower() == ".json":
+            with open(path, "r") as f:
+                payload = json.load(f)
+            records = payload if isinstance(payload, list) else payload.get(service, {}).get(resource_type, [])
+        else:
+            console.print(f"[yellow]⚠️  Unsupported evidence file for store ingest: {path.name}[/yellow]")
+            return None
+        return self.write_records(
+            records, account, region, service, resource_type,
+            fiscal_year=fiscal_year, source_file=str(path), source=SOURCE_IMPORT,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Reads
+    # ------------------------------------------------------------------ #
+
+    def list_partitions(self, **filters: str) -> List[Dict[str, str]]:
+        """List stored partitions, optionally filtered by partition key values."""
+        partitions = []
+        for snapshot in self.root.glob("/".join(["*"] * len(PARTITION_KEYS)) + f"/{SNAPSHOT_FILENAME}"):
+            parts = snapshot.relative_to(self.root).parts[:-1]
+            entry = dict(part.split("=", 1) for part in parts if "=" in part)
+            if all(entry.get(k) == _partition_value(v) for k, v in filters.items() if v):
+                entry["path"] = str(snapshot)
+                partitions.append(entry)
+        return sorted(partitions, key=lambda p: tuple(p.get(k, "") for k in PARTITION_KEYS))
+
+    def query(self, sql: str, max_rows: int = DEFAULT_MAX_ROWS) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Run SQL against the `evidence` view.
+
+        Partition keys (fiscal_year, account, region, service, resource_type,
+        source) are regular columns; filtering on them prunes whole directories
+        and only referenced columns are read from the Parquet files.
+
+        Only a single SELECT (or WITH ... SELECT) statement is accepted. The
+        connection runs with external access disabled, so the SQL cannot read
+        or write files outside the `evidence` view.
+
+        Raises:
+            ValueError: If the SQL is not a single read-only query
+        """
+        if not DUCKDB_AVAILABLE or not PYARROW_AVAILABLE:
+            raise RuntimeError("duckdb and pyarrow are required - use scan() or `pip install duckdb pyarrow`")
+        partitions = self.list_partitions()
+        if not partitions:
+            return [], []
+
+        conn = duckdb.connect(database=":memory:")
+        try:
+            statements = conn.extract_statements(sql)
+            if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+                raise ValueError("Only a single read-only SELECT/WITH query is allowed")
+
+            # The snapshots are scanned through PyArrow, so DuckDB itself needs no file access
+            files = [p["path"] for p in partitions]
+            schema = _union_schema(pq.read_schema(f) for f in files)
+            partitioning = pa_dataset.partitioning(
+                pa.schema([(key, pa.string()) for key in PARTITION_KEYS]), flavor="hive"
+            )
+            for key in PARTITION_KEYS:
+                if key not in schema.names:
+                    schema = schema.append(pa.field(key, pa.string()))
+            dataset = pa_dataset.dataset(
+                files, schema=schema, format="parquet",
+                partitioning=partitioning, partition_base_dir=str(self.root),
+            )
+            conn.register("evidence", dataset)
+            conn.execute("SET enable_external_access = false")
+            conn.execute("SET lock_configuration = true")
+
+            cursor = conn.execute(sql)
+            columns = [d[0] for d in cursor.description] if cursor.description else []
+            rows = cursor.fetchmany(max_rows) if max_rows else cursor.fetchall()
+        finally:
+            conn.close()
+        return columns, [dict(zip(columns, row)) for row in rows]
+
+    def scan(
+        self,
+        columns: Optional[Iterable[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> "pd.DataFrame":
+        """
+        Return a DataFrame for the matching partitions.
+
+        Args:
+            columns: Columns to read (None = all). Partition keys are always available.
+            filters: Equality filters; list values mean IN. Partition-key filters
+                     are applied by directory pruning before any file is opened.
+        """
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow is not installed - `pip install pyarrow`")
+
+        filters = filters or {}
+        partition_filters = {k: v for k, v in filters.items() if k in PARTITION_KEYS and not isinstance(v, list)}
+        files = [p["path"] for p in self.list_partitions(**partition_filters)]
+        if not files:
+            return pd.DataFrame()
+
+        frames = []
+        for file_path in files:
+            # Schemas differ per resource type, so each snapshot is read on its own
+            dataset = pa_dataset.dataset(file_path, format="parquet", partitioning=None)
+            available = set(dataset.schema.names)
+            column_filters = {k: v for k, v in filters.items() if k not in PARTITION_KEYS}
+            if any(k not in available for k in column_filters):
+                # Filter on a column this resource type doesn't have - nothing can match
+                continue
+            wanted = [c for c in columns if c in available] if columns else None
+
+            expression = None
+            try:
+                for key, value in column_filters.items():
+                    arrow_type = dataset.schema.field(key).type
+                    field = pa_dataset.field(key)
+                    if isinstance(value, list):
+                        clause = field.isin(pa.array([_typed_value(v, arrow_type) for v in value], type=arrow_type))
+                    else:
+                        clause = field == _typed_value(value, arrow_type)
+                    expression = clause if expression is None else expression & clause
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # Value can't be expressed in the column's type (e.g. "abc" on an int column) - nothing can match
+                continue
+
+            df = dataset.to_table(columns=wanted, filter=expression).to_pandas()
+            parts = Path(file_path).relative_to(self.root).parts[:-1]
+            for part in parts:
+                key, value = part.split("=", 1)
+                df[key] = value
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True, sort=False)
+        for key, value in filters.items():
+            if key in PARTITION_KEYS and isinstance(value, list):
+                df = df[df[key].isin([_partition_value(v) for v in value])]
+        return df
+
+    def get_stats(self) -> Dict[str, Any]:
+        partitions = self.list_partitions()
+        total_bytes = sum(Path(p["path"]).stat().st_size for p in partitions)
+        return {
+            "root": str(self.root),
+            "partitions": len(partitions),
+            "fiscal_years": sorted({p.get("fiscal_year") for p in partitions}),
+            "accounts": sorted({p.get("account") for p in partitions}),
+            "sources": sorted({p.get("source") for p in partitions}),
+            "total_size_mb": round(total_bytes / (1024 * 1024), 2),
+            "sql_available": DUCKDB_AVAILABLE,
+            "parquet_available": PYARROW_AVAILABLE,
+        }
+
+
+_evidence_store = None
+
+
+def get_evidence_store() -> ColumnarEvidenceStore:
+    """Get global evidence store instance."""
+    global _evidence_store
+    if _evidence_store is None:
+        _evidence_store = ColumnarEvidenceStore()
+    return _evidence_store
+
+
+def record_evidence_snapshot(
+    data: Dict[str, Dict[str, List[Dict[str, Any]]]],
+    account: str,
+    region: str,
+    source_file: Optional[str] = None,
+    source: str = SOURCE_COLLECTOR,
+) -> List[str]:
+    """
+    Best-effort hook used by exporters: never lets a store failure
+    break the evidence export itself.
+    """
+    try:
+        return get_evidence_store().write_collection(
+            data, account, region, source_file=source_file, source=source
+        )
+    except Exception as e:
+        console.print(f"[yellow]⚠️  Evidence store write skipped: {e}[/yellow]")
+        return []
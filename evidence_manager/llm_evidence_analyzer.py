@@ -8,11 +8,14 @@ import json
 from typing import Dict, List, Optional
 from pathlib import Path
 from rich.console import Console
-from PIL import Image
-import pytesseract
-import pandas as pd
-from docx import Document
-import PyPDF2
+from ai_brain.shared.lazy_imports import lazy_import
+
+# Parsers load on first use of their file type
+Image = lazy_import("PIL.Image")
+pytesseract = lazy_import("pytesseract")
+pd = lazy_import("pandas")
+docx = lazy_import("docx")
+PyPDF2 = lazy_import("PyPDF2")
 
 console = Console()
 
@@ -110,7 +113,7 @@ class LLMEvidenceAnalyzer:
             elif file_ext in ['docx', 'doc']:
                 console.print(f"[dim]  📄 Reading Word document...[/dim]")
                 if file_ext == 'docx':
-                    doc = Document(file_path)
+                    doc = docx.Document(file_path)
                     text = '\n'.join([para.text for para in doc.paragraphs])
                     return text[:5000]
                 else:
@@ -14,9 +14,11 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from integrations.sharepoint_browser import SharePointBrowserAccess
+from ai_brain.shared.lazy_imports import lazy_import
 from evidence_manager.llm_evidence_analyzer import LLMEvidenceAnalyzer
 
+sharepoint_browser = lazy_import("integrations.sharepoint_browser")  # Playwright loads on first review
+
 console = Console()
 
 
@@ -65,7 +67,7 @@ class SharePointEvidenceLearner:
             
             # Browse SharePoint and list files
             console.print("[yellow]🌐 Connecting to SharePoint...[/yellow]")
-            browser = SharePointBrowserAccess()
+            browser = sharepoint_browser.SharePointBrowserAccess()
             
             # Connect to SharePoint
             if not browser.connect():
@@ -2,16 +2,30 @@
 Integrations Package - Jira, Confluence, GitHub
 
 Provides integrations with external services for the audit agent.
+
+Exports are resolved on first access (PEP 562) so importing one submodule,
+e.g. integrations.sharepoint_browser, does not load the Jira/GitHub SDKs.
 """
 
-from .jira_integration import JiraIntegration
-from .confluence_integration import ConfluenceIntegration
-from .github_integration import GitHubIntegration
-from .myid_exporter import MyIDExporter
-
-__all__ = [
-    'JiraIntegration',
-    'ConfluenceIntegration',
-    'GitHubIntegration',
-    'MyIDExporter',
-]
+import importlib
+
+_EXPORTS = {
+    'JiraIntegration': '.jira_integration',
+    'ConfluenceIntegration': '.confluence_integration',
+    'GitHubIntegration': '.github_integration',
+    'MyIDExporter': '.myid_exporter',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
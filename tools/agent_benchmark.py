@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Offline Agent Benchmark
+Replays recorded LLM transcripts through IntelligentAgent.chat with stubbed
+tools and reports per-turn latency, LLM calls, prompt bytes and tool time
+
+Record once (real provider, real tools):
+    python tools/agent_benchmark.py --record --provider bedrock
+Replay anywhere (no credentials, no network):
+    python tools/agent_benchmark.py --latency none
+
+Both modes run the legacy tool loop with the autonomous brain and web search
+disabled, and keep chat history in a temporary directory, so a run neither
+reaches the network outside the LLM nor touches the user's saved history.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent.parent / "config" / "benchmark_corpus.json"
+DEFAULT_TRANSCRIPT_DIR = Path.home() / ".auditmate_cache" / "llm_transcripts"
+
+
+class StubToolbox:
+    """
+    Stands in for ToolExecutor.execute_tool: canned results, fixed latency, timing per call
+
+    Fixtures map tool name -> result dict; unknown tools get a generic success.
+    """
+
+    def __init__(self, fixtures: Optional[Dict[str, Dict]] = None, latency_ms: int = 0):
+        self.fixtures = fixtures or {}
+        self.latency_ms = latency_ms
+        self.calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.time()
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        result = self.fixtures.get(tool_name) or {
+            "status": "success",
+            "result": {"message": f"{tool_name} completed (benchmark stub)", "parameters": parameters}
+        }
+        with self._lock:
+            self.calls.append({"tool": tool_name, "seconds": time.time() - started})
+        return json.loads(json.dumps(result))  # callers may mutate results
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+
+def _offline_web_search(query: str, *args, **kwargs) -> Dict[str, Any]:
+    """Web search stand-in: always 'no results', so answers come from the LLM transcript"""
+    return {"success": False, "query": query, "results": [], "answer": "", "sources": [],
+            "error": "web search disabled during benchmark"}
+
+
+class _ErrorTap:
+    """Proxy that records LLM exceptions the wrapped caller would otherwise swallow"""
+
+    def __init__(self, llm, errors: List[str]):
+        self._llm = llm
+        self._errors = errors
+
+    def invoke(self, *args, **kwargs):
+        try:
+            return self._llm.invoke(*args, **kwargs)
+        except Exception as e:
+            self._errors.append(f"{type(e).__name__}: {e}")
+            raise
+
+    def __getattr__(self, name):
+        return getattr(self._llm, name)
+
+
+def load_corpus(path: Path) -> Dict[str, Any]:
+    """Corpus file: {"requests": [...], "tool_fixtures": {...}, "tool_latency_ms": N}"""
+    with open(path) as f:
+        corpus = json.load(f)
+    if not corpus.get("requests"):
+        raise ValueError(f"Benchmark corpus has no requests: {path}")
+    return corpus
+
+
+class AgentBenchmark:
+    """Runs a request corpus through IntelligentAgent and collects per-turn metrics"""
+
+    def __init__(self, corpus: Dict[str, Any], transcript: Path, record: bool = False,
+                 provider: Optional[str] = None, latency: str = "recorded"):
+        self.corpus = corpus
+        self.transcript = transcript
+        self.record = record
+        self.provider = provider
+        self.latency = latency
+        self.turns: List[Dict[str, Any]] = []
+        self._history_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._turn_errors: List[str] = []
+
+    def _build_agent(self):
+        # Responses must come from the transcript, not from earlier cached runs
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+        os.environ["TOOL_RESULT_CACHE_ENABLED"] = "false"
+        # AutonomousBrain searches the web on its own; measure the tool loop only
+        os.environ["AUTONOMOUS_BRAIN_ENABLED"] = "false"
+        os.environ["LLM_TRANSCRIPT_PATH"] = str(self.transcript)
+        os.environ["LLM_REPLAY_LATENCY"] = self.latency
+        if self.record:
+            os.environ["LLM_RECORD_PROVIDER"] = self.provider or os.getenv("LLM_PROVIDER", "bedrock")
+            self.transcript.unlink(missing_ok=True)
+
+        from ai_brain.conversation_history import ConversationHistory
+        from ai_brain.intelligent_agent import IntelligentAgent
+        agent = IntelligentAgent(llm_provider="record" if self.record else "replay")
+        agent.conversational_agent.web_search.search = _offline_web_search
+        agent.conversational_agent.llm = _ErrorTap(agent.conversational_agent.llm, self._turn_errors)
+
+        # chat() and the tool loop turn LLM failures into reply text; keep them as errors
+        inject_error = agent._inject_generic_llm_error
+
+        def record_llm_error(err):
+            self._turn_errors.append(f"{type(err).__name__}: {err}")
+            return inject_error(err)
+
+        agent._inject_generic_llm_error = record_llm_error
+        self._history_dir = tempfile.TemporaryDirectory(prefix="auditmate-benchmark-")
+        agent.persistent_history = ConversationHistory(
+            max_exchanges=agent.persistent_history.max_exchanges,
+            history_file=os.path.join(self._history_dir.name, "conversation_history.json")
+        )
+
+        if not self.record:
+            toolbox = StubToolbox(self.corpus.get("tool_fixtures"), int(self.corpus.get("tool_latency_ms", 0)))
+            agent.tool_executor.execute_tool = toolbox.execute_tool
+            agent._benchmark_toolbox = toolbox
+        else:
+            # Real tools: time them through the same wrapper
+            real_execute = agent.tool_executor.execute_tool
+            toolbox = StubToolbox()
+
+            def timed_execute(tool_name, parameters):
+                started = time.time()
+                try:
+                    return real_execute(tool_name, parameters)
+                finally:
+                    with toolbox._lock:
+                        toolbox.calls.append({"tool": tool_name, "seconds": time.time() - started})
+
+            agent.tool_executor.execute_tool = timed_execute
+            agent._benchmark_toolbox = toolbox
+        return agent
+
+    def run(self) -> List[Dict[str, Any]]:
+        from ai_brain.intelligent_agent import CHAT_ERROR_PREFIX
+        agent = self._build_agent()
+        llm_calls = agent.llm.calls  # RecordingLLM / ReplayLLM log every invoke(), bound copies included
+        toolbox: StubToolbox = agent._benchmark_toolbox
+        mode = "Recording" if self.record else "Replaying"
+        console.print(f"[cyan]⏱️  {mode} {len(self.corpus['requests'])} requests ({self.transcript})[/cyan]")
+
+        try:
+            for request in self.corpus["requests"]:
+                llm_calls.clear()
+                toolbox.reset()
+                self._turn_errors.clear()
+                started = time.time()
+                error = None
+                try:
+                    reply = agent.chat(request)
+                    if isinstance(reply, str) and reply.startswith(CHAT_ERROR_PREFIX):
+                        error = reply[len(CHAT_ERROR_PREFIX):] or "chat failed"
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                if error is None and self._turn_errors:
+                    error = self._turn_errors[0]
+                elapsed = time.time() - started
+                self.turns.append({
+                    "request": request,
+                    "seconds": round(elapsed, 3),
+                    "llm_calls": len(llm_calls),
+                    "llm_seconds": round(sum(c["latency_ms"] for c in llm_calls) / 1000, 3),
+                    "prompt_bytes": sum(c["prompt_bytes"] for c in llm_calls),
+                    "tool_calls": len(toolbox.calls),
+                    "tool_seconds": round(sum(c["seconds"] for c in toolbox.calls), 3),
+                    "error": error
+                })
+        finally:
+            agent.cleanup()
+            if self._history_dir:
+                self._history_dir.cleanup()
+
+        replay_stats = getattr(agent.llm, "stats", None)
+        if replay_stats:
+            console.print(f"[dim]   Transcript matches: {replay_stats}[/dim]")
+        return self.turns
+
+    def print_report(self) -> None:
+        table = Table(show_header=True, title="Agent Benchmark")
+        table.add_column("#", style="dim")
+        table.add_column("Request", style="cyan", max_width=48)
+        table.add_column("Turn (s)", justify="right")
+        table.add_column("LLM calls", justify="right")
+        table.add_column("LLM (s)", justify="right")
+        table.add_column("Prompt KB", justify="right")
+        table.add_column("Tools", justify="right")
+        table.add_column("Tool (s)", justify="right")
+
+        for index, turn in enumerate(self.turns, 1):
+            table.add_row(
+                str(index),
+                turn["request"] + (" [red](error)[/red]" if turn["error"] else ""),
+                f"{turn['seconds']:.2f}",
+                str(turn["llm_calls"]),
+                f"{turn['llm_seconds']:.2f}",
+                f"{turn['prompt_bytes'] / 1024:.0f}",
+                str(turn["tool_calls"]),
+                f"{turn['tool_seconds']:.2f}"
+            )
+        console.print(table)
+
+        if self.turns:
+            seconds = [t["seconds"] for t in self.turns]
+            console.print(
+                f"\n[bold]Total {sum(seconds):.2f}s | median turn {statistics.median(seconds):.2f}s | "
+                f"LLM calls {sum(t['llm_calls'] for t in self.turns)} | "
+                f"prompt {sum(t['prompt_bytes'] for t in self.turns) / 1024:.0f} KB | "
+                f"tool time {sum(t['tool_seconds'] for t in self.turns):.2f}s[/bold]"
+            )
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the agent loop offline from recorded LLM transcripts")
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS), help="Request corpus JSON")
+    parser.add_argument("--transcript", help="Transcript JSONL (default: ~/.auditmate_cache/llm_transcripts/<corpus>.jsonl)")
+    parser.add_argument("--record", action="store_true", help="Record a new transcript with the real provider and tools")
+    parser.add_argument("--provider", help="Provider to record from (default: LLM_PROVIDER)")
+    parser.add_argument("--latency", default="recorded", help="Replay latency: recorded | none | <milliseconds>")
+    parser.add_argument("--json", dest="json_out", help="Also write per-turn results to this file")
+    args = parser.parse_args()
+
+    corpus_path = Path(args.corpus)
+    corpus = load_corpus(corpus_path)
+    transcript = Path(args.transcript) if args.transcript else DEFAULT_TRANSCRIPT_DIR / f"{corpus_path.stem}.jsonl"
+    transcript.parent.mkdir(parents=True, exist_ok=True)
+
+    benchmark = AgentBenchmark(corpus, transcript, record=args.record, provider=args.provider, latency=args.latency)
+    benchmark.run()
+    benchmark.print_report()
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(benchmark.turns, f, indent=2)
+        console.print(f"[green]✅ Results written to {args.json_out}[/green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,8 @@ from rich.console import Console
 from rich.table import Table
 import pandas as pd
 
+from evidence_manager.evidence_store import SOURCE_COLLECTOR, record_evidence_snapshot
+
 console = Console()
 
 
@@ -762,9 +764,14 @@ class AWSComprehensiveAuditCollector:
                 enriched.append(record)
                 continue
             
+            # Columns the compliance rules read (KMS-001) are always present,
+            # None when the API did not return them
+            record.update({'KeyManager': None, 'KeySpec': None, 'KeyState': None})
             try:
                 metadata = client.describe_key(KeyId=key_id).get('KeyMetadata', {})
                 record.update(metadata)
+                # Older API responses only carry the deprecated CustomerMasterKeySpec
+                record['KeySpec'] = metadata.get('KeySpec') or metadata.get('CustomerMasterKeySpec')
             except ClientError as exc:
                 record['DescribeError'] = exc.response['Error'].get('Message', str(exc))
             
@@ -772,6 +779,7 @@ class AWSComprehensiveAuditCollector:
                 rotation = client.get_key_rotation_status(KeyId=key_id)
                 record['KeyRotationEnabled'] = rotation.get('KeyRotationEnabled')
             except ClientError:
+                # Asymmetric, HMAC and imported keys do not support rotation
                 record['KeyRotationEnabled'] = None
             
             try:
@@ -793,10 +801,30 @@ class AWSComprehensiveAuditCollector:
         
         return enriched
     
+    def snapshot_to_store(
+        self,
+        data: Dict[str, Dict[str, List[Dict]]],
+        source_file: Optional[str] = None
+    ) -> List[str]:
+        """
+        Write collected data to the columnar evidence store.
+        
+        Call this with the complete collection: each snapshot replaces its
+        whole partition.
+        """
+        return record_evidence_snapshot(
+            data,
+            account=self.profile,
+            region=self.region,
+            source_file=source_file,
+            source=SOURCE_COLLECTOR,
+        )
+    
     def export_to_csv(
         self,
         data: Dict[str, Dict[str, List[Dict]]],
-        output_dir: str
+        output_dir: str,
+        record_snapshot: bool = True
     ) -> List[str]:
         """
         Export collected data to CSV files (one per resource type)
@@ -804,6 +832,7 @@ class AWSComprehensiveAuditCollector:
         Args:
             data: Collected data from collect_all_services()
             output_dir: Output directory path
+            record_snapshot: Also write to the evidence store (False for filtered subsets)
         
         Returns:
             List of created file paths
@@ -834,6 +863,8 @@ class AWSComprehensiveAuditCollector:
                     df.to_csv(filepath, index=False)
                     created_files.append(str(filepath))
                     console.print(f"[green]✅ Saved: {filename}[/green]")
+                    if record_snapshot:
+                        self.snapshot_to_store({service: {resource_type: resources}}, source_file=str(filepath))
                 except Exception as e:
                     console.print(f"[red]❌ Failed to save {filename}: {e}[/red]")
         
@@ -842,7 +873,8 @@ class AWSComprehensiveAuditCollector:
     def export_to_json(
         self,
         data: Dict[str, Dict[str, List[Dict]]],
-        output_file: str
+        output_file: str,
+        record_snapshot: bool = True
     ) -> bool:
         """
         Export all collected data to single JSON file
@@ -850,6 +882,7 @@ class AWSComprehensiveAuditCollector:
         Args:
             data: Collected data from collect_all_services()
             output_file: Output file path
+            record_snapshot: Also write to the evidence store (False for filtered subsets)
         
         Returns:
             True if successful
@@ -861,6 +894,8 @@ class AWSComprehensiveAuditCollector:
             with open(output_path, 'w') as f:
                 json.dump(data, f, indent=2, default=str)
             console.print(f"[green]✅ Saved: {output_file}[/green]")
+            if record_snapshot:
+                self.snapshot_to_store(data, source_file=str(output_path))
             return True
         except Exception as e:
             console.print(f"[red]❌ Failed to save JSON: {e}[/red]")
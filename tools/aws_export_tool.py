@@ -16,6 +16,7 @@ import pandas as pd
 from rich.console import Console
 
 from tools.aws_export_filters import resolve_date_range, filter_records_by_date
+from evidence_manager.evidence_store import SOURCE_EXPORTER, record_evidence_snapshot
 
 console = Console()
 
@@ -680,6 +681,11 @@ class AWSExportToolEnhanced:
             return False
 
 
+def _canonical_export_type(export_type: str) -> str:
+    """Store singular/plural export types under one partition (user -> users)"""
+    return export_type if export_type.endswith('s') else f"{export_type}s"
+
+
 def _write_empty_placeholder(format: str, output_path: str, message: str) -> bool:
     """Create placeholder evidence file when no resources exist"""
     try:
@@ -773,6 +779,17 @@ def export_aws_data(
         if export_type in ['instances', 'instance']:
             data = exporter.export_ec2_instances()
     
+    # Keep a columnar snapshot for cross-account / cross-year queries. It is taken
+    # before date filtering because it replaces the whole partition; the export
+    # file then holds only a subset, so it is not used as the row pointer.
+    record_evidence_snapshot(
+        {service: {_canonical_export_type(export_type): data}},
+        account=aws_account,
+        region=aws_region,
+        source_file=None if start_dt and end_dt else output_path,
+        source=SOURCE_EXPORTER,
+    )
+    
     if start_dt and end_dt:
         inferred_field = date_field or DATE_FIELD_DEFAULTS.get(service, {}).get(export_type)
         if inferred_field:
@@ -174,6 +174,7 @@ class UnifiedAWSExportTool(BaseTool):
                 return False
             
             # Apply date filtering if requested
+            date_filtered = False
             if params.get('filter_by_date'):
                 start_dt, end_dt, _ = resolve_date_range(
                     True,
@@ -182,6 +183,9 @@ class UnifiedAWSExportTool(BaseTool):
                     params.get('audit_period')
                 )
                 if start_dt and end_dt:
+                    # Store the full collection; a snapshot replaces its whole partition
+                    collector.snapshot_to_store({service: all_data[service]})
+                    date_filtered = True
                     date_field = (
                         params.get('date_field') or
                         self.DATE_FIELD_DEFAULTS.get(service, {}).get(export_type)
@@ -199,13 +203,15 @@ class UnifiedAWSExportTool(BaseTool):
             if format_type == 'csv':
                 files = collector.export_to_csv(
                     {service: all_data[service]},
-                    os.path.dirname(output_path)
+                    os.path.dirname(output_path),
+                    record_snapshot=not date_filtered
                 )
                 return bool(files)
             elif format_type == 'json':
                 return collector.export_to_json(
                     {service: all_data[service]},
-                    output_path
+                    output_path,
+                    record_snapshot=not date_filtered
                 )
             else:
                 console.print(f"[red]❌ Unknown format: {format_type}[/red]")
@@ -7,6 +7,8 @@ import boto3
 from typing import Optional, List, Dict
 from rich.console import Console
 
+from tools.aws_resource_name_index import get_resource_name_index
+
 console = Console()
 
 
@@ -37,6 +39,9 @@ class AWSRDSHelper:
             console.print(f"[yellow]⚠️  AWS SDK init failed: {e}[/yellow]")
             console.print(f"[dim]   Will fall back to browser-only navigation[/dim]")
             self.rds_client = None
+        
+        # Shared per account/region name index (listed once, TTL-refreshed)
+        self.name_index = get_resource_name_index(profile=profile, region=region)
     
     def find_cluster_by_partial_name(self, partial_name: str) -> Optional[Dict]:
         """
@@ -58,40 +63,51 @@ class AWSRDSHelper:
         try:
             console.print(f"[cyan]🔍 Searching for cluster containing '{partial_name}'...[/cyan]")
             
-            # List all DB clusters
-            paginator = self.rds_client.get_paginator('describe_db_clusters')
-            
+            # Ranked lookup (exact > prefix > substring > fuzzy) from the cached name index
+            ranked = self.name_index.search('rds', partial_name, limit=10)
             matches = []
-            for page in paginator.paginate():
-                for cluster in page['DBClusters']:
-                    cluster_id = cluster['DBClusterIdentifier']
-                    
-                    # Case-insensitive partial match
-                    if partial_name.lower() in cluster_id.lower():
-                        matches.append({
-                            'cluster_id': cluster_id,
-                            'full_name': cluster_id,
-                            'arn': cluster.get('DBClusterArn', ''),
-                            'engine': cluster.get('Engine', 'unknown'),
-                            'status': cluster.get('Status', 'unknown'),
-                            'endpoint': cluster.get('Endpoint', ''),
-                        })
+            for _, entry in ranked:
+                cluster = entry.metadata
+                matches.append({
+                    'cluster_id': entry.resource_id,
+                    'full_name': entry.resource_id,
+                    'arn': cluster.get('DBClusterArn', ''),
+                    'engine': cluster.get('Engine', 'unknown'),
+                    'status': cluster.get('Status', 'unknown'),
+                    'endpoint': cluster.get('Endpoint', ''),
+                })
             
-            if matches:
-                if len(matches) == 1:
-                    cluster = matches[0]
-                    console.print(f"[green]✅ Found cluster: '{cluster['cluster_id']}'[/green]")
-                    console.print(f"[dim]   Engine: {cluster['engine']}, Status: {cluster['status']}[/dim]")
-                    return cluster
-                else:
-                    console.print(f"[yellow]⚠️  Found {len(matches)} matching clusters:[/yellow]")
+            # Only a confident match is used; fuzzy near-misses are shown as suggestions
+            best = self.name_index.best('rds', partial_name)
+            if best is None:
+                if matches:
+                    console.print(f"[yellow]⚠️  No confident match for '{partial_name}'. Did you mean:[/yellow]")
                     for i, cluster in enumerate(matches, 1):
                         console.print(f"[dim]   {i}. {cluster['cluster_id']}[/dim]")
-                    console.print(f"[green]✅ Using first match: '{matches[0]['cluster_id']}'[/green]")
-                    return matches[0]
-            else:
-                console.print(f"[yellow]⚠️  No clusters found containing '{partial_name}'[/yellow]")
+                else:
+                    console.print(f"[yellow]⚠️  No clusters found containing '{partial_name}'[/yellow]")
                 return None
+            
+            cluster = next((m for m in matches if m['cluster_id'] == best.resource_id), None)
+            if cluster is None:
+                # Found only after best() refreshed the index
+                cluster = {
+                    'cluster_id': best.resource_id,
+                    'full_name': best.resource_id,
+                    'arn': best.metadata.get('DBClusterArn', ''),
+                    'engine': best.metadata.get('Engine', 'unknown'),
+                    'status': best.metadata.get('Status', 'unknown'),
+                    'endpoint': best.metadata.get('Endpoint', ''),
+                }
+            if len(matches) > 1:
+                console.print(f"[yellow]⚠️  Found {len(matches)} matching clusters:[/yellow]")
+                for i, match in enumerate(matches, 1):
+                    console.print(f"[dim]   {i}. {match['cluster_id']}[/dim]")
+                console.print(f"[green]✅ Using best match: '{cluster['cluster_id']}'[/green]")
+            else:
+                console.print(f"[green]✅ Found cluster: '{cluster['cluster_id']}'[/green]")
+                console.print(f"[dim]   Engine: {cluster['engine']}, Status: {cluster['status']}[/dim]")
+            return cluster
         
         except Exception as e:
             console.print(f"[red]❌ AWS API error: {e}[/red]")
@@ -0,0 +1,263 @@
+"""
+AWS Resource Name Index - Per account/region name lookup for discovery helpers
+
+"Navigate to cluster foo" / "screenshot function bar" used to re-list the
+whole service and substring-scan it on every call. This index lists each
+service once (paginated, services in parallel), keeps the records in memory
+and refreshes only the services whose TTL has expired.
+
+Provides:
+- ResourceNameIndex per (profile, region) with per-service TTL refresh
+- Paginated listers for RDS, Lambda, EC2, S3, DynamoDB, API Gateway, ECS
+- Ranked matching: exact > prefix > substring > token > fuzzy (difflib)
+- best(): fuzzy matches only when close and unambiguous, one refresh on a miss
+- get_resource_name_index() shared registry so every helper reuses one index
+"""
+
+import difflib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import boto3
+from rich.console import Console
+
+console = Console()
+
+DEFAULT_TTL_SECONDS = int(os.getenv("RESOURCE_INDEX_TTL_SECONDS", "900"))
+FUZZY_CUTOFF = 0.6  # search(): loose near-misses are fine as ranked suggestions
+CONFIDENT_FUZZY_CUTOFF = 0.85  # best(): a resolved name drives navigation/screenshots
+FUZZY_WEIGHT = 0.6  # fuzzy scores stay below every exact/prefix/substring/token score
+MISS_REFRESH_MIN_AGE_SECONDS = 30
+
+
+@dataclass
+class IndexedResource:
+    """One named resource plus the raw API record it came from"""
+    service: str
+    name: str
+    resource_id: str
+    arn: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------- #
+# Paginated listers: client -> iterable of IndexedResource
+# ---------------------------------------------------------------------- #
+
+def _list_rds(client) -> Iterable[IndexedResource]:
+    for page in client.get_paginator("describe_db_clusters").paginate():
+        for cluster in page.get("DBClusters", []):
+            cluster_id = cluster["DBClusterIdentifier"]
+            yield IndexedResource("rds", cluster_id, cluster_id, cluster.get("DBClusterArn"), cluster)
+
+
+def _list_lambda(client) -> Iterable[IndexedResource]:
+    for page in client.get_paginator("list_functions").paginate():
+        for func in page.get("Functions", []):
+            yield IndexedResource("lambda", func["FunctionName"], func["FunctionName"], func.get("FunctionArn"), func)
+
+
+def _list_ec2(client) -> Iterable[IndexedResource]:
+    for page in client.get_paginator("describe_instances").paginate():
+        for reservation in page.get("Reservations", []):
+            for instance in reservation.get("Instances", []):
+                name = next((t["Value"] for t in instance.get("Tags", []) if t.get("Key") == "Name"), "")
+                yield IndexedResource("ec2", name or instance["InstanceId"], instance["InstanceId"], None, instance)
+
+
+def _list_s3(client) -> Iterable[IndexedResource]:
+    for bucket in client.list_buckets().get("Buckets", []):
+        yield IndexedResource("s3", bucket["Name"], bucket["Name"], f"arn:aws:s3:::{bucket['Name']}", bucket)
+
+
+def _list_dynamodb(client) -> Iterable[IndexedResource]:
+    for page in client.get_paginator("list_tables").paginate():
+        for table_name in page.get("TableNames", []):
+            yield IndexedResource("dynamodb", table_name, table_name)
+
+
+def _list_apigateway(client) -> Iterable[IndexedResource]:
+    for page in client.get_paginator("get_rest_apis").paginate():
+        for api in page.get("items", []):
+            yield IndexedResource("apigateway", api["name"], api["id"], None, api)
+
+
+def _list_ecs(client) -> Iterable[IndexedResource]:
+    for page in client.get_paginator("list_clusters").paginate():
+        for cluster_arn in page.get("clusterArns", []):
+            name = cluster_arn.split("/")[-1]
+            yield IndexedResource("ecs", name, name, cluster_arn)
+
+
+SERVICE_LISTERS: Dict[str, Tuple[str, Callable[[Any], Iterable[IndexedResource]]]] = {
+    "rds": ("rds", _list_rds),
+    "lambda": ("lambda", _list_lambda),
+    "ec2": ("ec2", _list_ec2),
+    "s3": ("s3", _list_s3),
+    "dynamodb": ("dynamodb", _list_dynamodb),
+    "apigateway": ("apigateway", _list_apigateway),
+    "ecs": ("ecs", _list_ecs),
+}
+
+
+def _score(query: str, candidate: str) -> float:
+    """Rank a candidate name for a (lowercased) query; 0 means no match."""
+    candidate = candidate.lower()
+    if not candidate:
+        return 0.0
+    if candidate == query:
+        return 1.0
+    # Shorter candidates win ties: "conure" prefers "conure-db" over "conure-db-replica-2"
+    length_penalty = min(len(candidate) - len(query), 100) / 1000
+    if candidate.startswith(query):
+        return 0.9 - length_penalty
+    if query in candidate:
+        return 0.8 - length_penalty
+    tokens = [t for t in query.replace("_", "-").split("-") if t]
+    if len(tokens) > 1 and all(t in candidate for t in tokens):
+        return 0.7 - length_penalty
+    ratio = difflib.SequenceMatcher(None, query, candidate).ratio()
+    return FUZZY_WEIGHT * ratio if ratio >= FUZZY_CUTOFF else 0.0
+
+
+def _is_fuzzy(score: float) -> bool:
+    return score < FUZZY_WEIGHT
+
+
+class ResourceNameIndex:
+    """Name index for one AWS profile + region."""
+
+    def __init__(self, profile: Optional[str] = None, region: str = "us-east-1", ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.profile = profile
+        self.region = region
+        self.ttl_seconds = ttl_seconds
+        self._session = None
+        self._entries: Dict[str, List[IndexedResource]] = {}
+        self._refreshed_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._service_locks = {service: threading.Lock() for service in SERVICE_LISTERS}
+
+    def _get_session(self) -> boto3.Session:
+        if self._session is None:
+            if self.profile:
+                self._session = boto3.Session(profile_name=self.profile, region_name=self.region)
+            else:
+                self._session = boto3.Session(region_name=self.region)
+        return self._session
+
+    def is_stale(self, service: str) -> bool:
+        refreshed = self._refreshed_at.get(service)
+        return refreshed is None or (time.time() - refreshed) > self.ttl_seconds
+
+    def _refresh_service(self, service: str, client) -> int:
+        _, lister = SERVICE_LISTERS[service]
+        with self._service_locks[service]:
+            if not self.is_stale(service):
+                return len(self._entries.get(service, []))
+            try:
+                entries = list(lister(client))
+            except Exception as e:
+                console.print(f"[yellow]⚠️  {service.upper()} name index refresh failed: {e}[/yellow]")
+                return 0
+            self._entries[service] = entries
+            self._refreshed_at[service] = time.time()
+            return len(entries)
+
+    def warm(self, services: Optional[List[str]] = None) -> Dict[str, int]:
+        """Refresh all stale services in parallel. Returns entries per refreshed service."""
+        services = [s for s in (services or SERVICE_LISTERS) if s in SERVICE_LISTERS and self.is_stale(s)]
+        if not services:
+            return {}
+        # boto3 sessions are not thread-safe; clients are, so create them up front
+        with self._lock:
+            session = self._get_session()
+            clients = {s: session.client(SERVICE_LISTERS[s][0], region_name=self.region) for s in services}
+
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=len(services)) as pool:
+            counts = dict(zip(services, pool.map(lambda s: self._refresh_service(s, clients[s]), services)))
+        console.print(
+            f"[dim]📇 Name index ({self.profile or 'default'}/{self.region}): "
+            f"{sum(counts.values())} resources across {len(services)} service(s) in {time.time() - started:.1f}s[/dim]"
+        )
+        return counts
+
+    def search(self, service: str, query: str, limit: int = 5) -> List[Tuple[float, IndexedResource]]:
+        """Ranked matches for `query` among the service's resource names/ids."""
+        service = service.lower()
+        if service not in SERVICE_LISTERS:
+            return []
+        self._ensure_fresh(service)
+        query = (query or "").strip().lower()
+        if not query:
+            return []
+
+        ranked = []
+        for entry in self._entries.get(service, []):
+            score = max(_score(query, entry.name), _score(query, entry.resource_id))
+            if score > 0:
+                ranked.append((score, entry))
+        ranked.sort(key=lambda item: (-item[0], item[1].name))
+        return ranked[:limit]
+
+    def _ensure_fresh(self, service: str) -> None:
+        if not self._refreshed_at:
+            self.warm()  # First use: list every service at once, in parallel
+        elif self.is_stale(service):
+            self.warm([service])
+
+    def _confident_match(self, service: str, query: str) -> Optional[IndexedResource]:
+        matches = self.search(service, query, limit=2)
+        if not matches:
+            return None
+        score, entry = matches[0]
+        if not _is_fuzzy(score):
+            return entry
+        # A near-miss must be close and the only candidate, or we'd act on the wrong resource
+        if score < FUZZY_WEIGHT * CONFIDENT_FUZZY_CUTOFF or len(matches) > 1:
+            return None
+        return entry
+
+    def best(self, service: str, query: str) -> Optional[IndexedResource]:
+        """
+        The resource `query` names, or None.
+
+        Fuzzy matches count only above CONFIDENT_FUZZY_CUTOFF and when no other
+        candidate matches. A miss on a list older than
+        MISS_REFRESH_MIN_AGE_SECONDS refreshes the service once and retries,
+        so resources created within the TTL are still found.
+        """
+        match = self._confident_match(service, query)
+        refreshed = self._refreshed_at.get(service.lower())
+        if match is None and refreshed is not None and time.time() - refreshed > MISS_REFRESH_MIN_AGE_SECONDS:
+            self.invalidate(service.lower())
+            match = self._confident_match(service, query)
+        return match
+
+    def names(self, service: str) -> List[str]:
+        self._ensure_fresh(service)
+        return [entry.resource_id for entry in self._entries.get(service, [])]
+
+    def invalidate(self, service: Optional[str] = None) -> None:
+        """Force a refresh on next lookup (e.g. after creating/deleting resources)."""
+        if service:
+            self._refreshed_at.pop(service, None)
+        else:
+            self._refreshed_at.clear()
+
+
+_indexes: Dict[Tuple[Optional[str], str], ResourceNameIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_resource_name_index(profile: Optional[str] = None, region: str = "us-east-1") -> ResourceNameIndex:
+    """Get the shared name index for an AWS profile + region."""
+    key = (profile, region)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = ResourceNameIndex(profile=profile, region=region)
+        return _indexes[key]
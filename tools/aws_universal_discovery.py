@@ -3,7 +3,7 @@ AWS Universal Discovery - Uses boto3 SDK to discover resources across ALL AWS se
 
 This makes the agent intelligent about ANY AWS service:
 - RDS, Lambda, EC2, S3, DynamoDB, SNS, SQS, API Gateway, ECS, EKS, etc.
-- Find resources by partial names
+- Find resources by partial names (ranked, from a cached name index)
 - Get resource metadata
 - Build console URLs
 """
@@ -12,6 +12,8 @@ import boto3
 from typing import Optional, List, Dict, Any
 from rich.console import Console
 
+from tools.aws_resource_name_index import get_resource_name_index
+
 console = Console()
 
 
@@ -39,34 +41,32 @@ class AWSUniversalDiscovery:
         except Exception as e:
             console.print(f"[red]❌ AWS SDK init failed: {e}[/red]")
             self.session = None
+        
+        # Shared per account/region name index (listed once, TTL-refreshed)
+        self.name_index = get_resource_name_index(profile=profile, region=region)
     
     # ========================================
     # RDS - Relational Database Service
     # ========================================
     
     def find_rds_cluster(self, partial_name: str) -> Optional[Dict]:
-        """Find RDS cluster by partial name"""
+        """Find RDS cluster by partial name (ranked match from the name index)"""
         try:
-            rds = self.session.client('rds')
-            response = rds.describe_db_clusters()
-            
-            for cluster in response['DBClusters']:
-                cluster_id = cluster['DBClusterIdentifier']
-                
-                if partial_name.lower() in cluster_id.lower():
-                    return {
-                        'service': 'rds',
-                        'resource_type': 'cluster',
-                        'id': cluster_id,
-                        'name': cluster_id,
-                        'arn': cluster.get('DBClusterArn'),
-                        'engine': cluster.get('Engine'),
-                        'status': cluster.get('Status'),
-                        'endpoint': cluster.get('Endpoint'),
-                        'metadata': cluster
-                    }
-            
-            return None
+            match = self.name_index.best('rds', partial_name)
+            if not match:
+                return None
+            cluster = match.metadata
+            return {
+                'service': 'rds',
+                'resource_type': 'cluster',
+                'id': match.resource_id,
+                'name': match.name,
+                'arn': match.arn,
+                'engine': cluster.get('Engine'),
+                'status': cluster.get('Status'),
+                'endpoint': cluster.get('Endpoint'),
+                'metadata': cluster
+            }
         except Exception as e:
             console.print(f"[yellow]⚠️  RDS discovery error: {e}[/yellow]")
             return None
@@ -74,9 +74,7 @@ class AWSUniversalDiscovery:
     def list_rds_clusters(self) -> List[str]:
         """List all RDS cluster IDs"""
         try:
-            rds = self.session.client('rds')
-            response = rds.describe_db_clusters()
-            return [c['DBClusterIdentifier'] for c in response['DBClusters']]
+            return self.name_index.names('rds')
         except:
             return []
     
@@ -87,28 +85,22 @@ class AWSUniversalDiscovery:
     def find_lambda_function(self, partial_name: str) -> Optional[Dict]:
         """Find Lambda function by partial name"""
         try:
-            lambda_client = self.session.client('lambda')
-            paginator = lambda_client.get_paginator('list_functions')
-            
-            for page in paginator.paginate():
-                for func in page['Functions']:
-                    func_name = func['FunctionName']
-                    
-                    if partial_name.lower() in func_name.lower():
-                        return {
-                            'service': 'lambda',
-                            'resource_type': 'function',
-                            'id': func_name,
-                            'name': func_name,
-                            'arn': func.get('FunctionArn'),
-                            'runtime': func.get('Runtime'),
-                            'handler': func.get('Handler'),
-                            'memory': func.get('MemorySize'),
-                            'timeout': func.get('Timeout'),
-                            'metadata': func
-                        }
-            
-            return None
+            match = self.name_index.best('lambda', partial_name)
+            if not match:
+                return None
+            func = match.metadata
+            return {
+                'service': 'lambda',
+                'resource_type': 'function',
+                'id': match.resource_id,
+                'name': match.name,
+                'arn': match.arn,
+                'runtime': func.get('Runtime'),
+                'handler': func.get('Handler'),
+                'memory': func.get('MemorySize'),
+                'timeout': func.get('Timeout'),
+                'metadata': func
+            }
         except Exception as e:
             console.print(f"[yellow]⚠️  Lambda discovery error: {e}[/yellow]")
             return None
@@ -120,35 +112,21 @@ class AWSUniversalDiscovery:
     def find_ec2_instance(self, partial_name: str) -> Optional[Dict]:
         """Find EC2 instance by partial name (searches Name tag and instance ID)"""
         try:
-            ec2 = self.session.client('ec2')
-            response = ec2.describe_instances()
-            
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_id = instance['InstanceId']
-                    
-                    # Get Name tag
-                    name = ''
-                    for tag in instance.get('Tags', []):
-                        if tag['Key'] == 'Name':
-                            name = tag['Value']
-                            break
-                    
-                    # Check if partial name matches
-                    if partial_name.lower() in instance_id.lower() or partial_name.lower() in name.lower():
-                        return {
-                            'service': 'ec2',
-                            'resource_type': 'instance',
-                            'id': instance_id,
-                            'name': name or instance_id,
-                            'instance_type': instance.get('InstanceType'),
-                            'state': instance.get('State', {}).get('Name'),
-                            'public_ip': instance.get('PublicIpAddress'),
-                            'private_ip': instance.get('PrivateIpAddress'),
-                            'metadata': instance
-                        }
-            
-            return None
+            match = self.name_index.best('ec2', partial_name)
+            if not match:
+                return None
+            instance = match.metadata
+            return {
+                'service': 'ec2',
+                'resource_type': 'instance',
+                'id': match.resource_id,
+                'name': match.name,
+                'instance_type': instance.get('InstanceType'),
+                'state': instance.get('State', {}).get('Name'),
+                'public_ip': instance.get('PublicIpAddress'),
+                'private_ip': instance.get('PrivateIpAddress'),
+                'metadata': instance
+            }
         except Exception as e:
             console.print(f"[yellow]⚠️  EC2 discovery error: {e}[/yellow]")
             return None
@@ -160,23 +138,17 @@ class AWSUniversalDiscovery:
     def find_s3_bucket(self, partial_name: str) -> Optional[Dict]:
         """Find S3 bucket by partial name"""
         try:
-            s3 = self.session.client('s3')
-            response = s3.list_buckets()
-            
-            for bucket in response['Buckets']:
-                bucket_name = bucket['Name']
-                
-                if partial_name.lower() in bucket_name.lower():
-                    return {
-                        'service': 's3',
-                        'resource_type': 'bucket',
-                        'id': bucket_name,
-                        'name': bucket_name,
-                        'creation_date': bucket.get('CreationDate'),
-                        'metadata': bucket
-                    }
-            
-            return None
+            match = self.name_index.best('s3', partial_name)
+            if not match:
+                return None
+            return {
+                'service': 's3',
+                'resource_type': 'bucket',
+                'id': match.resource_id,
+                'name': match.name,
+                'creation_date': match.metadata.get('CreationDate'),
+                'metadata': match.metadata
+            }
         except Exception as e:
             console.print(f"[yellow]⚠️  S3 discovery error: {e}[/yellow]")
             return None
@@ -188,28 +160,25 @@ class AWSUniversalDiscovery:
     def find_dynamodb_table(self, partial_name: str) -> Optional[Dict]:
         """Find DynamoDB table by partial name"""
         try:
-            dynamodb = self.session.client('dynamodb')
-            paginator = dynamodb.get_paginator('list_tables')
+            match = self.name_index.best('dynamodb', partial_name)
+            if not match:
+                return None
             
-            for page in paginator.paginate():
-                for table_name in page['TableNames']:
-                    if partial_name.lower() in table_name.lower():
-                        # Get table details
-                        table_info = dynamodb.describe_table(TableName=table_name)['Table']
-                        
-                        return {
-                            'service': 'dynamodb',
-                            'resource_type': 'table',
-                            'id': table_name,
-                            'name': table_name,
-                            'arn': table_info.get('TableArn'),
-                            'status': table_info.get('TableStatus'),
-                            'item_count': table_info.get('ItemCount'),
-                            'size_bytes': table_info.get('TableSizeBytes'),
-                            'metadata': table_info
-                        }
+            # Index only holds names; describe the winning table
+            dynamodb = self.session.client('dynamodb')
+            table_info = dynamodb.describe_table(TableName=match.resource_id)['Table']
             
-            return None
+            return {
+                'service': 'dynamodb',
+                'resource_type': 'table',
+                'id': match.resource_id,
+                'name': match.name,
+                'arn': table_info.get('TableArn'),
+                'status': table_info.get('TableStatus'),
+                'item_count': table_info.get('ItemCount'),
+                'size_bytes': table_info.get('TableSizeBytes'),
+                'metadata': table_info
+            }
         except Exception as e:
             console.print(f"[yellow]⚠️  DynamoDB discovery error: {e}[/yellow]")
             return None
@@ -221,24 +190,19 @@ class AWSUniversalDiscovery:
     def find_api_gateway(self, partial_name: str) -> Optional[Dict]:
         """Find API Gateway by partial name"""
         try:
-            apigw = self.session.client('apigateway')
-            response = apigw.get_rest_apis()
-            
-            for api in response['items']:
-                api_name = api['name']
-                
-                if partial_name.lower() in api_name.lower():
-                    return {
-                        'service': 'apigateway',
-                        'resource_type': 'rest_api',
-                        'id': api['id'],
-                        'name': api_name,
-                        'description': api.get('description'),
-                        'created_date': api.get('createdDate'),
-                        'metadata': api
-                    }
-            
-            return None
+            match = self.name_index.best('apigateway', partial_name)
+            if not match:
+                return None
+            api = match.metadata
+            return {
+                'service': 'apigateway',
+                'resource_type': 'rest_api',
+                'id': match.resource_id,
+                'name': match.name,
+                'description': api.get('description'),
+                'created_date': api.get('createdDate'),
+                'metadata': api
+            }
         except Exception as e:
             console.print(f"[yellow]⚠️  API Gateway discovery error: {e}[/yellow]")
             return None
@@ -250,28 +214,24 @@ class AWSUniversalDiscovery:
     def find_ecs_cluster(self, partial_name: str) -> Optional[Dict]:
         """Find ECS cluster by partial name"""
         try:
-            ecs = self.session.client('ecs')
-            response = ecs.list_clusters()
+            match = self.name_index.best('ecs', partial_name)
+            if not match:
+                return None
             
-            for cluster_arn in response['clusterArns']:
-                cluster_name = cluster_arn.split('/')[-1]
-                
-                if partial_name.lower() in cluster_name.lower():
-                    # Get cluster details
-                    details = ecs.describe_clusters(clusters=[cluster_arn])['clusters'][0]
-                    
-                    return {
-                        'service': 'ecs',
-                        'resource_type': 'cluster',
-                        'id': cluster_name,
-                        'name': cluster_name,
-                        'arn': cluster_arn,
-                        'status': details.get('status'),
-                        'running_tasks': details.get('runningTasksCount'),
-                        'metadata': details
-                    }
+            # Get cluster details for the winning match only
+            ecs = self.session.client('ecs')
+            details = ecs.describe_clusters(clusters=[match.arn])['clusters'][0]
             
-            return None
+            return {
+                'service': 'ecs',
+                'resource_type': 'cluster',
+                'id': match.resource_id,
+                'name': match.name,
+                'arn': match.arn,
+                'status': details.get('status'),
+                'running_tasks': details.get('runningTasksCount'),
+                'metadata': details
+            }
         except Exception as e:
             console.print(f"[yellow]⚠️  ECS discovery error: {e}[/yellow]")
             return None
@@ -145,7 +145,10 @@ def export_aws_universal(
         
         # Export single service data
         start_dt, end_dt, _ = resolve_date_range(filter_by_date, start_date, end_date, audit_period)
-        if start_dt and end_dt:
+        date_filtered = bool(start_dt and end_dt)
+        if date_filtered:
+            # Store the full collection; a snapshot replaces its whole partition
+            collector.snapshot_to_store({service: all_data[service]})
             target_field = date_field or DATE_FIELD_DEFAULTS.get(service, {}).get(export_type)
             if target_field and export_type in all_data.get(service, {}):
                 filtered = filter_records_by_date(
@@ -157,13 +160,21 @@ def export_aws_universal(
                 all_data[service][export_type] = filtered
 
         if format == 'csv':
-            files = collector.export_to_csv({service: all_data[service]}, os.path.dirname(output_path))
+            files = collector.export_to_csv(
+                {service: all_data[service]},
+                os.path.dirname(output_path),
+                record_snapshot=not date_filtered
+            )
             if files:
                 console.print(f"[green]✅ Exported {len(files)} file(s)[/green]")
                 return True
             return False
         elif format == 'json':
-            success = collector.export_to_json({service: all_data[service]}, output_path)
+            success = collector.export_to_json(
+                {service: all_data[service]},
+                output_path,
+                record_snapshot=not date_filtered
+            )
             return success
         else:
             console.print(f"[red]❌ Unknown format: {format}[/red]")
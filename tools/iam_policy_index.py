@@ -0,0 +1,476 @@
+"""
+IAM Policy Index - Effective-permission lookups from one authorization snapshot
+
+Built from a single paginated `iam:GetAccountAuthorizationDetails` call:
+every managed and inline policy document is parsed exactly once and indexed
+by action, so "who can do X on Y" / "what can Z do" never re-exports IAM.
+
+Provides:
+- Action index: exact actions, per-service wildcard patterns (s3:Get*), global '*', NotAction
+- Resource / NotResource wildcard matching on ARNs
+- Explicit Deny evaluation, Condition flags (conditional allows/denies are reported, not assumed)
+- Group policies folded into member users; role trust policies for "who can assume"
+- JSON serialization under ~/.auditmate_cache/iam_index/<account>.json
+
+Scope: identity-based policies only. SCPs, resource policies and permission
+boundaries are not evaluated; principals with a boundary are flagged.
+"""
+
+import json
+import re
+import time
+import urllib.parse
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from rich.console import Console
+
+console = Console()
+
+INDEX_DIR = Path.home() / ".auditmate_cache" / "iam_index"
+INDEX_FORMAT_VERSION = 1
+DEFAULT_MAX_AGE_HOURS = 24
+
+_pattern_cache: Dict[Tuple[str, bool], "re.Pattern"] = {}
+
+
+def _wildcard_regex(pattern: str, case_sensitive: bool) -> "re.Pattern":
+    """Compile an IAM wildcard pattern (* and ?) to an anchored regex."""
+    key = (pattern, case_sensitive)
+    compiled = _pattern_cache.get(key)
+    if compiled is None:
+        regex = "^" + re.escape(pattern).replace(r"\*", ".*").replace(r"\?", ".") + "$"
+        compiled = re.compile(regex, 0 if case_sensitive else re.IGNORECASE)
+        _pattern_cache[key] = compiled
+    return compiled
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _load_document(document: Any) -> Dict[str, Any]:
+    """Policy documents may arrive URL-encoded JSON strings or already decoded."""
+    if isinstance(document, dict):
+        return document
+    if isinstance(document, str):
+        try:
+            return json.loads(urllib.parse.unquote(document))
+        except ValueError:
+            return {}
+    return {}
+
+
+@dataclass
+class PolicyStatement:
+    """One parsed policy statement"""
+    source: str  # e.g. "managed:AdministratorAccess" or "inline:role/app/s3-access"
+    effect: str  # "Allow" | "Deny"
+    actions: List[str]
+    resources: List[str]
+    not_action: bool = False
+    not_resource: bool = False
+    condition_keys: List[str] = field(default_factory=list)
+
+    @property
+    def conditional(self) -> bool:
+        return bool(self.condition_keys)
+
+    def matches_action(self, action: str) -> bool:
+        hit = any(_wildcard_regex(p, False).match(action) for p in self.actions)
+        return not hit if self.not_action else hit
+
+    def matches_resource(self, resource: str) -> bool:
+        if resource == "*":
+            return True
+        hit = any(_wildcard_regex(p, True).match(resource) for p in self.resources)
+        return not hit if self.not_resource else hit
+
+    def covers_resources_of(self, other: "PolicyStatement") -> bool:
+        """True if this statement's resources include every resource `other` grants."""
+        if self.not_resource:
+            return False
+        if "*" in self.resources:
+            return True
+        if other.not_resource:
+            return False
+        return all(
+            any(_wildcard_regex(p, True).match(granted) for p in self.resources)
+            for granted in other.resources
+        )
+
+
+@dataclass
+class IAMPrincipal:
+    """A user or role with its effective statement ids"""
+    arn: str
+    name: str
+    principal_type: str  # "user" | "role"
+    groups: List[str] = field(default_factory=list)
+    statement_ids: List[int] = field(default_factory=list)
+    has_permissions_boundary: bool = False
+
+
+class IAMPolicyIndex:
+    """
+    Inverted index over parsed IAM statements.
+
+    Statements are shared (a managed policy attached to 40 roles is parsed
+    and stored once); principal -> statements and statement -> principals
+    maps are built from the attachments.
+    """
+
+    def __init__(self, account: str = ""):
+        self.account = account
+        self.created_at = time.time()
+        self.statements: List[PolicyStatement] = []
+        self.principals: Dict[str, IAMPrincipal] = {}
+        self.trust_policies: Dict[str, List[Dict[str, Any]]] = {}
+        self._reset_indexes()
+
+    def _reset_indexes(self) -> None:
+        self._statement_principals: List[List[str]] = []
+        self._exact_actions: Dict[str, Set[int]] = {}
+        self._service_wildcards: Dict[str, List[int]] = {}
+        self._global_actions: List[int] = []
+        self._name_index: Dict[str, str] = {}
+
+    # ------------------------------------------------------------------ #
+    # Build
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def from_aws(cls, aws_profile: Optional[str] = None) -> "IAMPolicyIndex":
+        """Fetch one authorization snapshot (paginated) and build the index."""
+        import boto3
+
+        session = boto3.Session(profile_name=aws_profile) if aws_profile else boto3.Session()
+        iam = session.client("iam")
+        snapshot: Dict[str, List[Any]] = {
+            "UserDetailList": [], "GroupDetailList": [], "RoleDetailList": [], "Policies": []
+        }
+        console.print(f"[cyan]📥 Fetching IAM authorization details ({aws_profile or 'default'})...[/cyan]")
+        for page in iam.get_paginator("get_account_authorization_details").paginate():
+            for key in snapshot:
+                snapshot[key].extend(page.get(key, []))
+        return cls.from_snapshot(snapshot, account=aws_profile or "")
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any], account: str = "") -> "IAMPolicyIndex":
+        """Build from a GetAccountAuthorizationDetails response (merged pages)."""
+        started = time.time()
+        index = cls(account=account)
+
+        managed: Dict[str, List[int]] = {}
+        for policy in snapshot.get("Policies", []):
+            document = None
+            for version in policy.get("PolicyVersionList", []):
+                if version.get("IsDefaultVersion") or version.get("VersionId") == policy.get("DefaultVersionId"):
+                    document = version.get("Document")
+                    break
+            managed[policy["Arn"]] = index._add_document(document, f"managed:{policy.get('PolicyName', policy['Arn'])}")
+
+        def attached(entity: Dict[str, Any]) -> List[int]:
+            ids = []
+            for attachment in entity.get("AttachedManagedPolicies", []):
+                ids.extend(managed.get(attachment.get("PolicyArn"), []))
+            return ids
+
+        group_statements: Dict[str, List[int]] = {}
+        for group in snapshot.get("GroupDetailList", []):
+            ids = attached(group)
+            for inline in group.get("GroupPolicyList", []):
+                ids.extend(index._add_document(
+                    inline.get("PolicyDocument"), f"inline:group/{group['GroupName']}/{inline.get('PolicyName')}"
+                ))
+            group_statements[group["GroupName"]] = ids
+
+        for user in snapshot.get("UserDetailList", []):
+            ids = attached(user)
+            for inline in user.get("UserPolicyList", []):
+                ids.extend(index._add_document(
+                    inline.get("PolicyDocument"), f"inline:user/{user['UserName']}/{inline.get('PolicyName')}"
+                ))
+            groups = list(user.get("GroupList", []))
+            for group_name in groups:
+                ids.extend(group_statements.get(group_name, []))
+            index.principals[user["Arn"]] = IAMPrincipal(
+                arn=user["Arn"],
+                name=user["UserName"],
+                principal_type="user",
+                groups=groups,
+                statement_ids=sorted(set(ids)),
+                has_permissions_boundary=bool(user.get("PermissionsBoundary")),
+            )
+
+        for role in snapshot.get("RoleDetailList", []):
+            ids = attached(role)
+            for inline in role.get("RolePolicyList", []):
+                ids.extend(index._add_document(
+                    inline.get("PolicyDocument"), f"inline:role/{role['RoleName']}/{inline.get('PolicyName')}"
+                ))
+            index.principals[role["Arn"]] = IAMPrincipal(
+                arn=role["Arn"],
+                name=role["RoleName"],
+                principal_type="role",
+                statement_ids=sorted(set(ids)),
+                has_permissions_boundary=bool(role.get("PermissionsBoundary")),
+            )
+            trust = _load_document(role.get("AssumeRolePolicyDocument"))
+            index.trust_policies[role["Arn"]] = [
+                {
+                    "effect": stmt.get("Effect", "Allow"),
+                    "principal": stmt.get("Principal"),
+                    "conditional": bool(stmt.get("Condition")),
+                }
+                for stmt in _as_list(trust.get("Statement"))
+            ]
+
+        index._build_indexes()
+        elapsed = (time.time() - started) * 1000
+        console.print(
+            f"[green]✅ IAM index: {len(index.principals)} principals, "
+            f"{len(index.statements)} statements ({elapsed:.0f} ms)[/green]"
+        )
+        return index
+
+    def _add_document(self, document: Any, source: str) -> List[int]:
+        ids = []
+        for stmt in _as_list(_load_document(document).get("Statement")):
+            not_action = "NotAction" in stmt
+            not_resource = "NotResource" in stmt
+            statement = PolicyStatement(
+                source=source,
+                effect=stmt.get("Effect", "Allow"),
+                actions=[str(a) for a in _as_list(stmt.get("NotAction" if not_action else "Action"))],
+                resources=[str(r) for r in _as_list(stmt.get("NotResource" if not_resource else "Resource"))] or ["*"],
+                not_action=not_action,
+                not_resource=not_resource,
+                condition_keys=sorted(
+                    key for conditions in (stmt.get("Condition") or {}).values()
+                    if isinstance(conditions, dict) for key in conditions
+                ),
+            )
+            ids.append(len(self.statements))
+            self.statements.append(statement)
+        return ids
+
+    def _build_indexes(self) -> None:
+        self._reset_indexes()
+        self._statement_principals = [[] for _ in self.statements]
+        for arn, principal in self.principals.items():
+            self._name_index[principal.name.lower()] = arn
+            for sid in principal.statement_ids:
+                self._statement_principals[sid].append(arn)
+
+        for sid, statement in enumerate(self.statements):
+            if statement.not_action:
+                # NotAction statements can match almost anything - always evaluated
+                self._global_actions.append(sid)
+                continue
+            for action in statement.actions:
+                action = action.lower()
+                service, _, name = action.partition(":")
+                if "*" in service or "?" in service:
+                    self._global_actions.append(sid)
+                elif "*" in name or "?" in name:
+                    self._service_wildcards.setdefault(service, []).append(sid)
+                else:
+                    self._exact_actions.setdefault(action, set()).add(sid)
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def _candidate_statements(self, action: str) -> Set[int]:
+        action = action.lower()
+        service = action.partition(":")[0]
+        candidates = set(self._exact_actions.get(action, ()))
+        candidates.update(self._service_wildcards.get(service, ()))
+        candidates.update(self._global_actions)
+        return {sid for sid in candidates if self.statements[sid].matches_action(action)}
+
+    @staticmethod
+    def normalize_resource(action: str, resource: Optional[str]) -> str:
+        """Accept bare S3 bucket names: 'my-bucket' -> bucket or object ARN by action."""
+        if not resource or resource == "*" or resource.startswith("arn:"):
+            return resource or "*"
+        if action.lower().startswith("s3:"):
+            bucket = resource.split("/", 1)[0]
+            return f"arn:aws:s3:::{bucket}/*" if "object" in action.lower() else f"arn:aws:s3:::{bucket}"
+        return resource
+
+    def resolve_principal(self, ref: str) -> Optional[IAMPrincipal]:
+        if ref in self.principals:
+            return self.principals[ref]
+        arn = self._name_index.get(ref.lower())
+        return self.principals.get(arn) if arn else None
+
+    def who_can(self, action: str, resource: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Principals whose identity policies allow `action` on `resource`.
+
+        Without a resource the query means "on any resource": a Deny scoped to
+        part of what an Allow grants leaves the principal in the result with
+        `conditional_deny` set.
+        """
+        resource = self.normalize_resource(action, resource)
+        matching = [
+            sid for sid in self._candidate_statements(action)
+            if self.statements[sid].matches_resource(resource)
+        ]
+        allows: Dict[str, List[int]] = {}
+        denies: Dict[str, List[int]] = {}
+        for sid in matching:
+            target = denies if self.statements[sid].effect == "Deny" else allows
+            for arn in self._statement_principals[sid]:
+                target.setdefault(arn, []).append(sid)
+
+        any_resource = resource == "*"
+        results = []
+        for arn, allow_ids in allows.items():
+            deny_ids = denies.get(arn, [])
+            hard_denies = [self.statements[sid] for sid in deny_ids if not self.statements[sid].conditional]
+            if any_resource:
+                # No resource given: the principal keeps access unless every Allow
+                # is fully shadowed by an unconditional Deny covering its resources.
+                shadowed = all(
+                    any(deny.covers_resources_of(self.statements[sid]) for deny in hard_denies)
+                    for sid in allow_ids
+                )
+            else:
+                shadowed = bool(hard_denies)
+            if shadowed:
+                continue  # unconditional explicit deny wins
+            principal = self.principals[arn]
+            results.append({
+                "principal": arn,
+                "name": principal.name,
+                "type": principal.principal_type,
+                "via": sorted({self.statements[sid].source for sid in allow_ids}),
+                "conditional": all(self.statements[sid].conditional for sid in allow_ids),
+                "condition_keys": sorted({k for sid in allow_ids for k in self.statements[sid].condition_keys}),
+                "conditional_deny": bool(deny_ids),
+                "permissions_boundary": principal.has_permissions_boundary,
+            })
+        return sorted(results, key=lambda r: (r["conditional"], r["type"], r["name"]))
+
+    def what_can(self, principal_ref: str, service: Optional[str] = None) -> Dict[str, Any]:
+        """Effective statements for a user/role, optionally limited to one service prefix."""
+        principal = self.resolve_principal(principal_ref)
+        if not principal:
+            raise KeyError(f"Unknown principal: {principal_ref}")
+        statements = []
+        for sid in principal.statement_ids:
+            stmt = self.statements[sid]
+            if service and not stmt.not_action and not any(
+                a == "*" or a.lower().startswith(f"{service.lower()}:") for a in stmt.actions
+            ):
+                continue
+            entry = asdict(stmt)
+            entry["conditional"] = stmt.conditional
+            statements.append(entry)
+        return {
+            "principal": principal.arn,
+            "type": principal.principal_type,
+            "groups": principal.groups,
+            "permissions_boundary": principal.has_permissions_boundary,
+            "admin_like": any(
+                s["effect"] == "Allow" and "*" in s["actions"] and "*" in s["resources"]
+                and not s["not_action"] and not s["conditional"] for s in statements
+            ),
+            "statements": statements,
+        }
+
+    def who_can_assume(self, role_ref: str) -> List[Dict[str, Any]]:
+        principal = self.resolve_principal(role_ref)
+        if not principal or principal.principal_type != "role":
+            raise KeyError(f"Unknown role: {role_ref}")
+        return self.trust_policies.get(principal.arn, [])
+
+    def age_hours(self) -> float:
+        return (time.time() - self.created_at) / 3600
+
+    # ------------------------------------------------------------------ #
+    # Serialization
+    # ------------------------------------------------------------------ #
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "account": self.account,
+            "created_at": self.created_at,
+            "statements": [asdict(s) for s in self.statements],
+            "principals": [asdict(p) for p in self.principals.values()],
+            "trust_policies": self.trust_policies,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IAMPolicyIndex":
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported IAM index version: {data.get('version')}")
+        index = cls(account=data.get("account", ""))
+        index.created_at = data.get("created_at", time.time())
+        index.statements = [PolicyStatement(**s) for s in data.get("statements", [])]
+        index.principals = {p["arn"]: IAMPrincipal(**p) for p in data.get("principals", [])}
+        index.trust_policies = data.get("trust_policies", {})
+        index._build_indexes()
+        return index
+
+    @staticmethod
+    def index_path(account: str) -> Path:
+        safe = re.sub(r"[^A-Za-z0-9._-]+", "_", account or "default")
+        return INDEX_DIR / f"{safe}.json"
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        path = Path(path) if path else self.index_path(self.account)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(), f)
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "IAMPolicyIndex":
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+
+_indexes: Dict[str, IAMPolicyIndex] = {}
+
+
+def get_iam_policy_index(
+    aws_account: Optional[str] = None,
+    refresh: bool = False,
+    max_age_hours: float = DEFAULT_MAX_AGE_HOURS,
+) -> IAMPolicyIndex:
+    """
+    Get the IAM index for an account: memory -> disk -> AWS.
+
+    A saved index younger than `max_age_hours` is reused across sessions.
+    """
+    key = aws_account or "default"
+    index = _indexes.get(key)
+    if index and not refresh and index.age_hours() < max_age_hours:
+        return index
+
+    path = IAMPolicyIndex.index_path(key)
+    if not refresh and path.exists():
+        try:
+            index = IAMPolicyIndex.load(path)
+            if index.age_hours() < max_age_hours:
+                console.print(f"[dim]💾 Loaded IAM index for {key} ({index.age_hours():.1f}h old)[/dim]")
+                _indexes[key] = index
+                return index
+        except Exception as e:
+            console.print(f"[yellow]⚠️  Ignoring unreadable IAM index {path.name}: {e}[/yellow]")
+
+    index = IAMPolicyIndex.from_aws(aws_account)
+    index.account = key
+    index.save()
+    _indexes[key] = index
+    return index
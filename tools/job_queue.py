@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Bulk Job Queue
+Queues tool calls in the durable task queue and runs them in a background
+worker (started by `auditmate daemon`). Jobs survive restarts: a crashed
+worker's tasks are picked up again and finished tasks are never rerun
+
+    python tools/job_queue.py submit jobs.jsonl     # queue jobs (JSON list or one object per line)
+    python tools/job_queue.py work                  # run queued jobs until stopped
+    python tools/job_queue.py status
+
+Each job: {"tool": "aws_export_data", "parameters": {...}, "priority": "high",
+"idempotency_key": "..."}. Without a key, the tool and parameters are the key,
+so resubmitting the same file only queues jobs that were never queued, plus
+jobs that failed or were cancelled (fix the cause, then resubmit to retry).
+Priority is one of low, normal, high, urgent.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from rich.console import Console
+from rich.table import Table
+
+from ai_brain.shared.task_queue import SQLiteTaskQueue
+from ai_brain.distributed_executor import TaskPriority
+
+console = Console()
+
+DEFAULT_QUEUE_PATH = Path(os.path.expanduser(os.getenv(
+    "DISTRIBUTED_QUEUE_PATH",
+    str(Path.home() / ".auditmate_cache" / "task_queue.db")
+)))
+TOOL_HANDLER = "tool"
+
+
+def load_jobs(path: str) -> List[Dict[str, Any]]:
+    """Jobs from a JSON list or a JSONL file."""
+    text = Path(path).read_text()
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def job_key(job: Dict[str, Any]) -> str:
+    """Idempotency key: explicit, else the tool and its parameters."""
+    if job.get("idempotency_key"):
+        return str(job["idempotency_key"])
+    canonical = json.dumps({"tool": job["tool"], "parameters": job.get("parameters") or {}}, sort_keys=True, default=str)
+    return f"{job['tool']}:{hashlib.sha256(canonical.encode()).hexdigest()[:16]}"
+
+
+def submit(queue_path: Path, jobs_file: str, max_retries: int) -> None:
+    jobs = load_jobs(jobs_file)
+    specs = []
+    for job in jobs:
+        if not job.get("tool"):
+            console.print(f"[yellow]⚠️  Skipping job without a tool: {job}[/yellow]")
+            continue
+        priority = str(job.get("priority", "normal")).upper()
+        if priority not in TaskPriority.__members__:
+            choices = ", ".join(p.lower() for p in TaskPriority.__members__)
+            console.print(f"[yellow]⚠️  Skipping {job['tool']} job with unknown priority "
+                          f"'{job.get('priority')}' (use one of: {choices})[/yellow]")
+            continue
+        specs.append({
+            "function": TOOL_HANDLER,
+            "args": (job["tool"], job.get("parameters") or {}),
+            "priority": TaskPriority[priority].value,
+            "max_retries": int(job.get("max_retries", max_retries)),
+            "idempotency_key": job_key(job),
+            "metadata": {"tool": job["tool"], "source": os.path.basename(jobs_file)}
+        })
+    results = SQLiteTaskQueue(queue_path).enqueue_many(specs)
+    created = sum(1 for _, is_new in results if is_new)
+    console.print(f"[green]✅ Queued {created} job(s); {len(results) - created} already queued or completed[/green]")
+
+
+def work(queue_path: Path, workers: int) -> None:
+    """Run queued tool jobs until SIGTERM/SIGINT."""
+    from ai_brain.distributed_executor import DistributedExecutor
+    from ai_brain.tool_concurrency import classify_tool
+    from ai_brain.tool_executor import ToolExecutor
+    from evidence_manager.local_evidence_manager import LocalEvidenceManager
+
+    tool_executor = ToolExecutor(LocalEvidenceManager())
+    browser_lock = threading.Lock()  # One browser session per worker process
+    executor = DistributedExecutor(max_local_workers=workers, queue_path=str(queue_path))
+
+    def run_tool(tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        if classify_tool(tool_name) == "parallel":
+            result = tool_executor.execute_tool(tool_name, parameters)
+        else:
+            # Queueing behind another browser job doesn't count toward task_timeout
+            with executor.task_timeout_paused():
+                browser_lock.acquire()
+            try:
+                result = tool_executor.execute_tool(tool_name, parameters)
+            finally:
+                browser_lock.release()
+        if not isinstance(result, dict) or result.get("status") != "success":
+            raise RuntimeError((result or {}).get("error") or (result or {}).get("message") or "tool failed")
+        return result
+
+    executor.register_handler(TOOL_HANDLER, run_tool)
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    signal.signal(signal.SIGINT, lambda *_: stopping.set())
+
+    executor.start()
+    console.print(f"[bold green]👷 Job worker running on {queue_path} (Ctrl-C to stop)[/bold green]")
+    while not stopping.wait(timeout=30):
+        counts = executor.get_stats()["durable_queue"] or {}
+        console.print(f"[dim]📊 Jobs: {counts.get('pending', 0)} pending, {counts.get('running', 0)} running, "
+                      f"{counts.get('completed', 0)} completed, {counts.get('failed', 0)} failed[/dim]")
+    executor.stop()
+
+
+def status(queue_path: Path, show_failed: int) -> None:
+    queue = SQLiteTaskQueue(queue_path)
+    counts = queue.counts()
+    table = Table(show_header=True, title=f"Job Queue ({queue_path})")
+    table.add_column("Status", style="cyan")
+    table.add_column("Tasks", justify="right")
+    for name in ("pending", "running", "completed", "failed", "cancelled"):
+        table.add_row(name, str(counts.get(name, 0)))
+    console.print(table)
+
+    if show_failed and counts.get("failed"):
+        rows = queue.conn.execute(
+            "SELECT task_id, metadata, attempts, error FROM tasks WHERE status = 'failed' "
+            "ORDER BY completed_at DESC LIMIT ?", (show_failed,)
+        ).fetchall()
+        for task_id, metadata, attempts, error in rows:
+            tool = json.loads(metadata or "{}").get("tool", "?")
+            console.print(f"[red]❌ {task_id} {tool} ({attempts} attempt(s)): {(error or '')[:200]}[/red]")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Durable bulk job queue for AuditMate tools")
+    parser.add_argument("--queue", default=str(DEFAULT_QUEUE_PATH), help="Queue database (DISTRIBUTED_QUEUE_PATH)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    submit_parser = sub.add_parser("submit", help="Queue jobs from a JSON/JSONL file")
+    submit_parser.add_argument("jobs_file")
+    submit_parser.add_argument("--max-retries", type=int, default=3)
+
+    work_parser = sub.add_parser("work", help="Run queued jobs until stopped")
+    work_parser.add_argument("--workers", type=int, default=int(os.getenv("DISTRIBUTED_QUEUE_WORKERS", "3")))
+
+    status_parser = sub.add_parser("status", help="Show queue counts")
+    status_parser.add_argument("--failed", type=int, default=10, help="Recent failures to list")
+
+    args = parser.parse_args()
+    queue_path = Path(os.path.expanduser(args.queue))
+    if args.command == "submit":
+        submit(queue_path, args.jobs_file, args.max_retries)
+    elif args.command == "work":
+        work(queue_path, args.workers)
+    else:
+        status(queue_path, args.failed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Evidence Campaign
+Collects evidence for several RFIs in one run. Units shared between RFIs
+(same tool, same parameters) are collected once and hardlinked into every
+RFI folder that needs them
+
+    python tools/run_campaign.py --accounts ctr-prod --regions us-east-1 --dry-run
+    python tools/run_campaign.py --rfis 10.1.2.12,10.1.2.13 --accounts ctr-prod,ctr-int
+
+RFIs and their units come from config/rfi_mapping.yaml (rfi_mappings and
+collection_units). Exits 1 when any task failed.
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from rich.console import Console
+
+from ai_brain.campaign_runner import (
+    CampaignRunner, DEFAULT_LINK_MODE, expand_campaign, load_campaign_config,
+    print_campaign_plan, print_campaign_summary, write_manifest
+)
+
+console = Console()
+
+
+def _split(value: str):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Collect evidence for many RFIs with shared units collected once")
+    parser.add_argument("--rfis", default="", help="Comma-separated RFI codes (default: every RFI in the mapping)")
+    parser.add_argument("--accounts", required=True, help="Comma-separated AWS accounts (e.g. ctr-prod,ctr-int)")
+    parser.add_argument("--regions", default=os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
+                        help="Comma-separated regions for regional units")
+    parser.add_argument("--mapping", help="Mapping file (default: config/rfi_mapping.yaml)")
+    parser.add_argument("--workers", type=int, help="Concurrent API tasks (default: PLAN_PARALLELISM)")
+    parser.add_argument("--browser-concurrency", type=int, help="Concurrent browser tasks (default: PLAN_BROWSER_CONCURRENCY)")
+    parser.add_argument("--link", choices=["hardlink", "copy"], default=DEFAULT_LINK_MODE,
+                        help="How shared files reach the other RFI folders")
+    parser.add_argument("--dry-run", action="store_true", help="Show the deduplicated task set and exit")
+    args = parser.parse_args()
+
+    config = load_campaign_config(args.mapping)
+    rfi_codes = _split(args.rfis) or list(config["rfi_mappings"])
+    tasks, manual = expand_campaign(rfi_codes, _split(args.accounts), _split(args.regions), config)
+    print_campaign_plan(tasks, manual)
+    if args.dry_run or not tasks:
+        sys.exit(0)
+
+    from evidence_manager.local_evidence_manager import LocalEvidenceManager
+    from ai_brain.tool_executor import ToolExecutor
+
+    evidence_manager = LocalEvidenceManager()
+    runner = CampaignRunner(
+        ToolExecutor(evidence_manager),
+        evidence_manager.get_rfi_directory,
+        max_workers=args.workers,
+        browser_concurrency=args.browser_concurrency,
+        link_mode=args.link
+    )
+    summary = runner.run(tasks)
+    summary["manual_units"] = manual
+    print_campaign_summary(summary)
+
+    manifest = write_manifest(summary, evidence_manager.evidence_dir / "_campaigns")
+    console.print(f"[green]✅ Campaign manifest: {manifest}[/green]")
+    sys.exit(0 if summary["failed"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures time-to-first-prompt (import chat_interface + build IntelligentAgent)
+in fresh interpreters, and breaks import time down per package
+
+    python tools/startup_benchmark.py                  # median of 5 cold starts, budget check
+    python tools/startup_benchmark.py --importtime     # python -X importtime, top packages
+
+Exits 1 when the median exceeds the budget (STARTUP_BUDGET_SECONDS) or when
+a module that should load on first use is already imported at startup.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "3.0"))
+
+# Heavy packages that only specific tools need; none of them should load before the first prompt
+DEFERRED_MODULES = [
+    "selenium", "undetected_chromedriver", "playwright", "pandas", "PIL",
+    "pytesseract", "docx", "PyPDF2", "jira", "github", "atlassian"
+]
+
+# Runs in a fresh interpreter; prints one JSON line
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import chat_interface
+imported = time.perf_counter()
+from ai_brain.intelligent_agent import IntelligentAgent
+agent = IntelligentAgent(llm_provider={provider!r})
+ready = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - started,
+    "agent_seconds": ready - imported,
+    "total_seconds": ready - started,
+    "deferred_loaded": sorted(m for m in {deferred!r} if m in sys.modules)
+}}))
+"""
+
+
+def _run_python(args: List[str], env_overrides: Dict[str, str] = None) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), **(env_overrides or {})}
+    return subprocess.run([sys.executable, *args], cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+
+
+def measure_startup(runs: int = 5, provider: str = "stub") -> List[Dict[str, Any]]:
+    """Cold-start the agent `runs` times, each in a new interpreter."""
+    probe = _PROBE.format(provider=provider, deferred=DEFERRED_MODULES)
+    samples = []
+    for index in range(runs):
+        proc = _run_python(["-c", probe])
+        lines = [line for line in proc.stdout.splitlines() if line.startswith("{")]
+        if proc.returncode != 0 or not lines:
+            console.print(f"[red]❌ Startup run {index + 1} failed:[/red]\n{proc.stderr[-2000:]}")
+            raise SystemExit(1)
+        samples.append(json.loads(lines[-1]))
+    return samples
+
+
+def measure_importtime(module: str = "chat_interface") -> Dict[str, float]:
+    """Self import time in seconds per top-level package (python -X importtime)."""
+    proc = _run_python(["-X", "importtime", "-c", f"import {module}"])
+    per_package: Dict[str, float] = defaultdict(float)
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, _cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            per_package[name.split(".")[0]] += int(self_us) / 1_000_000
+        except ValueError:
+            continue
+    if proc.returncode != 0:
+        console.print(f"[yellow]⚠️  import {module} failed; timings cover what loaded before the error[/yellow]")
+    return dict(per_package)
+
+
+def print_startup_report(samples: List[Dict[str, Any]], budget: float) -> bool:
+    table = Table(show_header=True, title="Time to First Prompt")
+    table.add_column("Run", style="dim")
+    table.add_column("Imports (s)", justify="right")
+    table.add_column("Agent init (s)", justify="right")
+    table.add_column("Total (s)", justify="right")
+    for index, sample in enumerate(samples, 1):
+        table.add_row(
+            str(index),
+            f"{sample['import_seconds']:.2f}",
+            f"{sample['agent_seconds']:.2f}",
+            f"{sample['total_seconds']:.2f}"
+        )
+    console.print(table)
+
+    median = statistics.median(s["total_seconds"] for s in samples)
+    deferred_loaded = sorted({m for s in samples for m in s["deferred_loaded"]})
+    ok = median <= budget and not deferred_loaded
+
+    status = "[green]✅" if median <= budget else "[red]❌"
+    console.print(f"\n{status} Median {median:.2f}s (budget {budget:.2f}s)[/]")
+    if deferred_loaded:
+        console.print(f"[red]❌ Loaded at startup but should be lazy: {', '.join(deferred_loaded)}[/red]")
+        console.print("[dim]   Run with --importtime to find the importer[/dim]")
+    return ok
+
+
+def print_importtime_report(per_package: Dict[str, float], top: int) -> None:
+    table = Table(show_header=True, title="Import Time by Package (self)")
+    table.add_column("Package", style="cyan")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Deferred?", justify="center")
+    for name, seconds in sorted(per_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        table.add_row(name, f"{seconds:.3f}", "[red]should be[/red]" if name in DEFERRED_MODULES else "")
+    console.print(table)
+    console.print(f"\n[bold]Total {sum(per_package.values()):.2f}s across {len(per_package)} packages[/bold]")
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Measure agent startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to measure (median is reported)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="Max median seconds to first prompt")
+    parser.add_argument("--provider", default="stub", help="LLM provider for the agent (default: stub, no network)")
+    parser.add_argument("--importtime", action="store_true", help="Show per-package import time instead")
+    parser.add_argument("--top", type=int, default=25, help="Packages to list with --importtime")
+    parser.add_argument("--json", dest="json_out", help="Also write raw results to this file")
+    args = parser.parse_args()
+
+    if args.importtime:
+        results = measure_importtime()
+        print_importtime_report(results, args.top)
+        ok = True
+    else:
+        results = measure_startup(args.runs, args.provider)
+        ok = print_startup_report(results, args.budget)
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(results, f, indent=2)
+        console.print(f"[green]✅ Results written to {args.json_out}[/green]")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()